@@ -0,0 +1,83 @@
+"""Benchmark audio quality validation: pure-Python loop vs NumPy single-chunk vs batched.
+
+Usage:
+    python -m benchmarks.bench_audio_quality --streams 2000 --batch 500
+"""
+
+import argparse
+import math
+import time
+from array import array
+
+import numpy as np
+
+from src.services.audio_ingress.quality import AudioQualityValidator, PcmChunk
+
+RATE = 16000
+CHUNK_SAMPLES = 800  # 50 ms
+
+
+def python_loop(data: bytes) -> tuple[float, int, float]:
+    """RMS, peak and clipping ratio with a per-sample interpreter loop."""
+    samples = array("h", data)
+    energy = 0.0
+    peak = 0
+    clipped = 0
+    for sample in samples:
+        energy += sample * sample
+        magnitude = abs(sample)
+        if magnitude > peak:
+            peak = magnitude
+        if magnitude >= 32735:
+            clipped += 1
+    return math.sqrt(energy / len(samples)), peak, clipped / len(samples)
+
+
+def make_chunks(streams: int, seed: int = 1) -> list[PcmChunk]:
+    rng = np.random.default_rng(seed)
+    t = np.arange(CHUNK_SAMPLES) / RATE
+    chunks = []
+    for i in range(streams):
+        signal = rng.normal(0, 0.01, CHUNK_SAMPLES) + 0.3 * np.sin(2 * np.pi * (200 + i) * t)
+        data = (signal * 32767).astype("<i2").tobytes()
+        chunks.append(PcmChunk(f"stream-{i}", data, RATE))
+    return chunks
+
+
+def rate(count: int, elapsed: float) -> str:
+    return f"{count / elapsed:>12,.0f} chunks/s  {elapsed / count * 1e6:8.1f} us/chunk"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.streams)
+    total = args.streams * args.rounds
+    print(f"{args.streams} streams x {args.rounds} chunks of 50 ms, 16 kHz int16")
+
+    start = time.perf_counter()
+    for chunk in chunks[: max(1, args.streams // 10)]:
+        python_loop(chunk.data)
+    print(f"python loop    {rate(max(1, args.streams // 10), time.perf_counter() - start)}")
+
+    validator = AudioQualityValidator()
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for chunk in chunks:
+            validator.validate(*chunk)
+    print(f"numpy single   {rate(total, time.perf_counter() - start)}")
+
+    validator = AudioQualityValidator()
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for offset in range(0, len(chunks), args.batch):
+            validator.validate_batch(chunks[offset:offset + args.batch])
+    print(f"numpy batch    {rate(total, time.perf_counter() - start)}  (batch={args.batch})")
+
+
+if __name__ == "__main__":
+    main()
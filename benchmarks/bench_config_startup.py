@@ -0,0 +1,47 @@
+"""Compare cold-start configuration loading: per-parameter reads vs one bulk load.
+
+A fake SSM client with ``--latency-ms`` per call stands in for Parameter
+Store. The report shows the wall time for the service to read ``--parameters``
+parameters, and the cost of a hot-path cached read afterwards.
+
+Usage:
+    python -m benchmarks.bench_config_startup --parameters 50 --latency-ms 15
+"""
+
+import argparse
+import time
+
+from src.shared.config import ConfigManager, Settings
+from src.shared.fakes import FakeSSMClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parameters", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=15.0)
+    args = parser.parse_args()
+
+    settings = Settings()
+    names = [f"service/setting-{i}" for i in range(args.parameters)]
+    values = {f"{settings.ssm_parameter_prefix}/{name}": "value" for name in names}
+
+    for label, use_bulk in (("per-parameter", False), ("bulk load", True)):
+        client = FakeSSMClient(values, latency=args.latency_ms / 1000)
+        manager = ConfigManager(settings, ssm_client=client)
+        start = time.perf_counter()
+        for name in names:
+            # use_cache=False is the old cold-start path: one GetParameter per name
+            manager.get_parameter(name, use_cache=use_bulk)
+        elapsed = time.perf_counter() - start
+        calls = sum(client.call_counts.values())
+        print(f"{label:<14} {elapsed * 1000:7.1f} ms  {calls:3d} SSM calls")
+
+    reads = 100_000
+    start = time.perf_counter()
+    for _ in range(reads):
+        manager.get_cached_parameter(names[0])
+    print(f"cached read    {(time.perf_counter() - start) / reads * 1e6:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
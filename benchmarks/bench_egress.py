@@ -0,0 +1,127 @@
+"""Benchmark fan-out of one session's translated audio to many listeners.
+
+A session publishes ``--seconds`` of synthesized 16 kHz PCM in one-second
+chunks. It fans out to 1, 100 and 1000 listeners whose sends complete
+immediately, so the numbers are egress overhead only, without network. Two
+setups are compared:
+- shared: one ``SessionBroadcaster`` encodes each chunk once and every
+  listener queues views of the same frames
+- per-listener: one broadcaster per listener, each encoding and pacing its
+  own copy, i.e. a pipeline per connection
+
+For each listener count, the report gives:
+- process CPU per listener per audio second
+- traced memory per listener (from a second, traced run)
+- the most audio any client held ahead of real time (bounded by the lead)
+- frames lost to full send queues when the event loop falls behind
+
+Usage:
+    python -m benchmarks.bench_egress --listeners 1 100 1000 --seconds 3
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+
+import structlog
+
+from src.services.audio_egress.broadcaster import FRAME_HEADER, SessionBroadcaster
+
+SAMPLE_RATE = 16_000
+CHUNK_SECONDS = 1.0
+
+
+class Client:
+    """Listener stand-in tracking how far ahead of playout frames arrive."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.started = 0.0
+        self.max_ahead_ms = 0.0
+
+    async def send(self, frame: memoryview) -> None:
+        now = time.perf_counter()
+        if not self.frames:
+            self.started = now
+        self.frames += 1
+        media_ms = FRAME_HEADER.unpack_from(frame)[1]
+        self.max_ahead_ms = max(self.max_ahead_ms, media_ms - (now - self.started) * 1000)
+
+
+async def run(
+    listeners: int, shared: bool, trace: bool, args: argparse.Namespace
+) -> dict[str, float]:
+    chunk = bytes(2 * int(SAMPLE_RATE * CHUNK_SECONDS))
+    chunks = max(1, round(args.seconds / CHUNK_SECONDS))
+    clients = [Client() for _ in range(listeners)]
+
+    if trace:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+    cpu = time.process_time()
+    options = {"sample_rate": SAMPLE_RATE, "frame_ms": args.frame_ms, "lead_ms": args.lead_ms}
+    if shared:
+        broadcasters = [SessionBroadcaster("session", **options)]
+        for index, client in enumerate(clients):
+            broadcasters[0].subscribe(f"connection-{index}", client.send)
+    else:
+        broadcasters = [SessionBroadcaster(f"session-{i}", **options) for i in range(listeners)]
+        for index, client in enumerate(clients):
+            broadcasters[index].subscribe(f"connection-{index}", client.send)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    memory = 0
+    for index in range(chunks):
+        # Synthesis delivers each chunk just before the previous one finishes playing
+        await asyncio.sleep(max(0.0, start + index * CHUNK_SECONDS - loop.time()))
+        for broadcaster in broadcasters:
+            broadcaster.publish(chunk, flush=index == chunks - 1)
+        await asyncio.sleep(0)
+        if trace:
+            memory = max(memory, tracemalloc.get_traced_memory()[0] - baseline)
+    await asyncio.gather(*(broadcaster.drain() for broadcaster in broadcasters))
+    await asyncio.sleep(args.frame_ms / 1000)
+    cpu = time.process_time() - cpu
+    for broadcaster in broadcasters:
+        await broadcaster.close()
+    if trace:
+        tracemalloc.stop()
+
+    expected = chunks * int(CHUNK_SECONDS * 1000) // args.frame_ms
+    return {
+        "cpu_us": cpu * 1e6 / listeners / (chunks * CHUNK_SECONDS),
+        "memory_kib": memory / listeners / 1024,
+        "ahead_ms": max(client.max_ahead_ms for client in clients),
+        "lost": 1 - sum(client.frames for client in clients) / (expected * listeners),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--listeners", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--seconds", type=float, default=2.0, help="Audio per session")
+    parser.add_argument("--frame-ms", type=int, default=20)
+    parser.add_argument("--lead-ms", type=int, default=200)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    print(
+        f"{'listeners':>9}  {'setup':<12}{'CPU us/listener/s':>19}"
+        f"{'KiB/listener':>14}{'max ahead ms':>14}{'lost':>8}"
+    )
+    for listeners in args.listeners:
+        for shared in (True, False):
+            row = asyncio.run(run(listeners, shared, False, args))
+            memory = asyncio.run(run(listeners, shared, True, args))["memory_kib"]
+            print(
+                f"{listeners:>9}  {'shared' if shared else 'per-listener':<12}"
+                f"{row['cpu_us']:19.1f}{memory:14.2f}{row['ahead_ms']:14.1f}"
+                f"{row['lost']:8.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
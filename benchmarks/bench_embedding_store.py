@@ -0,0 +1,119 @@
+"""Benchmark speaker matching against the memory-mapped embedding store.
+
+Profiles are synthetic 256-d embeddings: speakers scattered around a few
+thousand voice "types", like the clusters real speaker encoders produce.
+Queries are noisy re-recordings of enrolled speakers. For each store size
+the report gives build time, file size, and per-query latency for:
+- blob: one float32 blob per profile, deserialized and
+  compared on every lookup (up to --blob-max profiles)
+- exact: blocked NumPy cosine top-k over the mapped rows, for one query
+  and for a batch, with float16 and float32 rows
+- ivf: the coarse index, with recall@1 against exact search
+
+Usage:
+    python -m benchmarks.bench_embedding_store --sizes 10000 1000000
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from src.services.voice_profile.embedding_store import DATA_FILE, EmbeddingStore
+
+DIM = 256
+CHUNK = 100_000
+
+
+def embeddings(rng: np.random.Generator, centers: np.ndarray, count: int) -> np.ndarray:
+    types = rng.integers(0, len(centers), count)
+    return (centers[types] + 0.5 * rng.standard_normal((count, DIM))).astype(np.float32)
+
+
+def timed_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def bench(size: int, dtype: str, blob: bool, args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(args.seed)
+    centers = rng.standard_normal((4096, DIM))
+    with tempfile.TemporaryDirectory() as path:
+        store = EmbeddingStore(path, dim=DIM, dtype=dtype)
+        start = time.perf_counter()
+        enrolled = []
+        for first in range(0, size, CHUNK):
+            vectors = embeddings(rng, centers, min(CHUNK, size - first))
+            store.add_many([f"profile-{first + i}" for i in range(len(vectors))], vectors)
+            if first == 0:
+                enrolled = vectors[: args.queries]
+        build_s = time.perf_counter() - start
+        megabytes = (store.path / DATA_FILE).stat().st_size / 2**20
+        queries = enrolled + 0.2 * rng.standard_normal(enrolled.shape).astype(np.float32)
+        print(
+            f"\n{size:,} {dtype} profiles: written in {build_s:.1f} s, "
+            f"{megabytes:.0f} MiB on disk"
+        )
+
+        if blob and size <= args.blob_max:
+            blobs = {
+                f"profile-{i}": store.get(f"profile-{i}").tobytes() for i in range(size)
+            }
+
+            def blob_search() -> None:
+                query = queries[0] / np.linalg.norm(queries[0])
+                max(
+                    blobs,
+                    key=lambda pid: float(np.frombuffer(blobs[pid], np.float32) @ query),
+                )
+
+            print(f"  blob    1 query     {timed_ms(blob_search, 3):9.2f} ms")
+
+        exact = store.search(queries, k=1)
+        one = timed_ms(lambda: store.search(queries[0], k=5), args.repeat)
+        batch = timed_ms(lambda: store.search(queries, k=5), args.repeat)
+        print(f"  exact   1 query     {one:9.2f} ms")
+        print(
+            f"  exact   {len(queries)} queries  {batch:9.2f} ms "
+            f"({batch / len(queries):.2f} ms/query)"
+        )
+
+        start = time.perf_counter()
+        store.build_index(nprobe=args.nprobe)
+        index_s = time.perf_counter() - start
+        indexed = store.search(queries, k=1)
+        recall = sum(a[0][0] == b[0][0] for a, b in zip(exact, indexed)) / len(queries)
+        one = timed_ms(lambda: store.search(queries[0], k=5), args.repeat)
+        batch = timed_ms(lambda: store.search(queries, k=5), args.repeat)
+        print(f"  ivf     built in {index_s:.1f} s, nprobe {args.nprobe}, recall@1 {recall:.2f}")
+        print(f"  ivf     1 query     {one:9.2f} ms")
+        print(
+            f"  ivf     {len(queries)} queries  {batch:9.2f} ms "
+            f"({batch / len(queries):.2f} ms/query)"
+        )
+        store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dtypes", nargs="+", default=["float16", "float32"])
+    parser.add_argument("--queries", type=int, default=32)
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--blob-max", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    for size in args.sizes:
+        for index, dtype in enumerate(args.dtypes):
+            bench(size, dtype, index == 0, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Import-time budget check for the shared package.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``,
+``--runs`` times. The best cumulative time is compared with its budget in
+``BUDGETS_MS``. The script exits with status 1 when any module goes over
+budget, so it can gate CI. The report also lists the heaviest third-party
+packages each module pulled in, to point at the import that regressed.
+
+Usage:
+    python -m benchmarks.bench_import_time --runs 5
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Cumulative import time per module in ms, with headroom over the lazy-import
+# baseline (boto3, aioboto3 and the X-Ray SDK load on first use)
+BUDGETS_MS = {
+    "src.shared.errors": 30,
+    "src.shared.metrics": 30,
+    "src.shared.config": 300,
+    "src.shared.logging": 400,
+    "src.shared.tracing": 400,
+    "src.shared.resilience": 400,
+    "src.shared.aws_clients": 400,
+    "src.shared.async_aws_clients": 400,
+    "src.shared.cache": 550,
+    "src.shared.rate_limiter": 550,
+    "src.shared.timing": 350,
+}
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in µs of every module loaded by importing ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3, help="Heaviest dependencies listed")
+    args = parser.parse_args()
+
+    over = []
+    for module, budget in BUDGETS_MS.items():
+        runs = [import_times(module) for _ in range(args.runs)]
+        best = min(runs, key=lambda times: times[module])
+        elapsed = best[module] / 1000
+        heavy = sorted(
+            (
+                (cumulative, name)
+                for name, cumulative in best.items()
+                if "." not in name and name != module.split(".")[0]
+            ),
+            reverse=True,
+        )[: args.top]
+        status = "ok" if elapsed <= budget else "OVER"
+        if status == "OVER":
+            over.append(module)
+        deps = ", ".join(f"{name} {cumulative / 1000:.0f}" for cumulative, name in heavy)
+        print(f"{status:<4} {module:<26} {elapsed:7.1f} ms / {budget:4d} ms  ({deps})")
+
+    if over:
+        print(f"Import budget exceeded: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
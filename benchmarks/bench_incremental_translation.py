@@ -0,0 +1,117 @@
+"""Compare translation strategies for Transcribe partial results.
+
+Utterances are replayed as simulated partial hypotheses: a new partial every
+``--partial-ms``, trailing speech by a short lag, with an unstable last word
+that is sometimes misrecognised, and punctuation that appears once the next
+word is heard. Times are stream time, so the run is instant. The report
+covers translation calls per utterance and time to the first translated
+words, counted from the start of speech and including ``--translate-ms``.
+
+Usage:
+    python -m benchmarks.bench_incremental_translation --utterances 500
+"""
+
+import argparse
+import asyncio
+import random
+
+import numpy as np
+
+from src.services.speech_to_text.models import TranscriptionResult
+from src.services.translation.incremental import IncrementalTranslator
+from src.services.translation.models import TranslationRequest, TranslationResult
+
+SENTENCES = (
+    "Good morning, everyone. Today we will look at the results from last week.",
+    "Can you repeat that, please?",
+    "My order number is on the receipt, but the website says it does not exist.",
+    "If you open the second chapter, you will see the diagram we discussed yesterday.",
+    "Thank you for waiting; I have found your account and fixed the address.",
+    "So what we need to do next is check whether the printer is connected to the network",
+)
+
+
+class _CountingService:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def translate(self, request: TranslationRequest) -> TranslationResult:
+        self.calls += 1
+        return TranslationResult(
+            request.session_id,
+            request.segment_id,
+            request.source_text,
+            request.source_language,
+            request.target_language,
+            latency=0.0,
+        )
+
+
+def partials_for(sentence: str, rng: random.Random, args) -> list[tuple[float, str]]:
+    """Simulated (arrival ms, transcript) partials for one utterance, final last."""
+    words = sentence.split()
+    bare = [w.rstrip(",.;:?!") for w in words]
+    spoken_at = np.cumsum([rng.uniform(180, 420) for _ in words])
+    partials = []
+    t = args.partial_ms
+    while t < spoken_at[-1] + args.lag_ms:
+        heard = int(np.searchsorted(spoken_at, t - args.lag_ms, side="right"))
+        if heard:
+            hypothesis = words[: heard - 1] + [bare[heard - 1]]
+            if rng.random() < args.misrecognition:
+                hypothesis[-1] = hypothesis[-1][::-1]
+            partials.append((t, " ".join(hypothesis)))
+        t += args.partial_ms
+    partials.append((spoken_at[-1] + args.final_lag_ms, sentence))
+    return partials
+
+
+async def run(args) -> None:
+    rng = random.Random(7)
+    service = _CountingService()
+    translator = IncrementalTranslator("en", "es", service=service)
+    stats = {"every partial": ([], []), "final only": ([], []), "incremental": ([], [])}
+    revisions = 0
+
+    for index in range(args.utterances):
+        partials = partials_for(rng.choice(SENTENCES), rng, args)
+        stats["every partial"][0].append(len(partials))
+        stats["every partial"][1].append(partials[0][0] + args.translate_ms)
+        stats["final only"][0].append(1)
+        stats["final only"][1].append(partials[-1][0] + args.translate_ms)
+
+        before, first = service.calls, None
+        for position, (arrival, transcript) in enumerate(partials):
+            final = position == len(partials) - 1
+            updates = await translator.process(
+                TranscriptionResult("s1", f"r{index}", not final, transcript)
+            )
+            if first is None and any(u.source_text for u in updates):
+                first = arrival + args.translate_ms
+            revisions += any(u.revision for u in updates)
+        stats["incremental"][0].append(service.calls - before)
+        stats["incremental"][1].append(first)
+
+    for name, (calls, first_token) in stats.items():
+        print(
+            f"{name:<14} {np.mean(calls):5.1f} calls/utterance  first translated words "
+            f"p50 {np.percentile(first_token, 50):6.0f} ms  "
+            f"p95 {np.percentile(first_token, 95):6.0f} ms"
+        )
+    print(f"incremental revisions: {revisions}/{args.utterances} utterances")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--utterances", type=int, default=500)
+    parser.add_argument("--partial-ms", type=float, default=150.0)
+    parser.add_argument("--lag-ms", type=float, default=200.0, help="Partial lag behind speech")
+    parser.add_argument("--final-lag-ms", type=float, default=600.0)
+    parser.add_argument("--misrecognition", type=float, default=0.3)
+    parser.add_argument("--translate-ms", type=float, default=80.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
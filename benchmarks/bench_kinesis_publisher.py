@@ -0,0 +1,66 @@
+"""Benchmark per-record PutRecord against the batched Kinesis publisher.
+
+Usage:
+    python -m benchmarks.bench_kinesis_publisher --sessions 200 --seconds 2
+"""
+
+import argparse
+import time
+
+from src.shared.fakes import FakeKinesisClient
+from src.shared.kinesis_publisher import KinesisBatchPublisher
+from src.shared.metrics import get_metrics_registry
+
+CHUNK = b"\x00" * 1600  # 50 ms of 16 kHz 16-bit mono PCM
+
+
+def bench_put_record(client: FakeKinesisClient, records: int, sessions: int) -> float:
+    start = time.perf_counter()
+    for i in range(records):
+        client.put_record(StreamName="bench", Data=CHUNK, PartitionKey=f"session-{i % sessions}")
+    return time.perf_counter() - start
+
+
+def bench_publisher(
+    client: FakeKinesisClient, records: int, sessions: int, linger_ms: float
+) -> float:
+    start = time.perf_counter()
+    with KinesisBatchPublisher("bench", client=client, linger_ms=linger_ms) as publisher:
+        for i in range(records):
+            publisher.publish(CHUNK, partition_key=f"session-{i % sessions}")
+        publisher.flush()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=2.0, help="Audio seconds per session")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Fake API round trip")
+    parser.add_argument("--failure-rate", type=float, default=0.01)
+    parser.add_argument("--linger-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    records = int(args.sessions * args.seconds * 20)
+    latency = args.latency_ms / 1000
+
+    baseline = FakeKinesisClient(latency=latency, seed=1)
+    elapsed = bench_put_record(baseline, records, args.sessions)
+    print(
+        f"put_record:  {records} records, {baseline.call_count} calls, "
+        f"{elapsed:.2f}s, {records / elapsed:,.0f} records/s"
+    )
+
+    batched = FakeKinesisClient(latency=latency, failure_rate=args.failure_rate, seed=1)
+    elapsed = bench_publisher(batched, records, args.sessions, args.linger_ms)
+    print(
+        f"publisher:   {records} records, {batched.call_count} calls, "
+        f"{elapsed:.2f}s, {records / elapsed:,.0f} records/s"
+    )
+    for key, value in sorted(get_metrics_registry().snapshot().items()):
+        if key.startswith("kinesis_publisher"):
+            print(f"  {key} = {value:,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Replay the DESIGN.md load scenarios against the in-process AWS fakes.
+
+Each synthetic session writes its session record, then streams 100 ms
+chunks of 16 kHz PCM in real time through the pipeline:
+
+    ingress -> Kinesis -> stt (Transcribe) -> translate -> clone (Polly) -> egress
+
+Every AWS call goes to a fake from ``src.shared.fakes``, with log-normal
+latency and optional throttling and errors, so no AWS account is needed.
+User counts and durations are scaled down from DESIGN.md (``--scale`` and
+``--time-scale``) to fit a laptop. The report gives:
+- chunk and result throughput
+- per-stage and queueing p50/p95/p99 from the final results' timing envelopes
+- traced memory per concurrent session
+
+Usage:
+    python -m benchmarks.bench_load --scenario all --scale 0.005
+"""
+
+import argparse
+import asyncio
+import logging
+import tracemalloc
+from collections import Counter, deque
+from typing import Any
+
+import fakeredis
+import structlog
+from botocore.exceptions import ClientError
+
+from src.services.audio_ingress.models import AudioChunk, parse_audio_record
+from src.services.translation.cache import TranslationCache
+from src.services.translation.models import TranslationRequest
+from src.services.translation.service import TranslationService
+from src.shared.async_aws_clients import (
+    AsyncAWSClientManager,
+    AsyncDynamoDBClient,
+    AsyncKinesisClient,
+    AsyncTranslateClient,
+)
+from src.shared.cache import TwoTierCache
+from src.shared.config import get_settings
+from src.shared.errors import UniVoiceError
+from src.shared.fakes import FakeAWS, FaultInjector, LatencyModel
+from src.shared.resilience import get_circuit_breaker
+from src.shared.timing import STAGES, TOTAL, LatencyCollector, TimingEnvelope, now_ms
+
+# DESIGN.md "Load Testing Scenarios"; times in seconds
+SCENARIOS = {
+    "normal": {"duration": 1800, "users": 10_000, "ramp_up": 300, "session": 300},
+    "peak": {"duration": 900, "users": 50_000, "ramp_up": 120, "session": 300},
+    "stress": {"duration": 600, "users": 100_000, "ramp_up": 60, "session": 180},
+    "spike": {
+        "duration": 1200,
+        "users": 10_000,
+        "ramp_up": 0,
+        "session": 300,
+        "spike_users": 80_000,
+        "spike_at": 600,
+        "spike_duration": 300,
+    },
+}
+# Median and p99 call latency in seconds (Transcribe: per result, DESIGN.md 200 ms)
+LATENCY = {
+    "kinesis": (0.015, 0.06),
+    "dynamodb": (0.005, 0.02),
+    "s3": (0.02, 0.1),
+    "transcribe": (0.2, 0.5),
+    "translate": (0.08, 0.25),
+    "polly": (0.12, 0.4),
+}
+TARGETS = ("es", "fr", "de", "ja")
+SAMPLE_RATE = 16_000
+CHUNK_MS = 100
+FRAME_BYTES = 640  # 20 ms egress frames
+
+
+def scaled(scenario: dict[str, int], scale: float, time_scale: float) -> dict[str, float]:
+    """Shrink a scenario's user counts by ``scale`` and its times by ``time_scale``."""
+    return {
+        name: max(1, round(value * scale)) if "users" in name else value * time_scale
+        for name, value in scenario.items()
+    }
+
+
+def target_users(scenario: dict[str, float], elapsed: float) -> int:
+    """Concurrent sessions the scenario calls for ``elapsed`` seconds in."""
+    if "spike_at" in scenario:
+        spike_at = scenario["spike_at"]
+        if spike_at <= elapsed < spike_at + scenario["spike_duration"]:
+            return scenario["spike_users"]
+    if scenario["ramp_up"] and elapsed < scenario["ramp_up"]:
+        return max(1, int(scenario["users"] * elapsed / scenario["ramp_up"]))
+    return scenario["users"]
+
+
+class Pipeline:
+    """Pipeline stages wired to one set of fakes, plus the run's counters."""
+
+    def __init__(self, args: argparse.Namespace, window_seconds: float):
+        self.settings = get_settings()
+        faults = {
+            name: FaultInjector(
+                LatencyModel(median, p99),
+                throttle_rate=args.throttle_rate,
+                error_rate=args.error_rate,
+                seed=args.seed + index,
+            )
+            for index, (name, (median, p99)) in enumerate(LATENCY.items())
+        }
+        self.aws = FakeAWS(faults, seed=args.seed)
+        self.aws.transcribe.segment_seconds = args.segment_ms / 1000
+        manager = AsyncAWSClientManager()
+        self.aws.install(async_manager=manager)
+        self.manager = manager
+        self.kinesis = AsyncKinesisClient(manager)
+        self.dynamodb = AsyncDynamoDBClient(manager)
+        self.translation = TranslationService(
+            AsyncTranslateClient(manager),
+            TranslationCache(TwoTierCache(redis=fakeredis.FakeAsyncRedis(), l1_ttl=60)),
+        )
+        self.collector = LatencyCollector(window_seconds=window_seconds)
+        self.audio = bytes(2 * SAMPLE_RATE * CHUNK_MS // 1000)
+        self.chunks = 0
+        self.results = 0
+        self.errors: Counter[str] = Counter()
+
+    async def session(self, session_id: str, seconds: float, target: str) -> None:
+        """Stream one session's audio in real time and deliver its results."""
+        table = self.settings.dynamodb_sessions_table
+        try:
+            await self.dynamodb.put_item(table, {"sessionId": session_id, "status": "ACTIVE"})
+            stream = await self.aws.transcribe.start_stream_transcription(
+                language_code="en-US", media_sample_rate_hz=SAMPLE_RATE
+            )
+        except (UniVoiceError, ClientError) as e:
+            self.errors[f"session:{type(e).__name__}"] += 1
+            return
+
+        timings: deque[TimingEnvelope] = deque()
+        reader = asyncio.create_task(self.read_results(session_id, stream, timings, target))
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        for sequence in range(max(1, int(seconds * 1000 / CHUNK_MS))):
+            chunk = AudioChunk(self.audio, "wav", SAMPLE_RATE, 1, now_ms(), sequence)
+            chunk.start_timing()
+            record = chunk.to_record()
+            try:
+                await self.kinesis.put_record(
+                    self.settings.kinesis_audio_stream, record, session_id
+                )
+            except UniVoiceError as e:
+                self.errors[f"ingress:{type(e).__name__}"] += 1
+            else:
+                audio, timing = parse_audio_record(record)
+                timings.append(timing)
+                await stream.input_stream.send_audio_event(audio_chunk=audio)
+                self.chunks += 1
+            next_at += CHUNK_MS / 1000
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+        await stream.input_stream.end_stream()
+        await reader
+        try:
+            await self.dynamodb.put_item(table, {"sessionId": session_id, "status": "ENDED"})
+        except UniVoiceError as e:
+            self.errors[f"session:{type(e).__name__}"] += 1
+        self.collector.end_session(session_id)
+
+    async def read_results(
+        self, session_id: str, stream: Any, timings: deque, target: str
+    ) -> None:
+        """Pair results with the chunks that completed them; deliver the finals."""
+        deliveries = []
+        last = None
+        async for event in stream.output_stream:
+            for result in event["Transcript"]["Results"]:
+                # One result per audio event; the end-of-stream final has no chunk of its own
+                if timings:
+                    last = timings.popleft()
+                last.exit("stt")
+                if not result["IsPartial"]:
+                    deliveries.append(
+                        asyncio.create_task(self.deliver(session_id, result, last, target))
+                    )
+        await asyncio.gather(*deliveries)
+
+    async def deliver(
+        self, session_id: str, result: dict, timing: TimingEnvelope, target: str
+    ) -> None:
+        """Translate, synthesize and frame one final result."""
+        try:
+            translated = await self.translation.translate(
+                TranslationRequest(
+                    session_id,
+                    result["ResultId"],
+                    result["Alternatives"][0]["Transcript"],
+                    "en",
+                    target,
+                    timing=timing,
+                )
+            )
+            timing = translated.timing
+            with timing.stage("clone"):
+                polly = await self.manager.get_client("polly")
+                response = await polly.synthesize_speech(
+                    Text=translated.translated_text,
+                    OutputFormat="pcm",
+                    VoiceId="Joanna",
+                    SampleRate=str(SAMPLE_RATE),
+                )
+                audio = response["AudioStream"].read()
+            with timing.stage("egress"):
+                frames = [
+                    audio[start:start + FRAME_BYTES]
+                    for start in range(0, len(audio), FRAME_BYTES)
+                ]
+        except (UniVoiceError, ClientError) as e:
+            self.errors[f"deliver:{type(e).__name__}"] += 1
+            return
+        if frames:
+            self.collector.observe(session_id, timing)
+            self.results += 1
+
+
+async def run(name: str, scenario: dict[str, float], args: argparse.Namespace) -> None:
+    # Each scenario starts with closed circuit breakers
+    get_circuit_breaker.cache_clear()
+    pipeline = Pipeline(args, window_seconds=scenario["duration"] + 60)
+    loop = asyncio.get_running_loop()
+    sessions: set[asyncio.Task] = set()
+    started = 0
+    peak_sessions = 0
+    peak_memory = 0
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = loop.time()
+    while (elapsed := loop.time() - start) < scenario["duration"]:
+        while len(sessions) < target_users(scenario, elapsed):
+            started += 1
+            task = asyncio.create_task(
+                pipeline.session(
+                    f"session-{started}", scenario["session"], TARGETS[started % len(TARGETS)]
+                )
+            )
+            sessions.add(task)
+            task.add_done_callback(sessions.discard)
+        if len(sessions) >= peak_sessions:
+            peak_sessions = len(sessions)
+            peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[0] - baseline)
+        await asyncio.sleep(CHUNK_MS / 1000)
+    await asyncio.gather(*sessions)
+    wall = loop.time() - start
+    tracemalloc.stop()
+
+    errors = ", ".join(f"{kind} {count}" for kind, count in pipeline.errors.most_common())
+    print(
+        f"\n{name}: {started} sessions, peak {peak_sessions} concurrent, {wall:.1f} s\n"
+        f"  {pipeline.chunks} chunks ({pipeline.chunks / wall:.0f}/s, "
+        f"{pipeline.chunks * CHUNK_MS / 1000 / wall:.1f} audio s/s), "
+        f"{pipeline.results} results ({pipeline.results / wall:.1f}/s), "
+        f"errors: {errors or 'none'}"
+    )
+    summary = pipeline.collector.node_percentiles()
+    print(f"  {'part':<18}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'count':>8}")
+    for part in [p for stage in STAGES for p in (f"queue:{stage}", stage)] + [TOTAL]:
+        if part in summary:
+            row = summary[part]
+            print(
+                f"  {part:<18}{row['p50']:9.1f}{row['p95']:9.1f}{row['p99']:9.1f}"
+                f"{row['count']:8d}"
+            )
+    print(f"  memory: {peak_memory / max(1, peak_sessions) / 1024:.1f} KiB traced per session")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="normal")
+    parser.add_argument("--scale", type=float, default=0.002, help="Fraction of DESIGN.md users")
+    parser.add_argument(
+        "--time-scale", type=float, default=0.005, help="Fraction of DESIGN.md durations"
+    )
+    parser.add_argument("--segment-ms", type=int, default=1000, help="Audio per final result")
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Injected failures are reported in the summary rather than logged per call
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    for name in names:
+        scenario = scaled(SCENARIOS[name], args.scale, args.time_scale)
+        asyncio.run(run(name, scenario, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure the caller-side cost of one structlog call, synchronous vs queued.
+
+Each configuration runs the same processor chain as ``setup_logging``. The
+synchronous variant renders JSON and writes on the calling thread. The
+queued variant hands the event dict to the ``LogWriter`` thread. Output goes
+to ``--output``, which defaults to /dev/null, so terminal speed does not
+skew the numbers. A pipe to a log driver is slower than that, which widens
+the gap. The "sampled" rows log one hot event name, so everything beyond
+``--sample`` events per second is dropped early in the chain.
+
+Usage:
+    python -m benchmarks.bench_logging --calls 200000
+"""
+
+import argparse
+import logging
+import time
+
+import structlog
+
+from src.shared.logging import (
+    EventSampler,
+    LogWriter,
+    QueueLogger,
+    defer_rendering,
+    stamp_time,
+)
+
+WRAPPER = structlog.make_filtering_bound_logger(logging.DEBUG)
+
+
+def processors(sample: int, stamp, renderer) -> list:
+    return [
+        EventSampler(sample),
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        stamp,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        renderer,
+    ]
+
+
+def run(logger, calls: int) -> float:
+    start = time.perf_counter()
+    for seq in range(calls):
+        logger.debug("audio_chunk", session_id="s1", seq=seq, bytes=1600, rms=0.12)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--sample", type=int, default=100, help="Events/s kept when sampled")
+    parser.add_argument("--output", default="/dev/null")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as stream:
+        for label, sample in (("unsampled", 0), ("sampled", args.sample)):
+            sync = structlog.wrap_logger(
+                structlog.PrintLogger(stream),
+                processors=processors(
+                    sample,
+                    structlog.processors.TimeStamper(fmt="iso"),
+                    structlog.processors.JSONRenderer(),
+                ),
+                wrapper_class=WRAPPER,
+            ).bind()
+            print(f"sync   {label:<9} {run(sync, args.calls):6.2f} us/call")
+
+            # Queue sized to the run so the figure measures hand-off, not drops
+            writer = LogWriter(stream, max_queue=args.calls, batch_size=512)
+            queued = structlog.wrap_logger(
+                QueueLogger(writer),
+                processors=processors(sample, stamp_time, defer_rendering),
+                wrapper_class=WRAPPER,
+            ).bind()
+            per_call = run(queued, args.calls)
+            start = time.perf_counter()
+            writer.close(timeout=60)
+            drain = time.perf_counter() - start
+            print(
+                f"queued {label:<9} {per_call:6.2f} us/call  "
+                f"(writer thread drained the rest in {drain * 1000:.0f} ms)"
+            )
+
+
+if __name__ == "__main__":
+    main()
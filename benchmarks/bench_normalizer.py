@@ -0,0 +1,64 @@
+"""Benchmark the streaming 16 kHz mono normalizer and its per-stream memory.
+
+Usage:
+    python -m benchmarks.bench_normalizer --chunks 2000 --streams 10000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.services.audio_ingress.normalizer import StreamNormalizer
+
+LAYOUTS = (
+    ("48k stereo int16", 48000, 2, "int16"),
+    ("48k mono float32", 48000, 1, "float32"),
+    ("44.1k stereo int16", 44100, 2, "int16"),
+    ("16k stereo int16", 16000, 2, "int16"),
+)
+
+
+def chunk_for(rate: int, channels: int, sample_format: str) -> bytes:
+    samples = np.random.default_rng(1).normal(0, 0.1, rate // 20 * channels)
+    if sample_format == "int16":
+        return (samples * 32767).astype("<i2").tobytes()
+    return samples.astype("<f4").tobytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=2000, help="50 ms chunks per layout")
+    parser.add_argument("--streams", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for name, rate, channels, sample_format in LAYOUTS:
+        data = chunk_for(rate, channels, sample_format)
+        normalizer = StreamNormalizer(rate, channels, sample_format)
+        start = time.perf_counter()
+        for _ in range(args.chunks):
+            normalizer.process(data)
+        elapsed = time.perf_counter() - start
+        realtime = args.chunks * 0.05 / elapsed
+        print(
+            f"{name:<20} {args.chunks / elapsed:>9,.0f} chunks/s  "
+            f"{elapsed / args.chunks * 1e6:7.1f} us/chunk  {realtime:6,.0f}x real time"
+        )
+
+    data = chunk_for(48000, 2, "int16")
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    streams = [StreamNormalizer(48000, 2, "int16") for _ in range(args.streams)]
+    for normalizer in streams:
+        normalizer.process(data)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    print(
+        f"{args.streams:,} 48k stereo streams: {used / 1024 / 1024:.1f} MB state, "
+        f"{used / args.streams:,.0f} B per stream"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare per-check cost of the leased rate limiter against one Redis call per check.
+
+Runs against an in-process fakeredis server, so the ``--rtt-ms`` delay is
+added to each script call to stand in for the ElastiCache round trip. The
+report shows mean time per check and Redis calls per 1000 checks for
+``--streams`` concurrent streams, each sending ``--frames`` frames.
+
+Usage:
+    python -m benchmarks.bench_rate_limiter --streams 50 --frames 400 --rtt-ms 0.5
+"""
+
+import argparse
+import asyncio
+import time
+
+import fakeredis
+
+from src.shared.errors import RateLimitError
+from src.shared.rate_limiter import TokenBucketLimiter
+
+
+async def measure(lease_tokens: int, args) -> tuple[float, float, int, float]:
+    limiter = TokenBucketLimiter(
+        "bench",
+        rate=1_000_000,
+        capacity=1_000_000,
+        redis=fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()),
+        lease_tokens=lease_tokens,
+        lease_ttl_ms=1000,
+    )
+    script, calls, rejected = limiter._script, 0, 0
+
+    async def remote(*a, **kw):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(args.rtt_ms / 1000)
+        return await script(*a, **kw)
+
+    limiter._script = remote
+
+    async def stream(index: int) -> None:
+        nonlocal rejected
+        key = f"rate-limit:user:u{index}:audio"
+        for _ in range(args.frames):
+            try:
+                await limiter.acquire(key)
+            except RateLimitError:
+                rejected += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(stream(i) for i in range(args.streams)))
+    elapsed = time.perf_counter() - start
+
+    checks = args.streams * args.frames
+    # Local fast path alone, one key with a lease big enough for every check
+    fast = TokenBucketLimiter(
+        "bench-fast",
+        rate=1,
+        capacity=checks + 1,
+        redis=limiter.redis,
+        lease_tokens=checks + 1,
+        lease_ttl_ms=60_000,
+    )
+    await fast.acquire("k")
+    fast_start = time.perf_counter()
+    for _ in range(checks):
+        await fast.acquire("k")
+    fast_us = (time.perf_counter() - fast_start) / checks * 1e6
+    return elapsed / checks * 1e6, calls * 1000 / checks, rejected, fast_us
+
+
+async def run(args) -> None:
+    for label, lease in (("script per check", 1), (f"lease {args.lease}", args.lease)):
+        per_check, per_1000, rejected, fast_us = await measure(lease, args)
+        print(
+            f"{label:<17} {per_check:8.1f} us/check (wall, {args.streams} streams)  "
+            f"{per_1000:7.1f} Redis calls/1000 checks  rejected {rejected}"
+        )
+    print(f"local fast path   {fast_us:8.2f} us/check")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=50)
+    parser.add_argument("--frames", type=int, default=400)
+    parser.add_argument("--lease", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Simulated Redis RTT")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
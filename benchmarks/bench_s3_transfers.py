@@ -0,0 +1,93 @@
+"""Benchmark whole-object S3 transfers against streaming and multipart transfers.
+
+Reports throughput and peak traced memory against the in-process S3 fake.
+
+Usage:
+    python -m benchmarks.bench_s3_transfers --size-mb 64 --latency-ms 5
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable
+
+from src.shared.aws_clients import AWSClientManager, S3Client
+from src.shared.fakes import FakeS3Client
+
+BUCKET = "bench"
+
+
+def measure(fn: Callable[[], None]) -> tuple[float, float]:
+    """Run fn, returning (elapsed seconds, peak traced MB above baseline)."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, (peak - baseline) / 1024 / 1024
+
+
+def report(name: str, size_mb: float, elapsed: float, peak_mb: float) -> None:
+    print(f"{name:<16} {elapsed:6.2f}s  {size_mb / elapsed:8.1f} MB/s  peak {peak_mb:7.1f} MB")
+
+
+class ZeroReader:
+    """File-like source that produces bytes on demand instead of holding them."""
+
+    def __init__(self, size: int):
+        self.remaining = size
+
+    def read(self, n: int = -1) -> bytes:
+        n = self.remaining if n < 0 else min(n, self.remaining)
+        self.remaining -= n
+        return b"\x01" * n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--part-mb", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Fake API round trip")
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    part_size = args.part_mb * 1024 * 1024
+    latency = args.latency_ms / 1000
+
+    def s3(fake: FakeS3Client) -> S3Client:
+        manager = AWSClientManager()
+        manager.register_client("s3", fake)
+        return S3Client(manager=manager)
+
+    # Uploads go to a fake that discards bodies so only client-side memory is traced
+    uploads = s3(FakeS3Client(latency=latency, keep_data=False))
+    downloads = s3(FakeS3Client(latency=latency))
+    downloads.client.put_object(Bucket=BUCKET, Key="object", Body=b"\x01" * size)
+
+    def upload_file() -> None:
+        uploads.upload_file(BUCKET, "object", ZeroReader(size).read())
+
+    def upload_stream() -> None:
+        uploads.upload_stream(
+            BUCKET, "object", ZeroReader(size), part_size=part_size, concurrency=args.concurrency
+        )
+
+    def download_file() -> None:
+        downloads.download_file(BUCKET, "object")
+
+    def iter_download() -> None:
+        for _ in downloads.iter_download(BUCKET, "object", chunk_size=part_size):
+            pass
+
+    print(f"{args.size_mb} MB object, {args.part_mb} MB parts, concurrency {args.concurrency}")
+    report("upload_file", args.size_mb, *measure(upload_file))
+    report("upload_stream", args.size_mb, *measure(upload_stream))
+    report("download_file", args.size_mb, *measure(download_file))
+    report("iter_download", args.size_mb, *measure(iter_download))
+
+
+if __name__ == "__main__":
+    main()
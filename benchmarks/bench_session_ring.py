@@ -0,0 +1,67 @@
+"""Simulate session placement on the consistent-hash ring.
+
+For several virtual-node counts, the report shows:
+- load imbalance across nodes
+- the share of sessions that move when a node joins or leaves, next to the
+  ideal 1/N
+- lookup and ring-rebuild cost
+
+Usage:
+    python -m benchmarks.bench_session_ring --nodes 10 --sessions 100000
+"""
+
+import argparse
+import time
+
+from src.services.session_manager.registry import HashRing
+
+VNODE_COUNTS = (1, 16, 64, 160, 400)
+
+
+def placement(ring: HashRing, sessions: list[str]) -> dict[str, str]:
+    return {session: ring.node_for(session) for session in sessions}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=10)
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    nodes = [f"10.0.{i // 256}.{i % 256}:8080" for i in range(args.nodes)]
+    sessions = [f"session-{i:08d}" for i in range(args.sessions)]
+    ideal_join = 1 / (args.nodes + 1)
+    ideal_leave = 1 / args.nodes
+    print(f"ideal movement: join {ideal_join:.1%}, leave {ideal_leave:.1%}")
+
+    for vnodes in VNODE_COUNTS:
+        start = time.perf_counter()
+        ring = HashRing(nodes, vnodes=vnodes)
+        rebuild_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        before = placement(ring, sessions)
+        lookup_ns = (time.perf_counter() - start) / len(sessions) * 1e9
+
+        load: dict[str, int] = {}
+        for node in before.values():
+            load[node] = load.get(node, 0) + 1
+        imbalance = max(load.values()) / (len(sessions) / len(nodes))
+
+        ring.add_node("10.0.99.99:8080")
+        joined = placement(ring, sessions)
+        join_moved = sum(before[s] != joined[s] for s in sessions) / len(sessions)
+        ring.remove_node("10.0.99.99:8080")
+        ring.remove_node(nodes[0])
+        left = placement(ring, sessions)
+        leave_moved = sum(before[s] != left[s] for s in sessions) / len(sessions)
+
+        print(
+            f"vnodes {vnodes:>4}: max/mean load {imbalance:5.2f}  "
+            f"join moves {join_moved:6.1%}  leave moves {leave_moved:6.1%}  "
+            f"lookup {lookup_ns:5.0f} ns  rebuild {rebuild_ms:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
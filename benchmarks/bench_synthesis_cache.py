@@ -0,0 +1,161 @@
+"""Benchmark the synthesis cache on a workload of recurring phrases.
+
+Requests draw phrases from a Zipf distribution over a phrase vocabulary,
+which models the short replies and greetings that recur across sessions.
+Each phrase is spoken by one of ``--profiles`` cloned voices. Requests are
+spread over two nodes. Each node has its own disk tier, and both share an
+S3 tier and Redis. Synthesis is the in-process Polly fake with DESIGN.md's
+~500 ms latency, and S3 calls take ~20 ms. Partway through, one profile is
+re-enrolled to show invalidation.
+
+The report gives:
+- hit rate overall and by tier
+- time to first audio for hits and misses
+- latency and synthesis characters saved compared with synthesizing every
+  request
+
+Usage:
+    python -m benchmarks.bench_synthesis_cache --requests 3000 --phrases 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+import fakeredis
+import structlog
+
+from src.services.voice_cloning.cache import DiskLRU, SynthesisCache
+from src.services.voice_cloning.models import SynthesisRequest
+from src.shared.async_aws_clients import AsyncAWSClientManager, AsyncS3Client
+from src.shared.fakes import AsyncFake, FakePollyClient, FakeS3Client, FaultInjector, LatencyModel
+
+SAMPLE_RATE = 16_000
+CHUNK_BYTES = 32 * 1024
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    polly = FakePollyClient(FaultInjector(LatencyModel(0.5, 1.2), seed=args.seed))
+    synthesizer = AsyncFake(polly)
+    s3 = FakeS3Client(faults=FaultInjector(LatencyModel(0.02, 0.08), seed=args.seed + 1))
+    manager = AsyncAWSClientManager()
+    manager.register_client("s3", AsyncFake(s3))
+    redis = fakeredis.FakeAsyncRedis()
+
+    async def synthesize(request: SynthesisRequest) -> AsyncIterator[bytes]:
+        response = await synthesizer.synthesize_speech(
+            Text=request.text, OutputFormat="pcm", VoiceId="Joanna", SampleRate=str(SAMPLE_RATE)
+        )
+        audio = response["AudioStream"].read()
+        for offset in range(0, len(audio), CHUNK_BYTES):
+            yield audio[offset:offset + CHUNK_BYTES]
+
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.phrases)]
+    phrases = [f"phrase number {rank} of the session" for rank in range(args.phrases)]
+    texts = rng.choices(phrases, weights, k=args.requests)
+    profiles = [f"profile-{rng.randrange(args.profiles)}" for _ in range(args.requests)]
+
+    with tempfile.TemporaryDirectory() as root:
+        nodes = [
+            SynthesisCache(
+                disk=DiskLRU(Path(root) / f"node-{n}", args.disk_mib * 1024 * 1024),
+                s3=AsyncS3Client(manager),
+                redis=redis,
+                bucket="synthesis-cache",
+            )
+            for n in range(2)
+        ]
+        hit_ttfa: list[float] = []
+        miss_ttfa: list[float] = []
+        limit = asyncio.Semaphore(args.concurrency)
+
+        async def one(index: int) -> None:
+            request = SynthesisRequest(
+                f"session-{index}", "seg-1", texts[index], profiles[index], "es"
+            )
+            synthesized = False
+
+            def tracked(request: SynthesisRequest) -> AsyncIterator[bytes]:
+                nonlocal synthesized
+                synthesized = True
+                return synthesize(request)
+
+            async with limit:
+                start = time.perf_counter()
+                first = None
+                async for _ in nodes[index % 2].stream(request, tracked):
+                    if first is None:
+                        first = (time.perf_counter() - start) * 1000
+                (miss_ttfa if synthesized else hit_ttfa).append(first or 0.0)
+
+        half = args.requests // 2
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(half)))
+        await nodes[0].invalidate_profile("profile-0")
+        await asyncio.gather(*(one(i) for i in range(half, args.requests)))
+        wall = time.perf_counter() - start
+        await asyncio.gather(*(node.flush() for node in nodes))
+
+    disk_hits = sum(node.disk_hits for node in nodes)
+    s3_hits = sum(node.s3_hits for node in nodes)
+    requests = args.requests
+    miss_mean = statistics.fmean(miss_ttfa) if miss_ttfa else 0.0
+    cached_mean = statistics.fmean(hit_ttfa + miss_ttfa)
+    all_chars = sum(len(text) for text in texts)
+    print(
+        f"{requests} requests, {args.phrases} phrases (zipf {args.zipf}), "
+        f"{args.profiles} voices, 2 nodes, {wall:.1f} s"
+    )
+    print(
+        f"  hit rate {(disk_hits + s3_hits) / requests:.1%} "
+        f"(disk {disk_hits / requests:.1%}, s3 {s3_hits / requests:.1%}), "
+        f"misses {len(miss_ttfa)}"
+    )
+    print(f"  {'time to first audio':<22}{'p50 ms':>9}{'p95 ms':>9}{'mean ms':>9}")
+    for name, values in (("hit", hit_ttfa), ("miss", miss_ttfa)):
+        print(
+            f"  {name:<22}{percentile(values, 50):9.1f}{percentile(values, 95):9.1f}"
+            f"{statistics.fmean(values) if values else 0.0:9.1f}"
+        )
+    print(
+        f"  mean latency {cached_mean:.0f} ms vs ~{miss_mean:.0f} ms uncached "
+        f"(saved {miss_mean - cached_mean:.0f} ms/request, "
+        f"{(miss_mean - cached_mean) * requests / 1000:.0f} s total)"
+    )
+    print(
+        f"  synthesized {polly.characters:,} of {all_chars:,} characters "
+        f"({1 - polly.characters / all_chars:.1%} saved)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--phrases", type=int, default=2000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Phrase popularity skew")
+    parser.add_argument("--profiles", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--disk-mib", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
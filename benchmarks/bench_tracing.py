@@ -0,0 +1,83 @@
+"""Measure per-call overhead of ``trace_function``.
+
+The same trivial sync and async functions are timed bare, with latency
+recording only (``xray=False``), and with an X-Ray subsegment per call under
+an open segment. The X-Ray emitter is replaced with a no-op, so no UDP is
+sent. Also reports the cost of one ``Histogram.record``.
+
+Usage:
+    python -m benchmarks.bench_tracing --calls 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+from aws_xray_sdk.core import xray_recorder
+
+from src.shared.metrics import Histogram
+from src.shared.tracing import trace_function
+
+
+class _NullEmitter:
+    def send_entity(self, entity) -> None:
+        pass
+
+    def set_daemon_address(self, address) -> None:
+        pass
+
+
+def per_call_us(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def per_call_async_us(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    xray_recorder.configure(sampling=False, emitter=_NullEmitter(), context_missing="LOG_ERROR")
+    xray_recorder.begin_segment("bench")
+
+    def bare() -> int:
+        return 1
+
+    async def bare_async() -> int:
+        return 1
+
+    variants = {
+        "bare": (bare, bare_async),
+        "histogram only": (
+            trace_function("bench_sync", xray=False)(bare),
+            trace_function("bench_async", xray=False)(bare_async),
+        ),
+        "histogram + x-ray": (
+            trace_function("bench_sync_xray", xray=True)(bare),
+            trace_function("bench_async_xray", xray=True)(bare_async),
+        ),
+    }
+    # Subsegments pile up under one segment; keep the X-Ray run shorter
+    xray_calls = min(args.calls, 20_000)
+    for label, (sync_func, async_func) in variants.items():
+        calls = xray_calls if "x-ray" in label else args.calls
+        sync_us = per_call_us(sync_func, calls)
+        async_us = asyncio.run(per_call_async_us(async_func, calls))
+        print(f"{label:<18} sync {sync_us:6.2f} us/call  async {async_us:6.2f} us/call")
+
+    histogram = Histogram()
+    print(f"Histogram.record   {per_call_us(lambda: histogram.record(12.5), args.calls):6.2f} us")
+    xray_recorder.end_segment()
+
+
+if __name__ == "__main__":
+    main()
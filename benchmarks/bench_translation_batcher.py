@@ -0,0 +1,120 @@
+"""Benchmark one Translate call per segment against the adaptive micro-batcher.
+
+Sessions emit bursts of 1 to ``--burst`` short segments at random
+intervals across a few language pairs, like the phrases of one utterance.
+The fake Translate endpoint has a fixed round trip plus per-character cost,
+and serves a limited number of calls at once, which stands in for the
+account's throughput limit. Batches only join segments of the same session,
+so the gain comes from the bursts. Segments that miss their deadline
+count as failed.
+
+Usage:
+    python -m benchmarks.bench_translation_batcher --sessions 600 --seconds 5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from src.services.translation.batcher import TranslationBatcher
+from src.shared.async_aws_clients import AsyncTranslateClient
+from src.shared.errors import UniVoiceError
+from src.shared.resilience import get_circuit_breaker
+from src.shared.fakes import FakeTranslateClient
+
+PAIRS = (("en", "es"), ("en", "fr"), ("es", "en"))
+PHRASES = (
+    "Could you say that again please",
+    "My account number is on the form",
+    "We will start the lesson in five minutes",
+    "Thank you for waiting",
+    "The printer on the second floor is not working",
+)
+
+
+class _Manager:
+    def __init__(self, client: FakeTranslateClient):
+        self.client = client
+
+    async def get_client(self, service_name: str) -> FakeTranslateClient:
+        return self.client
+
+
+async def run(mode: str, sessions: int, seconds: float, rate: float, args) -> dict:
+    # Each run starts with a closed breaker, whatever the previous one left behind
+    get_circuit_breaker.cache_clear()
+    fake = FakeTranslateClient(
+        latency=args.latency_ms / 1000,
+        latency_per_char=args.per_char_us / 1e6,
+        max_concurrency=args.concurrency,
+    )
+    client = AsyncTranslateClient(manager=_Manager(fake))
+    batcher = TranslationBatcher(client, max_wait_ms=args.max_wait_ms)
+    latencies: list[float] = []
+    failures = 0
+
+    async def translate(text: str, source: str, target: str, session_id: str) -> None:
+        nonlocal failures
+        start = time.perf_counter()
+        try:
+            if mode == "per-segment":
+                await client.translate_text(text, source, target)
+            else:
+                await batcher.translate(text, source, target, session_id=session_id)
+        except UniVoiceError:
+            failures += 1
+            return
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    async def session(seed: int) -> None:
+        rng = random.Random(seed)
+        source, target = rng.choice(PAIRS)
+        pending = []
+        at = rng.expovariate(rate)
+        while at < seconds:
+            await asyncio.sleep(max(0.0, start + at - time.perf_counter()))
+            for _ in range(rng.randint(1, args.burst)):
+                text = f"{rng.choice(PHRASES)} {rng.randrange(1000)}"
+                pending.append(asyncio.create_task(translate(text, source, target, f"s{seed}")))
+            at += rng.expovariate(rate)
+        await asyncio.gather(*pending)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return {
+        "segments": len(latencies),
+        "calls": fake.call_count,
+        "failed": failures,
+        "throughput": len(latencies) / elapsed,
+        "p50": np.percentile(latencies or [np.nan], 50),
+        "p99": np.percentile(latencies or [np.nan], 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=600)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=1.0, help="Bursts/s per session")
+    parser.add_argument("--burst", type=int, default=4, help="Most segments per burst")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Fake call round trip")
+    parser.add_argument("--per-char-us", type=float, default=20.0, help="Fake cost per char")
+    parser.add_argument("--concurrency", type=int, default=20, help="Fake calls served at once")
+    parser.add_argument("--max-wait-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    for mode in ("per-segment", "batched"):
+        r = asyncio.run(run(mode, args.sessions, args.seconds, args.rate, args))
+        print(
+            f"{mode:<12} {r['segments']:>6} segments in {r['calls']:>6} calls  "
+            f"{r['failed']:>5} failed  "
+            f"{r['throughput']:7.0f} segments/s  p50 {r['p50']:7.1f} ms  p99 {r['p99']:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Measure what the voice activity gate saves and the latency it adds.
+
+The corpus is synthetic: harmonic, syllable-modulated "speech" bursts
+separated by pauses over background noise at several levels. The report
+covers bytes saved, speech kept, how late each utterance start and end is
+signalled relative to the true boundary, and CPU cost per frame.
+
+Usage:
+    python -m benchmarks.bench_vad --utterances 200 --frame-ms 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.services.audio_ingress.vad import VadEventType, VadGate
+
+RATE = 16000
+NOISE_LEVELS_DBFS = (-70, -55, -45)
+
+
+def build_corpus(utterances: int, noise_dbfs: float, seed: int = 0):
+    """Return int16 PCM bytes and the true (start, end) of each utterance in ms."""
+    rng = np.random.default_rng(seed)
+    pieces, boundaries, position = [], [], 0
+    for _ in range(utterances):
+        pause = int(rng.uniform(0.3, 3.0) * RATE)
+        length = int(rng.uniform(0.4, 4.0) * RATE)
+        t = np.arange(length) / RATE
+        pitch = rng.uniform(90, 250)
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 10))
+        envelope = np.abs(np.sin(np.pi * rng.uniform(3, 6) * t)) ** 0.5
+        loudness = 10 ** (rng.uniform(-30, -12) / 20)
+        pieces += [np.zeros(pause), loudness * voiced * envelope]
+        onset = position + pause
+        boundaries.append((onset * 1000 / RATE, (onset + length) * 1000 / RATE))
+        position += pause + length
+    pieces.append(np.zeros(RATE))
+    signal = np.concatenate(pieces)
+    signal += rng.normal(0, 10 ** (noise_dbfs / 20), signal.size)
+    pcm = (np.clip(signal, -1, 32767 / 32768) * 32768).astype("<i2").tobytes()
+    return pcm, boundaries
+
+
+def run(pcm: bytes, boundaries, frame_ms: int) -> dict:
+    gate = VadGate(RATE)
+    step = RATE * frame_ms // 1000 * 2
+    starts, ends, kept = [], [], 0.0
+    start = time.perf_counter()
+    for offset in range(0, len(pcm), step):
+        emitted_at = (offset + step) * 1000 / (RATE * 2)
+        for event in gate.process(pcm[offset:offset + step]):
+            if event.type is VadEventType.UTTERANCE_START:
+                starts.append((event.timestamp_ms, emitted_at))
+            elif event.type is VadEventType.UTTERANCE_END:
+                ends.append(emitted_at)
+            else:
+                first = event.timestamp_ms
+                last = first + len(event.data) * 1000 / (RATE * 2)
+                kept += sum(max(0.0, min(last, e) - max(first, s)) for s, e in boundaries)
+    elapsed = time.perf_counter() - start
+    gate.close()
+
+    onset_delay, end_delay, clipped = [], [], 0
+    for s, e in boundaries:
+        opened = [(ts, at) for ts, at in starts if ts <= e and at >= s]
+        closed = [at for at in ends if at >= e]
+        if opened:
+            onset_delay.append(opened[0][1] - s)
+            clipped += opened[0][0] > s
+        if closed:
+            end_delay.append(closed[0] - e)
+    speech_ms = sum(e - s for s, e in boundaries)
+    return {
+        "saved": gate.bytes_saved / gate.bytes_in,
+        "kept": kept / speech_ms,
+        "utterances": gate.utterances,
+        "clipped": clipped,
+        "onset_p50": np.percentile(onset_delay, 50),
+        "onset_p95": np.percentile(onset_delay, 95),
+        "end_p50": np.percentile(end_delay, 50),
+        "us_per_frame": elapsed / (len(pcm) / step) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--utterances", type=int, default=200)
+    parser.add_argument("--frame-ms", type=int, default=100, help="Frame size fed to the gate")
+    args = parser.parse_args()
+
+    for noise in NOISE_LEVELS_DBFS:
+        pcm, boundaries = build_corpus(args.utterances, noise)
+        r = run(pcm, boundaries, args.frame_ms)
+        print(
+            f"noise {noise:>4} dBFS: {r['saved']:6.1%} bytes saved, {r['kept']:6.1%} speech kept, "
+            f"{r['utterances']:>4}/{len(boundaries)} utterances ({r['clipped']} clipped)  "
+            f"start signalled +{r['onset_p50']:.0f}/{r['onset_p95']:.0f} ms p50/p95, "
+            f"end +{r['end_p50']:.0f} ms p50  {r['us_per_frame']:.0f} us/frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Benchmark predictive model warm-up against on-demand model loading.
+
+Sessions arrive over ``--minutes`` of simulated time, each with 2-4 speakers
+drawn from a population of returning voice profiles. Speakers start talking
+10-90 s after joining, pause ~25 s between utterances and sometimes go quiet
+for several minutes. Each translated utterance reaches synthesis 0.6-1.0 s
+after it starts, and synthesis takes 0.5 s on a warm model.
+
+The fake endpoint holds ``--capacity`` models, unloads a model after 10
+minutes without use and takes ``--load-s`` to load a cold one. The same
+workload runs twice: once loading models on demand, and once with
+``WarmupScheduler`` fed the speaker events and sized to the endpoint's
+capacity. Simulated time runs ``--speed`` times faster than real time.
+
+The report gives, from the endpoint's side:
+- cold-start rate for first utterances and for all utterances, and the
+  share that caught a load already in flight ("warming")
+- first utterances over the 2 s budget
+- warm-up calls and endpoint seconds spent on them
+
+Usage:
+    python -m benchmarks.bench_warmup --minutes 60 --capacity 96
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import structlog
+
+from src.services.session_manager.registry import SessionEvent, SessionEventType
+from src.services.voice_cloning.warmup import WarmupScheduler
+
+BUDGET_S = 2.0
+SYNTHESIS_S = 0.5
+PRIMER_S = 0.2
+MODEL_IDLE_S = 600.0
+
+
+class FakeEndpoint:
+    """Model host with limited memory, idle unloading and slow cold loads."""
+
+    def __init__(self, capacity: int, load_s: float, clock: Callable[[], float], speed: float):
+        self.capacity = capacity
+        self.load_s = load_s
+        self.clock = clock
+        self.speed = speed
+        self.loaded: OrderedDict[str, float] = OrderedDict()  # profile -> last use
+        self.loading: dict[str, asyncio.Future] = {}
+        self.warm_calls = 0
+        self.warm_seconds = 0.0
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds / self.speed)
+
+    async def _ensure(self, profile_id: str) -> str:
+        """Load a model if needed; returns the state it was found in."""
+        now = self.clock()
+        last = self.loaded.get(profile_id)
+        if last is not None and now - last < MODEL_IDLE_S:
+            self.loaded[profile_id] = now
+            self.loaded.move_to_end(profile_id)
+            return "warm"
+        self.loaded.pop(profile_id, None)
+        pending = self.loading.get(profile_id)
+        if pending is not None:
+            await pending
+            return "warming"
+        pending = self.loading[profile_id] = asyncio.get_running_loop().create_future()
+        try:
+            await self.sleep(self.load_s)
+        finally:
+            del self.loading[profile_id]
+            pending.set_result(None)
+        self.loaded[profile_id] = self.clock()
+        while len(self.loaded) > self.capacity:
+            self.loaded.popitem(last=False)
+        return "cold"
+
+    async def synthesize(self, profile_id: str) -> tuple[str, float]:
+        start = self.clock()
+        state = await self._ensure(profile_id)
+        load = self.clock() - start
+        await self.sleep(SYNTHESIS_S)
+        return state, load
+
+    async def warm(self, profile_id: str) -> None:
+        start = self.clock()
+        await self._ensure(profile_id)
+        await self.sleep(PRIMER_S)
+        self.warm_calls += 1
+        self.warm_seconds += self.clock() - start
+
+    async def unload(self, profile_id: str) -> None:
+        self.loaded.pop(profile_id, None)
+
+
+async def run(args: argparse.Namespace, predictive: bool) -> dict[str, float]:
+    rng = random.Random(args.seed)
+    start = time.monotonic()
+
+    def clock() -> float:
+        return (time.monotonic() - start) * args.speed
+
+    endpoint = FakeEndpoint(args.capacity, args.load_s, clock, args.speed)
+    scheduler: Optional[WarmupScheduler] = None
+    if predictive:
+        scheduler = WarmupScheduler(
+            endpoint.warm,
+            unload=endpoint.unload,
+            max_profiles=args.capacity,
+            ttl_seconds=MODEL_IDLE_S,
+            keepalive_seconds=480,
+            idle_seconds=300,
+            keepalive_per_minute=30,
+            concurrency=8,
+            clock=clock,
+        )
+    results = {"first": 0, "first_cold": 0, "first_late": 0, "uses": 0, "cold": 0, "warming": 0}
+
+    def emit(kind: SessionEventType, session_id: str, profile_id: str) -> None:
+        if scheduler is not None:
+            scheduler.on_session_event(SessionEvent(kind, session_id, profile_id, clock()))
+
+    async def utterance(
+        session_id: str, profile_id: str, first: bool, rng: random.Random
+    ) -> None:
+        emit(SessionEventType.SPEAKER_ACTIVE, session_id, profile_id)
+        before = rng.uniform(0.6, 1.0)
+        await endpoint.sleep(before)
+        if scheduler is not None:
+            scheduler.record_use(profile_id)
+        state, load = await endpoint.synthesize(profile_id)
+        results["uses"] += 1
+        results["cold"] += state == "cold"
+        results["warming"] += state == "warming"
+        if first:
+            results["first"] += 1
+            results["first_cold"] += state == "cold"
+            results["first_late"] += before + load + SYNTHESIS_S > BUDGET_S
+
+    async def speaker(
+        session_id: str, profile_id: str, end: float, rng: random.Random
+    ) -> None:
+        emit(SessionEventType.SPEAKER_JOINED, session_id, profile_id)
+        await endpoint.sleep(rng.uniform(10, 90))
+        first = True
+        while clock() < end:
+            await utterance(session_id, profile_id, first, rng)
+            first = False
+            if rng.random() < 0.15:
+                await endpoint.sleep(rng.uniform(400, 1200))
+            else:
+                await endpoint.sleep(rng.expovariate(1 / 25))
+        emit(SessionEventType.SPEAKER_LEFT, session_id, profile_id)
+
+    async def ticker() -> None:
+        while True:
+            await endpoint.sleep(5)
+            scheduler.tick()
+
+    tick_task = asyncio.create_task(ticker()) if scheduler is not None else None
+    speakers = []
+    horizon = args.minutes * 60
+    arrival, index = 0.0, 0
+    while True:
+        arrival += rng.expovariate(args.sessions_per_minute / 60)
+        if arrival >= horizon:
+            break
+        await endpoint.sleep(max(0.0, arrival - clock()))
+        end = arrival + rng.uniform(600, 2400)
+        for _ in range(rng.randint(2, 4)):
+            profile_id = f"profile-{rng.randrange(args.population)}"
+            # Each speaker draws from its own stream, so both runs see the same workload
+            own = random.Random(rng.random())
+            speakers.append(asyncio.create_task(speaker(f"s{index}", profile_id, end, own)))
+        index += 1
+    await asyncio.gather(*speakers)
+    if tick_task is not None:
+        tick_task.cancel()
+        await scheduler.close()
+
+    return {
+        "sessions": index,
+        "first_cold": results["first_cold"] / max(1, results["first"]),
+        "cold": results["cold"] / max(1, results["uses"]),
+        "warming": results["warming"] / max(1, results["uses"]),
+        "first_late": results["first_late"] / max(1, results["first"]),
+        "utterances": results["uses"],
+        "calls": endpoint.warm_calls,
+        "spend": endpoint.warm_seconds,
+        "hours": clock() / 3600,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    on_demand = await run(args, predictive=False)
+    predictive = await run(args, predictive=True)
+    print(
+        f"{on_demand['sessions']} sessions over {args.minutes} min, "
+        f"{on_demand['utterances']} utterances, endpoint capacity {args.capacity} models, "
+        f"cold load {args.load_s} s"
+    )
+    print(
+        f"  {'mode':<12}{'first cold':>11}{'all cold':>10}{'warming':>9}{'first >2s':>11}"
+        f"{'warm calls':>12}{'warm s/h':>10}"
+    )
+    for name, result in (("on-demand", on_demand), ("predictive", predictive)):
+        print(
+            f"  {name:<12}{result['first_cold']:11.1%}{result['cold']:10.1%}"
+            f"{result['warming']:9.1%}{result['first_late']:11.1%}{result['calls']:12d}"
+            f"{result['spend'] / result['hours']:10.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=int, default=60)
+    parser.add_argument("--sessions-per-minute", type=float, default=2.0)
+    parser.add_argument("--population", type=int, default=600, help="Distinct voice profiles")
+    parser.add_argument("--capacity", type=int, default=96, help="Models the endpoint holds")
+    parser.add_argument("--load-s", type=float, default=1.5, help="Cold model load time")
+    parser.add_argument("--speed", type=float, default=200.0, help="Simulated seconds per second")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,502 @@
+"""Encode-once fan-out of synthesized audio to every listener of a session.
+
+One translated stream can reach many listeners, e.g. a classroom (DESIGN.md
+keeps ``ws-session:{sessionId}:connections`` as a set). Each synthesized
+chunk is framed and packed into a single buffer exactly once, however many
+listeners there are. Every listener's send queue then holds read-only
+``memoryview`` slices of that shared buffer, so the per-listener cost is a
+queue entry and a send, never a copy.
+
+A per-session pacer releases frames at real-time rate, at most
+``AUDIO_EGRESS_LEAD_MS`` ahead of playback, which caps what a client has to
+buffer. Each listener's queue is bounded by ``AUDIO_EGRESS_QUEUE_FRAMES``.
+A listener that falls a full queue behind is handled by
+``AUDIO_EGRESS_SLOW_POLICY``: ``drop_oldest`` discards its oldest frames and
+``disconnect`` closes it.
+
+Frames on the wire are an ``>II`` header (frame sequence number, media time
+in ms since the stream started) followed by ``AUDIO_EGRESS_FRAME_MS`` of
+16-bit PCM.
+"""
+
+import asyncio
+import struct
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.services.audio_ingress.jitter_buffer import pcm_bytes
+from src.shared.config import get_settings
+from src.shared.errors import ValidationError
+from src.shared.logging import get_logger
+from src.shared.metrics import get_metrics_registry
+from src.shared.redis_client import get_redis_client
+
+logger = get_logger(__name__)
+
+CONNECTIONS_KEY = "ws-session:{session_id}:connections"
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+POLICIES = (DROP_OLDEST, DISCONNECT)
+
+FRAME_HEADER = struct.Struct(">II")
+
+Send = Callable[[memoryview], Awaitable[Any]]
+Close = Callable[[], Awaitable[Any]]
+
+
+class FrameEncoder:
+    """
+    Cuts a session's PCM stream into headered frames, once per chunk.
+
+    A tail that does not fill a whole frame is carried into the next chunk, so
+    frame boundaries do not depend on how synthesis chunked the stream.
+
+    Args:
+        frame_bytes: PCM bytes per frame
+        frame_ms: Frame duration, for the media-time header field
+    """
+
+    def __init__(self, frame_bytes: int, frame_ms: int):
+        if frame_bytes <= 0 or frame_ms <= 0:
+            raise ValueError("frame_bytes and frame_ms must be positive")
+        self.frame_bytes = frame_bytes
+        self.frame_ms = frame_ms
+        self.packet_bytes = FRAME_HEADER.size + frame_bytes
+        self.sequence = 0
+        self._carry = b""
+
+    def encode(self, audio: bytes, flush: bool = True) -> list[memoryview]:
+        """
+        Pack audio into frames that share one buffer.
+
+        Args:
+            audio: 16-bit PCM
+            flush: Pad the trailing partial frame with silence and emit it
+                (end of utterance); pass False for chunks of an utterance
+                that is still being synthesized
+
+        Returns:
+            One read-only view per frame, header included
+        """
+        if self._carry:
+            audio = self._carry + audio
+        count, tail = divmod(len(audio), self.frame_bytes)
+        self._carry = b""
+        if tail and flush:
+            count += 1
+        elif tail:
+            self._carry = bytes(audio[count * self.frame_bytes:])
+
+        header = FRAME_HEADER.size
+        packet = self.packet_bytes
+        buffer = bytearray(count * packet)  # zero-filled, so the padding is silence
+        source = memoryview(audio)
+        for index in range(count):
+            offset = index * packet
+            sequence = self.sequence + index
+            FRAME_HEADER.pack_into(
+                buffer, offset, sequence & 0xFFFFFFFF, sequence * self.frame_ms & 0xFFFFFFFF
+            )
+            chunk = source[index * self.frame_bytes:(index + 1) * self.frame_bytes]
+            buffer[offset + header:offset + header + len(chunk)] = chunk
+        self.sequence += count
+
+        view = memoryview(buffer).toreadonly()
+        return [view[offset:offset + packet] for offset in range(0, len(buffer), packet)]
+
+
+class Listener:
+    """
+    One connection's bounded send queue and the task that drains it.
+
+    Args:
+        connection_id: WebSocket connection ID
+        send: Coroutine function sending one binary message
+        close: Coroutine function called once when the listener stops, for
+            any reason (unsubscribe, slow-consumer disconnect, send failure)
+        max_frames: Queue bound
+        policy: ``drop_oldest`` or ``disconnect`` when the queue is full
+    """
+
+    def __init__(
+        self,
+        connection_id: str,
+        send: Send,
+        close: Optional[Close] = None,
+        max_frames: int = 50,
+        policy: str = DROP_OLDEST,
+    ):
+        self.connection_id = connection_id
+        self.max_frames = max_frames
+        self.policy = policy
+        self.closed = False
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self._send = send
+        self._close = close
+        self._closer: Optional[asyncio.Future] = None
+        self._done = asyncio.Event()
+        self._queue: deque[memoryview] = deque()
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        self._task.add_done_callback(self._finished)
+
+        metrics = get_metrics_registry()
+        self._dropped = metrics.counter("egress_frames_dropped_total")
+        self._disconnects = metrics.counter("egress_slow_disconnects_total")
+
+    @property
+    def queued(self) -> int:
+        """Frames waiting to be sent."""
+        return len(self._queue)
+
+    def offer(self, frame: memoryview) -> bool:
+        """
+        Queue a frame, applying the slow-consumer policy if the queue is full.
+
+        Args:
+            frame: Shared frame view
+
+        Returns:
+            False if the listener has stopped or was just disconnected
+        """
+        if self.closed:
+            return False
+        queue = self._queue
+        if len(queue) >= self.max_frames:
+            if self.policy == DISCONNECT:
+                logger.info(
+                    "Disconnecting slow egress listener",
+                    connection_id=self.connection_id,
+                    queued=len(queue),
+                )
+                self._disconnects.inc()
+                self.stop()
+                return False
+            queue.popleft()
+            self.frames_dropped += 1
+            self._dropped.inc()
+        queue.append(frame)
+        self._ready.set()
+        return True
+
+    def stop(self) -> None:
+        """Stop sending and drop queued frames; the close callback follows."""
+        if not self.closed:
+            self.closed = True
+            self._queue.clear()
+            self._task.cancel()
+
+    async def wait_closed(self) -> None:
+        """Wait until the writer has exited and the close callback has run."""
+        await self._done.wait()
+
+    async def _run(self) -> None:
+        queue = self._queue
+        ready = self._ready
+        send = self._send
+        while True:
+            while not queue:
+                ready.clear()
+                await ready.wait()
+            await send(queue.popleft())
+            self.frames_sent += 1
+
+    def _finished(self, task: asyncio.Task) -> None:
+        # Runs as a done callback so the close callback fires even if the
+        # writer was cancelled before its first step
+        self.closed = True
+        self._queue.clear()
+        if not task.cancelled() and task.exception() is not None:
+            logger.info(
+                "Egress send failed",
+                connection_id=self.connection_id,
+                error=str(task.exception()),
+            )
+        if self._close is None:
+            self._done.set()
+        else:
+            self._closer = asyncio.ensure_future(self._run_close())
+
+    async def _run_close(self) -> None:
+        try:
+            await self._close()
+        except Exception as e:
+            logger.warning(
+                "Egress close callback failed", connection_id=self.connection_id, error=str(e)
+            )
+        finally:
+            self._done.set()
+
+
+class SessionBroadcaster:
+    """
+    Fans one session's synthesized audio out to all of its listeners.
+
+    Args:
+        session_id: Session ID
+        sample_rate: Sample rate of the synthesized PCM (defaults to
+            AUDIO_SAMPLE_RATE)
+        frame_ms: Frame duration (defaults to AUDIO_EGRESS_FRAME_MS)
+        lead_ms: How far ahead of real time frames may be sent (defaults to
+            AUDIO_EGRESS_LEAD_MS)
+        queue_frames: Per-listener queue bound (defaults to
+            AUDIO_EGRESS_QUEUE_FRAMES)
+        policy: Slow-consumer policy (defaults to AUDIO_EGRESS_SLOW_POLICY)
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        sample_rate: Optional[int] = None,
+        frame_ms: Optional[int] = None,
+        lead_ms: Optional[int] = None,
+        queue_frames: Optional[int] = None,
+        policy: Optional[str] = None,
+    ):
+        settings = get_settings()
+        self.session_id = session_id
+        self.frame_ms = frame_ms or settings.audio_egress_frame_ms
+        self.lead_ms = settings.audio_egress_lead_ms if lead_ms is None else lead_ms
+        self.queue_frames = queue_frames or settings.audio_egress_queue_frames
+        self.policy = policy or settings.audio_egress_slow_policy
+        if self.policy not in POLICIES:
+            raise ValidationError(
+                "Unknown slow-consumer policy",
+                details={"policy": self.policy, "allowed": list(POLICIES)},
+            )
+        burst = self.lead_ms // self.frame_ms + 1
+        if self.queue_frames < burst:
+            # A healthy listener receives the whole lead window at once
+            raise ValidationError(
+                "Egress queue shorter than the lead window",
+                details={"queue_frames": self.queue_frames, "lead_frames": burst},
+            )
+        self.encoder = FrameEncoder(
+            pcm_bytes(self.frame_ms, sample_rate or settings.audio_sample_rate), self.frame_ms
+        )
+        self.listeners: dict[str, Listener] = {}
+        self._pending: deque[memoryview] = deque()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        metrics = get_metrics_registry()
+        self._released = metrics.counter("egress_frames_released_total")
+        self._listener_count = metrics.gauge("egress_listeners")
+
+    @property
+    def pending(self) -> int:
+        """Frames encoded but not yet released to listeners."""
+        return len(self._pending)
+
+    def subscribe(
+        self, connection_id: str, send: Send, close: Optional[Close] = None
+    ) -> Listener:
+        """
+        Add a listener; it receives frames released from now on.
+
+        A connection ID that is already subscribed is replaced.
+
+        Args:
+            connection_id: WebSocket connection ID
+            send: Coroutine function sending one binary message
+            close: Coroutine function called once when the listener stops
+
+        Returns:
+            The new listener
+        """
+        self.unsubscribe(connection_id)
+        listener = Listener(connection_id, send, close, self.queue_frames, self.policy)
+        self.listeners[connection_id] = listener
+        self._listener_count.inc()
+        return listener
+
+    def unsubscribe(self, connection_id: str) -> Optional[Listener]:
+        """
+        Remove a listener and stop its writer.
+
+        Returns:
+            The removed listener, or None if it was not subscribed
+        """
+        listener = self.listeners.pop(connection_id, None)
+        if listener is not None:
+            listener.stop()
+            self._listener_count.dec()
+        return listener
+
+    def publish(self, audio: bytes, flush: bool = True) -> int:
+        """
+        Encode a synthesized chunk once and queue it for paced release.
+
+        Args:
+            audio: 16-bit PCM at the session's sample rate
+            flush: Emit the trailing partial frame (see ``FrameEncoder.encode``)
+
+        Returns:
+            Number of frames queued
+        """
+        frames = self.encoder.encode(audio, flush)
+        if frames:
+            self._pending.extend(frames)
+            self._wake.set()
+            if self._task is None:
+                self._task = asyncio.create_task(self._pace())
+        return len(frames)
+
+    async def drain(self) -> None:
+        """Wait until every queued frame has been released to the listeners."""
+        while self._pending:
+            await asyncio.sleep(self.frame_ms / 1000)
+
+    async def close(self) -> None:
+        """Stop pacing and disconnect every listener."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._pending.clear()
+        listeners = [self.unsubscribe(connection_id) for connection_id in list(self.listeners)]
+        await asyncio.gather(*(listener.wait_closed() for listener in listeners if listener))
+
+    async def _pace(self) -> None:
+        loop = asyncio.get_running_loop()
+        frame_s = self.frame_ms / 1000
+        lead_s = self.lead_ms / 1000
+        pending = self._pending
+        # Playout time of the next frame to release
+        next_at = loop.time()
+        while True:
+            if not pending:
+                self._wake.clear()
+                await self._wake.wait()
+                # After a pause, playout restarts now rather than catching up
+                next_at = max(next_at, loop.time())
+            now = loop.time()
+            released = 0
+            while pending and next_at <= now + lead_s:
+                self._release(pending.popleft())
+                next_at += frame_s
+                released += 1
+            if released:
+                self._released.inc(released)
+            if pending:
+                await asyncio.sleep(next_at - lead_s - now)
+
+    def _release(self, frame: memoryview) -> None:
+        stopped = None
+        for connection_id, listener in self.listeners.items():
+            if not listener.offer(frame):
+                stopped = stopped or []
+                stopped.append(connection_id)
+        if stopped:
+            for connection_id in stopped:
+                self.unsubscribe(connection_id)
+
+
+class EgressHub:
+    """
+    Node-level egress: one broadcaster per session with live listeners.
+
+    Listener membership is mirrored into the Redis set
+    ``ws-session:{sessionId}:connections``; Redis failures are logged and
+    never interrupt audio delivery.
+
+    Args:
+        redis: Redis client for the connection sets
+        **broadcaster_options: Passed to every ``SessionBroadcaster``
+    """
+
+    def __init__(self, redis: Optional[Redis] = None, **broadcaster_options: Any):
+        self.redis = redis or get_redis_client()
+        self.sessions: dict[str, SessionBroadcaster] = {}
+        self._options = broadcaster_options
+
+    def broadcaster(self, session_id: str) -> SessionBroadcaster:
+        """Broadcaster for a session, created on first use."""
+        broadcaster = self.sessions.get(session_id)
+        if broadcaster is None:
+            broadcaster = SessionBroadcaster(session_id, **self._options)
+            self.sessions[session_id] = broadcaster
+        return broadcaster
+
+    async def subscribe(
+        self,
+        session_id: str,
+        connection_id: str,
+        send: Send,
+        close: Optional[Close] = None,
+    ) -> Listener:
+        """
+        Attach a connection to a session's translated audio.
+
+        Args:
+            session_id: Session ID
+            connection_id: WebSocket connection ID
+            send: Coroutine function sending one binary message
+            close: Coroutine function called once when the listener stops
+
+        Returns:
+            The new listener
+        """
+
+        async def stopped() -> None:
+            await self._forget(session_id, connection_id)
+            if close is not None:
+                await close()
+
+        listener = self.broadcaster(session_id).subscribe(connection_id, send, stopped)
+        try:
+            await self.redis.sadd(CONNECTIONS_KEY.format(session_id=session_id), connection_id)
+        except RedisError as e:
+            logger.warning(
+                "Egress connection register failed", session_id=session_id, error=str(e)
+            )
+        return listener
+
+    def unsubscribe(self, session_id: str, connection_id: str) -> None:
+        """Detach a connection ($disconnect); its Redis entry is removed as it stops."""
+        broadcaster = self.sessions.get(session_id)
+        if broadcaster is not None:
+            broadcaster.unsubscribe(connection_id)
+
+    def publish(self, session_id: str, audio: bytes, flush: bool = True) -> int:
+        """
+        Send synthesized audio to every listener of a session.
+
+        Returns:
+            Number of frames queued (0 if nobody is listening)
+        """
+        broadcaster = self.sessions.get(session_id)
+        if broadcaster is None or not broadcaster.listeners:
+            return 0
+        return broadcaster.publish(audio, flush)
+
+    async def close_session(self, session_id: str) -> None:
+        """Disconnect every listener of an ended session."""
+        broadcaster = self.sessions.pop(session_id, None)
+        if broadcaster is not None:
+            await broadcaster.close()
+
+    async def _forget(self, session_id: str, connection_id: str) -> None:
+        broadcaster = self.sessions.get(session_id)
+        if broadcaster is not None and connection_id in broadcaster.listeners:
+            return  # Replaced by a newer subscription under the same ID
+        try:
+            await self.redis.srem(CONNECTIONS_KEY.format(session_id=session_id), connection_id)
+        except RedisError as e:
+            logger.warning(
+                "Egress connection removal failed", session_id=session_id, error=str(e)
+            )
+
+
+@lru_cache()
+def get_egress_hub() -> EgressHub:
+    """Get cached egress hub for this node."""
+    return EgressHub()
@@ -0,0 +1,334 @@
+"""Per-connection jitter buffer and frame reassembler for incoming PCM audio.
+
+Clients send ``AudioChunk``s every 50 ms with a ``sequenceNumber``. Chunks can
+arrive late, out of order, duplicated or not at all, while the transcriber
+wants a steady stream of fixed-size frames. Both stages work on preallocated
+``bytearray`` rings through ``memoryview``s so the per-chunk path copies audio
+once and allocates no new buffers.
+"""
+
+from array import array
+from typing import Optional
+
+from src.shared.config import get_settings
+from src.shared.errors import ValidationError
+
+SAMPLE_WIDTH_BYTES = 2  # 16-bit PCM
+
+
+def pcm_bytes(duration_ms: int, sample_rate: int, channels: int = 1) -> int:
+    """
+    Size in bytes of a 16-bit PCM buffer.
+
+    Args:
+        duration_ms: Duration in milliseconds
+        sample_rate: Samples per second
+        channels: Interleaved channel count
+
+    Returns:
+        Byte count, always a whole number of samples
+    """
+    return sample_rate * duration_ms // 1000 * channels * SAMPLE_WIDTH_BYTES
+
+
+class FrameAssembler:
+    """
+    Re-frames a byte stream into fixed-size frames on a preallocated ring.
+
+    The ring holds a whole number of frames and reads always start on a frame
+    boundary, so every frame is a contiguous slice of the ring and is handed
+    out without copying. A returned view stays valid until the next write.
+    When the consumer falls behind, the oldest whole frames are dropped.
+
+    Args:
+        frame_bytes: Output frame size
+        capacity_frames: Frames the ring can hold before dropping
+    """
+
+    def __init__(self, frame_bytes: int, capacity_frames: int = 16):
+        if frame_bytes <= 0 or capacity_frames <= 0:
+            raise ValueError("frame_bytes and capacity_frames must be positive")
+        self.frame_bytes = frame_bytes
+        self.capacity = frame_bytes * capacity_frames
+        self._ring = bytearray(self.capacity)
+        self._view = memoryview(self._ring)
+        self._silence = memoryview(bytes(self.capacity))
+        self._read = 0
+        self._write = 0
+        self.frames_dropped = 0
+
+    @property
+    def available(self) -> int:
+        """Bytes written but not yet read."""
+        return self._write - self._read
+
+    @property
+    def frames_ready(self) -> int:
+        """Complete frames waiting to be read."""
+        return (self._write - self._read) // self.frame_bytes
+
+    def write(self, data: memoryview) -> None:
+        """
+        Append bytes to the ring.
+
+        Args:
+            data: Bytes-like object no larger than the ring
+        """
+        size = len(data)
+        if size > self.capacity:
+            raise ValueError(f"Write of {size} bytes exceeds ring capacity {self.capacity}")
+        overflow = self._write - self._read + size - self.capacity
+        if overflow > 0:
+            dropped = -(-overflow // self.frame_bytes)
+            self._read += dropped * self.frame_bytes
+            self.frames_dropped += dropped
+
+        position = self._write % self.capacity
+        end = position + size
+        if end <= self.capacity:
+            self._view[position:end] = data
+        else:
+            first = self.capacity - position
+            source = memoryview(data)
+            self._view[position:] = source[:first]
+            self._view[:size - first] = source[first:]
+        self._write += size
+
+    def write_silence(self, size: int) -> None:
+        """Append ``size`` bytes of digital silence."""
+        self.write(self._silence[:size])
+
+    def read_frame(self) -> Optional[memoryview]:
+        """
+        Take the next complete frame.
+
+        Returns:
+            View onto the ring holding one frame, or None if none is ready
+        """
+        position = self._read
+        if self._write - position < self.frame_bytes:
+            return None
+        self._read = position + self.frame_bytes
+        position %= self.capacity
+        return self._view[position:position + self.frame_bytes]
+
+    def read_partial(self) -> Optional[memoryview]:
+        """
+        Take whatever is left after the last complete frame (end of stream).
+
+        Returns:
+            View onto the remaining bytes, or None if the ring is empty
+        """
+        remaining = self.available
+        if remaining == 0:
+            return None
+        if remaining >= self.frame_bytes:
+            return self.read_frame()
+        position = self._read % self.capacity
+        self._read += remaining
+        # Consume up to the next frame boundary so later reads stay aligned
+        self._write = self._read = self._read + (-self._read % self.frame_bytes)
+        return self._view[position:position + remaining]
+
+
+class JitterBuffer:
+    """
+    Reorders sequenced audio chunks and conceals gaps with silence.
+
+    Chunks are held in a ring of ``depth`` slots indexed by sequence number.
+    Contiguous chunks are released to the ``FrameAssembler`` as soon as they
+    arrive; a chunk ``depth`` or more ahead of the next expected one forces
+    the oldest slots out, filling any that never arrived with silence. Late
+    and duplicate chunks are dropped. Gaps longer than ``max_gap_chunks``
+    (e.g., after a client reconnect) resynchronise without emitting silence.
+    Frames returned by ``read_frame`` are views that stay valid until the
+    next ``push``.
+
+    Args:
+        chunk_bytes: Largest expected chunk size
+        frame_bytes: Output frame size
+        depth: Chunks held for reordering (adds ``depth - 1`` chunks of latency
+            in the worst case)
+        max_gap_chunks: Longest gap concealed with silence
+    """
+
+    def __init__(
+        self,
+        chunk_bytes: int,
+        frame_bytes: int,
+        depth: int = 6,
+        max_gap_chunks: int = 20,
+    ):
+        if chunk_bytes <= 0 or depth <= 0:
+            raise ValueError("chunk_bytes and depth must be positive")
+        self.chunk_bytes = chunk_bytes
+        self.depth = depth
+        self.max_gap_chunks = max_gap_chunks
+        self._slots = bytearray(chunk_bytes * depth)
+        self._slot_view = memoryview(self._slots)
+        self._slot_sizes = array("i", [-1] * depth)
+        self._next: Optional[int] = None
+
+        # Room for the longest concealed gap on top of a full reorder window, so
+        # silence never pushes held audio out, plus a few frames of consumer lag
+        window_frames = -(-chunk_bytes * (depth + max_gap_chunks + 1) // frame_bytes)
+        self.frames = FrameAssembler(frame_bytes, capacity_frames=window_frames + 4)
+        self.read_frame = self.frames.read_frame
+
+        self.chunks_received = 0
+        self.chunks_out_of_order = 0
+        self.chunks_late = 0
+        self.chunks_duplicate = 0
+        self.chunks_concealed = 0
+        self.resyncs = 0
+
+    @property
+    def next_sequence(self) -> Optional[int]:
+        """Sequence number the buffer is waiting for."""
+        return self._next
+
+    def push(self, sequence: int, data: bytes) -> int:
+        """
+        Add a chunk and release everything that is now in order.
+
+        Args:
+            sequence: Chunk ``sequenceNumber``
+            data: PCM bytes (at most ``chunk_bytes``)
+
+        Returns:
+            Number of complete frames ready to read
+        """
+        size = len(data)
+        if size > self.chunk_bytes:
+            raise ValidationError(
+                "Audio chunk too large",
+                details={"size": size, "max_size": self.chunk_bytes, "sequence": sequence},
+            )
+        self.chunks_received += 1
+        if self._next is None:
+            self._next = sequence
+        elif sequence < self._next:
+            self.chunks_late += 1
+            return self.frames.frames_ready
+
+        if sequence - self._next > self.depth + self.max_gap_chunks:
+            self._resync(sequence)
+        elif sequence >= self._next + self.depth:
+            self._advance(sequence - self.depth + 1)
+            self._drain()
+
+        frames = self.frames
+        slot = sequence % self.depth
+        if self._slot_sizes[slot] >= 0:
+            self.chunks_duplicate += 1
+        elif sequence == self._next:
+            # In-order fast path: straight into the frame ring, skipping the slot copy
+            frames.write(data)
+            self._next = sequence + 1
+            if self._slot_sizes[self._next % self.depth] >= 0:
+                self._drain()
+        else:
+            self.chunks_out_of_order += 1
+            offset = slot * self.chunk_bytes
+            self._slot_view[offset:offset + size] = data
+            self._slot_sizes[slot] = size
+        return frames.frames_ready
+
+    def release_overdue(self) -> int:
+        """
+        Stop waiting for the missing chunk at the head of the buffer.
+
+        Call this from the connection's playout timer when the next expected
+        chunk is overdue; the gap up to the oldest held chunk is concealed.
+
+        Returns:
+            Number of complete frames ready to read
+        """
+        held = self._held_sequences()
+        if held:
+            self._advance(min(held))
+            self._drain()
+        return self.frames.frames_ready
+
+    def flush(self) -> int:
+        """
+        Release every held chunk, concealing gaps between them (end of stream).
+
+        Returns:
+            Number of complete frames ready to read
+        """
+        held = self._held_sequences()
+        if held:
+            self._advance(max(held) + 1)
+        return self.frames.frames_ready
+
+    def stats(self) -> dict[str, int]:
+        """Counters for this connection."""
+        return {
+            "chunks_received": self.chunks_received,
+            "chunks_out_of_order": self.chunks_out_of_order,
+            "chunks_late": self.chunks_late,
+            "chunks_duplicate": self.chunks_duplicate,
+            "chunks_concealed": self.chunks_concealed,
+            "resyncs": self.resyncs,
+            "frames_dropped": self.frames.frames_dropped,
+        }
+
+    def _held_sequences(self) -> list[int]:
+        if self._next is None:
+            return []
+        return [
+            self._next + i
+            for i in range(self.depth)
+            if self._slot_sizes[(self._next + i) % self.depth] >= 0
+        ]
+
+    def _emit(self, slot: int) -> None:
+        offset = slot * self.chunk_bytes
+        self.frames.write(self._slot_view[offset:offset + self._slot_sizes[slot]])
+        self._slot_sizes[slot] = -1
+
+    def _drain(self) -> None:
+        slot = self._next % self.depth
+        while self._slot_sizes[slot] >= 0:
+            self._emit(slot)
+            self._next += 1
+            slot = self._next % self.depth
+
+    def _advance(self, target: int) -> None:
+        """Move the head to ``target``, emitting held chunks and concealing the rest."""
+        while self._next < target:
+            slot = self._next % self.depth
+            if self._slot_sizes[slot] >= 0:
+                self._emit(slot)
+            else:
+                self.chunks_concealed += 1
+                self.frames.write_silence(self.chunk_bytes)
+            self._next += 1
+
+    def _resync(self, sequence: int) -> None:
+        """Gap too long to conceal: keep what is held, then restart at ``sequence``."""
+        self.resyncs += 1
+        for held in self._held_sequences():
+            self._emit(held % self.depth)
+        self._next = sequence
+
+
+def create_jitter_buffer(sample_rate: Optional[int] = None, channels: int = 1) -> JitterBuffer:
+    """
+    Build a jitter buffer sized from the audio ingress settings.
+
+    Args:
+        sample_rate: Stream sample rate (defaults to AUDIO_SAMPLE_RATE)
+        channels: Interleaved channel count
+
+    Returns:
+        Jitter buffer for one connection
+    """
+    settings = get_settings()
+    sample_rate = sample_rate or settings.audio_sample_rate
+    return JitterBuffer(
+        chunk_bytes=pcm_bytes(settings.audio_chunk_ms, sample_rate, channels),
+        frame_bytes=pcm_bytes(settings.audio_frame_ms, sample_rate, channels),
+        depth=settings.audio_jitter_depth_chunks,
+    )
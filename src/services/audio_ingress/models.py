@@ -0,0 +1,47 @@
+"""Audio chunk type (DESIGN.md Audio Ingress Service interface)."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.shared.timing import TimingEnvelope, frame_record, split_record
+
+
+@dataclass(slots=True)
+class AudioChunk:
+    """One chunk of client audio."""
+
+    data: bytes
+    format: str  # 'wav', 'mp3' or 'opus'
+    sample_rate: int
+    channels: int
+    timestamp: float  # Unix ms, client clock
+    sequence_number: int
+    timing: Optional[TimingEnvelope] = None
+
+    def start_timing(self) -> TimingEnvelope:
+        """Open the chunk's latency waterfall at its capture time and enter ingress."""
+        self.timing = TimingEnvelope(self.timestamp)
+        self.timing.enter("ingress")
+        return self.timing
+
+    def to_record(self) -> bytes:
+        """Kinesis record payload: the timing envelope (if any), then the audio."""
+        if self.timing is not None:
+            self.timing.exit("ingress")
+        return frame_record(self.data, self.timing)
+
+
+def parse_audio_record(data: bytes) -> tuple[bytes, Optional[TimingEnvelope]]:
+    """
+    Split a Kinesis audio record and enter the STT stage on its envelope.
+
+    Args:
+        data: Record payload from ``AudioChunk.to_record``
+
+    Returns:
+        The audio bytes and the chunk's envelope (None for untimed records)
+    """
+    audio, timing = split_record(data)
+    if timing is not None:
+        timing.enter("stt")
+    return audio, timing
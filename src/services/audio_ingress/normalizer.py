@@ -0,0 +1,208 @@
+"""Streaming normalization of inbound PCM to the canonical 16 kHz mono int16.
+
+Clients may send int16 or float32 PCM at any rate of at least 16 kHz, in
+mono or interleaved stereo. Each stream gets a ``StreamNormalizer`` that
+downmixes to mono, resamples with a polyphase FIR filter and converts to
+int16. The filter's history is carried across chunk boundaries, so the
+output is identical to resampling the whole stream at once and has no
+clicks at chunk edges.
+
+Filter tables are shared by every stream with the same rate ratio. The
+per-stream state is only the last few dozen input samples and two counters.
+"""
+
+from functools import lru_cache
+from math import gcd
+from typing import Optional
+
+import numpy as np
+
+from src.shared.errors import ValidationError
+
+TARGET_SAMPLE_RATE = 16000
+HALF_LENGTH_PER_FACTOR = 10  # filter half-length in input samples per rate factor
+KAISER_BETA = 5.0
+
+_DTYPES = {"int16": np.dtype("<i2"), "float32": np.dtype("<f4")}
+
+
+@lru_cache(maxsize=None)
+def polyphase_filter(up: int, down: int) -> np.ndarray:
+    """
+    Kaiser-windowed sinc low-pass split into ``up`` polyphase branches.
+
+    The cutoff sits at the lower of the input and output Nyquist
+    frequencies, as in ``scipy.signal.resample_poly``.
+
+    Args:
+        up: Interpolation factor
+        down: Decimation factor
+
+    Returns:
+        Read-only (up, taps) table; row ``p`` holds the taps for phase ``p``
+        in the order they multiply consecutive input samples, oldest first
+    """
+    factor = max(up, down)
+    half_length = HALF_LENGTH_PER_FACTOR * factor
+    n = np.arange(-half_length, half_length + 1)
+    taps = np.sinc(n / factor) * np.kaiser(n.size, KAISER_BETA) * (up / factor)
+
+    per_phase = -(-taps.size // up)
+    padded = np.zeros(per_phase * up)
+    padded[: taps.size] = taps
+    # Row p, column k multiplies input (base - k); reverse so columns run oldest first
+    table = padded.reshape(per_phase, up).T[:, ::-1].astype(np.float32)
+    table.setflags(write=False)
+    return table
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler for mono float32 samples.
+
+    Output sample ``n`` is centred on input time ``n * down / up``, so the
+    filter adds a delay of about ``HALF_LENGTH_PER_FACTOR`` input samples
+    per rate factor but no phase shift.
+
+    Args:
+        input_rate: Input sample rate
+        output_rate: Output sample rate
+    """
+
+    def __init__(self, input_rate: int, output_rate: int):
+        common = gcd(input_rate, output_rate)
+        self.up = output_rate // common
+        self.down = input_rate // common
+        self._table = polyphase_filter(self.up, self.down)
+        self.taps = self._table.shape[1]
+        self._delay = HALF_LENGTH_PER_FACTOR * max(self.up, self.down)
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._consumed = 0
+        self._produced = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of input.
+
+        Args:
+            samples: Mono float32 input
+
+        Returns:
+            Every output sample whose filter window is now complete
+        """
+        up, down, taps = self.up, self.down, self.taps
+        buffer = np.concatenate((self._history, samples))
+        last = self._consumed + samples.size - 1
+        end = -(-((last + 1) * up - self._delay) // down)
+
+        n = np.arange(self._produced, max(end, self._produced))
+        position = n * down + self._delay
+        # Index in `buffer` of the oldest input sample each output depends on
+        start = position // up - self._consumed
+        windows = np.lib.stride_tricks.sliding_window_view(buffer, taps)
+        if up == 1:
+            output = windows[start] @ self._table[0]
+        else:
+            output = np.einsum("nk,nk->n", windows[start], self._table[position % up])
+
+        self._history = buffer[buffer.size - (taps - 1):].copy()
+        self._consumed += samples.size
+        self._produced = max(end, self._produced)
+        # Keep the counters small; (n * down + delay) // up is invariant under this shift
+        cycles = min(self._produced // up, self._consumed // down)
+        self._produced -= cycles * up
+        self._consumed -= cycles * down
+        return output.astype(np.float32, copy=False)
+
+    def flush(self) -> np.ndarray:
+        """Emit the remaining output by feeding silence through the filter (end of stream)."""
+        remaining = -(-self._consumed * self.up // self.down) - self._produced
+        if remaining <= 0:
+            return np.zeros(0, dtype=np.float32)
+        padding = np.zeros(-(-self._delay // self.up) + 1, dtype=np.float32)
+        return self.process(padding)[:remaining]
+
+
+class StreamNormalizer:
+    """
+    Converts one stream's chunks to 16 kHz mono int16 PCM.
+
+    Streams that already match the target format pass through untouched.
+
+    Args:
+        sample_rate: Input sample rate (at least 16 kHz)
+        channels: Interleaved input channel count
+        sample_format: 'int16' or 'float32'
+        target_rate: Output sample rate
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int = 1,
+        sample_format: str = "int16",
+        target_rate: int = TARGET_SAMPLE_RATE,
+    ):
+        if sample_format not in _DTYPES:
+            raise ValidationError(
+                "Unsupported sample format", details={"sample_format": sample_format}
+            )
+        if sample_rate < target_rate or channels < 1:
+            raise ValidationError(
+                "Unsupported audio layout",
+                details={"sample_rate": sample_rate, "channels": channels},
+            )
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_format = sample_format
+        self._dtype = _DTYPES[sample_format]
+        self._scale = (1 / 32768 if sample_format == "int16" else 1.0) / channels
+        self.passthrough = (
+            sample_rate == target_rate and channels == 1 and sample_format == "int16"
+        )
+        self._resampler: Optional[PolyphaseResampler] = (
+            PolyphaseResampler(sample_rate, target_rate) if sample_rate != target_rate else None
+        )
+
+    def process(self, data: bytes) -> bytes:
+        """
+        Normalize the next chunk.
+
+        Args:
+            data: Interleaved PCM in the stream's input format
+
+        Returns:
+            16 kHz mono int16 PCM (may be a sample shorter or longer than the
+            chunk's exact duration; the remainder is carried to the next call)
+        """
+        if self.passthrough:
+            return data
+        frame_bytes = self._dtype.itemsize * self.channels
+        if len(data) % frame_bytes:
+            raise ValidationError(
+                "Audio chunk is not a whole number of frames",
+                details={"size": len(data), "frame_bytes": frame_bytes},
+            )
+        interleaved = np.frombuffer(data, dtype=self._dtype).astype(np.float32)
+        samples = interleaved[:: self.channels]
+        for channel in range(1, self.channels):
+            # Strided adds are much faster than reshape(-1, channels).sum(axis=1)
+            samples = samples + interleaved[channel :: self.channels]
+        # Downmix averaging and int16 scaling folded into one multiply
+        samples *= np.float32(self._scale)
+        if self._resampler is not None:
+            samples = self._resampler.process(samples)
+        return _to_int16(samples)
+
+    def flush(self) -> bytes:
+        """Return the audio still held in the resampler (end of stream)."""
+        if self._resampler is None:
+            return b""
+        return _to_int16(self._resampler.flush())
+
+
+def _to_int16(samples: np.ndarray) -> bytes:
+    scaled = samples * np.float32(32768)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return scaled.astype("<i2").tobytes()
@@ -0,0 +1,418 @@
+"""Vectorized audio quality validation (``validateAudioQuality`` in DESIGN.md).
+
+Every inbound chunk is checked for sample rate, level, clipping and
+signal-to-noise ratio. Samples are read with ``np.frombuffer`` (no copy of the
+wire bytes) and a whole batch of chunks from many streams is reduced with a
+handful of ``ufunc.reduceat`` calls, so the cost per chunk is dominated by
+NumPy rather than the interpreter.
+
+The SNR is a running estimate per stream: a minimum-statistics noise floor
+over 10 ms frames that may rise only slowly, against a smoothed level of the
+frames that stand clearly above it.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from src.shared.config import get_settings
+
+FRAME_MS = 10
+SPEECH_MARGIN = 10 ** (3 / 10)  # frames 3 dB above the floor count as signal
+SPEECH_SMOOTHING = 0.2
+NOISE_FLOOR_RISE_DB_PER_SECOND = 3.0
+CLIP_LEVEL = 0.999
+MIN_POWER = 1e-10  # -100 dBFS
+SILENCE_DBFS = -60.0
+
+_DTYPES = {"int16": np.dtype("<i2"), "float32": np.dtype("<f4")}
+
+
+class PcmChunk(NamedTuple):
+    """One chunk of interleaved PCM from a stream."""
+
+    stream_id: str
+    data: bytes
+    sample_rate: int
+    channels: int = 1
+    sample_format: str = "int16"
+
+
+@dataclass(slots=True)
+class AudioQualityReport:
+    """Quality of one chunk (``AudioQualityReport`` in DESIGN.md)."""
+
+    is_valid: bool
+    sample_rate: int
+    signal_to_noise_ratio: float
+    clipping_detected: bool
+    rms_dbfs: float = -100.0
+    peak_dbfs: float = -100.0
+    clipping_ratio: float = 0.0
+    issues: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Serialize with the DESIGN.md field names."""
+        return {
+            "isValid": self.is_valid,
+            "sampleRate": self.sample_rate,
+            "signalToNoiseRatio": self.signal_to_noise_ratio,
+            "clippingDetected": self.clipping_detected,
+            "issues": list(self.issues),
+        }
+
+
+def _dbfs(power: np.ndarray) -> np.ndarray:
+    return 10 * np.log10(np.maximum(power, MIN_POWER))
+
+
+class AudioQualityValidator:
+    """
+    Validates PCM chunks and tracks a per-stream noise floor across calls.
+
+    Stream state is two floats kept in NumPy arrays indexed by a slot per
+    stream, so updating a whole batch is a gather, a few vector ops and a
+    scatter. Call ``forget`` when a connection closes to recycle its slot.
+    A low sample rate or heavy clipping makes a chunk invalid; LOW_SNR and
+    SILENT are reported as advisory issues.
+
+    Args:
+        min_sample_rate: Lowest accepted sample rate (Hz)
+        min_snr_db: SNR below which a stream carrying signal is flagged
+        max_clipping_ratio: Fraction of full-scale samples tolerated per chunk
+    """
+
+    def __init__(
+        self,
+        min_sample_rate: Optional[int] = None,
+        min_snr_db: Optional[float] = None,
+        max_clipping_ratio: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.min_sample_rate = min_sample_rate or settings.audio_min_sample_rate
+        self.min_snr_db = min_snr_db if min_snr_db is not None else settings.audio_min_snr_db
+        self.max_clipping_ratio = (
+            max_clipping_ratio
+            if max_clipping_ratio is not None
+            else settings.audio_max_clipping_ratio
+        )
+        self._slots: dict[str, int] = {}
+        self._free: list[int] = []
+        self._noise_floor = np.zeros(64)
+        self._signal_level = np.zeros(64)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def validate(
+        self,
+        stream_id: str,
+        data: bytes,
+        sample_rate: int,
+        channels: int = 1,
+        sample_format: str = "int16",
+    ) -> AudioQualityReport:
+        """
+        Validate a single chunk.
+
+        Args:
+            stream_id: Connection or session the chunk belongs to
+            data: Interleaved little-endian PCM
+            sample_rate: Samples per second per channel
+            channels: Channel count
+            sample_format: 'int16' or 'float32'
+
+        Returns:
+            Quality report for the chunk
+        """
+        chunk = PcmChunk(stream_id, data, sample_rate, channels, sample_format)
+        error = self._format_error(chunk)
+        if error is not None:
+            return self._invalid(chunk, error)
+        return self._validate_one(chunk)
+
+    def validate_batch(self, chunks: Sequence[PcmChunk]) -> list[AudioQualityReport]:
+        """
+        Validate chunks from many streams in one vectorized pass.
+
+        Chunks from the same stream are applied to its noise floor in order.
+
+        Args:
+            chunks: Chunks to validate
+
+        Returns:
+            One report per chunk, in input order
+        """
+        reports: list[Optional[AudioQualityReport]] = [None] * len(chunks)
+        rounds: list[list[int]] = []
+        seen: dict[str, int] = {}
+        for index, chunk in enumerate(chunks):
+            error = self._format_error(chunk)
+            if error is not None:
+                reports[index] = self._invalid(chunk, error)
+                continue
+            occurrence = seen.get(chunk.stream_id, 0)
+            seen[chunk.stream_id] = occurrence + 1
+            if occurrence == len(rounds):
+                rounds.append([])
+            rounds[occurrence].append(index)
+
+        for indexes in rounds:
+            for index, report in zip(indexes, self._validate_round([chunks[i] for i in indexes])):
+                reports[index] = report
+        return reports  # type: ignore[return-value]
+
+    def forget(self, stream_id: str) -> None:
+        """Drop the noise-floor state of a closed stream."""
+        slot = self._slots.pop(stream_id, None)
+        if slot is not None:
+            self._noise_floor[slot] = 0.0
+            self._signal_level[slot] = 0.0
+            self._free.append(slot)
+
+    @staticmethod
+    def _invalid(chunk: PcmChunk, issue: str) -> AudioQualityReport:
+        return AudioQualityReport(
+            is_valid=False,
+            sample_rate=chunk.sample_rate,
+            signal_to_noise_ratio=0.0,
+            clipping_detected=False,
+            issues=[issue],
+        )
+
+    def _report(
+        self,
+        chunk: PcmChunk,
+        snr_db: float,
+        clipping_ratio: float,
+        rms_db: float,
+        peak_db: float,
+        has_signal: bool,
+    ) -> AudioQualityReport:
+        issues = []
+        rate_ok = chunk.sample_rate >= self.min_sample_rate
+        if not rate_ok:
+            issues.append("SAMPLE_RATE_TOO_LOW")
+        clipping = clipping_ratio > self.max_clipping_ratio
+        if clipping:
+            issues.append("CLIPPING")
+        if has_signal and snr_db < self.min_snr_db:
+            issues.append("LOW_SNR")
+        if rms_db < SILENCE_DBFS:
+            issues.append("SILENT")
+        return AudioQualityReport(
+            is_valid=rate_ok and not clipping,
+            sample_rate=chunk.sample_rate,
+            signal_to_noise_ratio=snr_db,
+            clipping_detected=clipping,
+            rms_dbfs=rms_db,
+            peak_dbfs=peak_db,
+            clipping_ratio=clipping_ratio,
+            issues=issues,
+        )
+
+    def _format_error(self, chunk: PcmChunk) -> Optional[str]:
+        dtype = _DTYPES.get(chunk.sample_format)
+        if dtype is None or chunk.channels < 1 or chunk.sample_rate <= 0:
+            return "INVALID_AUDIO_FORMAT"
+        if not chunk.data or len(chunk.data) % (dtype.itemsize * chunk.channels):
+            return "INVALID_AUDIO_FORMAT"
+        return None
+
+    def _slot(self, stream_id: str) -> int:
+        slot = self._slots.get(stream_id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._slots)
+                if slot == len(self._noise_floor):
+                    self._noise_floor = np.resize(self._noise_floor, slot * 2)
+                    self._signal_level = np.resize(self._signal_level, slot * 2)
+                    self._noise_floor[slot:] = 0.0
+                    self._signal_level[slot:] = 0.0
+            self._slots[stream_id] = slot
+        return slot
+
+    def _samples(self, chunks: Sequence[PcmChunk]) -> tuple[np.ndarray, float]:
+        """
+        Decode a round of chunks into one float32 array.
+
+        Returns:
+            Samples and the factor that scales their squares to full-scale power
+        """
+        if all(chunk.sample_format == "int16" for chunk in chunks):
+            raw = [np.frombuffer(chunk.data, dtype=_DTYPES["int16"]) for chunk in chunks]
+            ints = raw[0] if len(raw) == 1 else np.concatenate(raw)
+            # Scaling is applied to the reduced powers instead of every sample
+            return ints.astype(np.float32), 1 / 32768**2
+        parts = []
+        for chunk in chunks:
+            values = np.frombuffer(chunk.data, dtype=_DTYPES[chunk.sample_format])
+            if chunk.sample_format == "int16":
+                values = values.astype(np.float32) * np.float32(1 / 32768)
+            parts.append(values)
+        return np.concatenate(parts), 1.0
+
+    def _reduce(
+        self,
+        squares: np.ndarray,
+        clip_power: float,
+        lengths: np.ndarray,
+        frame_lengths: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reduce squared samples per chunk and per 10 ms frame.
+
+        Rounds where every chunk has the same layout (the normal case) are
+        reduced through a reshape; otherwise with ``reduceat``, leaving the
+        missing trailing frames of shorter chunks as NaN.
+
+        Returns:
+            Mean power, peak power and clipping ratio per chunk, and frame
+            powers as a (chunks, frames) array
+        """
+        count = lengths.size
+        length = int(lengths[0])
+        frame_length = int(frame_lengths[0])
+        if (
+            length % frame_length == 0
+            and (lengths == length).all()
+            and (frame_lengths == frame_length).all()
+        ):
+            per_chunk = squares.reshape(count, length)
+            frame_power = per_chunk.reshape(count, -1, frame_length).mean(axis=2, dtype=np.float64)
+            power = frame_power.mean(axis=1)
+            peak = per_chunk.max(axis=1)
+            clipped = np.count_nonzero(per_chunk >= clip_power, axis=1) / length
+            return power, peak, clipped, frame_power
+
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        power = np.add.reduceat(squares, offsets, dtype=np.float64) / lengths
+        peak = np.maximum.reduceat(squares, offsets)
+        clipped = np.add.reduceat(squares >= clip_power, offsets) / lengths
+
+        frame_counts = -(-lengths // frame_lengths)
+        frame_chunk = np.repeat(np.arange(count), frame_counts)
+        first_frame = np.concatenate(([0], np.cumsum(frame_counts)[:-1]))
+        within = np.arange(frame_chunk.size) - first_frame[frame_chunk]
+        starts = offsets[frame_chunk] + within * frame_lengths[frame_chunk]
+        sizes = np.diff(np.append(starts, squares.size))
+        frame_power = np.full((count, int(frame_counts.max())), np.nan)
+        frame_power[frame_chunk, within] = (
+            np.add.reduceat(squares, starts, dtype=np.float64) / sizes
+        )
+        return power, peak, clipped, frame_power
+
+    def _validate_round(self, chunks: Sequence[PcmChunk]) -> list[AudioQualityReport]:
+        """Validate chunks that all belong to different streams."""
+        samples, scale = self._samples(chunks)
+        squares = np.square(samples)
+
+        meta = np.array(
+            [
+                (
+                    len(c.data) // _DTYPES[c.sample_format].itemsize,
+                    c.sample_rate,
+                    c.channels,
+                    self._slot(c.stream_id),
+                )
+                for c in chunks
+            ]
+        ).T
+        lengths, rates, channels, slots = meta
+        frame_lengths = np.maximum(rates * FRAME_MS // 1000 * channels, 1)
+        power, peak, clipped, frame_power = self._reduce(
+            squares, CLIP_LEVEL**2 / scale, lengths, frame_lengths
+        )
+        power *= scale
+        peak = peak.astype(np.float64) * scale
+        frame_power *= scale
+
+        # Minimum-statistics noise floor that may rise only slowly
+        floor = self._noise_floor[slots]
+        rise = 10 ** (NOISE_FLOOR_RISE_DB_PER_SECOND * lengths / (rates * channels) / 10)
+        chunk_min = np.maximum(np.fmin.reduce(frame_power, axis=1), MIN_POWER)
+        floor = np.where(floor > 0, np.minimum(floor * rise, chunk_min), chunk_min)
+
+        # Smoothed level of the frames that stand clearly above the floor
+        loud = frame_power > (floor * SPEECH_MARGIN)[:, None]
+        loud_frames = loud.sum(axis=1)
+        chunk_level = np.where(loud, frame_power, 0.0).sum(axis=1) / np.maximum(loud_frames, 1)
+        level = self._signal_level[slots]
+        smoothed = np.where(
+            level > 0, level + SPEECH_SMOOTHING * (chunk_level - level), chunk_level
+        )
+        level = np.where(loud_frames > 0, smoothed, level)
+
+        self._noise_floor[slots] = floor
+        self._signal_level[slots] = level
+
+        snr = np.where(level > 0, _dbfs(level) - _dbfs(floor), 0.0)
+        return [
+            self._report(chunk, snr_db, ratio, rms, peak_db, has_signal)
+            for chunk, snr_db, ratio, rms, peak_db, has_signal in zip(
+                chunks,
+                np.round(snr, 2).tolist(),
+                clipped.tolist(),
+                np.round(_dbfs(power), 2).tolist(),
+                np.round(_dbfs(peak), 2).tolist(),
+                (level > 0).tolist(),
+            )
+        ]
+
+    def _validate_one(self, chunk: PcmChunk) -> AudioQualityReport:
+        """
+        Scalar twin of ``_validate_round`` for a single chunk.
+
+        Small arrays make per-call NumPy overhead dominate, so the per-stream
+        state is updated with Python floats instead of vector ops.
+        """
+        values = np.frombuffer(chunk.data, dtype=_DTYPES[chunk.sample_format])
+        scale = 1.0
+        if chunk.sample_format == "int16":
+            values = values.astype(np.float32)
+            scale = 1 / 32768**2
+        squares = np.square(values)
+        length = squares.size
+        frame_length = max(chunk.sample_rate * FRAME_MS // 1000 * chunk.channels, 1)
+        whole = length - length % frame_length
+
+        frame_power = squares[:whole].reshape(-1, frame_length).mean(axis=1, dtype=np.float64)
+        if whole < length:
+            tail = squares[whole:].mean(dtype=np.float64)
+            frame_power = np.append(frame_power, tail)
+            power = float(squares.sum(dtype=np.float64)) / length * scale
+        else:
+            power = float(frame_power.mean()) * scale
+        frame_power *= scale
+        peak = float(squares.max()) * scale
+        clipping_ratio = int(np.count_nonzero(squares >= CLIP_LEVEL**2 / scale)) / length
+
+        slot = self._slot(chunk.stream_id)
+        floor = float(self._noise_floor[slot])
+        level = float(self._signal_level[slot])
+        duration = length / (chunk.sample_rate * chunk.channels)
+        rise = 10 ** (NOISE_FLOOR_RISE_DB_PER_SECOND * duration / 10)
+        chunk_min = max(float(frame_power.min()), MIN_POWER)
+        floor = min(floor * rise, chunk_min) if floor > 0 else chunk_min
+
+        loud = frame_power > floor * SPEECH_MARGIN
+        loud_frames = int(np.count_nonzero(loud))
+        if loud_frames:
+            chunk_level = float(frame_power[loud].sum()) / loud_frames
+            level = level + SPEECH_SMOOTHING * (chunk_level - level) if level > 0 else chunk_level
+        self._noise_floor[slot] = floor
+        self._signal_level[slot] = level
+
+        snr = 10 * math.log10(max(level, MIN_POWER) / floor) if level > 0 else 0.0
+        return self._report(
+            chunk,
+            round(snr, 2),
+            clipping_ratio,
+            round(10 * math.log10(max(power, MIN_POWER)), 2),
+            round(10 * math.log10(max(peak, MIN_POWER)), 2),
+            level > 0,
+        )
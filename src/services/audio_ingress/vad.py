@@ -0,0 +1,192 @@
+"""Voice activity gate between audio ingress and the speech-to-text pipeline.
+
+Silence between utterances is dropped before it reaches Kinesis, which
+saves shard capacity and Transcribe minutes and keeps real speech from
+queueing behind it. The detector is deliberately cheap. A 10 ms window counts
+as speech when its energy stands ``threshold_db`` above a tracked noise
+floor and its spectrum is not noise-flat. A short pre-roll is replayed at
+each onset so word beginnings are not clipped, and a hangover keeps short
+pauses and unvoiced sounds inside the utterance.
+"""
+
+from collections import deque
+from enum import Enum
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from src.services.audio_ingress.quality import MIN_POWER, NOISE_FLOOR_RISE_DB_PER_SECOND
+from src.shared.config import get_settings
+
+WINDOW_MS = 10
+
+
+class VadEventType(str, Enum):
+    """Kinds of events emitted by the gate."""
+
+    AUDIO = "AUDIO"
+    UTTERANCE_START = "UTTERANCE_START"
+    UTTERANCE_END = "UTTERANCE_END"
+
+
+class VadEvent(NamedTuple):
+    """Gate output: audio to publish or an utterance boundary."""
+
+    type: VadEventType
+    utterance_id: int
+    timestamp_ms: float
+    data: bytes = b""
+
+
+class VadGate:
+    """
+    Energy/spectral-flatness voice activity gate with pre-roll and hangover.
+
+    Feed 16-bit mono PCM in any frame size; only audio inside utterances is
+    returned. Timestamps are milliseconds of stream audio since the first
+    frame.
+
+    Args:
+        sample_rate: Input sample rate
+        threshold_db: Energy above the noise floor that counts as speech
+        onset_ms: Consecutive speech needed to open an utterance
+        hangover_ms: Non-speech tolerated before an utterance closes
+        pre_roll_ms: Audio before the onset replayed when an utterance opens
+        max_flatness: Spectral flatness above which a window is treated as noise
+        min_level_dbfs: Absolute level below which nothing counts as speech
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        threshold_db: Optional[float] = None,
+        onset_ms: Optional[int] = None,
+        hangover_ms: Optional[int] = None,
+        pre_roll_ms: Optional[int] = None,
+        max_flatness: float = 0.5,
+        min_level_dbfs: float = -55.0,
+    ):
+        settings = get_settings()
+        self.window_samples = sample_rate * WINDOW_MS // 1000
+        self.window_bytes = self.window_samples * 2
+        threshold_db = threshold_db if threshold_db is not None else settings.audio_vad_threshold_db
+        self._threshold = 10 ** (threshold_db / 10)
+        self._min_power = 10 ** (min_level_dbfs / 10)
+        self._rise = 10 ** (NOISE_FLOOR_RISE_DB_PER_SECOND * WINDOW_MS / 1000 / 10)
+        self.max_flatness = max_flatness
+        self.onset_windows = max(1, (onset_ms or settings.audio_vad_onset_ms) // WINDOW_MS)
+        self.hangover_windows = max(1, (hangover_ms or settings.audio_vad_hangover_ms) // WINDOW_MS)
+        pre_roll = pre_roll_ms if pre_roll_ms is not None else settings.audio_vad_pre_roll_ms
+        self.pre_roll_windows = pre_roll // WINDOW_MS
+
+        self._noise_floor = 0.0
+        self._carry = b""
+        self._windows = 0
+        self._onset = 0
+        self._hangover = 0
+        self._in_speech = False
+        self._pending: deque[bytes] = deque(maxlen=self.pre_roll_windows + self.onset_windows)
+        self.utterances = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def in_utterance(self) -> bool:
+        return self._in_speech
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    def _classify(self, samples: np.ndarray) -> np.ndarray:
+        """Speech decision for each whole window in ``samples``."""
+        windows = samples.reshape(-1, self.window_samples)
+        power = np.mean(np.square(windows, dtype=np.float64), axis=1)
+
+        spectrum = np.square(np.abs(np.fft.rfft(windows, axis=1)[:, 1:])) + MIN_POWER
+        flatness = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+
+        # Minimum-statistics floor as in quality.py, updated once per call
+        quietest = max(float(power.min()), MIN_POWER)
+        floor = self._noise_floor
+        floor = min(floor * self._rise ** power.size, quietest) if floor > 0 else quietest
+        self._noise_floor = floor
+        return (
+            (power > floor * self._threshold)
+            & (power > self._min_power)
+            & (flatness < self.max_flatness)
+        )
+
+    def process(self, data: bytes) -> list[VadEvent]:
+        """
+        Gate the next block of audio.
+
+        Args:
+            data: 16-bit mono PCM
+
+        Returns:
+            Events in stream order; consecutive published audio is coalesced
+            into a single AUDIO event
+        """
+        self.bytes_in += len(data)
+        buffer = self._carry + data if self._carry else data
+        whole = len(buffer) - len(buffer) % self.window_bytes
+        self._carry = bytes(buffer[whole:])
+        if not whole:
+            return []
+
+        samples = np.frombuffer(buffer, dtype="<i2", count=whole // 2).astype(np.float32)
+        active = self._classify(samples * np.float32(1 / 32768)).tolist()
+
+        events: list[VadEvent] = []
+        out = bytearray()
+        view = memoryview(buffer)
+        window_bytes = self.window_bytes
+        for index, speech in enumerate(active):
+            window = view[index * window_bytes:(index + 1) * window_bytes]
+            self._windows += 1
+            if self._in_speech:
+                out += window
+                if speech:
+                    self._hangover = self.hangover_windows
+                    continue
+                self._hangover -= 1
+                if self._hangover == 0:
+                    self._in_speech = False
+                    self._flush(events, out)
+                    events.append(
+                        VadEvent(VadEventType.UTTERANCE_END, self.utterances, self._now())
+                    )
+                continue
+
+            self._pending.append(bytes(window))
+            self._onset = self._onset + 1 if speech else 0
+            if self._onset >= self.onset_windows:
+                self._in_speech = True
+                self._onset = 0
+                self._hangover = self.hangover_windows
+                self.utterances += 1
+                start = self._now() - len(self._pending) * WINDOW_MS
+                events.append(VadEvent(VadEventType.UTTERANCE_START, self.utterances, start))
+                out += b"".join(self._pending)
+                self._pending.clear()
+
+        self._flush(events, out)
+        return events
+
+    def close(self) -> list[VadEvent]:
+        """End the stream, closing an open utterance."""
+        if not self._in_speech:
+            return []
+        self._in_speech = False
+        return [VadEvent(VadEventType.UTTERANCE_END, self.utterances, self._now())]
+
+    def _now(self) -> float:
+        return float(self._windows * WINDOW_MS)
+
+    def _flush(self, events: list[VadEvent], out: bytearray) -> None:
+        if out:
+            start = self._now() - len(out) // self.window_bytes * WINDOW_MS
+            events.append(VadEvent(VadEventType.AUDIO, self.utterances, start, bytes(out)))
+            self.bytes_out += len(out)
+            out.clear()
@@ -0,0 +1,407 @@
+"""Sharded in-process session registry with consistent-hash routing.
+
+Every session is owned by exactly one node, chosen by a consistent-hash
+ring with virtual nodes. That node runs the session's ingress, STT and
+egress work and keeps the hot session state in process. Admission control
+caps each node at ``MAX_CONCURRENT_SESSIONS`` live sessions.
+
+Redis holds only two things. One is the ring membership, a hash of node id
+to last heartbeat; nodes silent for ``PRUNE_AFTER_TTLS`` node TTLs are
+removed from it. The other is hand-off records for sessions that move
+when a node joins or leaves. When membership changes, each node sends off
+the sessions it no longer owns as a hand-off record. The new owner claims
+the record when the session next reaches it. Only about ``1/N`` of the
+sessions move when one node joins or leaves.
+
+Observers (e.g., model warm-up) subscribe with ``add_listener`` to speaker
+events: a speaker joining a hosted session, starting an utterance, or
+leaving because the session ended or moved to another node.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import socket
+import time
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.shared.cache import decode_value, encode_value
+from src.shared.config import get_settings
+from src.shared.errors import ResourceNotFoundError, SessionCapacityError
+from src.shared.logging import get_logger
+from src.shared.metrics import get_metrics_registry
+from src.shared.redis_client import get_redis_client
+
+logger = get_logger(__name__)
+
+MEMBERS_KEY = "session-ring:members"
+HANDOFF_KEY = "session-handoff:{session_id}"
+PRUNE_AFTER_TTLS = 5  # node TTLs of silence before a member is removed from the hash
+
+
+class SessionEventType(str, Enum):
+    """Speaker lifecycle signals."""
+
+    SPEAKER_JOINED = "SPEAKER_JOINED"
+    SPEAKER_ACTIVE = "SPEAKER_ACTIVE"
+    SPEAKER_LEFT = "SPEAKER_LEFT"
+
+
+class SessionEvent(NamedTuple):
+    """Speaker signal delivered to registry listeners."""
+
+    type: SessionEventType
+    session_id: str
+    profile_id: str
+    at: float  # time.monotonic()
+
+
+SessionListener = Callable[[SessionEvent], None]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring mapping keys to nodes through virtual nodes.
+
+    Args:
+        nodes: Initial node ids
+        vnodes: Points each node places on the ring
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = 160):
+        self.vnodes = vnodes
+        self._nodes: set[str] = set(nodes)
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        self._rebuild()
+
+    @property
+    def nodes(self) -> frozenset[str]:
+        return frozenset(self._nodes)
+
+    def _rebuild(self) -> None:
+        points = sorted(
+            (_hash(f"{node}#{replica}"), node)
+            for node in self._nodes
+            for replica in range(self.vnodes)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def add_node(self, node: str) -> None:
+        """Place a node on the ring."""
+        if node not in self._nodes:
+            self._nodes.add(node)
+            self._rebuild()
+
+    def remove_node(self, node: str) -> None:
+        """Take a node off the ring."""
+        if node in self._nodes:
+            self._nodes.discard(node)
+            self._rebuild()
+
+    def set_nodes(self, nodes: Iterable[str]) -> bool:
+        """
+        Replace the membership.
+
+        Returns:
+            True if the membership changed
+        """
+        nodes = set(nodes)
+        if nodes == self._nodes:
+            return False
+        self._nodes = nodes
+        self._rebuild()
+        return True
+
+    def node_for(self, key: str) -> Optional[str]:
+        """Node owning a key: the first ring point clockwise from its hash."""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _hash(key))
+        return self._owners[index if index < len(self._owners) else 0]
+
+
+class SessionRegistry:
+    """
+    Per-node registry of the sessions this node owns.
+
+    Call ``start()`` to join the ring and keep membership fresh, and
+    ``close()`` to leave it gracefully, handing every session off.
+
+    Args:
+        node_id: Routable id of this node (e.g., task address)
+        redis: Redis client for membership and hand-off records
+        max_sessions: Live sessions this node admits
+        vnodes: Virtual nodes per ring member
+    """
+
+    def __init__(
+        self,
+        node_id: str,
+        redis: Optional[Redis] = None,
+        max_sessions: Optional[int] = None,
+        vnodes: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.node_id = node_id
+        self.redis = redis or get_redis_client()
+        self.max_sessions = max_sessions or settings.max_concurrent_sessions
+        self.heartbeat_interval = settings.session_heartbeat_seconds
+        self.node_ttl = settings.session_node_ttl_seconds
+        self.handoff_ttl = settings.session_handoff_ttl_seconds
+        self.ring = HashRing([node_id], vnodes or settings.session_ring_vnodes)
+        self.sessions: dict[str, dict[str, Any]] = {}
+        # Admits awaiting their hand-off claim; they hold a slot already
+        self._pending: dict[str, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: list[SessionListener] = []
+
+        metrics = get_metrics_registry()
+        self._active = metrics.gauge("session_registry_active_sessions")
+        self._ring_size = metrics.gauge("session_ring_nodes")
+        self._rejected = metrics.counter("session_admission_rejected_total")
+        self._handoffs = metrics.counter("session_handoffs_total")
+        self._claims = metrics.counter("session_handoff_claims_total")
+
+    def owner(self, session_id: str) -> str:
+        """Node that should serve a session."""
+        return self.ring.node_for(session_id) or self.node_id
+
+    def is_local(self, session_id: str) -> bool:
+        """Whether this node owns a session."""
+        return self.owner(session_id) == self.node_id
+
+    def get(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Hot state of a session hosted here."""
+        return self.sessions.get(session_id)
+
+    async def admit(
+        self, session_id: str, state: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Host a session on this node, resuming handed-off state if any.
+
+        Callers route with ``owner()`` first; this only enforces capacity.
+
+        Args:
+            session_id: Session ID
+            state: Initial state for a new session
+
+        Returns:
+            The session's hot state
+
+        Raises:
+            SessionCapacityError: If the node is full
+        """
+        hosted = self.sessions.get(session_id)
+        if hosted is not None:
+            return hosted
+        pending = self._pending.get(session_id)
+        if pending is not None:
+            # Share the first admit's claim instead of claiming (and overwriting) it again
+            hosted = await asyncio.shield(pending)
+            return hosted if hosted is not None else await self.admit(session_id, state)
+        if len(self.sessions) + len(self._pending) >= self.max_sessions:
+            self._rejected.inc()
+            raise SessionCapacityError(self.node_id, self.max_sessions)
+
+        # Reserve the slot and session id before yielding to the claim
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[session_id] = pending
+        try:
+            claimed = await self._claim(session_id)
+        except BaseException:
+            # Free the slot; waiters see None and admit afresh
+            del self._pending[session_id]
+            pending.set_result(None)
+            raise
+        del self._pending[session_id]
+        hosted = self.sessions.get(session_id)
+        if hosted is None:
+            hosted = claimed if claimed is not None else dict(state or {})
+            self.sessions[session_id] = hosted
+            self._active.set(len(self.sessions))
+            self._emit_speakers(SessionEventType.SPEAKER_JOINED, session_id, hosted)
+        pending.set_result(hosted)
+        return hosted
+
+    def release(self, session_id: str) -> None:
+        """Drop a session that has ended."""
+        hosted = self.sessions.pop(session_id, None)
+        if hosted is not None:
+            self._active.set(len(self.sessions))
+            self._emit_speakers(SessionEventType.SPEAKER_LEFT, session_id, hosted)
+
+    def add_listener(self, listener: SessionListener) -> None:
+        """Deliver speaker events to ``listener``, synchronously and in order."""
+        self._listeners.append(listener)
+
+    def add_speaker(self, session_id: str, speaker: dict[str, Any]) -> None:
+        """
+        Add a speaker to a hosted session.
+
+        Args:
+            session_id: Session ID
+            speaker: DESIGN.md ``SpeakerInfo`` (``speakerId``, ``voiceProfileId``, ...)
+
+        Raises:
+            ResourceNotFoundError: If the session is not hosted here
+        """
+        hosted = self.sessions.get(session_id)
+        if hosted is None:
+            raise ResourceNotFoundError("session", session_id)
+        hosted.setdefault("speakers", {})[speaker["speakerId"]] = speaker
+        self._emit(SessionEventType.SPEAKER_JOINED, session_id, speaker)
+
+    def speaker_active(self, session_id: str, speaker_id: str) -> None:
+        """
+        Record that a speaker started an utterance (VAD ``UTTERANCE_START``).
+
+        Args:
+            session_id: Session ID
+            speaker_id: Speaker ID within the session
+        """
+        speakers = (self.sessions.get(session_id) or {}).get("speakers")
+        speaker = speakers.get(speaker_id) if isinstance(speakers, dict) else None
+        if speaker is None:
+            return
+        speaker["utteranceCount"] = speaker.get("utteranceCount", 0) + 1
+        self._emit(SessionEventType.SPEAKER_ACTIVE, session_id, speaker)
+
+    def _emit(
+        self, event_type: SessionEventType, session_id: str, speaker: dict[str, Any]
+    ) -> None:
+        profile_id = speaker.get("voiceProfileId")
+        if not profile_id or not self._listeners:
+            return
+        event = SessionEvent(event_type, session_id, profile_id, time.monotonic())
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(
+                    "Session listener failed",
+                    session_id=session_id,
+                    event_type=event_type.value,
+                    error=str(e),
+                )
+
+    def _emit_speakers(
+        self, event_type: SessionEventType, session_id: str, hosted: dict[str, Any]
+    ) -> None:
+        speakers = hosted.get("speakers")
+        if isinstance(speakers, dict):
+            for speaker in speakers.values():
+                self._emit(event_type, session_id, speaker)
+
+    async def heartbeat(self) -> None:
+        """Record this node as alive in the ring membership."""
+        await self.redis.hset(MEMBERS_KEY, self.node_id, str(time.time()))
+
+    async def refresh(self) -> list[str]:
+        """
+        Reload ring membership and hand off sessions this node no longer owns.
+
+        Returns:
+            IDs of the sessions handed off
+        """
+        members = await self.redis.hgetall(MEMBERS_KEY)
+        now = time.time()
+        live: set[str] = set()
+        dead: list[str] = []
+        for node, seen in members.items():
+            node = node.decode() if isinstance(node, bytes) else node
+            age = now - float(seen)
+            if age <= self.node_ttl:
+                live.add(node)
+            elif age > self.node_ttl * PRUNE_AFTER_TTLS and node != self.node_id:
+                dead.append(node)
+        if dead:
+            # A node that comes back re-adds itself on its next heartbeat
+            await self.redis.hdel(MEMBERS_KEY, *dead)
+            logger.info("Pruned dead ring members", node=self.node_id, pruned=sorted(dead))
+        live.add(self.node_id)
+        if self.ring.set_nodes(live):
+            self._ring_size.set(len(live))
+            logger.info("Session ring membership changed", node=self.node_id, nodes=sorted(live))
+        # Recomputed every time so a hand-off that failed last refresh is retried
+        moved = [session_id for session_id in self.sessions if not self.is_local(session_id)]
+        await self._hand_off(moved)
+        return moved
+
+    async def start(self) -> None:
+        """Join the ring and keep heartbeating and refreshing membership."""
+        if self._task is not None:
+            return
+        await self.heartbeat()
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Leave the ring, handing every hosted session to its next owner."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.redis.hdel(MEMBERS_KEY, self.node_id)
+        self.ring.remove_node(self.node_id)
+        await self._hand_off(list(self.sessions))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.heartbeat()
+                await self.refresh()
+            except RedisError as e:
+                logger.warning("Session ring refresh failed", node=self.node_id, error=str(e))
+            except Exception as e:
+                # Never let the heartbeat loop die, or the node drops out of the ring
+                logger.error("Session ring refresh failed", node=self.node_id, error=str(e))
+
+    async def _hand_off(self, session_ids: list[str]) -> None:
+        if not session_ids:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.set(
+                    HANDOFF_KEY.format(session_id=session_id),
+                    encode_value(self.sessions[session_id]),
+                    ex=self.handoff_ttl,
+                )
+            await pipe.execute()
+        for session_id in session_ids:
+            hosted = self.sessions.pop(session_id)
+            self._emit_speakers(SessionEventType.SPEAKER_LEFT, session_id, hosted)
+        self._handoffs.inc(len(session_ids))
+        self._active.set(len(self.sessions))
+
+    async def _claim(self, session_id: str) -> Optional[dict[str, Any]]:
+        try:
+            data = await self.redis.getdel(HANDOFF_KEY.format(session_id=session_id))
+        except RedisError as e:
+            logger.warning("Session hand-off claim failed", session_id=session_id, error=str(e))
+            return None
+        if data is None:
+            return None
+        self._claims.inc()
+        return decode_value(data)
+
+
+@lru_cache()
+def get_session_registry() -> SessionRegistry:
+    """Get cached session registry for this node (identified by hostname)."""
+    return SessionRegistry(socket.gethostname())
@@ -0,0 +1,38 @@
+"""Transcription result type (DESIGN.md Speech-to-Text Service interface)."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.shared.timing import TimingEnvelope
+
+
+@dataclass(slots=True)
+class TranscriptionResult:
+    """Partial or final transcript of one Transcribe result."""
+
+    session_id: str
+    result_id: str
+    is_partial: bool
+    transcript: str
+    confidence: float = 1.0
+    start_time: float = 0.0  # ms from session start
+    end_time: float = 0.0  # ms from session start
+    speaker: Optional[str] = None
+    alternatives: list[dict[str, Any]] = field(default_factory=list)
+    timing: Optional[TimingEnvelope] = None  # of the chunk that completed this result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TranscriptionResult":
+        """Build from the camelCase wire format."""
+        return cls(
+            session_id=data["sessionId"],
+            result_id=data["resultId"],
+            is_partial=data["isPartial"],
+            transcript=data["transcript"],
+            confidence=data.get("confidence", 1.0),
+            start_time=data.get("startTime", 0.0),
+            end_time=data.get("endTime", 0.0),
+            speaker=data.get("speaker"),
+            alternatives=data.get("alternatives", []),
+            timing=TimingEnvelope.from_dict(data["timing"]) if data.get("timing") else None,
+        )
@@ -0,0 +1,256 @@
+"""Adaptive micro-batcher that coalesces concurrent translations into one call.
+
+A session often has several segments in flight at once: the interim and
+final results of an utterance, or a burst of short phrases. Each pending
+segment joins the open batch for its (source, target, terminology,
+formality, session) group, so text from different sessions never shares a
+call. Amazon Translate has no synchronous multi-segment API, so a batch is
+sent as a single ``TranslateText`` call with one segment per line and the
+output is split back on line breaks.
+
+A batch falls back to one call per segment when the line count does not
+survive translation, or when some line's length is far out of proportion
+with its source compared with the rest of the batch, which is how a segment
+that moved to a neighbouring line shows up. It also falls back when the
+batched call is rejected, so a segment Translate refuses fails only its own
+caller. Throttling and timeouts still fail the whole batch, since repeating
+them per segment would only add load.
+
+A batch is flushed when it reaches ``max_segments`` or ``max_bytes``, or when
+its wait window expires. The window adapts to traffic. A group whose
+requests arrive further apart than ``max_wait_ms`` is flushed on the next
+loop iteration, so a lone request pays no wait. Otherwise the window is long
+enough to expect another arrival, and at least a tenth of the observed call
+latency. It is always capped at ``max_wait_ms``.
+"""
+
+import asyncio
+import time
+from typing import NamedTuple, Optional
+
+from src.shared.async_aws_clients import AsyncTranslateClient, get_async_translate_client
+from src.shared.config import get_settings
+from src.shared.errors import TranslationError
+from src.shared.logging import get_logger
+from src.shared.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+SEPARATOR = "\n"
+WAIT_FRACTION = 0.1  # share of the observed call latency spent waiting for company
+SMOOTHING = 0.2
+MAX_SKEW = 3.0  # how far a line's length ratio may stray from the batch's
+SKEW_SLACK = 10  # characters added to both sides so short lines are not flagged
+
+
+class BatchKey(NamedTuple):
+    """Requests that can share a Translate call."""
+
+    source_language: str
+    target_language: str
+    terminology: Optional[str] = None
+    formality: Optional[str] = None
+    session_id: Optional[str] = None
+
+
+class _Batch:
+    __slots__ = ("texts", "futures", "size", "timer")
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.futures: list[asyncio.Future] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class TranslationBatcher:
+    """
+    Groups concurrent single-segment translations into batched calls.
+
+    Args:
+        client: Async Translate client
+        max_segments: Most segments per call
+        max_bytes: Largest UTF-8 payload per call (Translate accepts 10,000)
+        max_wait_ms: Longest a segment waits for others to join its batch
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncTranslateClient] = None,
+        max_segments: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.client = client or get_async_translate_client()
+        self.max_segments = max_segments or settings.translation_batch_max_segments
+        self.max_bytes = max_bytes or settings.translation_batch_max_bytes
+        self.max_wait_ms = (
+            max_wait_ms if max_wait_ms is not None else settings.translation_batch_max_wait_ms
+        )
+        self._pending: dict[BatchKey, _Batch] = {}
+        self._last_arrival: dict[BatchKey, float] = {}
+        self._interarrival_ms: dict[BatchKey, float] = {}
+        self._latency_ms = self.max_wait_ms / WAIT_FRACTION
+        self._tasks: set[asyncio.Task] = set()
+
+        metrics = get_metrics_registry()
+        self._batches = metrics.counter("translation_batches_total")
+        self._segments = metrics.counter("translation_batch_segments_total")
+        self._fallbacks = metrics.counter("translation_batch_fallbacks_total")
+        self._window = metrics.gauge("translation_batch_window_ms")
+
+    def window_ms(self, key: BatchKey) -> float:
+        """Current wait window for a group, in milliseconds."""
+        interarrival = self._interarrival_ms.get(key, float("inf"))
+        if interarrival > self.max_wait_ms:
+            return 0.0
+        # Long enough to expect company, short relative to the call it saves
+        return min(self.max_wait_ms, max(interarrival, self._latency_ms * WAIT_FRACTION))
+
+    async def translate(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        terminology: Optional[str] = None,
+        formality: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """
+        Translate one segment as part of a batch.
+
+        Args:
+            text: Source text (line breaks are folded into spaces)
+            source_language: Source language code
+            target_language: Target language code
+            terminology: Custom terminology name
+            formality: 'formal' or 'informal'
+            session_id: Session the segment belongs to; only segments of the
+                same session share a call
+
+        Returns:
+            Translated text
+        """
+        key = BatchKey(source_language, target_language, terminology, formality, session_id)
+        text = " ".join(text.splitlines())
+        self._observe_arrival(key)
+
+        size = len(text.encode()) + len(SEPARATOR)
+        batch = self._pending.get(key)
+        if batch is not None and batch.size + size > self.max_bytes:
+            self.flush(key)
+            batch = None
+        if batch is None:
+            batch = self._pending[key] = _Batch()
+            window = self.window_ms(key)
+            self._window.set(window)
+            loop = asyncio.get_running_loop()
+            batch.timer = (
+                loop.call_later(window / 1000, self.flush, key)
+                if window
+                else loop.call_soon(self.flush, key)
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.size += size
+        if len(batch.texts) >= self.max_segments:
+            self.flush(key)
+        return await future
+
+    def flush(self, key: BatchKey) -> None:
+        """Send a group's open batch now."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.create_task(self._send(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Flush every open batch and wait for in-flight calls."""
+        for key in list(self._pending):
+            self.flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _observe_arrival(self, key: BatchKey) -> None:
+        now = time.monotonic()
+        last = self._last_arrival.get(key)
+        self._last_arrival[key] = now
+        if last is not None:
+            gap = (now - last) * 1000
+            previous = self._interarrival_ms.get(key, gap)
+            self._interarrival_ms[key] = previous + (gap - previous) * SMOOTHING
+
+    async def _send(self, key: BatchKey, batch: _Batch) -> None:
+        self._batches.inc()
+        self._segments.inc(len(batch.texts))
+        start = time.perf_counter()
+        outcomes: list = []
+        try:
+            translated = await self._call(key, SEPARATOR.join(batch.texts))
+            lines = translated.split(SEPARATOR)
+            if len(batch.texts) == 1:
+                outcomes = [translated]
+            elif not _aligned(batch.texts, lines):
+                self._fallbacks.inc()
+                logger.warning(
+                    "Batched translation lost segment boundaries",
+                    segments=len(batch.texts),
+                    lines=len(lines),
+                )
+            else:
+                outcomes = lines
+        except TranslationError as e:
+            if len(batch.texts) == 1:
+                outcomes = [e]
+            else:
+                self._fallbacks.inc()
+                logger.warning(
+                    "Batched translation rejected, retrying per segment",
+                    segments=len(batch.texts),
+                    error=str(e),
+                )
+        except Exception as e:
+            outcomes = [e] * len(batch.texts)
+        if not outcomes:
+            outcomes = await asyncio.gather(
+                *(self._call(key, text) for text in batch.texts), return_exceptions=True
+            )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._latency_ms += (elapsed_ms - self._latency_ms) * SMOOTHING
+        for future, outcome in zip(batch.futures, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _call(self, key: BatchKey, text: str) -> str:
+        return await self.client.translate_text(
+            text,
+            key.source_language,
+            key.target_language,
+            terminology=key.terminology,
+            formality=key.formality,
+        )
+
+
+def _aligned(texts: list[str], lines: list[str]) -> bool:
+    """Whether each output line plausibly translates the segment at its position."""
+    if len(lines) != len(texts):
+        return False
+    overall = (sum(map(len, lines)) + SKEW_SLACK) / (sum(map(len, texts)) + SKEW_SLACK)
+    for text, line in zip(texts, lines):
+        if text.strip() and not line.strip():
+            return False
+        ratio = (len(line) + SKEW_SLACK) / (len(text) + SKEW_SLACK)
+        if not overall / MAX_SKEW <= ratio <= overall * MAX_SKEW:
+            return False
+    return True
@@ -0,0 +1,184 @@
+"""Content-addressed cache of translation results.
+
+Short phrases ("yes", "can you repeat that", greetings) recur constantly in
+help-desk and classroom sessions. Their translations are cached under a hash
+of everything that can change Amazon Translate's output: the normalized
+source text, the language pair, the custom terminology, and the formality
+and domain. They are stored in a ``TwoTierCache``, an in-process LRU in
+front of Redis with per-key TTLs.
+
+Text is only Unicode- and whitespace-normalized. Case and punctuation are
+kept because they can change the translation, for example a question versus
+a statement. Transcribe output is already consistently cased and
+punctuated.
+
+A segment that depends on earlier conversation is not eligible. That is any
+segment sent with previous segments that is longer than a short standalone
+phrase. Neither is a segment too long to plausibly repeat.
+"""
+
+import hashlib
+import time
+import unicodedata
+from typing import Awaitable, Callable, Optional
+
+from src.services.translation.models import TranslationRequest
+from src.shared.cache import TwoTierCache, cache_key
+from src.shared.config import get_settings
+from src.shared.metrics import get_metrics_registry
+
+KEY_VERSION = "v1"
+NAMESPACE = "translation"
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize and collapse runs of whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class TranslationCache:
+    """
+    Read-through translation cache with eligibility rules and hit-ratio metrics.
+
+    Args:
+        cache: Two-tier cache to store translations in (defaults to a
+            dedicated instance sized by the TRANSLATION_CACHE_L1_* settings)
+        max_chars: Longest normalized text that is cached
+        context_max_words: Longest segment still cached when it arrives with
+            previous segments as context
+    """
+
+    def __init__(
+        self,
+        cache: Optional[TwoTierCache] = None,
+        max_chars: Optional[int] = None,
+        context_max_words: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.cache = cache or TwoTierCache(
+            max_entries=settings.translation_cache_l1_max_entries,
+            l1_ttl=settings.translation_cache_l1_ttl_seconds,
+        )
+        self.max_chars = max_chars or settings.translation_cache_max_chars
+        self.context_max_words = context_max_words or settings.translation_cache_context_max_words
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        metrics = get_metrics_registry()
+        self._hits = metrics.counter("translation_cache_requests_total", result="hit")
+        self._misses = metrics.counter("translation_cache_requests_total", result="miss")
+        self._coalesced = metrics.counter("translation_cache_requests_total", result="coalesced")
+        self._hit_ratio = metrics.gauge("translation_cache_hit_ratio")
+        self._saved_ms = metrics.counter("translation_cache_saved_ms_total")
+        self._miss_latency = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Hits over eligible lookups since start-up."""
+        lookups = self.hits + self.misses + self.coalesced
+        return self.hits / lookups if lookups else 0.0
+
+    def ineligible_reason(self, request: TranslationRequest, text: str) -> Optional[str]:
+        """
+        Explain why a request must bypass the cache.
+
+        Args:
+            request: Translation request
+            text: Normalized source text
+
+        Returns:
+            Reason label ('empty', 'too_long' or 'context'), or None if cacheable
+        """
+        if not text:
+            return "empty"
+        if len(text) > self.max_chars:
+            return "too_long"
+        context = request.context
+        if (
+            context is not None
+            and context.previous_segments
+            and len(text.split()) > self.context_max_words
+        ):
+            return "context"
+        return None
+
+    def key(self, request: TranslationRequest, text: str) -> str:
+        """
+        Content address of a translation.
+
+        Args:
+            request: Translation request
+            text: Normalized source text
+
+        Returns:
+            Redis key ``translation:{sha256}``
+        """
+        context = request.context
+        parts = (
+            KEY_VERSION,
+            request.source_language,
+            request.target_language,
+            request.custom_terminology or "",
+            (context.formality if context else None) or "",
+            (context.domain if context else None) or "",
+            text,
+        )
+        digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+        return cache_key(NAMESPACE, digest=digest)
+
+    async def get_or_translate(
+        self,
+        request: TranslationRequest,
+        translate: Callable[[str], Awaitable[str]],
+    ) -> tuple[str, bool]:
+        """
+        Return a cached translation or translate and cache it.
+
+        Args:
+            request: Translation request
+            translate: Coroutine function translating the normalized text
+
+        Returns:
+            Translated text and whether it came from the cache. Text that is
+            empty after normalization translates to "" without a call.
+            Requests that joined a translation already in flight for the same
+            text are counted as coalesced, not as hits.
+        """
+        text = normalize_text(request.source_text)
+        reason = self.ineligible_reason(request, text)
+        if reason is not None:
+            get_metrics_registry().counter(
+                "translation_cache_requests_total", result="bypass", reason=reason
+            ).inc()
+            if reason == "empty":
+                return "", False  # Amazon Translate rejects empty Text
+            return await translate(text), False
+
+        loaded = False
+
+        async def load() -> str:
+            nonlocal loaded
+            loaded = True
+            start = time.perf_counter()
+            translated = await translate(text)
+            # Smoothed miss latency, used to estimate the time saved by hits
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._miss_latency += (elapsed_ms - self._miss_latency) * 0.1
+            return translated
+
+        key = self.key(request, text)
+        joined = self.cache.loading(key)
+        translated = await self.cache.get_or_load(NAMESPACE, key, load)
+        if loaded:
+            self.misses += 1
+            self._misses.inc()
+        elif joined:
+            self.coalesced += 1
+            self._coalesced.inc()
+        else:
+            self.hits += 1
+            self._hits.inc()
+            self._saved_ms.inc(self._miss_latency)
+        self._hit_ratio.set(self.hit_ratio)
+        return translated, not loaded and not joined
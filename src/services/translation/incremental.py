@@ -0,0 +1,218 @@
+"""Incremental translation of partial transcripts.
+
+Transcribe emits a growing partial hypothesis many times per utterance before
+the final result. Re-translating every partial wastes calls. Waiting for the
+final result delays the first translated words by the full utterance
+length. ``IncrementalTranslator`` sits between the two services. It tracks
+the prefix that the last ``agreement`` partials agree on and translates each
+clause once it is stable. A clause ends at punctuation, or after
+``max_words`` stable words without any.
+
+The final result is reconciled with what was already committed. If it
+extends the committed text, only the remainder is translated. If it revises
+earlier words, the whole utterance is translated again and the update is
+flagged as a revision, so consumers replace the clauses they already have.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from string import punctuation
+from typing import Optional
+
+from src.services.speech_to_text.models import TranscriptionResult
+from src.services.translation.models import ConversationContext, TranslationRequest
+from src.services.translation.service import TranslationService, get_translation_service
+from src.shared.config import get_settings
+from src.shared.metrics import get_metrics_registry
+
+CLAUSE_END = (",", ".", ";", ":", "?", "!")
+CONTEXT_SEGMENTS = 5
+MAX_OPEN_RESULTS = 64
+
+
+@dataclass(slots=True)
+class IncrementalUpdate:
+    """Translated text for part or all of one transcript result."""
+
+    session_id: str
+    result_id: str
+    source_text: str
+    translated_text: str
+    is_final: bool
+    revision: bool = False  # replaces every earlier update for this result
+    elapsed_ms: float = 0.0  # since the first partial of the result
+
+
+class _Utterance:
+    __slots__ = ("partials", "committed", "clauses", "calls", "first_seen", "first_output")
+
+    def __init__(self, agreement: int) -> None:
+        self.partials: deque[list[str]] = deque(maxlen=agreement)
+        self.committed: list[str] = []
+        self.clauses: list[str] = []
+        self.calls = 0
+        self.first_seen = time.monotonic()
+        self.first_output: Optional[float] = None
+
+
+def _same_words(left: list[str], right: list[str]) -> bool:
+    """Compare word lists ignoring case and surrounding punctuation."""
+    return len(left) == len(right) and all(
+        a.casefold().strip(punctuation) == b.casefold().strip(punctuation)
+        for a, b in zip(left, right)
+    )
+
+
+def _common_prefix(partials: deque[list[str]]) -> int:
+    length = min(len(words) for words in partials)
+    first = partials[0]
+    for index in range(length):
+        if any(words[index] != first[index] for words in partials):
+            return index
+    return length
+
+
+class IncrementalTranslator:
+    """
+    Translates one session's transcript stream clause by clause.
+
+    Args:
+        source_language: Transcript language
+        target_language: Language to translate into
+        service: Translation service
+        agreement: Consecutive partials that must agree before words are stable
+        max_words: Stable words committed without waiting for punctuation
+        custom_terminology: Custom terminology name
+    """
+
+    def __init__(
+        self,
+        source_language: str,
+        target_language: str,
+        service: Optional[TranslationService] = None,
+        agreement: Optional[int] = None,
+        max_words: Optional[int] = None,
+        custom_terminology: Optional[str] = None,
+    ):
+        settings = get_settings()
+        self.source_language = source_language
+        self.target_language = target_language
+        self.service = service or get_translation_service()
+        self.agreement = agreement or settings.translation_partial_agreement
+        self.max_words = max_words or settings.translation_partial_max_words
+        self.custom_terminology = custom_terminology
+        self._utterances: dict[str, _Utterance] = {}
+
+        metrics = get_metrics_registry()
+        self._calls = metrics.counter("translation_partial_calls_total")
+        self._utterance_count = metrics.counter("translation_partial_utterances_total")
+        self._revisions = metrics.counter("translation_partial_revisions_total")
+        self._first_token_sum = metrics.counter("translation_partial_first_token_ms_sum")
+        self._first_token_count = metrics.counter("translation_partial_first_token_count")
+
+    async def process(self, result: TranscriptionResult) -> list[IncrementalUpdate]:
+        """
+        Consume the next transcript result.
+
+        Args:
+            result: Partial or final transcription result
+
+        Returns:
+            Updates to deliver, in order (empty while nothing new is stable)
+        """
+        state = self._utterances.get(result.result_id)
+        if state is None:
+            state = self._utterances[result.result_id] = _Utterance(self.agreement)
+            if len(self._utterances) > MAX_OPEN_RESULTS:
+                # Results abandoned without a final (e.g., stream reset)
+                self._utterances.pop(next(iter(self._utterances)))
+        words = result.transcript.split()
+
+        if not result.is_partial:
+            del self._utterances[result.result_id]
+            return [await self._finish(result, state, words)]
+
+        state.partials.append(words)
+        if len(state.partials) < self.agreement:
+            return []
+        committed = len(state.committed)
+        if not _same_words(words[:committed], state.committed):
+            # Earlier words were revised; reconcile when the final arrives
+            return []
+
+        stable = _common_prefix(state.partials)
+        end = next(
+            (i for i in range(stable, committed, -1) if words[i - 1].endswith(CLAUSE_END)),
+            None,
+        )
+        if end is None and stable - committed >= self.max_words:
+            end = stable
+        if end is None:
+            return []
+        clause = words[committed:end]
+        state.committed.extend(clause)
+        return [await self._translate(result, state, " ".join(clause), is_final=False)]
+
+    async def _finish(
+        self, result: TranscriptionResult, state: _Utterance, words: list[str]
+    ) -> IncrementalUpdate:
+        committed = len(state.committed)
+        if committed and not _same_words(words[:committed], state.committed):
+            self._revisions.inc()
+            state.clauses.clear()
+            update = await self._translate(result, state, " ".join(words), is_final=True)
+            update.revision = True
+        elif len(words) > committed:
+            update = await self._translate(
+                result, state, " ".join(words[committed:]), is_final=True
+            )
+        else:
+            # Everything was already translated from partials
+            update = IncrementalUpdate(
+                result.session_id,
+                result.result_id,
+                source_text="",
+                translated_text="",
+                is_final=True,
+                elapsed_ms=(time.monotonic() - state.first_seen) * 1000,
+            )
+        self._utterance_count.inc()
+        return update
+
+    async def _translate(
+        self, result: TranscriptionResult, state: _Utterance, text: str, is_final: bool
+    ) -> IncrementalUpdate:
+        context = (
+            ConversationContext(previous_segments=state.clauses[-CONTEXT_SEGMENTS:])
+            if state.clauses
+            else None
+        )
+        translation = await self.service.translate(
+            TranslationRequest(
+                session_id=result.session_id,
+                segment_id=f"{result.result_id}:{state.calls}",
+                source_text=text,
+                source_language=self.source_language,
+                target_language=self.target_language,
+                context=context,
+                custom_terminology=self.custom_terminology,
+                timing=result.timing,
+            )
+        )
+        state.calls += 1
+        state.clauses.append(text)
+        self._calls.inc()
+        now = time.monotonic()
+        if state.first_output is None:
+            state.first_output = now
+            self._first_token_sum.inc((now - state.first_seen) * 1000)
+            self._first_token_count.inc()
+        return IncrementalUpdate(
+            result.session_id,
+            result.result_id,
+            text,
+            translation.translated_text,
+            is_final=is_final,
+            elapsed_ms=(now - state.first_seen) * 1000,
+        )
@@ -0,0 +1,58 @@
+"""Translation request and result types (DESIGN.md Translation Service interface)."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.shared.timing import TimingEnvelope
+
+
+@dataclass(slots=True)
+class ConversationContext:
+    """Recent conversation state that can influence a translation."""
+
+    previous_segments: list[str] = field(default_factory=list)
+    domain: Optional[str] = None
+    formality: Optional[str] = None  # 'formal' or 'informal'
+
+
+@dataclass(slots=True)
+class TranslationRequest:
+    """One segment to translate."""
+
+    session_id: str
+    segment_id: str
+    source_text: str
+    source_language: str
+    target_language: str
+    context: Optional[ConversationContext] = None
+    custom_terminology: Optional[str] = None
+    timing: Optional[TimingEnvelope] = None
+
+
+@dataclass(slots=True)
+class TranslationResult:
+    """Translated segment."""
+
+    session_id: str
+    segment_id: str
+    translated_text: str
+    source_language: str
+    target_language: str
+    latency: float  # ms
+    cached: bool = False
+    timing: Optional[TimingEnvelope] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize with the camelCase field names used on the wire."""
+        data = {
+            "sessionId": self.session_id,
+            "segmentId": self.segment_id,
+            "translatedText": self.translated_text,
+            "sourceLanguage": self.source_language,
+            "targetLanguage": self.target_language,
+            "latency": self.latency,
+            "cached": self.cached,
+        }
+        if self.timing is not None:
+            data["timing"] = self.timing.to_dict()
+        return data
@@ -0,0 +1,90 @@
+"""Translation service: Amazon Translate behind the translation cache and batcher."""
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Optional
+
+from src.services.translation.batcher import TranslationBatcher
+from src.services.translation.cache import TranslationCache
+from src.services.translation.models import TranslationRequest, TranslationResult
+from src.shared.async_aws_clients import AsyncTranslateClient, get_async_translate_client
+
+
+class TranslationService:
+    """
+    Translates transcript segments.
+
+    Args:
+        client: Async Translate client
+        cache: Translation result cache
+        batcher: Micro-batcher for cache misses (defaults to one over ``client``)
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncTranslateClient] = None,
+        cache: Optional[TranslationCache] = None,
+        batcher: Optional[TranslationBatcher] = None,
+    ):
+        self.client = client or get_async_translate_client()
+        self.cache = cache or TranslationCache()
+        self.batcher = batcher or TranslationBatcher(self.client)
+
+    async def translate(self, request: TranslationRequest) -> TranslationResult:
+        """
+        Translate one segment, serving repeated phrases from the cache.
+
+        Args:
+            request: Segment to translate
+
+        Returns:
+            Translation with its end-to-end latency in ms
+        """
+        start = time.perf_counter()
+        timing = request.timing.derive() if request.timing is not None else None
+        if timing is not None:
+            timing.enter("translate")
+        formality = request.context.formality if request.context else None
+
+        async def translate(text: str) -> str:
+            return await self.batcher.translate(
+                text,
+                request.source_language,
+                request.target_language,
+                terminology=request.custom_terminology,
+                formality=formality,
+                session_id=request.session_id,
+            )
+
+        translated, cached = await self.cache.get_or_translate(request, translate)
+        if timing is not None:
+            timing.exit("translate")
+        return TranslationResult(
+            session_id=request.session_id,
+            segment_id=request.segment_id,
+            translated_text=translated,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            latency=(time.perf_counter() - start) * 1000,
+            cached=cached,
+            timing=timing,
+        )
+
+    async def translate_batch(self, requests: list[TranslationRequest]) -> list[TranslationResult]:
+        """
+        Translate several segments; misses share Translate calls per language pair.
+
+        Args:
+            requests: Segments to translate
+
+        Returns:
+            Results in request order
+        """
+        return list(await asyncio.gather(*(self.translate(r) for r in requests)))
+
+
+@lru_cache()
+def get_translation_service() -> TranslationService:
+    """Get cached translation service instance."""
+    return TranslationService()
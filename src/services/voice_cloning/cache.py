@@ -0,0 +1,485 @@
+"""Content-addressed cache of synthesized speech.
+
+Synthesis is the largest stage of the latency budget (~500 ms, DESIGN.md),
+and recurring phrases ("thank you", "can everyone hear me") are said again
+and again in the same cloned voice. Synthesized audio is cached under a
+hash of everything that changes it: the voice profile and its enrollment
+generation, the synthesis model version, the target language, the
+normalized text and the prosody settings.
+
+There are two tiers:
+- ``DiskLRU``: a size-bounded LRU of files on local disk. Each worker
+  process claims its own ``worker-{n}`` directory under
+  ``SYNTHESIS_CACHE_DIR``, because the LRU's size accounting lives in
+  process memory. ``SYNTHESIS_CACHE_MAX_BYTES`` is therefore a per-worker
+  budget.
+- S3 (``S3_SYNTHESIS_CACHE_BUCKET``), shared by every node, which fills
+  local misses
+
+Both tiers are served as an async stream of PCM chunks, so egress can start
+on the first chunk. On a miss the synthesizer's own stream passes straight
+through and is stored once it completes. Disk reads and writes run in a
+worker thread, so they never stall the event loop. An S3 hit is written to
+disk after its audio has been streamed.
+
+Re-enrolling a voice profile bumps its generation in Redis
+(``voice-profile-generation:{profileId}``), so no node hits the old entries
+again. The node that re-enrolls also deletes its local files. Other nodes'
+copies age out of their LRU, and S3 objects should be expired by a bucket
+lifecycle rule.
+
+Requests that carry source emotion to preserve are not cached, because the
+emotion is continuous and rarely repeats.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import itertools
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Callable, Optional, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.services.translation.cache import normalize_text
+from src.services.voice_cloning.models import ProsodyHints, SynthesisRequest
+from src.shared.async_aws_clients import AsyncS3Client, get_async_s3_client
+from src.shared.config import get_settings
+from src.shared.errors import StorageError, UniVoiceError
+from src.shared.logging import get_logger
+from src.shared.metrics import get_metrics_registry
+from src.shared.redis_client import get_redis_client
+
+logger = get_logger(__name__)
+
+KEY_VERSION = "v1"
+GENERATION_KEY = "voice-profile-generation:{profile_id}"
+S3_PREFIX = "synthesis/"
+LOCK_FILE = ".lock"
+
+Synthesizer = Callable[[SynthesisRequest], AsyncIterator[bytes]]
+
+
+def _profile_group(profile_id: str) -> str:
+    """Directory name for a profile's entries (profile IDs are not path-safe)."""
+    return hashlib.sha256(profile_id.encode()).hexdigest()[:16]
+
+
+def canonical_prosody(hints: Optional[ProsodyHints]) -> str:
+    """
+    Render prosody hints so that equivalent settings hash alike.
+
+    Unset rate and pitch equal their neutral values, and values are rounded
+    below what is audible.
+    """
+    if hints is None:
+        hints = ProsodyHints()
+    rate = 1.0 if hints.speaking_rate is None else hints.speaking_rate
+    pitch = 0.0 if hints.pitch_shift is None else hints.pitch_shift
+    emphasis = ",".join(
+        f"{span.start_word}-{span.end_word}:{span.level}"
+        for span in sorted(hints.emphasis, key=lambda s: (s.start_word, s.end_word))
+    )
+    return f"{rate:.2f}|{pitch:.1f}|{emphasis}"
+
+
+class DiskLRU:
+    """
+    Size-bounded LRU of files under one directory, for a single process.
+
+    Entries live at ``{root}/{group}/{digest}``, so a group (one voice
+    profile) can be dropped at once. The recency order is kept in memory
+    and rebuilt from file modification times on start-up. Methods are
+    thread-safe, so callers can run them with ``asyncio.to_thread``.
+    Another process writing to the same directory would go unaccounted, so
+    use ``for_worker()`` when several processes share a cache directory.
+
+    Args:
+        root: Cache directory
+        max_bytes: Total size above which least recently used entries are
+            deleted
+    """
+
+    def __init__(self, root: Union[str, Path], max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._bytes = get_metrics_registry().gauge("synthesis_cache_disk_bytes")
+        self._guard = threading.Lock()
+        self._lock_file: Optional[BinaryIO] = None
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @classmethod
+    def for_worker(cls, root: Union[str, Path], max_bytes: int) -> "DiskLRU":
+        """
+        Open the first ``{root}/worker-{n}`` directory no live process holds.
+
+        The directory stays locked with ``flock`` until ``close()`` or process
+        exit. A restarted worker takes over a released directory, entries
+        included.
+
+        Args:
+            root: Shared cache directory
+            max_bytes: Budget of this process's directory
+        """
+        for slot in itertools.count():
+            directory = Path(root) / f"worker-{slot}"
+            directory.mkdir(parents=True, exist_ok=True)
+            lock = open(directory / LOCK_FILE, "ab")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock.close()
+                continue
+            disk = cls(directory, max_bytes)
+            disk._lock_file = lock
+            return disk
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._entries
+
+    def close(self) -> None:
+        """Release the directory claimed by ``for_worker()``."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _load(self) -> None:
+        found = []
+        for group in os.scandir(self.root):
+            if not group.is_dir():
+                continue
+            for entry in os.scandir(group.path):
+                if entry.name.endswith(".tmp"):
+                    os.unlink(entry.path)  # Interrupted write
+                    continue
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name, group.name, stat.st_size))
+        for _, digest, group, size in sorted(found):
+            self._entries[digest] = (group, size)
+            self.size += size
+        self._evict()
+
+    def open(self, digest: str) -> Optional[BinaryIO]:
+        """
+        Open an entry for reading and mark it most recently used.
+
+        The file stays readable even if it is evicted while open.
+
+        Returns:
+            Binary file object, or None on a miss
+        """
+        with self._guard:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            try:
+                f = open(self.root / entry[0] / digest, "rb")
+            except FileNotFoundError:
+                self._forget(digest)
+                return None
+            self._entries.move_to_end(digest)
+            return f
+
+    def put(self, group: str, digest: str, data: bytes) -> None:
+        """Store an entry, evicting least recently used ones to stay in budget."""
+        if len(data) > self.max_bytes:
+            return
+        directory = self.root / group
+        with self._guard:
+            directory.mkdir(exist_ok=True)
+            temp = directory / f"{digest}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, directory / digest)
+            self._forget(digest)
+            self._entries[digest] = (group, len(data))
+            self.size += len(data)
+            self._evict()
+
+    def drop_group(self, group: str) -> int:
+        """
+        Delete every entry in a group.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._guard:
+            digests = [digest for digest, (owner, _) in self._entries.items() if owner == group]
+            for digest in digests:
+                self._forget(digest)
+            shutil.rmtree(self.root / group, ignore_errors=True)
+            self._bytes.set(self.size)
+        return len(digests)
+
+    def _forget(self, digest: str) -> None:
+        entry = self._entries.pop(digest, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and self._entries:
+            digest, (group, size) = self._entries.popitem(last=False)
+            self.size -= size
+            try:
+                os.unlink(self.root / group / digest)
+            except FileNotFoundError:
+                pass
+        self._bytes.set(self.size)
+
+
+class SynthesisCache:
+    """
+    Two-tier synthesis output cache with hit-ratio and latency-saved metrics.
+
+    Args:
+        disk: Local tier (defaults to this worker's directory under
+            SYNTHESIS_CACHE_DIR, with a SYNTHESIS_CACHE_MAX_BYTES budget)
+        s3: Client for the shared tier
+        redis: Redis client holding profile generations
+        bucket: Shared-tier bucket (defaults to S3_SYNTHESIS_CACHE_BUCKET)
+        model_version: Synthesis model version (defaults to
+            VOICE_CLONING_MODEL_VERSION)
+        max_chars: Longest normalized text that is cached
+        chunk_bytes: Size of the chunks cached audio is streamed in
+    """
+
+    def __init__(
+        self,
+        disk: Optional[DiskLRU] = None,
+        s3: Optional[AsyncS3Client] = None,
+        redis: Optional[Redis] = None,
+        bucket: Optional[str] = None,
+        model_version: Optional[str] = None,
+        max_chars: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+    ):
+        settings = get_settings()
+        if disk is None:
+            disk = DiskLRU.for_worker(
+                settings.synthesis_cache_dir, settings.synthesis_cache_max_bytes
+            )
+        self.disk = disk
+        self.s3 = s3 or get_async_s3_client()
+        self.redis = redis or get_redis_client()
+        self.bucket = bucket or settings.s3_synthesis_cache_bucket
+        self.model_version = model_version or settings.voice_cloning_model_version
+        self.max_chars = max_chars or settings.synthesis_cache_max_chars
+        self.chunk_bytes = chunk_bytes or settings.synthesis_cache_chunk_bytes
+        self.disk_hits = 0
+        self.s3_hits = 0
+        self.misses = 0
+        self._uploads: set[asyncio.Task] = set()
+
+        metrics = get_metrics_registry()
+        self._hits = {
+            tier: metrics.counter("synthesis_cache_requests_total", result="hit", tier=tier)
+            for tier in ("disk", "s3")
+        }
+        self._misses = metrics.counter("synthesis_cache_requests_total", result="miss")
+        self._hit_ratio = metrics.gauge("synthesis_cache_hit_ratio")
+        self._saved_ms = metrics.counter("synthesis_cache_saved_ms_total")
+        # Smoothed time to first audio on a miss, used to estimate what hits save
+        self._miss_latency = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Hits from either tier over eligible lookups since start-up."""
+        hits = self.disk_hits + self.s3_hits
+        lookups = hits + self.misses
+        return hits / lookups if lookups else 0.0
+
+    def ineligible_reason(self, request: SynthesisRequest, text: str) -> Optional[str]:
+        """
+        Explain why a request must bypass the cache.
+
+        Args:
+            request: Synthesis request
+            text: Normalized text
+
+        Returns:
+            Reason label ('empty', 'too_long' or 'emotion'), or None if cacheable
+        """
+        if not text:
+            return "empty"
+        if len(text) > self.max_chars:
+            return "too_long"
+        emotion = request.emotional_context
+        if emotion is not None and emotion.preserve_emotion:
+            return "emotion"
+        return None
+
+    def key(self, request: SynthesisRequest, text: str, generation: str) -> str:
+        """
+        Content address of a synthesis.
+
+        Args:
+            request: Synthesis request
+            text: Normalized text
+            generation: Enrollment generation of the voice profile
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        parts = (
+            KEY_VERSION,
+            request.voice_profile_id,
+            generation,
+            self.model_version,
+            request.target_language,
+            canonical_prosody(request.prosody_hints),
+            text,
+        )
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    async def generation(self, profile_id: str) -> str:
+        """Current enrollment generation of a voice profile ('0' if never re-enrolled)."""
+        value = await self.redis.get(GENERATION_KEY.format(profile_id=profile_id))
+        if value is None:
+            return "0"
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def stream(
+        self, request: SynthesisRequest, synthesize: Synthesizer
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a synthesis from the cache, or from ``synthesize`` while caching it.
+
+        Args:
+            request: Synthesis request
+            synthesize: Function returning the synthesizer's async stream of
+                PCM chunks for a request
+
+        Yields:
+            PCM chunks, ready to publish to egress
+        """
+        start = time.perf_counter()
+        text = normalize_text(request.text)
+        reason = self.ineligible_reason(request, text)
+        if reason is None:
+            try:
+                generation = await self.generation(request.voice_profile_id)
+            except RedisError as e:
+                logger.warning(
+                    "Voice profile generation read failed",
+                    profile_id=request.voice_profile_id,
+                    error=str(e),
+                )
+                reason = "redis"
+        if reason is not None:
+            get_metrics_registry().counter(
+                "synthesis_cache_requests_total", result="bypass", reason=reason
+            ).inc()
+            async for chunk in synthesize(request):
+                yield chunk
+            return
+
+        digest = self.key(request, text, generation)
+        group = _profile_group(request.voice_profile_id)
+        f = await asyncio.to_thread(self.disk.open, digest)
+        if f is not None:
+            with f:
+                self._hit("disk", start)
+                while chunk := await asyncio.to_thread(f.read, self.chunk_bytes):
+                    yield chunk
+            return
+
+        data = await self._download(digest)
+        if data is not None:
+            self._hit("s3", start)
+            for offset in range(0, len(data), self.chunk_bytes):
+                yield data[offset:offset + self.chunk_bytes]
+            await asyncio.to_thread(self.disk.put, group, digest, data)
+            return
+
+        self.misses += 1
+        self._misses.inc()
+        self._hit_ratio.set(self.hit_ratio)
+        chunks = []
+        async for chunk in synthesize(request):
+            if not chunks:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._miss_latency += (elapsed_ms - self._miss_latency) * 0.1
+            chunks.append(chunk)
+            yield chunk
+        # Only a synthesis that was streamed to the end is stored
+        data = b"".join(chunks)
+        if data:
+            await asyncio.to_thread(self.disk.put, group, digest, data)
+            task = asyncio.create_task(self._upload(digest, data))
+            self._uploads.add(task)
+            task.add_done_callback(self._uploads.discard)
+
+    async def invalidate_profile(self, profile_id: str) -> int:
+        """
+        Retire every cached synthesis of a re-enrolled voice profile.
+
+        Args:
+            profile_id: Voice profile ID
+
+        Returns:
+            Number of local entries deleted
+
+        Raises:
+            StorageError: If the generation could not be bumped, in which
+                case the old voice may still be served
+        """
+        try:
+            await self.redis.incr(GENERATION_KEY.format(profile_id=profile_id))
+        except RedisError as e:
+            logger.error("Voice profile generation bump failed", profile_id=profile_id)
+            raise StorageError(
+                "Failed to invalidate synthesized speech",
+                details={"profile_id": profile_id, "error": str(e)},
+            )
+        return await asyncio.to_thread(self.disk.drop_group, _profile_group(profile_id))
+
+    async def flush(self) -> None:
+        """Wait for pending uploads to the shared tier."""
+        while self._uploads:
+            await asyncio.gather(*list(self._uploads))
+
+    def _hit(self, tier: str, start: float) -> None:
+        if tier == "disk":
+            self.disk_hits += 1
+        else:
+            self.s3_hits += 1
+        self._hits[tier].inc()
+        self._hit_ratio.set(self.hit_ratio)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._saved_ms.inc(max(0.0, self._miss_latency - elapsed_ms))
+
+    async def _download(self, digest: str) -> Optional[bytes]:
+        try:
+            return await self.s3.download_file(self.bucket, S3_PREFIX + digest)
+        except UniVoiceError as e:
+            # Best-effort tier: a missing object, an outage or an open breaker is a miss
+            if not isinstance(e, StorageError):
+                logger.warning("Synthesis cache download failed", digest=digest, error=str(e))
+            return None
+
+    async def _upload(self, digest: str, data: bytes) -> None:
+        try:
+            await self.s3.upload_file(self.bucket, S3_PREFIX + digest, data)
+        except UniVoiceError as e:
+            # The entry stays node-local; storage errors are logged by the client
+            if not isinstance(e, StorageError):
+                logger.warning("Synthesis cache upload failed", digest=digest, error=str(e))
+
+
+@lru_cache()
+def get_synthesis_cache() -> SynthesisCache:
+    """Get cached synthesis cache instance."""
+    return SynthesisCache()
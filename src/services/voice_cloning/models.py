@@ -0,0 +1,55 @@
+"""Synthesis request types (DESIGN.md Voice Cloning Service interface)."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.shared.timing import TimingEnvelope
+
+
+@dataclass(slots=True)
+class EmotionalProfile:
+    """Emotional tone of the source speech."""
+
+    valence: float  # -1 (negative) to 1 (positive)
+    arousal: float  # 0 (calm) to 1 (excited)
+    dominance: float  # 0 (submissive) to 1 (dominant)
+
+
+@dataclass(slots=True)
+class EmotionalContext:
+    """Source emotion to carry into the synthesized speech."""
+
+    source_emotion: EmotionalProfile
+    preserve_emotion: bool = True
+
+
+@dataclass(slots=True)
+class EmphasisSpan:
+    """Words to emphasize, by word index."""
+
+    start_word: int
+    end_word: int
+    level: str  # 'strong', 'moderate' or 'reduced'
+
+
+@dataclass(slots=True)
+class ProsodyHints:
+    """Prosody adjustments for one synthesis."""
+
+    speaking_rate: Optional[float] = None  # 0.5 - 2.0 (1.0 = normal)
+    pitch_shift: Optional[float] = None  # -12 to +12 semitones
+    emphasis: list[EmphasisSpan] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SynthesisRequest:
+    """One translated segment to speak in a cloned voice."""
+
+    session_id: str
+    segment_id: str
+    text: str
+    voice_profile_id: str
+    target_language: str
+    emotional_context: Optional[EmotionalContext] = None
+    prosody_hints: Optional[ProsodyHints] = None
+    timing: Optional[TimingEnvelope] = None
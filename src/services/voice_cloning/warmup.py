@@ -0,0 +1,437 @@
+"""Predictive warm-up of voice-cloning models.
+
+A speaker's first synthesis against a cold model has to load the voice
+profile and model onto the endpoint first, which alone can take most of the
+2 s budget (DESIGN.md). ``WarmupScheduler`` watches the session registry's
+speaker events and warms ahead of need:
+- a speaker joining a session warms their profile, long before their first
+  translated utterance reaches synthesis
+- an utterance starting (VAD ``UTTERANCE_START``) re-warms a profile that
+  went cold
+- active speakers get keep-alive refreshes before ``VOICE_WARMUP_TTL_SECONDS``
+  lapses, capped at ``VOICE_WARMUP_KEEPALIVE_PER_MINUTE`` calls
+- speakers that left, or have been quiet for ``VOICE_WARMUP_IDLE_SECONDS``,
+  are evicted
+
+The warm set never exceeds ``VOICE_WARMUP_MAX_PROFILES``, the number of
+profiles the endpoints have memory for. When it is full, the profile that
+has no session, or else the one with the oldest activity, makes room.
+
+``model-warmup:{profileId}`` in Redis records a warm-up for its TTL, so other
+nodes hosting the same speaker don't warm them again. Each node that keeps
+a profile warm also holds it in ``model-warmup:{profileId}:nodes``, a sorted
+set scored by when the hold lapses. An evicting node releases its hold, and
+only the last live holder clears the marker and unloads the model. Holds of
+nodes that died lapse with their TTL. The synthesis path calls
+``record_use`` to report the cold-start rate, and warm-up calls and their
+duration are counted as the spend.
+"""
+
+import asyncio
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.services.session_manager.registry import (
+    SessionEvent,
+    SessionEventType,
+    SessionRegistry,
+)
+from src.shared.cache import cache_key
+from src.shared.config import get_settings
+from src.shared.logging import get_logger
+from src.shared.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+TICK_SECONDS = 5.0
+
+# KEYS[1]: holder set. ARGV: node id, TTL seconds. Scores are expiry times on
+# the Redis server clock, so every node compares them alike.
+HOLD_LUA = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local ttl = tonumber(ARGV[2])
+redis.call('ZADD', KEYS[1], now + ttl, ARGV[1])
+redis.call('EXPIRE', KEYS[1], math.ceil(ttl))
+return 1
+"""
+
+# KEYS[1]: holder set, KEYS[2]: warm-up marker. ARGV: node id.
+# Returns 1, after deleting both keys, if no live holder is left.
+RELEASE_LUA = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) > 0 then
+  return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+return 1
+"""
+
+Warmer = Callable[[str], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _Profile:
+    """What the scheduler knows about one voice profile."""
+
+    sessions: set[str] = field(default_factory=set)
+    last_active: float = 0.0
+    warmed_at: Optional[float] = None  # None while cold
+    task: Optional[asyncio.Task] = None  # Pending warm-up
+    used: bool = False
+
+
+class WarmupScheduler:
+    """
+    Keeps the voice models of joining and active speakers warm within a budget.
+
+    Args:
+        warm: Loads a profile's model onto the endpoint (e.g., a short
+            primer synthesis)
+        unload: Optional call that frees an evicted profile's endpoint memory
+        redis: Redis client for ``model-warmup:{profileId}`` and its holders;
+            None to skip cross-node coordination
+        node_id: This node's id among a profile's holders (defaults to the
+            hostname, as for the session registry)
+        max_profiles: Warm-set size (defaults to VOICE_WARMUP_MAX_PROFILES)
+        ttl_seconds: How long a warm-up lasts without use (defaults to
+            VOICE_WARMUP_TTL_SECONDS)
+        keepalive_seconds: Age at which an active speaker's model is
+            refreshed (defaults to VOICE_WARMUP_KEEPALIVE_SECONDS)
+        idle_seconds: Quiet time after which a speaker is evicted (defaults to
+            VOICE_WARMUP_IDLE_SECONDS)
+        keepalive_per_minute: Keep-alive call budget (defaults to
+            VOICE_WARMUP_KEEPALIVE_PER_MINUTE)
+        concurrency: Warm-up calls in flight (defaults to
+            VOICE_WARMUP_CONCURRENCY)
+        clock: Monotonic clock, in the time base of ``SessionEvent.at``
+    """
+
+    def __init__(
+        self,
+        warm: Warmer,
+        unload: Optional[Warmer] = None,
+        redis: Optional[Redis] = None,
+        node_id: Optional[str] = None,
+        max_profiles: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        keepalive_seconds: Optional[float] = None,
+        idle_seconds: Optional[float] = None,
+        keepalive_per_minute: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        settings = get_settings()
+        self.warm = warm
+        self.unload = unload
+        self.redis = redis
+        self.node_id = node_id or socket.gethostname()
+        if redis is not None:
+            self._hold_script = redis.register_script(HOLD_LUA)
+            self._release_script = redis.register_script(RELEASE_LUA)
+        self.max_profiles = (
+            settings.voice_warmup_max_profiles if max_profiles is None else max_profiles
+        )
+        self.ttl_seconds = ttl_seconds or settings.voice_warmup_ttl_seconds
+        self.keepalive_seconds = keepalive_seconds or settings.voice_warmup_keepalive_seconds
+        self.idle_seconds = idle_seconds or settings.voice_warmup_idle_seconds
+        self.keepalive_per_minute = (
+            keepalive_per_minute or settings.voice_warmup_keepalive_per_minute
+        )
+        self.clock = clock
+        self._limit = asyncio.Semaphore(concurrency or settings.voice_warmup_concurrency)
+        self._profiles: dict[str, _Profile] = {}
+        self._tokens = self.keepalive_per_minute
+        self._refilled = clock()
+        self._background: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.Task] = None
+
+        self.calls = 0
+        self.spend_seconds = 0.0
+        self.uses = {"warm": 0, "warming": 0, "cold": 0}
+        self.first_uses = {"warm": 0, "warming": 0, "cold": 0}
+
+        metrics = get_metrics_registry()
+        self._metrics = metrics
+        self._warm_size = metrics.gauge("model_warmup_warm_profiles")
+        self._cold_rate = metrics.gauge("model_warmup_cold_start_ratio")
+        self._first_cold_rate = metrics.gauge("model_warmup_first_use_cold_start_ratio")
+
+    def status(self, profile_id: str) -> str:
+        """
+        Warm state of a profile.
+
+        Returns:
+            'warm', 'warming' (warm-up in flight) or 'cold'
+        """
+        profile = self._profiles.get(profile_id)
+        if profile is None:
+            return "cold"
+        if profile.warmed_at is not None and self.clock() - profile.warmed_at < self.ttl_seconds:
+            return "warm"
+        if profile.task is not None:
+            return "warming"
+        return "cold"
+
+    @property
+    def warm_profiles(self) -> list[str]:
+        """Profiles that are warm or being warmed."""
+        return [pid for pid, profile in self._profiles.items() if self._holds(profile)]
+
+    @property
+    def cold_start_rate(self) -> float:
+        """Share of syntheses since start-up that found their model cold."""
+        total = sum(self.uses.values())
+        return self.uses["cold"] / total if total else 0.0
+
+    @property
+    def first_use_cold_start_rate(self) -> float:
+        """Share of speakers whose first synthesis found their model cold."""
+        total = sum(self.first_uses.values())
+        return self.first_uses["cold"] / total if total else 0.0
+
+    def attach(self, registry: SessionRegistry) -> None:
+        """Follow a session registry's speaker events."""
+        registry.add_listener(self.on_session_event)
+
+    def on_session_event(self, event: SessionEvent) -> None:
+        """Update demand from a speaker event and warm ahead of it."""
+        if event.type is SessionEventType.SPEAKER_LEFT:
+            profile = self._profiles.get(event.profile_id)
+            if profile is not None:
+                profile.sessions.discard(event.session_id)
+            return
+        profile = self._profiles.setdefault(event.profile_id, _Profile())
+        profile.sessions.add(event.session_id)
+        profile.last_active = max(profile.last_active, event.at)
+        reason = "join" if event.type is SessionEventType.SPEAKER_JOINED else "activity"
+        self._schedule(event.profile_id, profile, reason)
+
+    def record_use(self, profile_id: str) -> str:
+        """
+        Record a synthesis for a profile, just before it is sent.
+
+        The synthesis loads a cold model itself, so the profile counts as
+        warm afterwards.
+
+        Returns:
+            State the model was in: 'warm', 'warming' or 'cold'
+        """
+        state = self.status(profile_id)
+        profile = self._profiles.setdefault(profile_id, _Profile())
+        first = not profile.used
+        profile.used = True
+        self.uses[state] += 1
+        if first:
+            self.first_uses[state] += 1
+        self._metrics.counter(
+            "model_warmup_uses_total", state=state, first=str(first).lower()
+        ).inc()
+        self._cold_rate.set(self.cold_start_rate)
+        self._first_cold_rate.set(self.first_use_cold_start_rate)
+
+        now = self.clock()
+        profile.last_active = max(profile.last_active, now)
+        if state == "cold" and not self._make_room(profile_id):
+            return state
+        if state == "cold" and self.redis is not None:
+            self._spawn(self._hold(profile_id))
+        profile.warmed_at = now
+        self._warm_size.set(len(self.warm_profiles))
+        return state
+
+    def tick(self) -> None:
+        """Evict departed, idle and expired profiles and run keep-alives."""
+        now = self.clock()
+        self._tokens = min(
+            self.keepalive_per_minute,
+            self._tokens + (now - self._refilled) * self.keepalive_per_minute / 60,
+        )
+        self._refilled = now
+        due = []
+        for profile_id, profile in list(self._profiles.items()):
+            idle = now - profile.last_active >= self.idle_seconds
+            if not profile.sessions or idle:
+                self._evict(profile_id, "departed" if not profile.sessions else "idle")
+                continue
+            if profile.warmed_at is None:
+                continue
+            age = now - profile.warmed_at
+            if age >= self.ttl_seconds:
+                profile.warmed_at = None  # Lapsed; re-warmed on the next activity
+            elif age >= self.keepalive_seconds and profile.task is None:
+                due.append((profile.warmed_at, profile_id))
+        for _, profile_id in sorted(due):
+            if self._tokens < 1:
+                self._metrics.counter("model_warmup_keepalive_deferred_total").inc()
+                continue
+            self._tokens -= 1
+            self._start(profile_id, self._profiles[profile_id], "keepalive")
+        self._warm_size.set(len(self.warm_profiles))
+
+    async def start(self) -> None:
+        """Run ``tick`` in the background every few seconds."""
+        if self._loop is None:
+            self._loop = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background loop and wait for warm-ups in flight."""
+        if self._loop is not None:
+            self._loop.cancel()
+            await asyncio.gather(self._loop, return_exceptions=True)
+            self._loop = None
+        tasks = [p.task for p in self._profiles.values() if p.task is not None]
+        await asyncio.gather(*tasks, *self._background, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(TICK_SECONDS)
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error("Warm-up tick failed", error=str(e))
+
+    def _holds(self, profile: _Profile) -> bool:
+        return profile.task is not None or profile.warmed_at is not None
+
+    def _schedule(self, profile_id: str, profile: _Profile, reason: str) -> None:
+        if self.status(profile_id) != "cold":
+            return
+        if self._make_room(profile_id):
+            self._start(profile_id, profile, reason)
+        else:
+            self._metrics.counter("model_warmup_skipped_total", reason="budget").inc()
+
+    def _make_room(self, profile_id: str) -> bool:
+        """Evict another profile if the warm set is full; False if none can go."""
+        held = [
+            (bool(p.sessions), p.last_active, pid)
+            for pid, p in self._profiles.items()
+            if pid != profile_id and self._holds(p)
+        ]
+        if len(held) < self.max_profiles:
+            return True
+        if not held:
+            return False
+        self._evict(min(held)[2], "budget")
+        return True
+
+    def _start(self, profile_id: str, profile: _Profile, reason: str) -> None:
+        profile.task = asyncio.create_task(self._warm(profile_id, profile, reason))
+
+    async def _warm(self, profile_id: str, profile: _Profile, reason: str) -> None:
+        key = cache_key("model_warmup", profile_id=profile_id)
+        try:
+            async with self._limit:
+                if self.redis is not None:
+                    try:
+                        remaining = await self.redis.ttl(key)
+                        if self._shared_warmup(reason, remaining):
+                            # Another node warmed (or refreshed) it recently
+                            self._metrics.counter(
+                                "model_warmup_skipped_total", reason="shared"
+                            ).inc()
+                            profile.warmed_at = self.clock() - (self.ttl_seconds - remaining)
+                            await self._hold(profile_id)
+                            return
+                    except RedisError as e:
+                        logger.warning(
+                            "Warm-up marker read failed", profile_id=profile_id, error=str(e)
+                        )
+                start = time.perf_counter()
+                try:
+                    await self.warm(profile_id)
+                except Exception as e:
+                    self._metrics.counter("model_warmup_failures_total", reason=reason).inc()
+                    logger.warning("Model warm-up failed", profile_id=profile_id, error=str(e))
+                    return
+                finally:
+                    elapsed = time.perf_counter() - start
+                    self.calls += 1
+                    self.spend_seconds += elapsed
+                    self._metrics.counter("model_warmup_calls_total", reason=reason).inc()
+                    self._metrics.counter(
+                        "model_warmup_seconds_total", reason=reason
+                    ).inc(elapsed)
+                if self._profiles.get(profile_id) is not profile:
+                    return  # Evicted while warming
+                profile.warmed_at = self.clock()
+                if self.redis is not None:
+                    try:
+                        await self.redis.set(key, "1", ex=int(self.ttl_seconds))
+                    except RedisError as e:
+                        logger.warning(
+                            "Warm-up marker write failed", profile_id=profile_id, error=str(e)
+                        )
+                    await self._hold(profile_id)
+        finally:
+            if profile.task is asyncio.current_task():
+                profile.task = None
+            self._warm_size.set(len(self.warm_profiles))
+
+    def _shared_warmup(self, reason: str, remaining: int) -> bool:
+        if remaining <= 0:
+            return False
+        if reason == "keepalive":
+            return remaining > self.ttl_seconds - self.keepalive_seconds
+        return True
+
+    def _evict(self, profile_id: str, reason: str) -> None:
+        profile = self._profiles.get(profile_id)
+        if profile is None:
+            return
+        held = self._holds(profile)
+        if profile.task is not None:
+            profile.task.cancel()
+            profile.task = None
+        profile.warmed_at = None
+        if not profile.sessions:
+            del self._profiles[profile_id]
+        if not held:
+            return
+        self._metrics.counter("model_warmup_evictions_total", reason=reason).inc()
+        if self.redis is not None or self.unload is not None:
+            self._spawn(self._unload(profile_id))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _hold(self, profile_id: str) -> None:
+        try:
+            await self._hold_script(
+                keys=[cache_key("model_warmup_nodes", profile_id=profile_id)],
+                args=[self.node_id, self.ttl_seconds],
+            )
+        except RedisError as e:
+            logger.warning("Warm-up hold failed", profile_id=profile_id, error=str(e))
+
+    async def _unload(self, profile_id: str) -> None:
+        try:
+            if self.redis is not None:
+                last = await self._release_script(
+                    keys=[
+                        cache_key("model_warmup_nodes", profile_id=profile_id),
+                        cache_key("model_warmup", profile_id=profile_id),
+                    ],
+                    args=[self.node_id],
+                )
+                if not int(last):
+                    # Another node still hosts the speaker; its TTL governs the model
+                    self._metrics.counter("model_warmup_unloads_skipped_total").inc()
+                    return
+            if self.unload is not None:
+                await self.unload(profile_id)
+        except Exception as e:
+            # Includes Redis errors: without knowing the holders, leave the model loaded
+            logger.warning("Model unload failed", profile_id=profile_id, error=str(e))
+
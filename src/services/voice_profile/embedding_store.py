@@ -0,0 +1,516 @@
+"""Memory-mapped voice-embedding store with vectorized cosine search.
+
+Enrolled speaker embeddings (256-dimensional in DESIGN.md) live in two
+files in one directory:
+
+- ``embeddings.bin``: a 64-byte header, then one fixed-width row per
+  embedding, float16 or float32, L2-normalized on write. Rows are only ever
+  appended. Each process maps the file read-only with ``np.memmap``, so
+  worker processes share the page cache instead of each holding a copy.
+- ``embeddings.log``: append-only ``add`` (profile id -> row) and ``remove``
+  (tombstone) records. Replaying the log rebuilds the id index, and
+  ``refresh()`` applies only the records appended since the last call.
+
+Replacing a profile's embedding tombstones its old row and appends a new
+one. ``compact()`` rewrites both files without the dead rows.
+
+Search normalizes a batch of queries, multiplies it against the rows block
+by block, and keeps the top k with ``argpartition``. For large tenants,
+``build_index()`` adds an IVF coarse index: spherical k-means centroids,
+and each query scans only the rows listed under its ``nprobe`` nearest
+centroids. Rows appended after the index was built are scanned
+exhaustively until it is rebuilt.
+
+NumPy converts float16 to float32 in software, so float16 rows halve the
+file and page cache but make exact scans several times slower than float32
+rows. The coarse index keeps either fast.
+
+One process writes a store; any number may read it. A writer holds an
+exclusive ``flock`` on ``embeddings.lock`` for as long as it is open, so a
+second writer fails fast instead of truncating the files or assigning rows
+the first writer has already used. ``get_embedding_store()`` opens the
+store read-only in every process, and only the process that enrolls
+profiles calls ``get_embedding_writer()``.
+"""
+
+import fcntl
+import math
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from src.shared.config import get_settings
+from src.shared.errors import StorageError, ValidationError
+
+DATA_FILE = "embeddings.bin"
+LOG_FILE = "embeddings.log"
+LOCK_FILE = "embeddings.lock"  # never replaced, unlike the log, so the lock survives compaction
+MAGIC = b"UVEM"
+VERSION = 1
+HEADER_BYTES = 64
+SEARCH_BLOCK_ROWS = 16_384
+ASSIGN_BLOCK_ROWS = 16_384  # rows x centroids scores per k-means step
+TRAIN_ROWS_PER_LIST = 32
+
+_HEADER = struct.Struct(">4sHHB")  # magic, version, dimension, dtype code
+_RECORD = struct.Struct(">BIH")  # op, row, profile id length (then the id)
+_ADD, _REMOVE = 1, 2
+_DTYPES = {1: np.dtype("<f2"), 2: np.dtype("<f4")}
+_DTYPE_CODES = {"float16": 1, "float32": 2}
+
+Match = tuple[str, float]
+
+
+class CoarseIndex(NamedTuple):
+    """IVF lists: row ids grouped by nearest centroid."""
+
+    centroids: np.ndarray  # (lists, dim) float32, unit length
+    rows: np.ndarray  # row ids, list by list
+    bounds: np.ndarray  # list i is rows[bounds[i]:bounds[i + 1]]
+    indexed: int  # rows at build time; later rows are scanned exhaustively
+    nprobe: int
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    if not np.all(norms > 0):
+        raise ValidationError("Embedding vectors must be non-zero")
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the ``k`` largest scores per row, unordered."""
+    if k >= scores.shape[1]:
+        return np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    return np.argpartition(scores, -k, axis=1)[:, -k:]
+
+
+class EmbeddingStore:
+    """
+    Local store of L2-normalized speaker embeddings keyed by profile id.
+
+    Args:
+        path: Store directory, created with a new store when missing
+        dim: Embedding width of a new store (defaults to ``VOICE_EMBEDDING_DIM``)
+        dtype: ``float16`` or ``float32`` rows for a new store
+            (defaults to ``VOICE_EMBEDDING_DTYPE``)
+        readonly: Open for search only; ``refresh()`` picks up the writer's changes
+
+    Raises:
+        StorageError: If another writer has the store open, or ``path`` holds
+            no store and ``readonly`` is set
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        dim: Optional[int] = None,
+        dtype: Optional[str] = None,
+        readonly: bool = False,
+    ):
+        self.path = Path(path)
+        self.readonly = readonly
+        self._data_path = self.path / DATA_FILE
+        self._log_path = self.path / LOG_FILE
+        self._data = self._log = self._lock = None
+        if not readonly:
+            self._acquire_lock()
+        try:
+            self._load(dim, dtype)
+        except BaseException:
+            self.close()
+            raise
+
+    def _acquire_lock(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = open(self.path / LOCK_FILE, "ab")
+        try:
+            fcntl.flock(self._lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._lock.close()
+            self._lock = None
+            raise StorageError(
+                f"Embedding store {self.path} is already open for writing",
+                details={"path": str(self.path)},
+            )
+
+    def _load(self, dim: Optional[int], dtype: Optional[str]) -> None:
+        settings = get_settings()
+        if not self._data_path.exists():
+            if self.readonly:
+                raise StorageError(f"No embedding store at {self.path}")
+            dtype = dtype or settings.voice_embedding_dtype
+            if dtype not in _DTYPE_CODES:
+                raise ValidationError(f"Unsupported embedding dtype: {dtype}")
+            header = _HEADER.pack(
+                MAGIC, VERSION, dim or settings.voice_embedding_dim, _DTYPE_CODES[dtype]
+            )
+            self._data_path.write_bytes(header.ljust(HEADER_BYTES, b"\0"))
+            self._log_path.write_bytes(b"")
+
+        with open(self._data_path, "rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise StorageError(f"Not an embedding store: {self._data_path}")
+        magic, version, self.dim, code = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or code not in _DTYPES:
+            raise StorageError(f"Not an embedding store: {self._data_path}")
+        self.dtype = _DTYPES[code]
+        self._row_bytes = self.dim * self.dtype.itemsize
+        self._reset()
+        self.refresh()
+        if not self.readonly:
+            # Drop what a crashed writer wrote without logging it
+            os.truncate(self._data_path, HEADER_BYTES + len(self._ids) * self._row_bytes)
+            os.truncate(self._log_path, self._log_offset)
+            self._data = open(self._data_path, "ab")
+            self._log = open(self._log_path, "ab")
+
+    def _reset(self) -> None:
+        self._ids: list[Optional[str]] = []  # row -> profile id, None once removed
+        self._rows: dict[str, int] = {}
+        self._live = np.zeros(1024, dtype=bool)
+        self._log_offset = 0
+        self._data_inode = os.stat(self._data_path).st_ino
+        self._log_inode = os.stat(self._log_path).st_ino
+        self._matrix: Optional[np.ndarray] = None
+        self._index: Optional[CoarseIndex] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, profile_id: object) -> bool:
+        return profile_id in self._rows
+
+    def __enter__(self) -> "EmbeddingStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the writer's files, release the writer lock and unmap the rows."""
+        self._close_files()
+        if self._lock is not None:
+            self._lock.close()  # releases the flock
+            self._lock = None
+        self._matrix = None
+
+    def _close_files(self) -> None:
+        for f in (self._data, self._log):
+            if f is not None:
+                f.close()
+        self._data = self._log = None
+
+    def refresh(self) -> None:
+        """Apply log records appended since the last call, by any process."""
+        if os.stat(self._log_path).st_ino != self._log_inode:
+            # The writer compacted the store: start over from the new files
+            self._reset()
+        elif os.stat(self._data_path).st_ino != self._data_inode:
+            # Compaction has swapped in the new rows but not yet their log
+            return
+        with open(self._log_path, "rb") as f:
+            f.seek(self._log_offset)
+            data = f.read()
+        offset = 0
+        while offset + _RECORD.size <= len(data):
+            op, row, length = _RECORD.unpack_from(data, offset)
+            end = offset + _RECORD.size + length
+            if end > len(data):
+                break  # the writer is midway through this record
+            self._apply(op, row, data[offset + _RECORD.size:end].decode())
+            offset = end
+        self._log_offset += offset
+        # Map now, so the rows always come from the same generation as the log
+        self._matrix_view()
+
+    def _apply(self, op: int, row: int, profile_id: str) -> None:
+        if op == _ADD:
+            old = self._rows.get(profile_id)
+            if old is not None:
+                self._ids[old] = None
+                self._live[old] = False
+            if row >= len(self._ids):
+                self._ids.extend([None] * (row + 1 - len(self._ids)))
+            if row >= len(self._live):
+                live = np.zeros(max(row + 1, 2 * len(self._live)), dtype=bool)
+                live[:len(self._live)] = self._live
+                self._live = live
+            self._ids[row] = profile_id
+            self._rows[profile_id] = row
+            self._live[row] = True
+        elif self._rows.get(profile_id) == row:
+            del self._rows[profile_id]
+            self._ids[row] = None
+            self._live[row] = False
+
+    def _matrix_view(self) -> np.ndarray:
+        rows = len(self._ids)
+        if self._matrix is None or len(self._matrix) != rows:
+            if rows == 0:
+                self._matrix = np.empty((0, self.dim), dtype=self.dtype)
+            else:
+                self._matrix = np.memmap(
+                    self._data_path,
+                    dtype=self.dtype,
+                    mode="r",
+                    offset=HEADER_BYTES,
+                    shape=(rows, self.dim),
+                )
+        return self._matrix
+
+    def _writable(self) -> None:
+        if self.readonly or self._data is None:
+            raise StorageError("Embedding store is not open for writing")
+
+    @staticmethod
+    def _record(op: int, row: int, profile_id: str) -> bytes:
+        encoded = profile_id.encode()
+        return _RECORD.pack(op, row, len(encoded)) + encoded
+
+    def add(self, profile_id: str, vector: Sequence[float]) -> None:
+        """Store or replace one profile's embedding."""
+        self.add_many([profile_id], [vector])
+
+    def add_many(self, profile_ids: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Store or replace many embeddings with one write to each file.
+
+        Args:
+            profile_ids: Distinct profile ids
+            vectors: One embedding of width ``dim`` per id
+
+        Raises:
+            ValidationError: On a width mismatch, a zero vector or a repeated id
+        """
+        self._writable()
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape != (len(profile_ids), self.dim):
+            raise ValidationError(
+                f"Expected {len(profile_ids)} embeddings of width {self.dim}",
+                details={"shape": list(vectors.shape)},
+            )
+        if len(set(profile_ids)) != len(profile_ids):
+            raise ValidationError("Profile ids must be distinct")
+        rows = _normalize(vectors).astype(self.dtype)
+        first = len(self._ids)
+        # Rows first: a log record never points past the end of the data file
+        self._data.write(rows.tobytes())
+        self._data.flush()
+        self._log.write(
+            b"".join(
+                self._record(_ADD, first + i, profile_id)
+                for i, profile_id in enumerate(profile_ids)
+            )
+        )
+        self._log.flush()
+        self.refresh()
+
+    def remove(self, profile_id: str) -> bool:
+        """Tombstone a profile's embedding; returns whether it was stored."""
+        self._writable()
+        row = self._rows.get(profile_id)
+        if row is None:
+            return False
+        self._log.write(self._record(_REMOVE, row, profile_id))
+        self._log.flush()
+        self.refresh()
+        return True
+
+    def get(self, profile_id: str) -> Optional[np.ndarray]:
+        """A profile's normalized embedding as float32, or None."""
+        row = self._rows.get(profile_id)
+        if row is None:
+            return None
+        return self._matrix_view()[row].astype(np.float32)
+
+    def search(
+        self,
+        queries: Union[Sequence[float], Sequence[Sequence[float]]],
+        k: int = 5,
+        nprobe: Optional[int] = None,
+    ) -> list[list[Match]]:
+        """
+        Find the stored embeddings most similar to each query.
+
+        Args:
+            queries: One embedding, or a batch of them
+            k: Matches per query
+            nprobe: Coarse lists scanned per query when indexed
+                (defaults to the index's ``nprobe``)
+
+        Returns:
+            Per query, up to ``k`` (profile id, cosine similarity), best first
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if queries.shape[1] != self.dim:
+            raise ValidationError(f"Expected queries of width {self.dim}")
+        queries = _normalize(queries)
+        k = min(k, len(self))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+        if self._index is not None:
+            found = self._search_index(queries, k, nprobe or self._index.nprobe)
+        else:
+            found = self._search_exact(queries, k)
+        return [
+            [(self._ids[row], float(score)) for row, score in zip(rows, scores)]
+            for rows, scores in found
+        ]
+
+    def _search_exact(self, queries: np.ndarray, k: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        matrix = self._matrix_view()
+        has_dead = len(self._rows) < len(matrix)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, len(matrix), SEARCH_BLOCK_ROWS):
+            block = np.asarray(matrix[start:start + SEARCH_BLOCK_ROWS], dtype=np.float32)
+            scores = queries @ block.T
+            if has_dead:
+                scores[:, ~self._live[start:start + len(block)]] = -np.inf
+            top = _top_k(scores, k)
+            rows = np.concatenate([best_rows, top + start], axis=1)
+            scores = np.concatenate([best_scores, np.take_along_axis(scores, top, 1)], axis=1)
+            keep = _top_k(scores, k)
+            best_rows = np.take_along_axis(rows, keep, 1)
+            best_scores = np.take_along_axis(scores, keep, 1)
+        order = np.argsort(-best_scores, axis=1)
+        return list(
+            zip(np.take_along_axis(best_rows, order, 1), np.take_along_axis(best_scores, order, 1))
+        )
+
+    def _search_index(
+        self, queries: np.ndarray, k: int, nprobe: int
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        index = self._index
+        matrix = self._matrix_view()
+        probes = _top_k(queries @ index.centroids.T, min(nprobe, len(index.centroids)))
+        tail = np.arange(index.indexed, len(matrix))
+        found = []
+        for query, lists in zip(queries, probes):
+            candidates = np.concatenate(
+                [index.rows[index.bounds[i]:index.bounds[i + 1]] for i in lists] + [tail]
+            )
+            candidates = candidates[self._live[candidates]]
+            # Ascending rows read the mapped file front to back
+            candidates.sort()
+            scores = np.asarray(matrix[candidates], dtype=np.float32) @ query
+            top = _top_k(scores[None, :], k)[0]
+            top = top[np.argsort(-scores[top])]
+            found.append((candidates[top], scores[top]))
+        return found
+
+    def build_index(
+        self,
+        lists: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        iterations: int = 8,
+        seed: int = 0,
+    ) -> None:
+        """
+        Build the IVF coarse index over the live rows.
+
+        Args:
+            lists: Number of centroids (defaults to the square root of the row count)
+            nprobe: Lists scanned per query (defaults to ``VOICE_EMBEDDING_IVF_NPROBE``)
+            iterations: Spherical k-means iterations over a sample of the rows
+            seed: Random seed for the sample and initial centroids
+        """
+        matrix = self._matrix_view()
+        live_rows = np.flatnonzero(self._live[:len(matrix)])
+        if len(live_rows) == 0:
+            self._index = None
+            return
+        lists = min(lists or max(1, int(math.sqrt(len(live_rows)))), len(live_rows))
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(live_rows, min(len(live_rows), lists * TRAIN_ROWS_PER_LIST), False)
+        train = np.asarray(matrix[np.sort(sample)], dtype=np.float32)
+        centroids = train[rng.choice(len(train), lists, replace=False)]
+        for _ in range(iterations):
+            assign = self._assign(train, centroids)
+            order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=lists)
+            filled = np.flatnonzero(counts)
+            starts = np.concatenate([[0], np.cumsum(counts)])[filled]
+            centroids[filled] = np.add.reduceat(train[order], starts, axis=0)
+            centroids = _normalize(centroids)
+
+        assign = np.concatenate(
+            [
+                self._assign(
+                    np.asarray(matrix[live_rows[start:start + ASSIGN_BLOCK_ROWS]], np.float32),
+                    centroids,
+                )
+                for start in range(0, len(live_rows), ASSIGN_BLOCK_ROWS)
+            ]
+        )
+        order = np.argsort(assign, kind="stable")
+        self._index = CoarseIndex(
+            centroids=centroids,
+            rows=live_rows[order],
+            bounds=np.searchsorted(assign[order], np.arange(lists + 1)),
+            indexed=len(matrix),
+            nprobe=nprobe or get_settings().voice_embedding_ivf_nprobe,
+        )
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        return np.concatenate(
+            [
+                np.argmax(vectors[start:start + ASSIGN_BLOCK_ROWS] @ centroids.T, axis=1)
+                for start in range(0, len(vectors), ASSIGN_BLOCK_ROWS)
+            ]
+        )
+
+    def drop_index(self) -> None:
+        """Go back to exact search."""
+        self._index = None
+
+    def compact(self) -> None:
+        """Rewrite the store without removed rows; drops the coarse index."""
+        self._writable()
+        matrix = self._matrix_view()
+        rows = np.flatnonzero(self._live[:len(matrix)])
+        data_tmp = self._data_path.with_name(DATA_FILE + ".tmp")
+        log_tmp = self._log_path.with_name(LOG_FILE + ".tmp")
+        with open(self._data_path, "rb") as f:
+            header = f.read(HEADER_BYTES)
+        with open(data_tmp, "wb") as data, open(log_tmp, "wb") as log:
+            data.write(header)
+            for start in range(0, len(rows), SEARCH_BLOCK_ROWS):
+                data.write(np.asarray(matrix[rows[start:start + SEARCH_BLOCK_ROWS]]).tobytes())
+            log.write(
+                b"".join(
+                    self._record(_ADD, new_row, self._ids[row])
+                    for new_row, row in enumerate(rows)
+                )
+            )
+        self._close_files()
+        # Data first: readers wait for the new log before switching (see ``refresh``)
+        os.replace(data_tmp, self._data_path)
+        os.replace(log_tmp, self._log_path)
+        self._reset()
+        self.refresh()
+        self._data = open(self._data_path, "ab")
+        self._log = open(self._log_path, "ab")
+
+
+@lru_cache()
+def get_embedding_store() -> EmbeddingStore:
+    """Get cached read-only embedding store, with a coarse index once it is large."""
+    settings = get_settings()
+    store = EmbeddingStore(settings.voice_embedding_store_dir, readonly=True)
+    if len(store) >= settings.voice_embedding_ivf_min_profiles:
+        store.build_index(nprobe=settings.voice_embedding_ivf_nprobe)
+    return store
+
+
+@lru_cache()
+def get_embedding_writer() -> EmbeddingStore:
+    """Get cached writable embedding store; only one process may hold it."""
+    return EmbeddingStore(get_settings().voice_embedding_store_dir)
@@ -0,0 +1,543 @@
+"""Asyncio AWS service client wrappers built on aioboto3."""
+
+import asyncio
+import inspect
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from .aws_clients import (
+    BATCH_GET_MAX_KEYS,
+    BATCH_WRITE_MAX_ITEMS,
+    _chunked,
+    _dedupe_keys,
+    _dedupe_writes,
+    _projection_args,
+    _unprocessed_backoff,
+)
+from .config import get_settings
+from .errors import ServiceUnavailableError, StorageError, TranslationError
+from .logging import get_logger
+from .resilience import RetryPolicy, client_config_options, is_retryable
+
+logger = get_logger(__name__)
+
+
+class AsyncAWSClientManager:
+    """
+    Manages long-lived aioboto3 clients sharing one session and connection pool.
+
+    Clients are opened on first use and kept until ``close()`` is called, so
+    services should call ``start()``/``close()`` from their startup and
+    shutdown hooks (see ``aws_client_lifespan``).
+    """
+
+    def __init__(self, max_pool_connections: Optional[int] = None):
+        # aioboto3 pulls in aiohttp and botocore (~300 ms); import with the first manager
+        import aioboto3
+        from aiobotocore.config import AioConfig
+
+        self.settings = get_settings()
+        self.session = aioboto3.Session(region_name=self.settings.aws_region)
+        self._config = AioConfig(**client_config_options(max_pool_connections))
+        self._clients: dict[str, Any] = {}
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Prepare the manager to open clients. Safe to call more than once."""
+        if self._exit_stack is None:
+            self._exit_stack = AsyncExitStack()
+            logger.info("Async AWS client manager started")
+
+    async def close(self) -> None:
+        """Close every open client and release pooled connections."""
+        async with self._lock:
+            if self._exit_stack is not None:
+                await self._exit_stack.aclose()
+                self._exit_stack = None
+            self._clients.clear()
+        logger.info("Async AWS client manager closed")
+
+    async def __aenter__(self) -> "AsyncAWSClientManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _open(self, key: str, factory: Any) -> Any:
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        async with self._lock:
+            if key not in self._clients:
+                await self.start()
+                self._clients[key] = await self._exit_stack.enter_async_context(factory)
+        return self._clients[key]
+
+    async def get_client(self, service_name: str) -> Any:
+        """
+        Get or create async AWS service client.
+
+        Args:
+            service_name: AWS service name (e.g., 's3', 'dynamodb')
+
+        Returns:
+            aiobotocore client instance
+        """
+        if service_name in self._clients:
+            return self._clients[service_name]
+
+        client = await self._open(
+            service_name, self.session.client(service_name, config=self._config)
+        )
+        logger.info("Created async AWS client", service=service_name)
+        return client
+
+    async def get_resource(self, service_name: str) -> Any:
+        """
+        Get or create async AWS service resource.
+
+        Args:
+            service_name: AWS service name (e.g., 's3', 'dynamodb')
+
+        Returns:
+            aioboto3 resource instance
+        """
+        resource_key = f"{service_name}_resource"
+        if resource_key in self._clients:
+            return self._clients[resource_key]
+
+        resource = await self._open(
+            resource_key, self.session.resource(service_name, config=self._config)
+        )
+        logger.info("Created async AWS resource", service=service_name)
+        return resource
+
+    def register_client(self, service_name: str, client: Any) -> None:
+        """
+        Use a pre-built client for a service (e.g., an in-process fake).
+
+        Args:
+            service_name: AWS service name
+            client: Client instance to return from get_client
+        """
+        self._clients[service_name] = client
+
+    def register_resource(self, service_name: str, resource: Any) -> None:
+        """
+        Use a pre-built resource for a service (e.g., an in-process fake).
+
+        Args:
+            service_name: AWS service name
+            resource: Resource instance to return from get_resource
+        """
+        self._clients[f"{service_name}_resource"] = resource
+
+
+@lru_cache()
+def get_async_aws_client_manager() -> AsyncAWSClientManager:
+    """Get cached async AWS client manager instance."""
+    return AsyncAWSClientManager()
+
+
+@asynccontextmanager
+async def aws_client_lifespan(app: Any = None) -> AsyncIterator[AsyncAWSClientManager]:
+    """
+    Lifespan hook that opens the shared async clients and closes them on shutdown.
+
+    Usage:
+        app = FastAPI(lifespan=aws_client_lifespan)
+    """
+    manager = get_async_aws_client_manager()
+    await manager.start()
+    try:
+        yield manager
+    finally:
+        await manager.close()
+
+
+class AsyncDynamoDBClient:
+    """Async DynamoDB client wrapper with error handling."""
+
+    def __init__(self, manager: Optional[AsyncAWSClientManager] = None):
+        self.manager = manager or get_async_aws_client_manager()
+        self.settings = get_settings()
+        self._resource: Any = None
+        self._tables: dict[str, Any] = {}
+        self._get_policy = RetryPolicy.for_service("dynamodb", "get_item")
+        self._put_policy = RetryPolicy.for_service("dynamodb", "put_item")
+        self._batch_get_policy = RetryPolicy.for_service("dynamodb", "batch_get_item")
+        self._batch_write_policy = RetryPolicy.for_service("dynamodb", "batch_write_item")
+
+    async def _table(self, table_name: str) -> Any:
+        """Get a cached Table handle, rebuilt if the manager reopened its resource."""
+        resource = await self.manager.get_resource("dynamodb")
+        if resource is not self._resource:
+            self._resource = resource
+            self._tables.clear()
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables[table_name] = await resource.Table(table_name)
+        return table
+
+    async def _key_names(self, table_name: str) -> list[str]:
+        """Key attribute names of a table, loaded once per Table handle."""
+        key_schema = (await self._table(table_name)).key_schema
+        if inspect.isawaitable(key_schema):
+            key_schema = await key_schema  # aioboto3 loads resource attributes lazily
+        return [attr["AttributeName"] for attr in key_schema]
+
+    async def get_item(
+        self, table_name: str, key: dict, attributes: Optional[list[str]] = None
+    ) -> Optional[dict]:
+        """
+        Get item from DynamoDB table with deadline-aware retries.
+
+        Args:
+            table_name: DynamoDB table name
+            key: Item key
+            attributes: Attributes to fetch (defaults to the whole item)
+
+        Returns:
+            Item data or None if not found
+        """
+        try:
+            table = await self._table(table_name)
+            response = await self._get_policy.acall(
+                table.get_item, Key=key, **_projection_args(attributes)
+            )
+            return response.get("Item")
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                raise StorageError(f"Table not found: {table_name}")
+            logger.error("DynamoDB get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get item from {table_name}")
+        except BotoCoreError as e:
+            logger.error("DynamoDB get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get item from {table_name}")
+
+    async def put_item(self, table_name: str, item: dict) -> None:
+        """
+        Put item to DynamoDB table with deadline-aware retries.
+
+        Args:
+            table_name: DynamoDB table name
+            item: Item data
+        """
+        try:
+            table = await self._table(table_name)
+            await self._put_policy.acall(table.put_item, Item=item)
+        except (ClientError, BotoCoreError) as e:
+            logger.error("DynamoDB put_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to put item to {table_name}")
+
+    async def batch_get_items(
+        self,
+        table_name: str,
+        keys: list[dict],
+        attributes: Optional[list[str]] = None,
+        consistent_read: bool = False,
+    ) -> list[dict]:
+        """
+        Get many items in concurrent BatchGetItem calls of up to 100 keys.
+
+        At most ``DYNAMODB_BATCH_CONCURRENCY`` calls are in flight.
+
+        Args:
+            table_name: DynamoDB table name
+            keys: Item keys (duplicates are ignored)
+            attributes: Attributes to fetch (defaults to whole items)
+            consistent_read: Whether to use strongly consistent reads
+
+        Returns:
+            Found items, in no particular order
+        """
+        keys = _dedupe_keys(keys)
+        if not keys:
+            return []
+
+        request_args = {"ConsistentRead": consistent_read, **_projection_args(attributes)}
+        limit = asyncio.Semaphore(self.settings.dynamodb_batch_concurrency)
+
+        async def fetch(client: Any, chunk: list[dict]) -> list[dict]:
+            items: list[dict] = []
+            pending = {table_name: {"Keys": chunk, **request_args}}
+            for attempt in range(self.settings.dynamodb_unprocessed_max_retries + 1):
+                async with limit:
+                    response = await self._batch_get_policy.acall(
+                        client.batch_get_item, RequestItems=pending
+                    )
+                items.extend(response.get("Responses", {}).get(table_name, []))
+                pending = response.get("UnprocessedKeys") or {}
+                if not pending:
+                    return items
+                delay = _unprocessed_backoff(
+                    attempt, self._batch_get_policy.base_delay, self._batch_get_policy.max_delay
+                )
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+
+            remaining = len(pending.get(table_name, {}).get("Keys", []))
+            raise StorageError(
+                f"Failed to get {remaining} items from {table_name}",
+                details={"unprocessed": remaining},
+            )
+
+        try:
+            resource = await self.manager.get_resource("dynamodb")
+            results = await asyncio.gather(
+                *(
+                    fetch(resource.meta.client, chunk)
+                    for chunk in _chunked(keys, BATCH_GET_MAX_KEYS)
+                )
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                raise StorageError(f"Table not found: {table_name}")
+            logger.error("DynamoDB batch_get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get items from {table_name}")
+        except BotoCoreError as e:
+            logger.error("DynamoDB batch_get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get items from {table_name}")
+
+        return [item for chunk_items in results for item in chunk_items]
+
+    async def batch_write_items(
+        self,
+        table_name: str,
+        items: Optional[list[dict]] = None,
+        delete_keys: Optional[list[dict]] = None,
+    ) -> None:
+        """
+        Put and delete many items in concurrent BatchWriteItem calls of up to 25.
+
+        At most ``DYNAMODB_BATCH_CONCURRENCY`` calls are in flight. Writes to
+        the same key collapse to the last one, since DynamoDB rejects a batch
+        that names a key twice.
+
+        Args:
+            table_name: DynamoDB table name
+            items: Items to put
+            delete_keys: Keys of items to delete
+        """
+        requests = [{"PutRequest": {"Item": item}} for item in items or []]
+        requests += [{"DeleteRequest": {"Key": key}} for key in delete_keys or []]
+        if not requests:
+            return
+        limit = asyncio.Semaphore(self.settings.dynamodb_batch_concurrency)
+
+        async def write(client: Any, chunk: list[dict]) -> None:
+            pending = {table_name: chunk}
+            for attempt in range(self.settings.dynamodb_unprocessed_max_retries + 1):
+                async with limit:
+                    response = await self._batch_write_policy.acall(
+                        client.batch_write_item, RequestItems=pending
+                    )
+                pending = response.get("UnprocessedItems") or {}
+                if not pending:
+                    return
+                delay = _unprocessed_backoff(
+                    attempt,
+                    self._batch_write_policy.base_delay,
+                    self._batch_write_policy.max_delay,
+                )
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+
+            remaining = len(pending.get(table_name, []))
+            raise StorageError(
+                f"Failed to write {remaining} items to {table_name}",
+                details={"unprocessed": remaining},
+            )
+
+        try:
+            requests = _dedupe_writes(requests, await self._key_names(table_name))
+            resource = await self.manager.get_resource("dynamodb")
+            await asyncio.gather(
+                *(
+                    write(resource.meta.client, chunk)
+                    for chunk in _chunked(requests, BATCH_WRITE_MAX_ITEMS)
+                )
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error("DynamoDB batch_write_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to write items to {table_name}")
+
+
+class AsyncS3Client:
+    """Async S3 client wrapper with error handling."""
+
+    def __init__(self, manager: Optional[AsyncAWSClientManager] = None):
+        self.manager = manager or get_async_aws_client_manager()
+        self._upload_policy = RetryPolicy.for_service("s3", "put_object")
+        self._download_policy = RetryPolicy.for_service("s3", "get_object")
+
+    async def upload_file(self, bucket: str, key: str, data: bytes) -> None:
+        """
+        Upload file to S3 with deadline-aware retries.
+
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+            data: File data
+        """
+        try:
+            client = await self.manager.get_client("s3")
+            await self._upload_policy.acall(
+                client.put_object,
+                Bucket=bucket,
+                Key=key,
+                Body=data,
+                ServerSideEncryption="AES256",
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error("S3 upload failed", error=str(e), bucket=bucket, key=key)
+            raise StorageError(f"Failed to upload to S3: {bucket}/{key}")
+
+    async def download_file(self, bucket: str, key: str) -> bytes:
+        """
+        Download file from S3 with deadline-aware retries.
+
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+
+        Returns:
+            File data
+        """
+        try:
+            client = await self.manager.get_client("s3")
+
+            async def read_object() -> bytes:
+                # Body reads fail more often than the GET itself; retry them together
+                response = await client.get_object(Bucket=bucket, Key=key)
+                async with response["Body"] as stream:
+                    return await stream.read()
+
+            return await self._download_policy.acall(read_object)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                raise StorageError(f"Object not found: {bucket}/{key}")
+            logger.error("S3 download failed", error=str(e), bucket=bucket, key=key)
+            raise StorageError(f"Failed to download from S3: {bucket}/{key}")
+        except BotoCoreError as e:
+            logger.error("S3 download failed", error=str(e), bucket=bucket, key=key)
+            raise StorageError(f"Failed to download from S3: {bucket}/{key}")
+
+
+class AsyncKinesisClient:
+    """Async Kinesis client wrapper with error handling."""
+
+    def __init__(self, manager: Optional[AsyncAWSClientManager] = None):
+        self.manager = manager or get_async_aws_client_manager()
+        self._put_policy = RetryPolicy.for_service("kinesis", "put_record")
+
+    async def put_record(self, stream_name: str, data: bytes, partition_key: str) -> None:
+        """
+        Put record to Kinesis stream with deadline-aware retries.
+
+        Args:
+            stream_name: Kinesis stream name
+            data: Record data
+            partition_key: Partition key for sharding
+        """
+        try:
+            client = await self.manager.get_client("kinesis")
+            await self._put_policy.acall(
+                client.put_record,
+                StreamName=stream_name,
+                Data=data,
+                PartitionKey=partition_key,
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Kinesis put_record failed", error=str(e), stream=stream_name)
+            raise ServiceUnavailableError("kinesis", "Failed to publish to stream")
+
+
+class AsyncTranslateClient:
+    """Async Amazon Translate client wrapper with error handling."""
+
+    def __init__(self, manager: Optional[AsyncAWSClientManager] = None):
+        self.manager = manager or get_async_aws_client_manager()
+        self._translate_policy = RetryPolicy.for_service("translate", "translate_text")
+
+    async def translate_text(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        terminology: Optional[str] = None,
+        formality: Optional[str] = None,
+    ) -> str:
+        """
+        Translate text with deadline-aware retries.
+
+        Args:
+            text: Source text
+            source_language: Source language code
+            target_language: Target language code
+            terminology: Custom terminology name
+            formality: 'formal' or 'informal'
+
+        Returns:
+            Translated text
+        """
+        kwargs: dict[str, Any] = {}
+        if terminology:
+            kwargs["TerminologyNames"] = [terminology]
+        if formality:
+            kwargs["Settings"] = {"Formality": formality.upper()}
+        try:
+            client = await self.manager.get_client("translate")
+            response = await self._translate_policy.acall(
+                client.translate_text,
+                Text=text,
+                SourceLanguageCode=source_language,
+                TargetLanguageCode=target_language,
+                **kwargs,
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "Translate call failed",
+                error=str(e),
+                source=source_language,
+                target=target_language,
+            )
+            if is_retryable(e) or not isinstance(e, ClientError):
+                raise ServiceUnavailableError("translate", "Failed to translate text")
+            raise TranslationError(
+                "Translation rejected",
+                details={"code": e.response.get("Error", {}).get("Code", "")},
+            )
+        return response["TranslatedText"]
+
+
+@lru_cache()
+def get_async_dynamodb_client() -> AsyncDynamoDBClient:
+    """Get cached async DynamoDB client instance."""
+    return AsyncDynamoDBClient()
+
+
+@lru_cache()
+def get_async_s3_client() -> AsyncS3Client:
+    """Get cached async S3 client instance."""
+    return AsyncS3Client()
+
+
+@lru_cache()
+def get_async_kinesis_client() -> AsyncKinesisClient:
+    """Get cached async Kinesis client instance."""
+    return AsyncKinesisClient()
+
+
+@lru_cache()
+def get_async_translate_client() -> AsyncTranslateClient:
+    """Get cached async Translate client instance."""
+    return AsyncTranslateClient()
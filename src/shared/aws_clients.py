@@ -1,14 +1,18 @@
 """AWS service client wrappers with error handling and retry logic."""
 
-import boto3
-from typing import Optional
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
 from functools import lru_cache
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from botocore.exceptions import ClientError, BotoCoreError
 
 from .config import get_settings
 from .logging import get_logger
 from .errors import StorageError, ServiceUnavailableError
+from .resilience import RetryPolicy, client_config_options, remaining_budget
 
 logger = get_logger(__name__)
 
@@ -19,6 +23,16 @@ class AWSClientManager:
     def __init__(self):
         self.settings = get_settings()
         self._clients: dict[str, any] = {}
+        self._config = None
+    
+    def _boto3(self) -> Any:
+        # boto3 and botocore.config cost ~200 ms at import; load them with the first client
+        import boto3
+        from botocore.config import Config
+
+        if self._config is None:
+            self._config = Config(**client_config_options())
+        return boto3
     
     def get_client(self, service_name: str) -> any:
         """
@@ -31,9 +45,10 @@ class AWSClientManager:
             Boto3 client instance
         """
         if service_name not in self._clients:
-            self._clients[service_name] = boto3.client(
+            self._clients[service_name] = self._boto3().client(
                 service_name,
                 region_name=self.settings.aws_region,
+                config=self._config,
             )
             logger.info("Created AWS client", service=service_name)
         
@@ -52,13 +67,34 @@ class AWSClientManager:
         resource_key = f"{service_name}_resource"
         
         if resource_key not in self._clients:
-            self._clients[resource_key] = boto3.resource(
+            self._clients[resource_key] = self._boto3().resource(
                 service_name,
                 region_name=self.settings.aws_region,
+                config=self._config,
             )
             logger.info("Created AWS resource", service=service_name)
         
         return self._clients[resource_key]
+    
+    def register_client(self, service_name: str, client: any) -> None:
+        """
+        Use a pre-built client for a service (e.g., an in-process fake).
+        
+        Args:
+            service_name: AWS service name
+            client: Client instance to return from get_client
+        """
+        self._clients[service_name] = client
+    
+    def register_resource(self, service_name: str, resource: any) -> None:
+        """
+        Use a pre-built resource for a service (e.g., an in-process fake).
+        
+        Args:
+            service_name: AWS service name
+            resource: Resource instance to return from get_resource
+        """
+        self._clients[f"{service_name}_resource"] = resource
 
 
 @lru_cache()
@@ -67,76 +103,323 @@ def get_aws_client_manager() -> AWSClientManager:
     return AWSClientManager()
 
 
+# DynamoDB batch API limits
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+
+
+def _chunked(items: list, size: int) -> Iterator[list]:
+    """Split a list into consecutive chunks of at most size elements."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _dedupe_keys(keys: list[dict]) -> list[dict]:
+    """Drop duplicate keys, which BatchGetItem rejects outright."""
+    seen = set()
+    unique = []
+    for key in keys:
+        marker = tuple(sorted(key.items()))
+        if marker not in seen:
+            seen.add(marker)
+            unique.append(key)
+    return unique
+
+
+def _dedupe_writes(requests: list[dict], key_names: list[str]) -> list[dict]:
+    """Keep the last put or delete per key; BatchWriteItem rejects duplicate keys."""
+    latest: dict[tuple, dict] = {}
+    for request in requests:
+        if "PutRequest" in request:
+            target = request["PutRequest"]["Item"]
+        else:
+            target = request["DeleteRequest"]["Key"]
+        marker = tuple(target[name] for name in key_names)
+        latest.pop(marker, None)
+        latest[marker] = request
+    return list(latest.values())
+
+
+def _projection_args(attributes: Optional[list[str]]) -> dict[str, Any]:
+    """
+    Build ProjectionExpression arguments for a list of top-level attributes.
+    
+    Placeholders are used for every name so reserved words (e.g., "status")
+    can be projected safely.
+    """
+    if not attributes:
+        return {}
+    names = {f"#p{i}": name for i, name in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+    }
+
+
+def _unprocessed_backoff(attempt: int, base_delay: float, max_delay: float) -> Optional[float]:
+    """Full-jitter delay before re-sending unprocessed items, or None if out of budget."""
+    delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+    budget = remaining_budget()
+    if budget is not None and delay >= budget:
+        return None
+    return delay
+
+
 class DynamoDBClient:
     """DynamoDB client wrapper with error handling."""
     
-    def __init__(self):
-        self.manager = get_aws_client_manager()
+    def __init__(self, manager: Optional[AWSClientManager] = None):
+        self.manager = manager or get_aws_client_manager()
+        self.settings = self.manager.settings
         self.client = self.manager.get_client("dynamodb")
         self.resource = self.manager.get_resource("dynamodb")
+        self._tables: dict[str, Any] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._get_policy = RetryPolicy.for_service("dynamodb", "get_item")
+        self._put_policy = RetryPolicy.for_service("dynamodb", "put_item")
+        self._batch_get_policy = RetryPolicy.for_service("dynamodb", "batch_get_item")
+        self._batch_write_policy = RetryPolicy.for_service("dynamodb", "batch_write_item")
+    
+    def _table(self, table_name: str) -> Any:
+        """Get a cached Table handle."""
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables[table_name] = self.resource.Table(table_name)
+        return table
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ClientError, BotoCoreError)),
-    )
-    def get_item(self, table_name: str, key: dict) -> Optional[dict]:
+    def close(self) -> None:
+        """Shut down the batch thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def __enter__(self) -> "DynamoDBClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _run_concurrently(self, fn: Any, chunks: list[list]) -> list:
+        """Run fn over chunks on the batch thread pool, keeping the caller's deadline."""
+        if len(chunks) == 1:
+            return [fn(chunks[0])]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.settings.dynamodb_batch_concurrency,
+                thread_name_prefix="dynamodb-batch",
+            )
+        futures = [
+            self._executor.submit(contextvars.copy_context().run, fn, chunk)
+            for chunk in chunks
+        ]
+        return [future.result() for future in futures]
+    
+    def get_item(
+        self, table_name: str, key: dict, attributes: Optional[list[str]] = None
+    ) -> Optional[dict]:
         """
-        Get item from DynamoDB table with retry logic.
+        Get item from DynamoDB table with deadline-aware retries.
         
         Args:
             table_name: DynamoDB table name
             key: Item key
+            attributes: Attributes to fetch (defaults to the whole item)
             
         Returns:
             Item data or None if not found
         """
         try:
-            table = self.resource.Table(table_name)
-            response = table.get_item(Key=key)
+            table = self._table(table_name)
+            response = self._get_policy.call(
+                table.get_item, Key=key, **_projection_args(attributes)
+            )
             return response.get("Item")
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceNotFoundException":
                 raise StorageError(f"Table not found: {table_name}")
             logger.error("DynamoDB get_item failed", error=str(e), table=table_name)
             raise StorageError(f"Failed to get item from {table_name}")
+        except BotoCoreError as e:
+            logger.error("DynamoDB get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get item from {table_name}")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ClientError, BotoCoreError)),
-    )
     def put_item(self, table_name: str, item: dict) -> None:
         """
-        Put item to DynamoDB table with retry logic.
+        Put item to DynamoDB table with deadline-aware retries.
         
         Args:
             table_name: DynamoDB table name
             item: Item data
         """
         try:
-            table = self.resource.Table(table_name)
-            table.put_item(Item=item)
-        except ClientError as e:
+            table = self._table(table_name)
+            self._put_policy.call(table.put_item, Item=item)
+        except (ClientError, BotoCoreError) as e:
             logger.error("DynamoDB put_item failed", error=str(e), table=table_name)
             raise StorageError(f"Failed to put item to {table_name}")
+    
+    def batch_get_items(
+        self,
+        table_name: str,
+        keys: list[dict],
+        attributes: Optional[list[str]] = None,
+        consistent_read: bool = False,
+    ) -> list[dict]:
+        """
+        Get many items in BatchGetItem calls of up to 100 keys, run concurrently.
+        
+        Unprocessed keys are re-requested with backoff until they are all
+        returned or the retry budget runs out.
+        
+        Args:
+            table_name: DynamoDB table name
+            keys: Item keys (duplicates are ignored)
+            attributes: Attributes to fetch (defaults to whole items)
+            consistent_read: Whether to use strongly consistent reads
+            
+        Returns:
+            Found items, in no particular order
+        """
+        keys = _dedupe_keys(keys)
+        if not keys:
+            return []
+        
+        request_args = {"ConsistentRead": consistent_read, **_projection_args(attributes)}
+        
+        def fetch(chunk: list[dict]) -> list[dict]:
+            items: list[dict] = []
+            pending = {table_name: {"Keys": chunk, **request_args}}
+            for attempt in range(self.settings.dynamodb_unprocessed_max_retries + 1):
+                response = self._batch_get_policy.call(
+                    self.resource.meta.client.batch_get_item, RequestItems=pending
+                )
+                items.extend(response.get("Responses", {}).get(table_name, []))
+                pending = response.get("UnprocessedKeys") or {}
+                if not pending:
+                    return items
+                delay = _unprocessed_backoff(
+                    attempt, self._batch_get_policy.base_delay, self._batch_get_policy.max_delay
+                )
+                if delay is None:
+                    break
+                time.sleep(delay)
+            
+            remaining = len(pending.get(table_name, {}).get("Keys", []))
+            raise StorageError(
+                f"Failed to get {remaining} items from {table_name}",
+                details={"unprocessed": remaining},
+            )
+        
+        try:
+            results = self._run_concurrently(fetch, list(_chunked(keys, BATCH_GET_MAX_KEYS)))
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                raise StorageError(f"Table not found: {table_name}")
+            logger.error("DynamoDB batch_get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get items from {table_name}")
+        except BotoCoreError as e:
+            logger.error("DynamoDB batch_get_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to get items from {table_name}")
+        
+        return [item for chunk_items in results for item in chunk_items]
+    
+    def batch_write_items(
+        self,
+        table_name: str,
+        items: Optional[list[dict]] = None,
+        delete_keys: Optional[list[dict]] = None,
+    ) -> None:
+        """
+        Put and delete many items in BatchWriteItem calls of up to 25, run concurrently.
+        
+        Only the last put or delete of each key is sent. Unprocessed items are
+        re-sent with backoff until they are all written or the retry budget
+        runs out.
+        
+        Args:
+            table_name: DynamoDB table name
+            items: Items to put
+            delete_keys: Keys of items to delete (applied after the puts)
+        """
+        requests = [{"PutRequest": {"Item": item}} for item in items or []]
+        requests += [{"DeleteRequest": {"Key": key}} for key in delete_keys or []]
+        if not requests:
+            return
+        
+        def write(chunk: list[dict]) -> None:
+            pending = {table_name: chunk}
+            for attempt in range(self.settings.dynamodb_unprocessed_max_retries + 1):
+                response = self._batch_write_policy.call(
+                    self.resource.meta.client.batch_write_item, RequestItems=pending
+                )
+                pending = response.get("UnprocessedItems") or {}
+                if not pending:
+                    return
+                delay = _unprocessed_backoff(
+                    attempt,
+                    self._batch_write_policy.base_delay,
+                    self._batch_write_policy.max_delay,
+                )
+                if delay is None:
+                    break
+                time.sleep(delay)
+            
+            remaining = len(pending.get(table_name, []))
+            raise StorageError(
+                f"Failed to write {remaining} items to {table_name}",
+                details={"unprocessed": remaining},
+            )
+        
+        try:
+            key_schema = self._table(table_name).key_schema  # Loaded once per Table handle
+            requests = _dedupe_writes(requests, [attr["AttributeName"] for attr in key_schema])
+            self._run_concurrently(write, list(_chunked(requests, BATCH_WRITE_MAX_ITEMS)))
+        except (ClientError, BotoCoreError) as e:
+            logger.error("DynamoDB batch_write_item failed", error=str(e), table=table_name)
+            raise StorageError(f"Failed to write items to {table_name}")
+
+
+# S3 multipart limits
+S3_MIN_PART_BYTES = 5 * 1024 * 1024
+S3_MAX_PARTS = 10_000
+
+
+def _iter_parts(source: Union[BinaryIO, Iterable[bytes]], part_size: int) -> Iterator[bytes]:
+    """Re-slice a file object or byte-chunk iterable into parts of exactly part_size."""
+    if hasattr(source, "read"):
+        while True:
+            part = source.read(part_size)
+            if not part:
+                return
+            yield part
+    
+    buffer = bytearray()
+    for chunk in source:
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
 
 
 class S3Client:
     """S3 client wrapper with error handling."""
     
-    def __init__(self):
-        self.manager = get_aws_client_manager()
+    def __init__(self, manager: Optional[AWSClientManager] = None):
+        self.manager = manager or get_aws_client_manager()
+        self.settings = self.manager.settings
         self.client = self.manager.get_client("s3")
+        self._upload_policy = RetryPolicy.for_service("s3", "put_object")
+        self._download_policy = RetryPolicy.for_service("s3", "get_object")
+        transfer_budget = self.settings.s3_transfer_budget_ms
+        self._range_policy = RetryPolicy.for_service("s3", "get_object_range", transfer_budget)
+        self._part_policy = RetryPolicy.for_service("s3", "upload_part", transfer_budget)
+        self._multipart_policy = RetryPolicy.for_service("s3", "multipart", transfer_budget)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ClientError, BotoCoreError)),
-    )
     def upload_file(self, bucket: str, key: str, data: bytes) -> None:
         """
-        Upload file to S3 with retry logic.
+        Upload file to S3 with deadline-aware retries.
         
         Args:
             bucket: S3 bucket name
@@ -144,24 +427,25 @@ class S3Client:
             data: File data
         """
         try:
-            self.client.put_object(
+            self._upload_policy.call(
+                self.client.put_object,
                 Bucket=bucket,
                 Key=key,
                 Body=data,
                 ServerSideEncryption="AES256",
             )
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             logger.error("S3 upload failed", error=str(e), bucket=bucket, key=key)
             raise StorageError(f"Failed to upload to S3: {bucket}/{key}")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ClientError, BotoCoreError)),
-    )
+    def _read_object(self, **kwargs: Any) -> bytes:
+        """GET an object and read its body, so a retry covers a body cut off mid-read."""
+        response = self.client.get_object(**kwargs)
+        return response["Body"].read()
+    
     def download_file(self, bucket: str, key: str) -> bytes:
         """
-        Download file from S3 with retry logic.
+        Download file from S3 with deadline-aware retries.
         
         Args:
             bucket: S3 bucket name
@@ -171,30 +455,316 @@ class S3Client:
             File data
         """
         try:
-            response = self.client.get_object(Bucket=bucket, Key=key)
-            return response["Body"].read()
+            return self._download_policy.call(self._read_object, Bucket=bucket, Key=key)
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 raise StorageError(f"Object not found: {bucket}/{key}")
             logger.error("S3 download failed", error=str(e), bucket=bucket, key=key)
             raise StorageError(f"Failed to download from S3: {bucket}/{key}")
+        except BotoCoreError as e:
+            logger.error("S3 download failed", error=str(e), bucket=bucket, key=key)
+            raise StorageError(f"Failed to download from S3: {bucket}/{key}")
+    
+    def iter_download(
+        self, bucket: str, key: str, chunk_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream an object as a series of ranged GETs.
+        
+        Only one range is held in memory at a time, and a failed range is
+        retried on its own instead of restarting the whole download. Ranges
+        are pinned to the object's ETag so a concurrent overwrite fails the
+        download rather than mixing two versions.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+            chunk_size: Bytes per ranged GET (defaults to S3_PART_SIZE_BYTES)
+            
+        Yields:
+            Consecutive chunks of the object
+        """
+        chunk_size = chunk_size or self.settings.s3_part_size_bytes
+        try:
+            head = self._download_policy.call(self.client.head_object, Bucket=bucket, Key=key)
+            size = head["ContentLength"]
+            etag = head["ETag"]
+            for start in range(0, size, chunk_size):
+                end = min(start + chunk_size, size) - 1
+                yield self._range_policy.call(
+                    self._read_object,
+                    Bucket=bucket,
+                    Key=key,
+                    Range=f"bytes={start}-{end}",
+                    IfMatch=etag,
+                )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise StorageError(f"Object not found: {bucket}/{key}")
+            logger.error("S3 streaming download failed", error=str(e), bucket=bucket, key=key)
+            raise StorageError(f"Failed to download from S3: {bucket}/{key}")
+        except BotoCoreError as e:
+            logger.error("S3 streaming download failed", error=str(e), bucket=bucket, key=key)
+            raise StorageError(f"Failed to download from S3: {bucket}/{key}")
+    
+    def download_to_file(
+        self, bucket: str, key: str, fileobj: BinaryIO, chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Stream an object into a writable file object.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+            fileobj: Binary file object to write to
+            chunk_size: Bytes per ranged GET
+            
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        for chunk in self.iter_download(bucket, key, chunk_size):
+            fileobj.write(chunk)
+            written += len(chunk)
+        return written
+    
+    def upload_stream(
+        self,
+        bucket: str,
+        key: str,
+        source: Union[BinaryIO, Iterable[bytes]],
+        part_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Upload from a file object or byte iterable using concurrent multipart parts.
+        
+        At most ``concurrency`` parts are in flight, so memory stays bounded at
+        roughly ``part_size * (concurrency + 1)`` regardless of object size.
+        Sources smaller than one part are sent with a single PutObject.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+            source: Binary file object or iterable of byte chunks
+            part_size: Bytes per part (defaults to S3_PART_SIZE_BYTES)
+            concurrency: Parallel part uploads (defaults to S3_TRANSFER_CONCURRENCY)
+        """
+        with self.open_append_writer(bucket, key, part_size, concurrency) as writer:
+            for part in _iter_parts(source, writer.part_size):
+                writer.write(part)
+    
+    def open_append_writer(
+        self,
+        bucket: str,
+        key: str,
+        part_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> "S3AppendWriter":
+        """
+        Open an incremental writer that ships data while it is still being produced.
+        
+        Args:
+            bucket: S3 bucket name
+            key: Object key
+            part_size: Bytes per part (defaults to S3_PART_SIZE_BYTES)
+            concurrency: Parallel part uploads (defaults to S3_TRANSFER_CONCURRENCY)
+            
+        Returns:
+            Writer to use as a context manager
+        """
+        return S3AppendWriter(
+            self,
+            bucket,
+            key,
+            part_size=part_size or self.settings.s3_part_size_bytes,
+            concurrency=concurrency or self.settings.s3_transfer_concurrency,
+        )
+
+
+class S3AppendWriter:
+    """
+    Incremental multipart upload for data produced over time (e.g., live recordings).
+    
+    Each ``write`` is buffered until a full part is available, which is then
+    uploaded in the background. The multipart upload is only created once the
+    first part fills, so short objects fall back to a single PutObject on
+    ``close``. Leaving the context with an exception aborts the upload.
+    """
+    
+    def __init__(
+        self,
+        s3: S3Client,
+        bucket: str,
+        key: str,
+        part_size: int,
+        concurrency: int,
+    ):
+        if part_size < S3_MIN_PART_BYTES:
+            raise ValueError(f"part_size must be at least {S3_MIN_PART_BYTES} bytes")
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: list[Future] = []
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="s3-part-upload"
+        )
+        self._closed = False
+    
+    def __enter__(self) -> "S3AppendWriter":
+        return self
+    
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    
+    def write(self, data: bytes) -> None:
+        """
+        Append data, uploading every full part in the background.
+        
+        Args:
+            data: Bytes to append
+        """
+        if self._closed:
+            raise StorageError(f"Writer already closed: {self.bucket}/{self.key}")
+        self._raise_failed_part()
+        self.bytes_written += len(data)
+        view = memoryview(data)
+        if self._buffer:
+            needed = self.part_size - len(self._buffer)
+            self._buffer += view[:needed]
+            view = view[needed:]
+            if len(self._buffer) < self.part_size:
+                return
+            self._submit_part(bytes(self._buffer))
+            self._buffer = bytearray()
+        # Whole parts are sliced straight from the caller's data without buffering
+        while len(view) >= self.part_size:
+            if len(view) == len(data) == self.part_size and isinstance(data, bytes):
+                self._submit_part(data)
+            else:
+                self._submit_part(bytes(view[:self.part_size]))
+            view = view[self.part_size:]
+        self._buffer += view
+    
+    def close(self) -> None:
+        """Upload the remaining data and complete the object."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._upload_id is None:
+                self.s3.upload_file(self.bucket, self.key, bytes(self._buffer))
+                return
+            if self._buffer:
+                self._submit_part(bytes(self._buffer))
+            parts = [future.result() for future in self._parts]
+            self.s3._multipart_policy.call(
+                self.s3.client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error(
+                "S3 multipart upload failed", error=str(e), bucket=self.bucket, key=self.key
+            )
+            self._abort_upload()
+            raise StorageError(f"Failed to upload to S3: {self.bucket}/{self.key}")
+        except Exception:
+            self._abort_upload()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self._executor.shutdown(wait=True)
+    
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        self._closed = True
+        self._buffer = bytearray()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._abort_upload()
+    
+    def _submit_part(self, part: bytes) -> None:
+        if self._upload_id is None:
+            try:
+                response = self.s3._multipart_policy.call(
+                    self.s3.client.create_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    ServerSideEncryption="AES256",
+                )
+            except (ClientError, BotoCoreError) as e:
+                logger.error(
+                    "S3 multipart upload failed", error=str(e), bucket=self.bucket, key=self.key
+                )
+                raise StorageError(f"Failed to upload to S3: {self.bucket}/{self.key}")
+            self._upload_id = response["UploadId"]
+        
+        part_number = len(self._parts) + 1
+        if part_number > S3_MAX_PARTS:
+            raise StorageError(f"Too many parts for S3 object: {self.bucket}/{self.key}")
+        
+        # Blocks the producer while `concurrency` parts are already in flight
+        self._slots.acquire()
+        future = self._executor.submit(self._upload_part, part_number, part)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._parts.append(future)
+    
+    def _upload_part(self, part_number: int, part: bytes) -> dict[str, Any]:
+        response = self.s3._part_policy.call(
+            self.s3.client.upload_part,
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=part,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+    
+    def _raise_failed_part(self) -> None:
+        for future in self._parts:
+            if future.done() and future.exception() is not None:
+                self.abort()
+                error = future.exception()
+                logger.error(
+                    "S3 part upload failed", error=str(error), bucket=self.bucket, key=self.key
+                )
+                raise StorageError(f"Failed to upload to S3: {self.bucket}/{self.key}")
+    
+    def _abort_upload(self) -> None:
+        if self._upload_id is None:
+            return
+        try:
+            self.s3.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.warning(
+                "S3 multipart abort failed", error=str(e), bucket=self.bucket, key=self.key
+            )
+        self._upload_id = None
 
 
 class KinesisClient:
     """Kinesis client wrapper with error handling."""
     
-    def __init__(self):
-        self.manager = get_aws_client_manager()
+    def __init__(self, manager: Optional[AWSClientManager] = None):
+        self.manager = manager or get_aws_client_manager()
         self.client = self.manager.get_client("kinesis")
+        self._put_policy = RetryPolicy.for_service("kinesis", "put_record")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ClientError, BotoCoreError)),
-    )
     def put_record(self, stream_name: str, data: bytes, partition_key: str) -> None:
         """
-        Put record to Kinesis stream with retry logic.
+        Put record to Kinesis stream with deadline-aware retries.
         
         Args:
             stream_name: Kinesis stream name
@@ -202,12 +772,13 @@ class KinesisClient:
             partition_key: Partition key for sharding
         """
         try:
-            self.client.put_record(
+            self._put_policy.call(
+                self.client.put_record,
                 StreamName=stream_name,
                 Data=data,
                 PartitionKey=partition_key,
             )
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             logger.error("Kinesis put_record failed", error=str(e), stream=stream_name)
             raise ServiceUnavailableError("kinesis", "Failed to publish to stream")
 
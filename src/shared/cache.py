@@ -0,0 +1,453 @@
+"""Two-tier read-through cache: in-process TTL LRU (L1) in front of Redis (L2)."""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .async_aws_clients import AsyncDynamoDBClient, get_async_dynamodb_client
+from .config import get_settings
+from .logging import get_logger
+from .metrics import get_metrics_registry
+from .redis_client import get_redis_client
+
+logger = get_logger(__name__)
+
+# ElastiCache key patterns and TTLs (seconds) from the DESIGN.md Redis schema
+KEY_PATTERNS: dict[str, tuple[str, int]] = {
+    "session": ("session:{session_id}", 2 * 3600),
+    "session_speakers": ("session:{session_id}:speakers", 2 * 3600),
+    "session_context": ("session:{session_id}:context", 2 * 3600),
+    "voice_profile": ("voice-profile:{profile_id}", 3600),
+    "voice_embedding": ("voice-embedding:{profile_id}", 3600),
+    "translation_context": ("translation-context:{session_id}", 30 * 60),
+    "translation": ("translation:{digest}", 24 * 3600),
+    "ws_connection": ("ws-connection:{connection_id}", 2 * 3600),
+    "model_warmup": ("model-warmup:{profile_id}", 10 * 60),
+    "model_warmup_nodes": ("model-warmup:{profile_id}:nodes", 10 * 60),
+    "rate_limit_user": ("rate-limit:user:{user_id}:{endpoint}", 60),
+    "rate_limit_ip": ("rate-limit:ip:{ip_address}", 60),
+}
+
+_MISSING = object()
+
+# Invalidation listener resubscribe backoff (seconds)
+RECONNECT_BASE_DELAY = 0.1
+RECONNECT_MAX_DELAY = 5.0
+
+
+def cache_key(namespace: str, **params: str) -> str:
+    """
+    Build a Redis key from a DESIGN.md key pattern.
+
+    Args:
+        namespace: Pattern name (e.g., 'session', 'voice_profile')
+        **params: Pattern parameters (e.g., session_id='abc')
+
+    Returns:
+        Redis key such as 'session:abc'
+    """
+    return KEY_PATTERNS[namespace][0].format(**params)
+
+
+def key_ttl(namespace: str) -> int:
+    """Get the Redis TTL in seconds for a key pattern."""
+    return KEY_PATTERNS[namespace][1]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def encode_value(value: Any) -> bytes:
+    """Serialize a cache value (DynamoDB Decimals become JSON numbers)."""
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def decode_value(data: bytes) -> Any:
+    """Deserialize a cache value, restoring numbers as Decimal like boto3 does."""
+    return json.loads(data, parse_float=Decimal, parse_int=Decimal)
+
+
+class TTLCache:
+    """
+    Bounded LRU mapping whose entries expire after a per-entry TTL.
+
+    Not thread-safe; intended to be used from a single event loop.
+    """
+
+    def __init__(self, max_entries: int, default_ttl: float):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+class _Load:
+    """A read-through load shared by every caller that missed on one key."""
+
+    __slots__ = ("task", "stale")
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Task] = None
+        self.stale = False  # Set by a write or invalidation that lands mid-load
+
+
+class TwoTierCache:
+    """
+    Read-through cache with an in-process L1 and a shared Redis L2.
+
+    Concurrent misses on the same key share a single L2/backend read, run as
+    its own task so that cancelling one caller does not fail the others. A
+    write or invalidation during that read marks it stale, and its result is
+    then returned to the callers but not cached. Writes evict the key from L1
+    on every node through a Redis pub/sub channel; call ``start()`` to begin
+    listening for those invalidations.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        max_entries: Optional[int] = None,
+        l1_ttl: Optional[float] = None,
+        channel: Optional[str] = None,
+    ):
+        settings = get_settings()
+        self.redis = redis or get_redis_client()
+        self.l1 = TTLCache(
+            max_entries or settings.cache_l1_max_entries,
+            l1_ttl or settings.cache_l1_ttl_seconds,
+        )
+        self.channel = channel or settings.cache_invalidation_channel
+        self.node_id = uuid.uuid4().hex
+        self._inflight: dict[str, _Load] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._metrics = get_metrics_registry()
+
+    def loading(self, key: str) -> bool:
+        """Whether a read-through load of ``key`` is in flight on this node."""
+        return key in self._inflight
+
+    def _count(self, name: str, namespace: str, tier: str, amount: float = 1.0) -> None:
+        self._metrics.counter(name, namespace=namespace, tier=tier).inc(amount)
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get a value from L1, then Redis, then the loader, filling each tier.
+
+        Args:
+            namespace: Key pattern name, used for TTL and metric labels
+            key: Full cache key (see ``cache_key``)
+            loader: Coroutine function that reads the value from the backend
+
+        Returns:
+            Cached or loaded value (None values are not cached)
+        """
+        start = time.perf_counter()
+        value = self.l1.get(key, _MISSING)
+        if value is not _MISSING:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._count("cache_hits_total", namespace, "l1")
+            self._count("cache_latency_ms_sum", namespace, "l1", elapsed_ms)
+            return value
+        self._count("cache_misses_total", namespace, "l1")
+
+        load = self._inflight.get(key)
+        if load is not None:
+            self._count("cache_coalesced_total", namespace, "l1")
+        else:
+            load = self._inflight[key] = _Load()
+            load.task = asyncio.create_task(self._load(namespace, key, loader, load))
+            load.task.add_done_callback(lambda task: self._finish_load(key, load))
+        return await asyncio.shield(load.task)
+
+    def _finish_load(self, key: str, load: _Load) -> None:
+        if self._inflight.get(key) is load:
+            del self._inflight[key]
+        if not load.task.cancelled():
+            # Mark retrieved so a failure nobody awaited does not log a warning
+            load.task.exception()
+
+    def _mark_stale(self, key: str) -> None:
+        """Stop a load in flight from caching what it read before a write."""
+        load = self._inflight.pop(key, None)
+        if load is not None:
+            load.stale = True
+
+    async def _load(
+        self, namespace: str, key: str, loader: Callable[[], Awaitable[Any]], load: _Load
+    ) -> Any:
+        l1_ttl = min(self.l1.default_ttl, key_ttl(namespace))
+
+        start = time.perf_counter()
+        try:
+            data = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning("Redis cache read failed", key=key, error=str(e))
+            self._count("cache_errors_total", namespace, "l2")
+            data = None
+        self._count("cache_latency_ms_sum", namespace, "l2", (time.perf_counter() - start) * 1000)
+
+        if data is not None:
+            self._count("cache_hits_total", namespace, "l2")
+            value = decode_value(data)
+            if not load.stale:
+                self.l1.set(key, value, l1_ttl)
+            return value
+        self._count("cache_misses_total", namespace, "l2")
+
+        start = time.perf_counter()
+        value = await loader()
+        self._count(
+            "cache_latency_ms_sum", namespace, "backend", (time.perf_counter() - start) * 1000
+        )
+        self._count("cache_loads_total", namespace, "backend")
+        if value is None or load.stale:
+            return value
+
+        # NX: a fill never overwrites a value that a writer stored meanwhile
+        await self._write_l2(namespace, key, value, fill=True)
+        if not load.stale:
+            self.l1.set(key, value, l1_ttl)
+        return value
+
+    async def _write_l2(self, namespace: str, key: str, value: Any, fill: bool = False) -> None:
+        try:
+            await self.redis.set(key, encode_value(value), ex=key_ttl(namespace), nx=fill)
+        except RedisError as e:
+            logger.warning("Redis cache write failed", key=key, error=str(e))
+            self._count("cache_errors_total", namespace, "l2")
+
+    async def set(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Store a freshly written value and evict stale copies on other nodes.
+
+        Args:
+            namespace: Key pattern name
+            key: Full cache key
+            value: New value
+        """
+        self._mark_stale(key)
+        await self._write_l2(namespace, key, value)
+        self.l1.set(key, value, min(self.l1.default_ttl, key_ttl(namespace)))
+        await self._publish_invalidation(key)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Remove a key from both tiers on every node.
+
+        Args:
+            key: Full cache key
+        """
+        self._mark_stale(key)
+        self.l1.delete(key)
+        try:
+            await self.redis.delete(key)
+        except RedisError as e:
+            logger.warning("Redis cache delete failed", key=key, error=str(e))
+        await self._publish_invalidation(key)
+
+    async def _publish_invalidation(self, key: str) -> None:
+        message = json.dumps({"node": self.node_id, "key": key})
+        try:
+            await self.redis.publish(self.channel, message)
+        except RedisError as e:
+            logger.warning("Cache invalidation publish failed", key=key, error=str(e))
+
+    async def start(self) -> None:
+        """Start listening for invalidations published by other nodes."""
+        if self._listener is not None:
+            return
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def close(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self, pubsub: Any) -> None:
+        """Apply invalidations, resubscribing with backoff when the connection drops."""
+        failures = 0
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = self.redis.pubsub()
+                    await pubsub.subscribe(self.channel)
+                    # Invalidations sent while disconnected were lost
+                    self.l1.clear()
+                    logger.info("Cache invalidation listener reconnected")
+                failures = 0
+                async for message in pubsub.listen():
+                    self._on_message(message)
+            except (RedisError, OSError) as e:
+                failures += 1
+                self._metrics.counter("cache_invalidation_disconnects_total").inc()
+                logger.warning("Cache invalidation listener lost", error=str(e))
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except (RedisError, OSError):
+                        pass
+                    pubsub = None
+            await asyncio.sleep(min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** failures))
+
+    def _on_message(self, message: dict) -> None:
+        if message.get("type") != "message":
+            return
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if payload.get("node") != self.node_id:
+            key = payload.get("key", "")
+            self._mark_stale(key)
+            self.l1.delete(key)
+            self._metrics.counter("cache_invalidations_received_total").inc()
+
+
+class CachedTable:
+    """
+    DynamoDB table fronted by a ``TwoTierCache``.
+
+    Args:
+        table_name: DynamoDB table name
+        key_attribute: Partition key attribute name
+        namespace: Cache key pattern name
+        key_param: Key pattern parameter filled with the item ID
+        cache: Shared two-tier cache
+        dynamodb: Async DynamoDB client
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        key_attribute: str,
+        namespace: str,
+        key_param: str,
+        cache: Optional[TwoTierCache] = None,
+        dynamodb: Optional[AsyncDynamoDBClient] = None,
+    ):
+        self.table_name = table_name
+        self.key_attribute = key_attribute
+        self.namespace = namespace
+        self.key_param = key_param
+        self.cache = cache or get_two_tier_cache()
+        self.dynamodb = dynamodb or get_async_dynamodb_client()
+
+    def _key(self, item_id: str) -> str:
+        return cache_key(self.namespace, **{self.key_param: item_id})
+
+    async def get(self, item_id: str) -> Optional[dict]:
+        """
+        Read an item through the cache.
+
+        Args:
+            item_id: Partition key value
+
+        Returns:
+            Item data or None if not found
+        """
+        return await self.cache.get_or_load(
+            self.namespace,
+            self._key(item_id),
+            lambda: self.dynamodb.get_item(self.table_name, {self.key_attribute: item_id}),
+        )
+
+    async def put(self, item: dict) -> None:
+        """
+        Write an item to DynamoDB, then refresh the cache and notify other nodes.
+
+        Args:
+            item: Item data including the partition key
+        """
+        await self.dynamodb.put_item(self.table_name, item)
+        await self.cache.set(self.namespace, self._key(item[self.key_attribute]), item)
+
+    async def invalidate(self, item_id: str) -> None:
+        """Drop a cached item on every node."""
+        await self.cache.invalidate(self._key(item_id))
+
+
+@lru_cache()
+def get_two_tier_cache() -> TwoTierCache:
+    """Get cached two-tier cache instance."""
+    return TwoTierCache()
+
+
+@lru_cache()
+def get_session_store() -> CachedTable:
+    """Get cached session table accessor (``session:{sessionId}``)."""
+    return CachedTable(
+        get_settings().dynamodb_sessions_table,
+        key_attribute="sessionId",
+        namespace="session",
+        key_param="session_id",
+    )
+
+
+@lru_cache()
+def get_voice_profile_store() -> CachedTable:
+    """Get cached voice profile table accessor (``voice-profile:{profileId}``)."""
+    return CachedTable(
+        get_settings().dynamodb_voice_profiles_table,
+        key_attribute="profileId",
+        namespace="voice_profile",
+        key_param="profile_id",
+    )
@@ -1,10 +1,11 @@
 """Configuration management using environment variables and AWS Systems Manager."""
 
 import os
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import boto3
 from functools import lru_cache
 
 
@@ -21,9 +22,15 @@ class Settings(BaseSettings):
     # Environment
     environment: str = Field(default="development", alias="ENVIRONMENT")
     aws_region: str = Field(default="us-east-1", alias="AWS_REGION")
+    aws_max_pool_connections: int = Field(default=50, alias="AWS_MAX_POOL_CONNECTIONS")
     
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    log_async: bool = Field(default=True, alias="LOG_ASYNC")
+    log_queue_size: int = Field(default=10_000, alias="LOG_QUEUE_SIZE")
+    log_batch_size: int = Field(default=512, alias="LOG_BATCH_SIZE")
+    log_flush_interval_ms: int = Field(default=50, alias="LOG_FLUSH_INTERVAL_MS")
+    log_sample_per_second: int = Field(default=100, alias="LOG_SAMPLE_PER_SECOND")
     enable_xray: bool = Field(default=True, alias="ENABLE_XRAY")
     
     # Service Configuration
@@ -39,6 +46,10 @@ class Settings(BaseSettings):
     dynamodb_users_table: str = Field(
         default="univoice-users", alias="DYNAMODB_USERS_TABLE"
     )
+    dynamodb_batch_concurrency: int = Field(default=8, alias="DYNAMODB_BATCH_CONCURRENCY")
+    dynamodb_unprocessed_max_retries: int = Field(
+        default=5, alias="DYNAMODB_UNPROCESSED_MAX_RETRIES"
+    )
     
     s3_voice_embeddings_bucket: str = Field(
         default="univoice-voice-embeddings", alias="S3_VOICE_EMBEDDINGS_BUCKET"
@@ -46,50 +57,319 @@ class Settings(BaseSettings):
     s3_recordings_bucket: str = Field(
         default="univoice-session-recordings", alias="S3_RECORDINGS_BUCKET"
     )
+    s3_synthesis_cache_bucket: str = Field(
+        default="univoice-synthesis-cache", alias="S3_SYNTHESIS_CACHE_BUCKET"
+    )
+    s3_part_size_bytes: int = Field(default=8 * 1024 * 1024, alias="S3_PART_SIZE_BYTES")
+    s3_transfer_concurrency: int = Field(default=4, alias="S3_TRANSFER_CONCURRENCY")
+    s3_transfer_budget_ms: int = Field(default=30_000, alias="S3_TRANSFER_BUDGET_MS")
     
     kinesis_audio_stream: str = Field(
         default="univoice-audio-stream", alias="KINESIS_AUDIO_STREAM"
     )
+    kinesis_linger_ms: int = Field(default=50, alias="KINESIS_LINGER_MS")
+    kinesis_max_batch_records: int = Field(default=500, alias="KINESIS_MAX_BATCH_RECORDS")
+    kinesis_max_batch_bytes: int = Field(
+        default=5 * 1024 * 1024, alias="KINESIS_MAX_BATCH_BYTES"
+    )
+    kinesis_max_queued_records: int = Field(
+        default=100_000, alias="KINESIS_MAX_QUEUED_RECORDS"
+    )
     
     redis_host: str = Field(default="localhost", alias="REDIS_HOST")
     redis_port: int = Field(default=6379, alias="REDIS_PORT")
     redis_ssl: bool = Field(default=True, alias="REDIS_SSL")
+    redis_password: Optional[str] = Field(default=None, alias="REDIS_PASSWORD")
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    
+    # Caching
+    cache_l1_max_entries: int = Field(default=10_000, alias="CACHE_L1_MAX_ENTRIES")
+    cache_l1_ttl_seconds: float = Field(default=30.0, alias="CACHE_L1_TTL_SECONDS")
+    cache_invalidation_channel: str = Field(
+        default="cache-invalidation", alias="CACHE_INVALIDATION_CHANNEL"
+    )
+    
+    # Rate limiting
+    rate_limit_user_rate: float = Field(default=50.0, alias="RATE_LIMIT_USER_RATE")
+    rate_limit_user_burst: int = Field(default=100, alias="RATE_LIMIT_USER_BURST")
+    rate_limit_ip_rate: float = Field(default=100.0, alias="RATE_LIMIT_IP_RATE")
+    rate_limit_ip_burst: int = Field(default=200, alias="RATE_LIMIT_IP_BURST")
+    rate_limit_lease_tokens: int = Field(default=20, alias="RATE_LIMIT_LEASE_TOKENS")
+    rate_limit_lease_ttl_ms: int = Field(default=1000, alias="RATE_LIMIT_LEASE_TTL_MS")
+    
+    # Audio Ingress
+    audio_sample_rate: int = Field(default=16000, alias="AUDIO_SAMPLE_RATE")
+    audio_chunk_ms: int = Field(default=50, alias="AUDIO_CHUNK_MS")
+    audio_frame_ms: int = Field(default=100, alias="AUDIO_FRAME_MS")
+    audio_jitter_depth_chunks: int = Field(default=6, alias="AUDIO_JITTER_DEPTH_CHUNKS")
+    audio_min_sample_rate: int = Field(default=16000, alias="AUDIO_MIN_SAMPLE_RATE")
+    audio_min_snr_db: float = Field(default=15.0, alias="AUDIO_MIN_SNR_DB")
+    audio_max_clipping_ratio: float = Field(default=0.01, alias="AUDIO_MAX_CLIPPING_RATIO")
+    audio_vad_threshold_db: float = Field(default=9.0, alias="AUDIO_VAD_THRESHOLD_DB")
+    audio_vad_onset_ms: int = Field(default=20, alias="AUDIO_VAD_ONSET_MS")
+    audio_vad_hangover_ms: int = Field(default=300, alias="AUDIO_VAD_HANGOVER_MS")
+    audio_vad_pre_roll_ms: int = Field(default=200, alias="AUDIO_VAD_PRE_ROLL_MS")
+
+    # Audio Egress
+    audio_egress_frame_ms: int = Field(default=20, alias="AUDIO_EGRESS_FRAME_MS")
+    audio_egress_lead_ms: int = Field(default=200, alias="AUDIO_EGRESS_LEAD_MS")
+    audio_egress_queue_frames: int = Field(default=50, alias="AUDIO_EGRESS_QUEUE_FRAMES")
+    audio_egress_slow_policy: str = Field(
+        default="drop_oldest", alias="AUDIO_EGRESS_SLOW_POLICY"
+    )
+    
+    # Translation
+    translation_cache_l1_max_entries: int = Field(
+        default=50_000, alias="TRANSLATION_CACHE_L1_MAX_ENTRIES"
+    )
+    translation_cache_l1_ttl_seconds: float = Field(
+        default=600.0, alias="TRANSLATION_CACHE_L1_TTL_SECONDS"
+    )
+    translation_cache_max_chars: int = Field(default=200, alias="TRANSLATION_CACHE_MAX_CHARS")
+    translation_cache_context_max_words: int = Field(
+        default=6, alias="TRANSLATION_CACHE_CONTEXT_MAX_WORDS"
+    )
+    translation_batch_max_segments: int = Field(
+        default=25, alias="TRANSLATION_BATCH_MAX_SEGMENTS"
+    )
+    translation_batch_max_bytes: int = Field(default=9000, alias="TRANSLATION_BATCH_MAX_BYTES")
+    translation_batch_max_wait_ms: float = Field(
+        default=10.0, alias="TRANSLATION_BATCH_MAX_WAIT_MS"
+    )
+    translation_partial_agreement: int = Field(default=2, alias="TRANSLATION_PARTIAL_AGREEMENT")
+    translation_partial_max_words: int = Field(default=6, alias="TRANSLATION_PARTIAL_MAX_WORDS")
+
+    # Voice Profile
+    voice_embedding_store_dir: str = Field(
+        default="/var/lib/univoice/voice-embeddings", alias="VOICE_EMBEDDING_STORE_DIR"
+    )
+    voice_embedding_dim: int = Field(default=256, alias="VOICE_EMBEDDING_DIM")
+    voice_embedding_dtype: str = Field(default="float16", alias="VOICE_EMBEDDING_DTYPE")
+    voice_embedding_ivf_min_profiles: int = Field(
+        default=10_000, alias="VOICE_EMBEDDING_IVF_MIN_PROFILES"
+    )
+    voice_embedding_ivf_nprobe: int = Field(default=8, alias="VOICE_EMBEDDING_IVF_NPROBE")
+
+    # Voice Cloning
+    voice_cloning_model_version: str = Field(default="v1", alias="VOICE_CLONING_MODEL_VERSION")
+    synthesis_cache_dir: str = Field(
+        default="/var/cache/univoice/synthesis", alias="SYNTHESIS_CACHE_DIR"
+    )
+    synthesis_cache_max_bytes: int = Field(
+        default=2 * 1024**3, alias="SYNTHESIS_CACHE_MAX_BYTES"
+    )
+    synthesis_cache_max_chars: int = Field(default=200, alias="SYNTHESIS_CACHE_MAX_CHARS")
+    synthesis_cache_chunk_bytes: int = Field(
+        default=32 * 1024, alias="SYNTHESIS_CACHE_CHUNK_BYTES"
+    )
+    voice_warmup_max_profiles: int = Field(default=64, alias="VOICE_WARMUP_MAX_PROFILES")
+    voice_warmup_ttl_seconds: float = Field(default=600.0, alias="VOICE_WARMUP_TTL_SECONDS")
+    voice_warmup_keepalive_seconds: float = Field(
+        default=480.0, alias="VOICE_WARMUP_KEEPALIVE_SECONDS"
+    )
+    voice_warmup_idle_seconds: float = Field(default=300.0, alias="VOICE_WARMUP_IDLE_SECONDS")
+    voice_warmup_keepalive_per_minute: float = Field(
+        default=30.0, alias="VOICE_WARMUP_KEEPALIVE_PER_MINUTE"
+    )
+    voice_warmup_concurrency: int = Field(default=4, alias="VOICE_WARMUP_CONCURRENCY")
     
     # API Configuration
     api_gateway_endpoint: Optional[str] = Field(default=None, alias="API_GATEWAY_ENDPOINT")
     websocket_endpoint: Optional[str] = Field(default=None, alias="WEBSOCKET_ENDPOINT")
     
+    # Resilience
+    aws_retry_max_attempts: int = Field(default=3, alias="AWS_RETRY_MAX_ATTEMPTS")
+    aws_retry_base_delay_ms: int = Field(default=50, alias="AWS_RETRY_BASE_DELAY_MS")
+    aws_retry_max_delay_ms: int = Field(default=1000, alias="AWS_RETRY_MAX_DELAY_MS")
+    aws_call_budget_ms: int = Field(default=1000, alias="AWS_CALL_BUDGET_MS")
+    circuit_breaker_failure_threshold: int = Field(
+        default=5, alias="CIRCUIT_BREAKER_FAILURE_THRESHOLD"
+    )
+    circuit_breaker_success_threshold: int = Field(
+        default=2, alias="CIRCUIT_BREAKER_SUCCESS_THRESHOLD"
+    )
+    circuit_breaker_reset_timeout_seconds: float = Field(
+        default=60.0, alias="CIRCUIT_BREAKER_RESET_TIMEOUT_SECONDS"
+    )
+    
     # Performance
     max_concurrent_sessions: int = Field(default=1000, alias="MAX_CONCURRENT_SESSIONS")
     session_timeout_seconds: int = Field(default=7200, alias="SESSION_TIMEOUT_SECONDS")
+    session_ring_vnodes: int = Field(default=160, alias="SESSION_RING_VNODES")
+    session_heartbeat_seconds: float = Field(default=5.0, alias="SESSION_HEARTBEAT_SECONDS")
+    session_node_ttl_seconds: float = Field(default=15.0, alias="SESSION_NODE_TTL_SECONDS")
+    session_handoff_ttl_seconds: int = Field(default=300, alias="SESSION_HANDOFF_TTL_SECONDS")
+    pipeline_latency_budget_ms: float = Field(default=2000.0, alias="PIPELINE_LATENCY_BUDGET_MS")
+    pipeline_latency_window_seconds: float = Field(
+        default=60.0, alias="PIPELINE_LATENCY_WINDOW_SECONDS"
+    )
+    pipeline_session_samples: int = Field(default=256, alias="PIPELINE_SESSION_SAMPLES")
     
     # SSM Parameter Store prefix
     ssm_parameter_prefix: str = Field(
         default="/univoice", alias="SSM_PARAMETER_PREFIX"
     )
+    ssm_refresh_seconds: float = Field(default=300.0, alias="SSM_REFRESH_SECONDS")
+    secrets_cache_ttl_seconds: float = Field(default=300.0, alias="SECRETS_CACHE_TTL_SECONDS")
+
+
+ChangeCallback = Callable[[str, Optional[str], Optional[str]], None]
 
 
 class ConfigManager:
-    """Manages configuration from environment variables and AWS SSM Parameter Store."""
+    """
+    Manages configuration from environment variables and AWS SSM Parameter Store.
+
+    ``load()`` fetches every parameter under ``ssm_parameter_prefix`` with
+    paginated ``GetParametersByPath`` calls, instead of one ``GetParameter``
+    per name. ``start_refresh()`` reloads them, and the cached secrets, every
+    ``SSM_REFRESH_SECONDS`` on a daemon thread and fires ``on_change``
+    callbacks for values that changed. ``get_cached_parameter`` never calls
+    AWS, so hot paths can read configuration without blocking.
 
-    def __init__(self, settings: Settings):
+    Args:
+        settings: Application settings
+        ssm_client: SSM client (created lazily if omitted)
+        secrets_client: Secrets Manager client (created lazily if omitted)
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        ssm_client: Optional[Any] = None,
+        secrets_client: Optional[Any] = None,
+    ):
         self.settings = settings
-        self._ssm_client: Optional[boto3.client] = None
+        self.refresh_interval = settings.ssm_refresh_seconds
+        self.secret_ttl = settings.secrets_cache_ttl_seconds
+        self._ssm_client = ssm_client
+        self._secrets_client = secrets_client
         self._parameter_cache: dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._bulk_load_failed = False
+        # secret name -> (value, fetched at)
+        self._secret_cache: dict[str, tuple[str, float]] = {}
+        self._callbacks: list[tuple[Optional[str], ChangeCallback]] = []
+        self._client_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
 
     @property
-    def ssm_client(self) -> boto3.client:
+    def ssm_client(self) -> Any:
         """Lazy initialization of SSM client."""
         if self._ssm_client is None:
-            self._ssm_client = boto3.client(
-                "ssm", region_name=self.settings.aws_region
-            )
+            with self._client_lock:
+                if self._ssm_client is None:
+                    import boto3  # deferred: costs ~100 ms at import
+
+                    self._ssm_client = boto3.client(
+                        "ssm", region_name=self.settings.aws_region
+                    )
         return self._ssm_client
 
+    @property
+    def secrets_client(self) -> Any:
+        """Lazy initialization of Secrets Manager client."""
+        if self._secrets_client is None:
+            with self._client_lock:
+                if self._secrets_client is None:
+                    import boto3
+
+                    self._secrets_client = boto3.client(
+                        "secretsmanager", region_name=self.settings.aws_region
+                    )
+        return self._secrets_client
+
+    def _full_path(self, parameter_name: str) -> str:
+        return f"{self.settings.ssm_parameter_prefix}/{parameter_name}"
+
+    def load(self) -> int:
+        """
+        Fetch every parameter under the prefix in bulk, replacing the cache.
+
+        Returns:
+            Number of parameters loaded
+
+        Raises:
+            Exception: Whatever the SSM client raised; the cache is left as it was
+        """
+        prefix = self.settings.ssm_parameter_prefix
+        loaded: dict[str, str] = {}
+        token: Optional[str] = None
+        while True:
+            kwargs: dict[str, Any] = {"NextToken": token} if token else {}
+            response = self.ssm_client.get_parameters_by_path(
+                Path=prefix, Recursive=True, WithDecryption=True, MaxResults=10, **kwargs
+            )
+            for parameter in response["Parameters"]:
+                loaded[parameter["Name"]] = parameter["Value"]
+            token = response.get("NextToken")
+            if not token:
+                break
+
+        previous, self._parameter_cache = self._parameter_cache, loaded
+        first_load = self._loaded_at is None
+        self._loaded_at = time.monotonic()
+        if not first_load:
+            for path in previous.keys() | loaded.keys():
+                if previous.get(path) != loaded.get(path):
+                    self._notify(path[len(prefix) + 1:], previous.get(path), loaded.get(path))
+        return len(loaded)
+
+    def _ensure_loaded(self) -> None:
+        with self._load_lock:
+            if self._loaded_at is not None:
+                return
+            try:
+                self.load()
+            except Exception as e:
+                # Fall back to per-parameter reads until a refresh succeeds
+                self._bulk_load_failed = True
+                prefix = self.settings.ssm_parameter_prefix
+                print(f"Error loading SSM parameters under {prefix}: {e}")
+
+    def on_change(self, callback: ChangeCallback, parameter_name: Optional[str] = None) -> None:
+        """
+        Register a callback for parameter or secret changes seen by a refresh.
+
+        Args:
+            callback: Called with (name, old value, new value); None means absent
+            parameter_name: Only report this parameter or secret (all if omitted)
+        """
+        self._callbacks.append((parameter_name, callback))
+
+    def _notify(self, name: str, old: Optional[str], new: Optional[str]) -> None:
+        for wanted, callback in self._callbacks:
+            if wanted is None or wanted == name:
+                try:
+                    callback(name, old, new)
+                except Exception as e:
+                    print(f"Config change callback failed for {name}: {e}")
+
+    def get_cached_parameter(
+        self, parameter_name: str, default: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Read a parameter from the bulk-loaded cache without calling AWS.
+
+        Args:
+            parameter_name: Name of the parameter (without prefix)
+            default: Value when the parameter is not loaded
+
+        Returns:
+            Parameter value or ``default``
+        """
+        return self._parameter_cache.get(self._full_path(parameter_name), default)
+
     def get_parameter(self, parameter_name: str, use_cache: bool = True) -> Optional[str]:
         """
         Retrieve parameter from SSM Parameter Store.
         
+        The first cached read triggers the bulk ``load()``. Afterwards names
+        are answered from the cache, and a name missing from a load younger
+        than ``SSM_REFRESH_SECONDS`` is reported as not found without a call.
+
         Args:
             parameter_name: Name of the parameter (without prefix)
             use_cache: Whether to use cached value
@@ -97,10 +377,18 @@ class ConfigManager:
         Returns:
             Parameter value or None if not found
         """
-        full_path = f"{self.settings.ssm_parameter_prefix}/{parameter_name}"
+        full_path = self._full_path(parameter_name)
         
-        if use_cache and full_path in self._parameter_cache:
-            return self._parameter_cache[full_path]
+        if use_cache:
+            if self._loaded_at is None and not self._bulk_load_failed:
+                self._ensure_loaded()
+            if full_path in self._parameter_cache:
+                return self._parameter_cache[full_path]
+            if (
+                self._loaded_at is not None
+                and time.monotonic() - self._loaded_at < self.refresh_interval
+            ):
+                return None
         
         try:
             response = self.ssm_client.get_parameter(
@@ -116,25 +404,66 @@ class ConfigManager:
             print(f"Error retrieving SSM parameter {full_path}: {e}")
             return None
 
-    def get_secret(self, secret_name: str) -> Optional[str]:
+    def get_secret(self, secret_name: str, use_cache: bool = True) -> Optional[str]:
         """
         Retrieve secret from AWS Secrets Manager.
         
+        Secrets are cached for ``SECRETS_CACHE_TTL_SECONDS``. If a refetch
+        fails, the last known value is returned.
+
         Args:
             secret_name: Name of the secret
+            use_cache: Whether to use cached value
             
         Returns:
             Secret value or None if not found
         """
+        cached = self._secret_cache.get(secret_name)
+        if use_cache and cached is not None and time.monotonic() - cached[1] < self.secret_ttl:
+            return cached[0]
         try:
-            secrets_client = boto3.client(
-                "secretsmanager", region_name=self.settings.aws_region
-            )
-            response = secrets_client.get_secret_value(SecretId=secret_name)
-            return response["SecretString"]
+            response = self.secrets_client.get_secret_value(SecretId=secret_name)
         except Exception as e:
             print(f"Error retrieving secret {secret_name}: {e}")
-            return None
+            return cached[0] if cached is not None else None
+        value = response["SecretString"]
+        self._secret_cache[secret_name] = (value, time.monotonic())
+        if cached is not None and cached[0] != value:
+            self._notify(secret_name, cached[0], value)
+        return value
+
+    def refresh(self) -> None:
+        """Reload parameters and refetch cached secrets, firing change callbacks."""
+        try:
+            self.load()
+        except Exception as e:
+            # Keep serving the last good values
+            prefix = self.settings.ssm_parameter_prefix
+            print(f"Error refreshing SSM parameters under {prefix}: {e}")
+        for secret_name in list(self._secret_cache):
+            self.get_secret(secret_name, use_cache=False)
+
+    def start_refresh(self) -> None:
+        """Refresh in the background every ``SSM_REFRESH_SECONDS``."""
+        if self._refresher is not None:
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="config-refresh", daemon=True
+        )
+        self._refresher.start()
+
+    def stop_refresh(self) -> None:
+        """Stop the background refresher."""
+        if self._refresher is None:
+            return
+        self._stop.set()
+        self._refresher.join()
+        self._refresher = None
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
 
 
 @lru_cache()
@@ -20,6 +20,7 @@ class ErrorCode(str, Enum):
     # Server errors (5xx)
     INTERNAL_ERROR = "INTERNAL_ERROR"
     SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
+    TIMEOUT = "TIMEOUT"
     TRANSCRIPTION_FAILED = "TRANSCRIPTION_FAILED"
     TRANSLATION_FAILED = "TRANSLATION_FAILED"
     VOICE_CLONING_FAILED = "VOICE_CLONING_FAILED"
@@ -124,6 +125,34 @@ class ServiceUnavailableError(UniVoiceError):
         )
 
 
+class CircuitOpenError(ServiceUnavailableError):
+    """Raised when a circuit breaker rejects a call to an unhealthy dependency."""
+    
+    def __init__(self, service_name: str, retry_after: float):
+        super().__init__(service_name, f"Circuit breaker open for {service_name}")
+        self.details["retry_after"] = retry_after
+
+
+class SessionCapacityError(ServiceUnavailableError):
+    """Raised when a node is already hosting its maximum number of sessions."""
+    
+    def __init__(self, node_id: str, limit: int):
+        super().__init__("session_manager", "Session capacity reached")
+        self.details.update({"node": node_id, "limit": limit})
+
+
+class DeadlineExceededError(UniVoiceError):
+    """Raised when an operation's latency budget is exhausted."""
+    
+    def __init__(self, operation: str, budget_ms: Optional[float] = None):
+        super().__init__(
+            message=f"Deadline exceeded for {operation}",
+            error_code=ErrorCode.TIMEOUT,
+            status_code=504,
+            details={"operation": operation, "budget_ms": budget_ms},
+        )
+
+
 class TranscriptionError(UniVoiceError):
     """Raised when speech-to-text transcription fails."""
     
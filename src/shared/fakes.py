@@ -0,0 +1,982 @@
+"""In-process AWS service stand-ins for tests and local benchmarks.
+
+Each fake takes a ``FaultInjector`` that sets its latency distribution and
+how often calls are throttled or fail. ``FakeAWS`` builds one fake per
+pipeline service and registers them on the client managers, so the service
+code runs unchanged with no AWS account.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import math
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Optional, Union
+
+from botocore.exceptions import ClientError
+
+from .config import get_settings
+
+# z-score of the 99th percentile of a standard normal
+_Z99 = 2.3263
+
+# Set while ``AsyncFake`` runs a call whose latency it has already awaited
+_latency_awaited: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "fake_latency_awaited", default=False
+)
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    """Build a botocore ClientError the way the real clients raise it."""
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+class LatencyModel:
+    """
+    Log-normal service latency given by its median and 99th percentile.
+
+    Args:
+        median: Median latency in seconds
+        p99: 99th percentile in seconds (defaults to the median, i.e. constant)
+    """
+
+    def __init__(self, median: float, p99: Optional[float] = None):
+        self.median = median
+        self.p99 = median if p99 is None else p99
+        if self.p99 < median:
+            raise ValueError("p99 latency must not be below the median")
+        self._sigma = math.log(self.p99 / median) / _Z99 if median > 0 else 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if not self._sigma:
+            return self.median
+        return rng.lognormvariate(math.log(self.median), self._sigma)
+
+
+class FaultInjector:
+    """
+    Latency, throttling and error injection for a fake client.
+
+    Args:
+        latency: Seconds per call, as a constant or a ``LatencyModel``
+        throttle_rate: Probability that a call fails with the service's throttling error
+        error_rate: Probability that a call fails with ``InternalServerError``
+        seed: Random seed for reproducible runs
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, LatencyModel] = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency if isinstance(latency, LatencyModel) else LatencyModel(latency)
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        # error code -> calls failed with it
+        self.injected: dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Sample the latency of one call in seconds."""
+        with self._lock:
+            return self.latency.sample(self._random)
+
+    def check(self, operation: str, throttle_code: str = "ThrottlingException") -> None:
+        """
+        Fail the call at the configured rates.
+
+        Raises:
+            ClientError: With ``throttle_code`` or ``InternalServerError``
+        """
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.throttle_rate:
+                code, message = throttle_code, "Rate exceeded"
+            elif roll < self.throttle_rate + self.error_rate:
+                code, message = "InternalServerError", "Internal server error"
+            else:
+                return
+            self.injected[code] = self.injected.get(code, 0) + 1
+        raise _client_error(code, message, operation)
+
+    def call(self, operation: str, throttle_code: str = "ThrottlingException") -> None:
+        """Block for one call's latency, then ``check``."""
+        if not _latency_awaited.get():
+            delay = self.delay()
+            if delay:
+                time.sleep(delay)
+        self.check(operation, throttle_code)
+
+
+class AsyncFake:
+    """
+    aiobotocore-style view of a blocking fake client.
+
+    Each method awaits the fake's sampled latency on the event loop instead
+    of sleeping, then runs the call inline, so thousands of concurrent
+    callers can share one fake. The same fake can still be used blocking
+    through a sync client manager.
+
+    Args:
+        fake: Fake client with a ``faults`` injector
+    """
+
+    def __init__(self, fake: Any):
+        self._fake = fake
+        if getattr(getattr(fake, "meta", None), "client", None) is fake:
+            self.meta = type("Meta", (), {"client": self})()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._fake, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            delay = self._fake.faults.delay()
+            if delay:
+                await asyncio.sleep(delay)
+            token = _latency_awaited.set(True)
+            try:
+                result = attribute(*args, **kwargs)
+            finally:
+                _latency_awaited.reset(token)
+            # Sub-resources such as DynamoDB Table handles
+            return AsyncFake(result) if hasattr(result, "faults") else result
+
+        return call
+
+
+class FakeKinesisClient:
+    """
+    Minimal boto3-compatible Kinesis client backed by in-memory shards.
+
+    Args:
+        shard_count: Number of shards to hash partition keys across
+        latency: Simulated round-trip time per API call in seconds
+        failure_rate: Probability that an individual PutRecords entry is throttled
+        seed: Random seed for reproducible failure injection
+        faults: Call latency and whole-call failures (overrides ``latency``)
+    """
+
+    THROTTLE_CODE = "ProvisionedThroughputExceededException"
+
+    def __init__(
+        self,
+        shard_count: int = 4,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        faults: Optional[FaultInjector] = None,
+    ):
+        self.shard_count = shard_count
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.faults = faults or FaultInjector(latency, seed=seed)
+        self.shards: dict[str, list[dict[str, Any]]] = {
+            f"shardId-{i:012d}": [] for i in range(shard_count)
+        }
+        self.call_count = 0
+        self._sequence = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _shard_for(self, partition_key: str) -> str:
+        digest = int.from_bytes(hashlib.md5(partition_key.encode()).digest(), "big")
+        return f"shardId-{digest % self.shard_count:012d}"
+
+    def _append(self, data: bytes, partition_key: str) -> dict[str, str]:
+        shard_id = self._shard_for(partition_key)
+        self._sequence += 1
+        sequence_number = f"{self._sequence:056d}"
+        self.shards[shard_id].append(
+            {"Data": data, "PartitionKey": partition_key, "SequenceNumber": sequence_number}
+        )
+        return {"ShardId": shard_id, "SequenceNumber": sequence_number}
+
+    def _call(self, operation: str) -> None:
+        with self._lock:
+            self.call_count += 1
+        self.faults.call(operation, self.THROTTLE_CODE)
+
+    def put_record(self, StreamName: str, Data: bytes, PartitionKey: str) -> dict[str, str]:
+        self._call("PutRecord")
+        with self._lock:
+            if self._random.random() < self.failure_rate:
+                raise _client_error(
+                    "ProvisionedThroughputExceededException", "Rate exceeded", "PutRecord"
+                )
+            return self._append(Data, PartitionKey)
+
+    def put_records(self, StreamName: str, Records: list[dict[str, Any]]) -> dict[str, Any]:
+        self._call("PutRecords")
+        results = []
+        failed = 0
+        with self._lock:
+            for record in Records:
+                if self._random.random() < self.failure_rate:
+                    failed += 1
+                    results.append(
+                        {
+                            "ErrorCode": "ProvisionedThroughputExceededException",
+                            "ErrorMessage": "Rate exceeded",
+                        }
+                    )
+                else:
+                    results.append(self._append(record["Data"], record["PartitionKey"]))
+        return {"FailedRecordCount": failed, "Records": results}
+
+    def records(self) -> list[dict[str, Any]]:
+        """Return every stored record across all shards."""
+        with self._lock:
+            return [record for shard in self.shards.values() for record in shard]
+
+
+def _project(
+    item: dict[str, Any],
+    projection: Optional[str],
+    names: Optional[dict[str, str]],
+) -> dict[str, Any]:
+    """Apply a top-level ProjectionExpression to an item."""
+    if not projection:
+        return dict(item)
+    names = names or {}
+    attributes = [names.get(token.strip(), token.strip()) for token in projection.split(",")]
+    return {name: item[name] for name in attributes if name in item}
+
+
+class FakeDynamoDBTable:
+    """Table handle returned by ``FakeDynamoDBResource.Table``."""
+
+    def __init__(self, resource: "FakeDynamoDBResource", name: str):
+        self.resource = resource
+        self.name = name
+
+    @property
+    def faults(self) -> FaultInjector:
+        return self.resource.faults
+
+    @property
+    def key_schema(self) -> list[dict[str, str]]:
+        names = self.resource.key_schema[self.name]
+        return [
+            {"AttributeName": name, "KeyType": "HASH" if i == 0 else "RANGE"}
+            for i, name in enumerate(names)
+        ]
+
+    def get_item(
+        self,
+        Key: dict[str, Any],
+        ProjectionExpression: Optional[str] = None,
+        ExpressionAttributeNames: Optional[dict[str, str]] = None,
+        ConsistentRead: bool = False,
+    ) -> dict[str, Any]:
+        self.resource._call("GetItem")
+        item = self.resource._store(self.name, "GetItem").get(self.resource._key(self.name, Key))
+        if item is None:
+            return {}
+        return {"Item": _project(item, ProjectionExpression, ExpressionAttributeNames)}
+
+    def put_item(self, Item: dict[str, Any]) -> dict[str, Any]:
+        self.resource._call("PutItem")
+        store = self.resource._store(self.name, "PutItem")
+        store[self.resource._key(self.name, Item)] = dict(Item)
+        return {}
+
+    def delete_item(self, Key: dict[str, Any]) -> dict[str, Any]:
+        self.resource._call("DeleteItem")
+        store = self.resource._store(self.name, "DeleteItem")
+        store.pop(self.resource._key(self.name, Key), None)
+        return {}
+
+
+def _write_target(request: dict[str, Any]) -> dict[str, Any]:
+    """Item or key a BatchWriteItem request applies to."""
+    if "PutRequest" in request:
+        return request["PutRequest"]["Item"]
+    return request["DeleteRequest"]["Key"]
+
+
+class FakeDynamoDBResource:
+    """
+    Minimal boto3-compatible DynamoDB resource backed by dictionaries.
+
+    The resource doubles as its own ``meta.client`` for the batch APIs.
+
+    Args:
+        tables: Table name to key attribute names (partition key, optional sort key)
+        latency: Simulated round-trip time per API call in seconds
+        unprocessed_rate: Probability that a batch entry is returned as unprocessed
+        seed: Random seed for reproducible failure injection
+        faults: Call latency and whole-call failures (overrides ``latency``)
+    """
+
+    THROTTLE_CODE = "ProvisionedThroughputExceededException"
+
+    def __init__(
+        self,
+        tables: dict[str, list[str]],
+        latency: float = 0.0,
+        unprocessed_rate: float = 0.0,
+        seed: Optional[int] = None,
+        faults: Optional[FaultInjector] = None,
+    ):
+        self.key_schema = tables
+        self.items: dict[str, dict[tuple, dict[str, Any]]] = {name: {} for name in tables}
+        self.latency = latency
+        self.unprocessed_rate = unprocessed_rate
+        self.faults = faults or FaultInjector(latency, seed=seed)
+        self.call_counts: dict[str, int] = {}
+        self.meta = type("Meta", (), {"client": self})()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def Table(self, name: str) -> FakeDynamoDBTable:
+        return FakeDynamoDBTable(self, name)
+
+    def _call(self, operation: str) -> None:
+        with self._lock:
+            self.call_counts[operation] = self.call_counts.get(operation, 0) + 1
+        self.faults.call(operation, self.THROTTLE_CODE)
+
+    def _store(self, table_name: str, operation: str) -> dict[tuple, dict[str, Any]]:
+        if table_name not in self.items:
+            raise _client_error(
+                "ResourceNotFoundException", "Requested resource not found", operation
+            )
+        return self.items[table_name]
+
+    def _key(self, table_name: str, item: dict[str, Any]) -> tuple:
+        return tuple(item[name] for name in self.key_schema[table_name])
+
+    def _unprocessed(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.unprocessed_rate
+
+    def batch_get_item(self, RequestItems: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        self._call("BatchGetItem")
+        if sum(len(request["Keys"]) for request in RequestItems.values()) > 100:
+            raise _client_error("ValidationException", "Too many items requested", "BatchGetItem")
+
+        responses: dict[str, list[dict[str, Any]]] = {}
+        unprocessed: dict[str, dict[str, Any]] = {}
+        for table_name, request in RequestItems.items():
+            store = self._store(table_name, "BatchGetItem")
+            keys = [self._key(table_name, key) for key in request["Keys"]]
+            if len(set(keys)) != len(keys):
+                raise _client_error(
+                    "ValidationException",
+                    "Provided list of item keys contains duplicates",
+                    "BatchGetItem",
+                )
+            found = responses.setdefault(table_name, [])
+            for key, raw_key in zip(keys, request["Keys"]):
+                if self._unprocessed():
+                    retry = unprocessed.setdefault(table_name, {**request, "Keys": []})
+                    retry["Keys"].append(raw_key)
+                elif key in store:
+                    found.append(
+                        _project(
+                            store[key],
+                            request.get("ProjectionExpression"),
+                            request.get("ExpressionAttributeNames"),
+                        )
+                    )
+        return {"Responses": responses, "UnprocessedKeys": unprocessed}
+
+    def batch_write_item(self, RequestItems: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+        self._call("BatchWriteItem")
+        if sum(len(requests) for requests in RequestItems.values()) > 25:
+            raise _client_error(
+                "ValidationException",
+                "Too many items in the BatchWriteItem request",
+                "BatchWriteItem",
+            )
+
+        unprocessed: dict[str, list[dict[str, Any]]] = {}
+        for table_name, requests in RequestItems.items():
+            store = self._store(table_name, "BatchWriteItem")
+            keys = [self._key(table_name, _write_target(request)) for request in requests]
+            if len(set(keys)) != len(keys):
+                raise _client_error(
+                    "ValidationException",
+                    "Provided list of item keys contains duplicates",
+                    "BatchWriteItem",
+                )
+            for request in requests:
+                if self._unprocessed():
+                    unprocessed.setdefault(table_name, []).append(request)
+                elif "PutRequest" in request:
+                    item = request["PutRequest"]["Item"]
+                    store[self._key(table_name, item)] = dict(item)
+                else:
+                    store.pop(self._key(table_name, request["DeleteRequest"]["Key"]), None)
+        return {"UnprocessedItems": unprocessed}
+
+
+class _FakeBody:
+    """Streaming body returned by ``FakeS3Client.get_object``."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        # Real bodies are read off the socket into a fresh buffer
+        return bytes(memoryview(self._data))
+
+    async def __aenter__(self) -> "_FakeAsyncBody":
+        # aiobotocore bodies are read as ``async with body as stream``
+        return _FakeAsyncBody(self)
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class _FakeAsyncBody:
+    """Awaitable reads of a ``_FakeBody``, as from an aiobotocore stream."""
+
+    def __init__(self, body: _FakeBody):
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body.read()
+
+
+class FakeS3Client:
+    """
+    Minimal boto3-compatible S3 client backed by in-memory objects.
+
+    Supports ranged and conditional GETs and multipart uploads, including the
+    5 MiB minimum size for every part but the last.
+
+    Args:
+        latency: Simulated round-trip time per API call in seconds
+        keep_data: Store uploaded bytes; disable to keep benchmark memory
+            readings limited to the client side
+        faults: Call latency and failures (overrides ``latency``)
+    """
+
+    MIN_PART_BYTES = 5 * 1024 * 1024
+    THROTTLE_CODE = "SlowDown"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        keep_data: bool = True,
+        faults: Optional[FaultInjector] = None,
+    ):
+        self.latency = latency
+        self.keep_data = keep_data
+        self.faults = faults or FaultInjector(latency)
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.etags: dict[tuple[str, str], str] = {}
+        self.uploads: dict[str, dict[int, tuple[bytes, str]]] = {}
+        self.call_counts: dict[str, int] = {}
+        self._upload_ids = 0
+        self._lock = threading.Lock()
+
+    def _call(self, operation: str) -> None:
+        with self._lock:
+            self.call_counts[operation] = self.call_counts.get(operation, 0) + 1
+        self.faults.call(operation, self.THROTTLE_CODE)
+
+    @staticmethod
+    def _etag(data: bytes) -> str:
+        return f'"{hashlib.md5(data).hexdigest()}"'
+
+    def _object(self, bucket: str, key: str, operation: str) -> bytes:
+        data = self.objects.get((bucket, key))
+        if data is None:
+            code = "404" if operation == "HeadObject" else "NoSuchKey"
+            raise _client_error(code, "The specified key does not exist.", operation)
+        return data
+
+    def _store(self, bucket: str, key: str, data: bytes, etag: str) -> None:
+        self.objects[(bucket, key)] = data if self.keep_data else b""
+        self.etags[(bucket, key)] = etag
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs: Any) -> dict[str, Any]:
+        self._call("PutObject")
+        etag = self._etag(Body)
+        self._store(Bucket, Key, bytes(Body), etag)
+        return {"ETag": etag}
+
+    def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        self._call("HeadObject")
+        data = self._object(Bucket, Key, "HeadObject")
+        return {"ContentLength": len(data), "ETag": self.etags[(Bucket, Key)]}
+
+    def get_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Range: Optional[str] = None,
+        IfMatch: Optional[str] = None,
+    ) -> dict[str, Any]:
+        self._call("GetObject")
+        data = self._object(Bucket, Key, "GetObject")
+        if IfMatch is not None and IfMatch != self.etags[(Bucket, Key)]:
+            raise _client_error(
+                "PreconditionFailed", "At least one precondition failed", "GetObject"
+            )
+        if Range is not None:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start):int(end) + 1]
+        return {"Body": _FakeBody(data), "ContentLength": len(data)}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs: Any) -> dict[str, Any]:
+        self._call("CreateMultipartUpload")
+        with self._lock:
+            self._upload_ids += 1
+            upload_id = f"upload-{self._upload_ids}"
+            self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict[str, Any]:
+        self._call("UploadPart")
+        if UploadId not in self.uploads:
+            raise _client_error("NoSuchUpload", "The upload does not exist", "UploadPart")
+        etag = self._etag(Body)
+        self.uploads[UploadId][PartNumber] = (bytes(Body) if self.keep_data else b"", etag)
+        return {"ETag": etag}
+
+    def complete_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict[str, Any]
+    ) -> dict[str, Any]:
+        self._call("CompleteMultipartUpload")
+        stored = self.uploads.pop(UploadId, None)
+        if stored is None:
+            raise _client_error(
+                "NoSuchUpload", "The upload does not exist", "CompleteMultipartUpload"
+            )
+        parts = MultipartUpload["Parts"]
+        numbers = [part["PartNumber"] for part in parts]
+        if numbers != sorted(numbers):
+            raise _client_error(
+                "InvalidPartOrder", "Parts must be in ascending order", "CompleteMultipartUpload"
+            )
+        chunks = []
+        for index, part in enumerate(parts):
+            data, etag = stored.get(part["PartNumber"], (b"", None))
+            if etag != part["ETag"]:
+                raise _client_error(
+                    "InvalidPart", "One or more parts could not be found", "CompleteMultipartUpload"
+                )
+            if self.keep_data and index < len(parts) - 1 and len(data) < self.MIN_PART_BYTES:
+                raise _client_error(
+                    "EntityTooSmall", "Part is smaller than the minimum", "CompleteMultipartUpload"
+                )
+            chunks.append(data)
+        # Multipart ETags are the MD5 of the part MD5s plus the part count
+        digest = hashlib.md5("".join(part["ETag"] for part in parts).encode()).hexdigest()
+        etag = f'"{digest}-{len(parts)}"'
+        self._store(Bucket, Key, b"".join(chunks), etag)
+        return {"ETag": etag}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> dict[str, Any]:
+        self._call("AbortMultipartUpload")
+        self.uploads.pop(UploadId, None)
+        return {}
+
+
+class FakeSSMClient:
+    """
+    Minimal boto3-compatible SSM Parameter Store client.
+
+    Args:
+        parameters: Full parameter path to value
+        latency: Simulated round-trip time per API call in seconds
+    """
+
+    MAX_RESULTS = 10
+
+    class exceptions:
+        class ParameterNotFound(ClientError):
+            pass
+
+    def __init__(self, parameters: Optional[dict[str, str]] = None, latency: float = 0.0):
+        self.parameters = dict(parameters or {})
+        self.latency = latency
+        self.call_counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _call(self, operation: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.call_counts[operation] = self.call_counts.get(operation, 0) + 1
+
+    def get_parameter(self, Name: str, WithDecryption: bool = False) -> dict[str, Any]:
+        self._call("GetParameter")
+        if Name not in self.parameters:
+            raise self.exceptions.ParameterNotFound(
+                {"Error": {"Code": "ParameterNotFound", "Message": Name}}, "GetParameter"
+            )
+        return {"Parameter": {"Name": Name, "Value": self.parameters[Name]}}
+
+    def get_parameters_by_path(
+        self,
+        Path: str,
+        Recursive: bool = False,
+        WithDecryption: bool = False,
+        MaxResults: int = MAX_RESULTS,
+        NextToken: Optional[str] = None,
+    ) -> dict[str, Any]:
+        self._call("GetParametersByPath")
+        prefix = Path.rstrip("/") + "/"
+        names = sorted(
+            name
+            for name in self.parameters
+            if name.startswith(prefix) and (Recursive or "/" not in name[len(prefix):])
+        )
+        start = int(NextToken or 0)
+        end = start + min(MaxResults, self.MAX_RESULTS)
+        response: dict[str, Any] = {
+            "Parameters": [{"Name": n, "Value": self.parameters[n]} for n in names[start:end]]
+        }
+        if end < len(names):
+            response["NextToken"] = str(end)
+        return response
+
+
+class FakeSecretsManagerClient:
+    """
+    Minimal boto3-compatible Secrets Manager client.
+
+    Args:
+        secrets: Secret id to secret string
+        latency: Simulated round-trip time per API call in seconds
+    """
+
+    def __init__(self, secrets: Optional[dict[str, str]] = None, latency: float = 0.0):
+        self.secrets = dict(secrets or {})
+        self.latency = latency
+        self.call_count = 0
+
+    def get_secret_value(self, SecretId: str) -> dict[str, Any]:
+        if self.latency:
+            time.sleep(self.latency)
+        self.call_count += 1
+        if SecretId not in self.secrets:
+            raise _client_error(
+                "ResourceNotFoundException",
+                "Secrets Manager can't find the secret.",
+                "GetSecretValue",
+            )
+        return {"Name": SecretId, "SecretString": self.secrets[SecretId]}
+
+
+class FakeTranslateClient:
+    """
+    Minimal aiobotocore-compatible Amazon Translate client.
+
+    Each input line is "translated" to ``[target] line``, so line breaks
+    survive like they do in the real service.
+
+    Args:
+        latency: Simulated round trip per call in seconds
+        latency_per_char: Additional simulated time per input character
+        max_concurrency: Calls served at once; further calls queue, modelling
+            the account's throughput limit
+        faults: Extra latency per call, throttling and errors
+    """
+
+    MAX_TEXT_BYTES = 10_000
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_per_char: float = 0.0,
+        max_concurrency: Optional[int] = None,
+        faults: Optional[FaultInjector] = None,
+    ):
+        self.latency = latency
+        self.latency_per_char = latency_per_char
+        self.max_concurrency = max_concurrency
+        self.faults = faults or FaultInjector()
+        self.requests: list[dict[str, Any]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def call_count(self) -> int:
+        return len(self.requests)
+
+    async def translate_text(
+        self, Text: str, SourceLanguageCode: str, TargetLanguageCode: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        if len(Text.encode()) > self.MAX_TEXT_BYTES:
+            raise _client_error(
+                "TextSizeLimitExceededException", "Input text size exceeds limit", "TranslateText"
+            )
+        self.requests.append(
+            {
+                "Text": Text,
+                "SourceLanguageCode": SourceLanguageCode,
+                "TargetLanguageCode": TargetLanguageCode,
+                **kwargs,
+            }
+        )
+        if self.max_concurrency and self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        delay = self.latency + self.latency_per_char * len(Text) + self.faults.delay()
+        if self._slots is not None:
+            async with self._slots:
+                await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+        self.faults.check("TranslateText")
+        translated = "\n".join(f"[{TargetLanguageCode}] {line}" for line in Text.split("\n"))
+        return {
+            "TranslatedText": translated,
+            "SourceLanguageCode": SourceLanguageCode,
+            "TargetLanguageCode": TargetLanguageCode,
+        }
+
+
+class FakeTranscribeStream:
+    """
+    One stream opened by ``FakeTranscribeStreamingClient``.
+
+    Like the SDK stream, audio goes in through ``input_stream`` and results
+    come out of ``output_stream``. Events are dicts in the service's wire
+    shape, ``{"Transcript": {"Results": [...]}}``, with times in seconds.
+    Every audio event produces one result, which is emitted one sampled
+    latency after the audio arrived.
+    """
+
+    def __init__(
+        self,
+        client: "FakeTranscribeStreamingClient",
+        stream_id: str,
+        sample_rate: int,
+        rng: random.Random,
+    ):
+        self.client = client
+        self.stream_id = stream_id
+        self.sample_rate = sample_rate
+        self.input_stream = self
+        self.output_stream = self._events()
+        self._rng = rng
+        # (audio chunk or None at the end, loop time its result is ready)
+        self._audio: asyncio.Queue = asyncio.Queue()
+
+    async def send_audio_event(self, audio_chunk: bytes) -> None:
+        """Send 16-bit mono PCM audio."""
+        ready = asyncio.get_running_loop().time() + self.client.faults.delay()
+        await self._audio.put((audio_chunk, ready))
+
+    async def end_stream(self) -> None:
+        """Signal the end of the audio; a last final result follows."""
+        await self._audio.put((None, asyncio.get_running_loop().time()))
+
+    def _event(
+        self, segment: int, start: float, end: float, words: list[str], partial: bool
+    ) -> dict[str, Any]:
+        return {
+            "Transcript": {
+                "Results": [
+                    {
+                        "ResultId": f"{self.stream_id}-{segment}",
+                        "IsPartial": partial,
+                        "StartTime": start,
+                        "EndTime": end,
+                        "Alternatives": [{"Transcript": " ".join(words)}],
+                    }
+                ]
+            }
+        }
+
+    async def _events(self) -> AsyncIterator[dict[str, Any]]:
+        client = self.client
+        loop = asyncio.get_running_loop()
+        segment, start, end = 0, 0.0, 0.0
+        words: list[str] = []
+        try:
+            while True:
+                chunk, ready = await self._audio.get()
+                # Results keep audio order even when a later one was sampled faster
+                wait = ready - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                if chunk is None:
+                    break
+                end += len(chunk) / (2 * self.sample_rate)
+                target = max(1, round((end - start) * client.words_per_second))
+                while len(words) < target:
+                    words.append(self._rng.choice(client.VOCABULARY))
+                final = end - start >= client.segment_seconds
+                yield self._event(segment, start, end, words, partial=not final)
+                if final:
+                    segment, start, words = segment + 1, end, []
+            if words:
+                yield self._event(segment, start, end, words, partial=False)
+        finally:
+            client.active_streams -= 1
+
+
+class FakeTranscribeStreamingClient:
+    """
+    Minimal stand-in for the Amazon Transcribe streaming SDK client.
+
+    Transcripts are random words from ``VOCABULARY``, at ``words_per_second``
+    of audio. A final result closes each ``segment_seconds`` of audio.
+
+    Args:
+        faults: Result latency per audio event, and stream start failures
+        segment_seconds: Audio per final result
+        words_per_second: Transcript words per second of audio
+        max_streams: Concurrent streams allowed before starts are throttled
+        seed: Random seed for reproducible transcripts
+    """
+
+    THROTTLE_CODE = "LimitExceededException"
+    VOCABULARY = (
+        "could", "you", "say", "that", "again", "please", "my", "account", "number",
+        "is", "on", "the", "form", "we", "will", "start", "lesson", "in", "five",
+        "minutes", "thank", "for", "waiting", "printer", "second", "floor",
+    )
+
+    def __init__(
+        self,
+        faults: Optional[FaultInjector] = None,
+        segment_seconds: float = 2.0,
+        words_per_second: float = 2.5,
+        max_streams: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        self.faults = faults or FaultInjector()
+        self.segment_seconds = segment_seconds
+        self.words_per_second = words_per_second
+        self.max_streams = max_streams
+        self.active_streams = 0
+        self.started = 0
+        self._random = random.Random(seed)
+
+    async def start_stream_transcription(
+        self,
+        language_code: str,
+        media_sample_rate_hz: int,
+        media_encoding: str = "pcm",
+        **kwargs: Any,
+    ) -> FakeTranscribeStream:
+        """Open a stream; it counts against ``max_streams`` until its output is drained."""
+        if self.max_streams is not None and self.active_streams >= self.max_streams:
+            raise _client_error(
+                self.THROTTLE_CODE, "Concurrent stream limit exceeded", "StartStreamTranscription"
+            )
+        self.faults.check("StartStreamTranscription", self.THROTTLE_CODE)
+        self.active_streams += 1
+        self.started += 1
+        return FakeTranscribeStream(
+            self,
+            f"stream-{self.started}",
+            media_sample_rate_hz,
+            random.Random(self._random.random()),
+        )
+
+
+class FakePollyClient:
+    """
+    Minimal boto3-compatible Amazon Polly client.
+
+    ``synthesize_speech`` returns silent 16-bit PCM, as long as the text takes
+    to say at ``chars_per_second``.
+
+    Args:
+        faults: Call latency, throttling and errors
+        chars_per_second: Speaking rate used to size the audio
+    """
+
+    MAX_TEXT_CHARS = 3000
+    THROTTLE_CODE = "ThrottlingException"
+
+    def __init__(self, faults: Optional[FaultInjector] = None, chars_per_second: float = 15.0):
+        self.faults = faults or FaultInjector()
+        self.chars_per_second = chars_per_second
+        self.call_count = 0
+        self.characters = 0
+        self._lock = threading.Lock()
+
+    def synthesize_speech(
+        self,
+        Text: str,
+        OutputFormat: str,
+        VoiceId: str,
+        SampleRate: str = "16000",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        with self._lock:
+            self.call_count += 1
+        self.faults.call("SynthesizeSpeech", self.THROTTLE_CODE)
+        if len(Text) > self.MAX_TEXT_CHARS:
+            raise _client_error(
+                "TextLengthExceededException", "Maximum text length exceeded", "SynthesizeSpeech"
+            )
+        with self._lock:
+            self.characters += len(Text)
+        samples = int(len(Text) / self.chars_per_second * int(SampleRate))
+        return {
+            "AudioStream": _FakeBody(bytes(2 * samples)),
+            "ContentType": "audio/pcm",
+            "RequestCharacters": len(Text),
+        }
+
+
+class FakeAWS:
+    """
+    One fake per pipeline service, registered on the AWS client managers.
+
+    Args:
+        faults: Service name ("kinesis", "dynamodb", "s3", "translate",
+            "transcribe", "polly") to its fault injector; services left out
+            answer instantly
+        seed: Random seed for reproducible runs
+    """
+
+    def __init__(
+        self, faults: Optional[dict[str, FaultInjector]] = None, seed: Optional[int] = None
+    ):
+        settings = get_settings()
+        faults = faults or {}
+        self.kinesis = FakeKinesisClient(seed=seed, faults=faults.get("kinesis"))
+        self.dynamodb = FakeDynamoDBResource(
+            {
+                settings.dynamodb_sessions_table: ["sessionId"],
+                settings.dynamodb_voice_profiles_table: ["profileId"],
+                settings.dynamodb_users_table: ["userId"],
+            },
+            seed=seed,
+            faults=faults.get("dynamodb"),
+        )
+        self.s3 = FakeS3Client(keep_data=False, faults=faults.get("s3"))
+        self.translate = FakeTranslateClient(faults=faults.get("translate"))
+        self.transcribe = FakeTranscribeStreamingClient(faults=faults.get("transcribe"), seed=seed)
+        self.polly = FakePollyClient(faults=faults.get("polly"))
+
+    def install(self, manager: Any = None, async_manager: Any = None) -> None:
+        """
+        Register the fakes on client managers.
+
+        Args:
+            manager: ``AWSClientManager`` to serve the blocking fakes
+            async_manager: ``AsyncAWSClientManager`` to serve them through ``AsyncFake``
+        """
+        if manager is not None:
+            for name in ("kinesis", "s3", "polly"):
+                manager.register_client(name, getattr(self, name))
+            manager.register_client("dynamodb", self.dynamodb.meta.client)
+            manager.register_resource("dynamodb", self.dynamodb)
+        if async_manager is not None:
+            for name in ("kinesis", "s3", "polly"):
+                async_manager.register_client(name, AsyncFake(getattr(self, name)))
+            dynamodb = AsyncFake(self.dynamodb)
+            async_manager.register_client("dynamodb", dynamodb.meta.client)
+            async_manager.register_resource("dynamodb", dynamodb)
+            async_manager.register_client("translate", self.translate)
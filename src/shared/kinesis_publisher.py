@@ -0,0 +1,370 @@
+"""Buffered Kinesis publisher that aggregates small records into PutRecords batches."""
+
+import random
+import struct
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from .aws_clients import get_aws_client_manager
+from .config import get_settings
+from .errors import ServiceUnavailableError, ValidationError
+from .logging import get_logger
+from .metrics import get_metrics_registry
+from .resilience import is_retryable
+
+logger = get_logger(__name__)
+
+# Kinesis service limits
+MAX_RECORD_BYTES = 1024 * 1024
+MAX_BATCH_RECORDS = 500
+MAX_BATCH_BYTES = 5 * 1024 * 1024
+
+# Aggregated record framing: magic, record count, then length-prefixed records
+AGGREGATION_MAGIC = b"UVAG"
+_HEADER = struct.Struct(">4sI")
+_LENGTH = struct.Struct(">I")
+
+
+def aggregate_records(records: list[bytes]) -> bytes:
+    """
+    Pack several user records into a single Kinesis record payload.
+
+    Args:
+        records: User record payloads, in publish order
+
+    Returns:
+        Aggregated payload
+    """
+    parts = [_HEADER.pack(AGGREGATION_MAGIC, len(records))]
+    for record in records:
+        parts.append(_LENGTH.pack(len(record)))
+        parts.append(record)
+    return b"".join(parts)
+
+
+def deaggregate_record(data: bytes) -> list[bytes]:
+    """
+    Unpack an aggregated Kinesis record into its user records.
+
+    Records that were not produced by the aggregating publisher are returned
+    unchanged as a single-element list.
+
+    Args:
+        data: Kinesis record payload
+
+    Returns:
+        User record payloads, in publish order
+    """
+    if len(data) < _HEADER.size or data[:4] != AGGREGATION_MAGIC:
+        return [data]
+
+    view = memoryview(data)
+    _, count = _HEADER.unpack_from(view, 0)
+    offset = _HEADER.size
+    records = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        records.append(bytes(view[offset:offset + length]))
+        offset += length
+    return records
+
+
+def _aggregate_overhead(record_count: int) -> int:
+    return _HEADER.size + record_count * _LENGTH.size
+
+
+class KinesisBatchPublisher:
+    """
+    Coalesces records into aggregated PutRecords batches on a background thread.
+
+    Records sharing a partition key are packed into one Kinesis record per
+    batch and a batch is only sent once the previous one has completed, so
+    per-session ordering is preserved even when individual entries are retried.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        client: Optional[Any] = None,
+        linger_ms: float = 50,
+        max_batch_records: int = MAX_BATCH_RECORDS,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_queued_records: int = 100_000,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.05,
+        retry_max_delay: float = 1.0,
+    ):
+        self.stream_name = stream_name
+        self.client = client or get_aws_client_manager().get_client("kinesis")
+        self.linger = linger_ms / 1000
+        self.max_batch_records = min(max_batch_records, MAX_BATCH_RECORDS)
+        self.max_batch_bytes = min(max_batch_bytes, MAX_BATCH_BYTES)
+        self.max_queued_records = max_queued_records
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+        self._pending: dict[str, list[bytes]] = {}
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._oldest: Optional[float] = None
+        self._in_flight = False
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+        metrics = get_metrics_registry()
+        self._queue_depth = metrics.gauge("kinesis_publisher_queue_depth", stream=stream_name)
+        self._queue_bytes = metrics.gauge("kinesis_publisher_queue_bytes", stream=stream_name)
+        self._published = metrics.counter("kinesis_publisher_records_total", stream=stream_name)
+        self._batches = metrics.counter("kinesis_publisher_batches_total", stream=stream_name)
+        self._retried = metrics.counter(
+            "kinesis_publisher_retried_entries_total", stream=stream_name
+        )
+        self._failed = metrics.counter(
+            "kinesis_publisher_failed_records_total", stream=stream_name
+        )
+        self._rejected = metrics.counter(
+            "kinesis_publisher_rejected_records_total", stream=stream_name
+        )
+        self._flush_latency = metrics.gauge(
+            "kinesis_publisher_flush_latency_ms", stream=stream_name
+        )
+        self._flush_latency_sum = metrics.counter(
+            "kinesis_publisher_flush_latency_ms_sum", stream=stream_name
+        )
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"kinesis-publisher-{stream_name}", daemon=True
+        )
+        self._thread.start()
+
+    def publish(self, data: bytes, partition_key: str) -> None:
+        """
+        Queue a record for publishing without blocking on the network.
+
+        Args:
+            data: Record data
+            partition_key: Partition key for sharding (typically the session ID)
+
+        Raises:
+            ValidationError: If the record can never fit in a Kinesis record
+            ServiceUnavailableError: If the publisher is closed or its queue is full
+        """
+        size = len(data) + len(partition_key)
+        if size + _aggregate_overhead(1) > MAX_RECORD_BYTES:
+            raise ValidationError(
+                "Record exceeds Kinesis size limit",
+                details={"size": size, "limit": MAX_RECORD_BYTES},
+            )
+
+        with self._cond:
+            if self._closed:
+                raise ServiceUnavailableError("kinesis", "Publisher is closed")
+            if self._pending_records >= self.max_queued_records:
+                self._rejected.inc()
+                raise ServiceUnavailableError("kinesis", "Publisher queue is full")
+
+            records = self._pending.get(partition_key)
+            if records is None:
+                self._pending[partition_key] = records = []
+            records.append(data)
+            self._pending_records += 1
+            self._pending_bytes += size
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self._queue_depth.set(self._pending_records)
+            self._queue_bytes.set(self._pending_bytes)
+
+            if self._batch_full() or self._pending_records == 1:
+                self._cond.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all queued records and wait for them to complete.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the queue drained before the timeout
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            drained = self._cond.wait_for(
+                lambda: not self._pending and not self._in_flight, timeout
+            )
+            self._flush_requested = False
+            return drained
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush remaining records and stop the background thread.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def __enter__(self) -> "KinesisBatchPublisher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of records waiting to be sent."""
+        return self._pending_records
+
+    def _batch_full(self) -> bool:
+        return (
+            len(self._pending) >= self.max_batch_records
+            or self._pending_bytes >= self.max_batch_bytes
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._pending:
+                        if self._closed:
+                            return
+                        self._cond.wait()
+                        continue
+                    if self._closed or self._flush_requested or self._batch_full():
+                        break
+                    remaining = self._oldest + self.linger - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                entries = self._drain_batch()
+                self._in_flight = True
+
+            try:
+                self._send(entries)
+            except Exception as e:
+                # Never let the flusher thread die with records still queued
+                logger.error(
+                    "Kinesis publisher flush failed", error=str(e), stream=self.stream_name
+                )
+                self._failed.inc(sum(count for _, _, count in entries))
+            finally:
+                with self._cond:
+                    self._in_flight = False
+                    self._cond.notify_all()
+
+    def _drain_batch(self) -> list[tuple[str, bytes, int]]:
+        """Take at most one aggregated record per partition key off the queue."""
+        entries: list[tuple[str, bytes, int]] = []
+        batch_bytes = 0
+
+        for partition_key in list(self._pending):
+            if len(entries) >= self.max_batch_records:
+                break
+
+            records = self._pending[partition_key]
+            key_size = len(partition_key)
+            record_bytes = key_size + _aggregate_overhead(0)
+            taken = 0
+            for data in records:
+                size = len(data) + _LENGTH.size
+                if taken and (
+                    record_bytes + size > MAX_RECORD_BYTES
+                    or batch_bytes + record_bytes + size > self.max_batch_bytes
+                ):
+                    break
+                record_bytes += size
+                taken += 1
+
+            if entries and batch_bytes + record_bytes > self.max_batch_bytes:
+                break
+
+            batch = records[:taken]
+            entries.append((partition_key, aggregate_records(batch), taken))
+            batch_bytes += record_bytes
+            self._pending_records -= taken
+            self._pending_bytes -= sum(len(data) for data in batch) + key_size * taken
+            if taken == len(records):
+                del self._pending[partition_key]
+            else:
+                del records[:taken]
+
+        if not self._pending:
+            self._oldest = None
+        self._queue_depth.set(self._pending_records)
+        self._queue_bytes.set(self._pending_bytes)
+        return entries
+
+    def _send(self, entries: list[tuple[str, bytes, int]]) -> None:
+        """Send one batch, retrying only the entries that failed."""
+        start = time.perf_counter()
+        attempt = 0
+
+        while entries:
+            try:
+                response = self.client.put_records(
+                    StreamName=self.stream_name,
+                    Records=[{"Data": data, "PartitionKey": key} for key, data, _ in entries],
+                )
+                failed = [
+                    entry
+                    for entry, result in zip(entries, response["Records"])
+                    if result.get("ErrorCode")
+                ]
+            except (ClientError, BotoCoreError) as e:
+                logger.warning("Kinesis put_records failed", error=str(e), stream=self.stream_name)
+                if not is_retryable(e):
+                    self._failed.inc(sum(count for _, _, count in entries))
+                    break
+                failed = entries
+
+            self._batches.inc()
+            self._published.inc(
+                sum(count for _, _, count in entries) - sum(count for _, _, count in failed)
+            )
+            if not failed:
+                break
+
+            attempt += 1
+            if attempt > self.max_retries:
+                dropped = sum(count for _, _, count in failed)
+                logger.error(
+                    "Kinesis records dropped after retries",
+                    stream=self.stream_name,
+                    records=dropped,
+                )
+                self._failed.inc(dropped)
+                break
+
+            self._retried.inc(len(failed))
+            delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+            time.sleep(random.uniform(0, delay))
+            entries = failed
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._flush_latency.set(elapsed_ms)
+        self._flush_latency_sum.inc(elapsed_ms)
+
+
+@lru_cache()
+def get_kinesis_publisher() -> KinesisBatchPublisher:
+    """Get cached publisher for the audio stream."""
+    settings = get_settings()
+    return KinesisBatchPublisher(
+        stream_name=settings.kinesis_audio_stream,
+        linger_ms=settings.kinesis_linger_ms,
+        max_batch_records=settings.kinesis_max_batch_records,
+        max_batch_bytes=settings.kinesis_max_batch_bytes,
+        max_queued_records=settings.kinesis_max_queued_records,
+    )
@@ -1,13 +1,215 @@
-"""Structured logging configuration with CloudWatch integration."""
+"""Structured logging configuration with CloudWatch integration.
 
+By default structlog events are not rendered on the caller's thread. The
+last processor hands the event dict to ``LogWriter``, a bounded buffer that
+a background thread drains every ``LOG_FLUSH_INTERVAL_MS``. The thread
+formats timestamps, serializes each batch of events (with orjson when it is
+installed) and writes it with a single call. When the buffer is full, the
+event is dropped and counted instead of blocking the event loop.
+``EventSampler`` caps each event name at ``LOG_SAMPLE_PER_SECOND`` so
+per-chunk debug events cannot flood the pipeline. Warnings and errors are
+never sampled. Set ``LOG_ASYNC=false`` to render and print synchronously.
+"""
+
+import atexit
+import json
 import logging
 import sys
-from typing import Any
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Optional, TextIO
 import structlog
-from pythonjsonlogger import jsonlogger
-from aws_xray_sdk.core import xray_recorder
 
 from .config import get_settings
+from .metrics import get_metrics_registry
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+_NEVER_SAMPLED = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+_MAX_SAMPLED_EVENTS = 10_000
+
+
+def _dumps(event: dict[str, Any]) -> str:
+    stamp = event.get("timestamp")
+    if isinstance(stamp, float):
+        # Set by ``stamp_time``; same format as TimeStamper(fmt="iso")
+        event["timestamp"] = (
+            datetime.fromtimestamp(stamp, timezone.utc).isoformat().replace("+00:00", "Z")
+        )
+    if orjson is not None:
+        return orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(event, default=str)
+
+
+class EventSampler:
+    """
+    structlog processor logging each event name at most ``max_per_second`` times a second.
+
+    The first event logged after a window with drops carries the number of
+    dropped events as ``sampled_out``.
+
+    Args:
+        max_per_second: Events kept per event name per second (0 keeps all)
+    """
+
+    def __init__(self, max_per_second: int):
+        self.max_per_second = max_per_second
+        # event name -> [window start, kept, dropped]
+        self._windows: dict[Any, list] = {}
+        self._sampled = get_metrics_registry().counter("log_events_dropped_total", reason="sampled")
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        if self.max_per_second <= 0 or method_name in _NEVER_SAMPLED:
+            return event_dict
+        event = event_dict.get("event")
+        now = time.monotonic()
+        window = self._windows.get(event)
+        if window is None:
+            if len(self._windows) >= _MAX_SAMPLED_EVENTS:
+                # Dynamic event names; start over rather than grow without bound
+                self._windows.clear()
+            self._windows[event] = [now, 1, 0]
+            return event_dict
+        if now - window[0] >= 1.0:
+            if window[2]:
+                event_dict["sampled_out"] = window[2]
+            window[:] = [now, 1, 0]
+            return event_dict
+        if window[1] >= self.max_per_second:
+            window[2] += 1
+            self._sampled.inc()
+            raise structlog.DropEvent
+        window[1] += 1
+        return event_dict
+
+
+class LogWriter:
+    """
+    Bounded buffer of event dicts serialized and written by a background thread.
+
+    Callers only append to a deque. The thread wakes every ``flush_interval``
+    seconds, or straight away on ``flush()``, and writes everything buffered
+    in batches of up to ``batch_size`` lines.
+
+    Args:
+        stream: Output stream (defaults to stdout)
+        max_queue: Events buffered before new ones are dropped
+        batch_size: Most events serialized into one write
+        flush_interval: Seconds between writes while events trickle in
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        max_queue: int = 10_000,
+        batch_size: int = 512,
+        flush_interval: float = 0.05,
+    ):
+        self.stream = stream or sys.stdout
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._events: deque[dict[str, Any]] = deque()
+        self._wake = threading.Event()
+        self._closed = False
+        self._dropped = get_metrics_registry().counter(
+            "log_events_dropped_total", reason="queue_full"
+        )
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, event_dict: dict[str, Any]) -> None:
+        """Buffer an event without blocking; drops it when the buffer is full."""
+        if len(self._events) >= self.max_queue:
+            self._dropped.inc()
+            return
+        self._events.append(event_dict)
+
+    def flush(self) -> None:
+        """Ask the writer thread to write what is buffered now."""
+        self._wake.set()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Write everything buffered so far and stop the thread."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            while self._events:
+                self._write_batch()
+            if self._closed:
+                return
+
+    def _write_batch(self) -> None:
+        lines = []
+        events = self._events
+        while events and len(lines) < self.batch_size:
+            event = events.popleft()
+            try:
+                lines.append(_dumps(event))
+            except Exception as e:
+                lines.append(json.dumps({"event": repr(event), "log_error": str(e)}))
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+        except Exception:
+            # Nowhere left to report a broken log stream
+            pass
+
+
+class QueueLogger:
+    """structlog logger that hands event dicts to a ``LogWriter``."""
+
+    def __init__(self, writer: LogWriter):
+        self._writer = writer
+
+    def msg(self, event_dict: dict[str, Any]) -> None:
+        self._writer.put(event_dict)
+
+    def error(self, event_dict: dict[str, Any]) -> None:
+        # Errors go out now rather than at the next flush interval
+        self._writer.put(event_dict)
+        self._writer.flush()
+
+    debug = info = warning = warn = log = msg
+    exception = critical = fatal = error
+
+
+class QueueLoggerFactory:
+    """structlog logger factory sharing one ``LogWriter``."""
+
+    def __init__(self, writer: LogWriter):
+        self._logger = QueueLogger(writer)
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        return self._logger
+
+
+def stamp_time(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """Record the event time as epoch seconds; the writer thread formats it."""
+    event_dict["timestamp"] = time.time()
+    return event_dict
+
+
+def defer_rendering(logger: Any, method_name: str, event_dict: dict) -> tuple:
+    """Final processor handing the writer thread a copy of the event dict to render.
+
+    The copy is shallow: it keeps later changes to the dict (e.g., by a caller
+    reusing it) out of the queued event, but not changes inside mutable values.
+    """
+    return (dict(event_dict),), {}
+
+
+_writer: Optional[LogWriter] = None
 
 
 def setup_logging() -> None:
@@ -18,6 +220,8 @@ def setup_logging() -> None:
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     
     # JSON formatter for CloudWatch
+    from pythonjsonlogger import jsonlogger
+
     json_handler = logging.StreamHandler(sys.stdout)
     formatter = jsonlogger.JsonFormatter(
         fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
@@ -31,18 +235,34 @@ def setup_logging() -> None:
     root_logger.handlers = [json_handler]
     
     # Configure structlog
+    global _writer
+    processors = [
+        EventSampler(settings.log_sample_per_second),
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        stamp_time if settings.log_async else structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+    ]
+    if settings.log_async:
+        if _writer is None:
+            # One writer per process: loggers cached before a reconfigure keep using it
+            _writer = LogWriter(
+                max_queue=settings.log_queue_size,
+                batch_size=settings.log_batch_size,
+                flush_interval=settings.log_flush_interval_ms / 1000,
+            )
+            atexit.register(_writer.close)
+        processors.append(defer_rendering)
+        logger_factory = QueueLoggerFactory(_writer)
+    else:
+        processors.append(structlog.processors.JSONRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -60,6 +280,9 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+_logger = get_logger(__name__)
+
+
 def add_trace_context(logger: structlog.BoundLogger) -> structlog.BoundLogger:
     """
     Add X-Ray trace context to logger.
@@ -71,6 +294,8 @@ def add_trace_context(logger: structlog.BoundLogger) -> structlog.BoundLogger:
         Logger with trace context bound
     """
     try:
+        from aws_xray_sdk.core import xray_recorder
+
         trace_id = xray_recorder.current_segment().trace_id
         return logger.bind(trace_id=trace_id)
     except Exception:
@@ -86,8 +311,7 @@ def log_function_call(func_name: str, **kwargs: Any) -> None:
         func_name: Name of the function being called
         **kwargs: Function parameters to log
     """
-    logger = get_logger(__name__)
-    logger.info(
+    _logger.info(
         "function_call",
         function=func_name,
         parameters=kwargs,
@@ -102,8 +326,7 @@ def log_error(error: Exception, context: dict[str, Any] | None = None) -> None:
         error: Exception that occurred
         context: Additional context information
     """
-    logger = get_logger(__name__)
-    logger.error(
+    _logger.error(
         "error_occurred",
         error_type=type(error).__name__,
         error_message=str(error),
@@ -0,0 +1,296 @@
+"""Lightweight in-process metrics registry for counters, gauges and histograms."""
+
+import math
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any
+
+
+def _metric_key(name: str, labels: dict[str, Any]) -> str:
+    """Build a stable registry key from a metric name and its labels."""
+    if not labels:
+        return name
+    rendered = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter by the given amount."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Gauge:
+    """Point-in-time value that can go up and down."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge to an absolute value."""
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge by the given amount."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge by the given amount."""
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+_SUB_BUCKETS = 16
+_MIN_EXPONENT = -9  # smallest resolved value is 2**-10 (~1 µs in ms)
+_MAX_EXPONENT = 22  # values from 2**22 (~70 min in ms) share the top bucket
+_HISTOGRAM_SIZE = (_MAX_EXPONENT - _MIN_EXPONENT + 1) * _SUB_BUCKETS + 1
+
+
+class Histogram:
+    """
+    Log-linear histogram of non-negative values, typically latencies in ms.
+
+    Every power of two is split into 16 equal buckets, so the reported
+    percentiles are within about 3% of the true value. Recording
+    costs one ``frexp`` and a list increment. Histograms with the same layout
+    merge by adding counts, so per-node snapshots can be combined.
+    """
+
+    QUANTILES = (50, 95, 99)
+
+    def __init__(self) -> None:
+        self._counts = [0] * _HISTOGRAM_SIZE
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def _midpoint(self, index: int) -> float:
+        if index == 0:
+            return 0.0
+        if index == _HISTOGRAM_SIZE - 1:
+            return math.inf  # overflow; clamped to the observed max
+        exponent, sub = divmod(index - 1, _SUB_BUCKETS)
+        exponent += _MIN_EXPONENT
+        width = 2.0 ** exponent / (2 * _SUB_BUCKETS)
+        return 2.0 ** (exponent - 1) + (sub + 0.5) * width
+
+    def record(self, value: float) -> None:
+        """Add one observation."""
+        mantissa, exponent = math.frexp(value)
+        if value <= 0 or exponent < _MIN_EXPONENT:
+            index = 0
+        elif exponent > _MAX_EXPONENT:
+            index = _HISTOGRAM_SIZE - 1
+        else:
+            index = (
+                1
+                + (exponent - _MIN_EXPONENT) * _SUB_BUCKETS
+                + int((mantissa - 0.5) * (2 * _SUB_BUCKETS))
+            )
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's observations to this one."""
+        with other._lock:
+            counts = list(other._counts)
+            count, total, low, high = other._count, other._sum, other._min, other._max
+        with self._lock:
+            for index, n in enumerate(counts):
+                if n:
+                    self._counts[index] += n
+            self._count += count
+            self._sum += total
+            self._min = min(self._min, low)
+            self._max = max(self._max, high)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Value below which ``percent`` of observations fall.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Estimated value (0.0 when empty)
+        """
+        with self._lock:
+            if not self._count:
+                return 0.0
+            rank = max(1, math.ceil(percent / 100 * self._count))
+            seen = 0
+            for index, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank:
+                    # The observed extremes are exact; keep estimates inside them
+                    return min(max(self._midpoint(index), self._min), self._max)
+            return self._max
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def value(self) -> float:
+        """Mean of the observations, so histograms read like a gauge."""
+        return self._sum / self._count if self._count else 0.0
+
+    def export(self) -> dict[str, float]:
+        """Count, sum, max and ``QUANTILES`` keyed by suffix (e.g. ``p95``)."""
+        summary = {"count": float(self._count), "sum": self._sum, "max": float(self._max)}
+        for quantile in self.QUANTILES:
+            summary[f"p{quantile}"] = self.percentile(quantile)
+        return summary
+
+
+class RollingHistogram:
+    """
+    Histogram of the last ``window`` seconds, kept as rotating slices.
+
+    Args:
+        window: Seconds of observations kept
+        slices: Histograms the window is split into; older data ages out a
+            slice at a time
+    """
+
+    def __init__(self, window: float = 60.0, slices: int = 6):
+        self.slice_seconds = window / slices
+        self._slices: deque[tuple[int, Histogram]] = deque(maxlen=slices)
+
+    def record(self, value: float) -> None:
+        """Add one observation to the current slice."""
+        index = int(time.monotonic() / self.slice_seconds)
+        if not self._slices or self._slices[-1][0] != index:
+            self._slices.append((index, Histogram()))
+        self._slices[-1][1].record(value)
+
+    def merged(self) -> Histogram:
+        """Observations from slices still inside the window, as one histogram."""
+        oldest = int(time.monotonic() / self.slice_seconds) - self._slices.maxlen + 1
+        merged = Histogram()
+        for index, histogram in list(self._slices):
+            if index >= oldest:
+                merged.merge(histogram)
+        return merged
+
+
+class MetricsRegistry:
+    """Registry of named, labelled metrics that can be exported as a snapshot."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, labels: dict[str, Any]) -> Any:
+        key = _metric_key(name, labels)
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = cls()
+                    self._metrics[key] = metric
+        if not isinstance(metric, cls):
+            raise TypeError(f"Metric {key} already registered as {type(metric).__name__}")
+        return metric
+
+    def counter(self, name: str, **labels: Any) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name: Metric name
+            **labels: Metric labels (e.g., stream="audio")
+
+        Returns:
+            Counter instance
+        """
+        return self._get_or_create(Counter, name, labels)
+
+    def gauge(self, name: str, **labels: Any) -> Gauge:
+        """
+        Get or create a gauge.
+
+        Args:
+            name: Metric name
+            **labels: Metric labels
+
+        Returns:
+            Gauge instance
+        """
+        return self._get_or_create(Gauge, name, labels)
+
+    def histogram(self, name: str, **labels: Any) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name: Metric name
+            **labels: Metric labels
+
+        Returns:
+            Histogram instance
+        """
+        return self._get_or_create(Histogram, name, labels)
+
+    def histograms(self) -> dict[str, Histogram]:
+        """Registered histograms keyed by name and labels."""
+        with self._lock:
+            return {k: m for k, m in self._metrics.items() if isinstance(m, Histogram)}
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Export current metric values keyed by name and labels.
+
+        Histograms are flattened into one entry per ``Histogram.export`` field,
+        e.g. ``stage_latency_ms_p99{stage=translate}``.
+        """
+        with self._lock:
+            items = list(self._metrics.items())
+        values = {}
+        for key, metric in items:
+            if isinstance(metric, Histogram):
+                name, brace, labels = key.partition("{")
+                for suffix, value in metric.export().items():
+                    values[f"{name}_{suffix}{brace}{labels}"] = value
+            else:
+                values[key] = metric.value
+        return values
+
+    def reset(self) -> None:
+        """Drop all registered metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+
+@lru_cache()
+def get_metrics_registry() -> MetricsRegistry:
+    """Get cached metrics registry instance."""
+    return MetricsRegistry()
@@ -0,0 +1,231 @@
+"""Redis token-bucket rate limiter with per-node token leases.
+
+The bucket lives in Redis and is refilled and debited atomically by a Lua
+script that reads the Redis server clock, so every node sees the same time.
+Paying a round trip on every WebSocket frame would double Redis traffic.
+Instead, each node leases a batch of tokens at a time and spends them
+locally. A lease expires after ``lease_ttl_ms``, and unspent tokens are
+forfeited. That keeps a node from sitting on budget, at the cost of being
+slightly stricter than the configured rate. Denials are cached until the
+bucket can cover the request, so a rejected client does not hammer Redis
+either. Once both have lapsed, a lease holds nothing worth keeping, and
+leases like that are swept once per ``lease_ttl_ms``. Otherwise the lease
+table would grow with every client that ever connected.
+"""
+
+import asyncio
+import math
+import time
+from functools import lru_cache
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .cache import cache_key
+from .config import get_settings
+from .errors import RateLimitError, ValidationError
+from .logging import get_logger
+from .metrics import get_metrics_registry
+from .redis_client import get_redis_client
+
+logger = get_logger(__name__)
+
+# KEYS[1]: bucket hash. ARGV: rate (tokens/s), capacity, wanted, minimum.
+# Grants up to `wanted` tokens, or none if fewer than `minimum` are available.
+# Returns {granted, microseconds until `minimum` tokens are available}.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local wanted = tonumber(ARGV[3])
+local minimum = tonumber(ARGV[4])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000000 + tonumber(clock[2])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local last = tonumber(bucket[2])
+if tokens == nil or last == nil then
+  tokens = capacity
+  last = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - last) * rate / 1000000)
+local granted = math.min(wanted, math.floor(tokens))
+local wait = 0
+if granted < minimum then
+  granted = 0
+  wait = math.ceil((minimum - tokens) * 1000000 / rate)
+else
+  tokens = tokens - granted
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return {granted, wait}
+"""
+
+
+class _Lease:
+    __slots__ = ("tokens", "expires_at", "denied_until", "refill")
+
+    def __init__(self) -> None:
+        self.tokens = 0
+        self.expires_at = 0.0
+        self.denied_until = 0.0
+        self.refill: Optional[asyncio.Future] = None
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket shared across nodes through Redis, spent locally in leases.
+
+    Not thread-safe; use from a single event loop.
+
+    Args:
+        name: Limiter name for metric labels (e.g., 'user', 'ip')
+        rate: Sustained tokens per second
+        capacity: Bucket size (largest burst)
+        redis: Redis client
+        lease_tokens: Tokens taken from Redis per round trip
+        lease_ttl_ms: How long leased tokens remain spendable
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: int,
+        redis: Optional[Redis] = None,
+        lease_tokens: Optional[int] = None,
+        lease_ttl_ms: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.redis = redis or get_redis_client()
+        self.lease_tokens = min(capacity, lease_tokens or settings.rate_limit_lease_tokens)
+        self.lease_ttl = (lease_ttl_ms or settings.rate_limit_lease_ttl_ms) / 1000
+        self._script = self.redis.register_script(TOKEN_BUCKET_LUA)
+        self._leases: dict[str, _Lease] = {}
+        self._next_sweep = time.monotonic() + self.lease_ttl
+
+        metrics = get_metrics_registry()
+        self._local = metrics.counter("rate_limit_checks_total", limiter=name, path="local")
+        self._remote = metrics.counter("rate_limit_checks_total", limiter=name, path="redis")
+        self._rejected = metrics.counter("rate_limit_rejected_total", limiter=name)
+        self._errors = metrics.counter("rate_limit_errors_total", limiter=name)
+
+    async def acquire(self, key: str, cost: int = 1) -> None:
+        """
+        Spend ``cost`` tokens from a bucket.
+
+        Args:
+            key: Bucket key (see ``cache_key('rate_limit_user', ...)``)
+            cost: Tokens to spend
+
+        Raises:
+            ValidationError: If the cost exceeds the bucket's capacity, so no
+                wait could ever cover it
+            RateLimitError: If the bucket cannot cover the cost; ``retry_after``
+                is the whole seconds until it can
+        """
+        if cost > self.capacity:
+            raise ValidationError(
+                "Rate limit cost exceeds bucket capacity",
+                details={"cost": cost, "capacity": self.capacity},
+            )
+        if time.monotonic() >= self._next_sweep:
+            self._sweep()
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = _Lease()
+        while True:
+            now = time.monotonic()
+            if lease.tokens >= cost and now < lease.expires_at:
+                lease.tokens -= cost
+                self._local.inc()
+                return
+            if now < lease.denied_until:
+                self._rejected.inc()
+                raise RateLimitError(max(1, math.ceil(lease.denied_until - now)))
+            if lease.refill is None:
+                break
+            # Another caller is already refilling this lease; share its result
+            await asyncio.shield(lease.refill)
+
+        lease.refill = asyncio.get_running_loop().create_future()
+        try:
+            await self._refill(key, lease, cost)
+        finally:
+            lease.refill.set_result(None)
+            lease.refill = None
+        if lease.tokens >= cost:
+            lease.tokens -= cost
+            return
+        self._rejected.inc()
+        raise RateLimitError(max(1, math.ceil(lease.denied_until - time.monotonic())))
+
+    async def _refill(self, key: str, lease: _Lease, cost: int) -> None:
+        self._remote.inc()
+        if time.monotonic() >= lease.expires_at:
+            lease.tokens = 0
+        # Top up a live lease that is short rather than forfeiting what is left
+        needed = cost - lease.tokens
+        try:
+            granted, wait_us = await self._script(
+                keys=[key], args=[self.rate, self.capacity, max(needed, self.lease_tokens), needed]
+            )
+        except RedisError as e:
+            # Fail open: losing Redis must not take audio sessions down with it
+            self._errors.inc()
+            logger.warning("Rate limiter unavailable", limiter=self.name, error=str(e))
+            lease.tokens = cost
+            lease.expires_at = time.monotonic() + self.lease_ttl
+            return
+        now = time.monotonic()
+        if granted:
+            lease.tokens += int(granted)
+            lease.expires_at = now + self.lease_ttl
+        else:
+            lease.denied_until = now + int(wait_us) / 1_000_000
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        self._next_sweep = now + self.lease_ttl
+        idle = [
+            key
+            for key, lease in self._leases.items()
+            if lease.refill is None and now >= lease.expires_at and now >= lease.denied_until
+        ]
+        for key in idle:
+            del self._leases[key]
+
+    def forget(self, key: str) -> None:
+        """Drop the local lease for a key (e.g., when its connection closes)."""
+        self._leases.pop(key, None)
+
+
+@lru_cache()
+def get_user_rate_limiter() -> TokenBucketLimiter:
+    """Get cached per-user, per-endpoint limiter (``rate-limit:user:{userId}:{endpoint}``)."""
+    settings = get_settings()
+    return TokenBucketLimiter(
+        "user", settings.rate_limit_user_rate, settings.rate_limit_user_burst
+    )
+
+
+@lru_cache()
+def get_ip_rate_limiter() -> TokenBucketLimiter:
+    """Get cached per-IP limiter (``rate-limit:ip:{ipAddress}``)."""
+    settings = get_settings()
+    return TokenBucketLimiter("ip", settings.rate_limit_ip_rate, settings.rate_limit_ip_burst)
+
+
+async def check_user_rate_limit(user_id: str, endpoint: str, cost: int = 1) -> None:
+    """Spend from a user's bucket for an endpoint, raising RateLimitError when empty."""
+    key = cache_key("rate_limit_user", user_id=user_id, endpoint=endpoint)
+    await get_user_rate_limiter().acquire(key, cost)
+
+
+async def check_ip_rate_limit(ip_address: str, cost: int = 1) -> None:
+    """Spend from an IP address's bucket, raising RateLimitError when empty."""
+    await get_ip_rate_limiter().acquire(cache_key("rate_limit_ip", ip_address=ip_address), cost)
@@ -0,0 +1,25 @@
+"""Shared asyncio Redis connection pool."""
+
+from functools import lru_cache
+
+import redis.asyncio as redis
+
+from .config import get_settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache()
+def get_redis_client() -> redis.Redis:
+    """Get cached Redis client backed by a shared connection pool."""
+    settings = get_settings()
+    pool = redis.ConnectionPool(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        password=settings.redis_password,
+        max_connections=settings.redis_max_connections,
+        connection_class=redis.SSLConnection if settings.redis_ssl else redis.Connection,
+    )
+    logger.info("Created Redis connection pool", host=settings.redis_host, port=settings.redis_port)
+    return redis.Redis(connection_pool=pool)
@@ -0,0 +1,454 @@
+"""Deadline-aware retry policy and circuit breaker for calls to AWS dependencies."""
+
+import asyncio
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    IncompleteReadError,
+    ReadTimeoutError,
+    ResponseStreamingError,
+)
+
+from .config import get_settings
+from .errors import CircuitOpenError, DeadlineExceededError
+from .logging import get_logger
+from .metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        "InternalFailure",
+        "InternalError",
+        "InternalServerError",
+        "LimitExceededException",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "TransactionInProgressException",
+    }
+)
+
+RETRYABLE_BOTOCORE_ERRORS = (
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    IncompleteReadError,
+    ReadTimeoutError,
+    ResponseStreamingError,
+)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify an error as transient (worth retrying) or permanent.
+
+    Args:
+        error: Exception raised by a botocore call
+
+    Returns:
+        True for throttling, timeouts, connection failures and 5xx responses
+    """
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code", "")
+        if code in RETRYABLE_ERROR_CODES:
+            return True
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return status == 429 or status >= 500
+    if isinstance(error, BotoCoreError):
+        return isinstance(error, RETRYABLE_BOTOCORE_ERRORS)
+    return False
+
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(budget_seconds: float) -> Iterator[None]:
+    """
+    Set a latency budget for every resilient call made inside the block.
+
+    Nested budgets can only tighten the deadline, never extend it.
+
+    Args:
+        budget_seconds: Time available from now, in seconds
+    """
+    expires_at = time.monotonic() + budget_seconds
+    outer = _current_deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _current_deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left in the current deadline, or None when no deadline is set."""
+    expires_at = _current_deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "CLOSED"
+    HALF_OPEN = "HALF_OPEN"
+    OPEN = "OPEN"
+
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that fails fast while a dependency is unhealthy.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    rejects calls for ``reset_timeout`` seconds. It then half-opens and lets
+    one probe call through at a time; ``success_threshold`` consecutive
+    successful probes close it again while any failure re-opens it. A probe
+    that never reports back frees its slot after ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        success_threshold: int = 2,
+        reset_timeout: float = 60.0,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.success_threshold = success_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._success_count = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+        metrics = get_metrics_registry()
+        self._state_gauge = metrics.gauge("circuit_breaker_state", breaker=name)
+        self._rejections = metrics.counter("circuit_breaker_rejections_total", breaker=name)
+        self._transitions = metrics.counter("circuit_breaker_opened_total", breaker=name)
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state is not self._state:
+            logger.info(
+                "Circuit breaker state changed",
+                breaker=self.name,
+                previous=self._state.value,
+                state=state.value,
+            )
+        self._state = state
+        self._state_gauge.set(_STATE_VALUES[state])
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state is CircuitState.OPEN:
+                elapsed = now - self._opened_at
+                if elapsed < self.reset_timeout:
+                    self._rejections.inc()
+                    raise CircuitOpenError(self.name, retry_after=self.reset_timeout - elapsed)
+                self._set_state(CircuitState.HALF_OPEN)
+                self._success_count = 0
+                self._probe_started = None
+            if self._state is CircuitState.HALF_OPEN:
+                probing = self._probe_started
+                if probing is not None and now - probing < self.reset_timeout:
+                    self._rejections.inc()
+                    raise CircuitOpenError(
+                        self.name, retry_after=self.reset_timeout - (now - probing)
+                    )
+                self._probe_started = now
+
+    def release(self) -> None:
+        """Free the probe slot of a call that ended without a verdict (e.g., cancelled)."""
+        with self._lock:
+            self._probe_started = None
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            self._failure_count = 0
+            self._probe_started = None
+            if self._state is CircuitState.HALF_OPEN:
+                self._success_count += 1
+                if self._success_count >= self.success_threshold:
+                    self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call caused by the dependency."""
+        with self._lock:
+            self._failure_count += 1
+            self._probe_started = None
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._failure_count >= self.failure_threshold
+            ):
+                if self._state is not CircuitState.OPEN:
+                    self._transitions.inc()
+                self._opened_at = time.monotonic()
+                self._set_state(CircuitState.OPEN)
+
+
+def client_config_options(max_pool_connections: Optional[int] = None) -> dict[str, Any]:
+    """
+    Keyword arguments for botocore ``Config`` / aiobotocore ``AioConfig``.
+
+    ``RetryPolicy`` owns retries, so botocore's own are turned off, and the
+    connect and read timeouts are held to AWS_CALL_BUDGET_MS so that a single
+    hung attempt cannot outlast the latency budget.
+
+    Args:
+        max_pool_connections: Pool size (defaults to AWS_MAX_POOL_CONNECTIONS)
+    """
+    settings = get_settings()
+    timeout = settings.aws_call_budget_ms / 1000
+    return {
+        "max_pool_connections": max_pool_connections or settings.aws_max_pool_connections,
+        "retries": {"total_max_attempts": 1},
+        "connect_timeout": timeout,
+        "read_timeout": timeout,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for a dependency."""
+    settings = get_settings()
+    return CircuitBreaker(
+        name,
+        failure_threshold=settings.circuit_breaker_failure_threshold,
+        success_threshold=settings.circuit_breaker_success_threshold,
+        reset_timeout=settings.circuit_breaker_reset_timeout_seconds,
+    )
+
+
+class RetryPolicy:
+    """
+    Retries transient failures with full-jitter backoff inside a latency budget.
+
+    Only errors classified by ``is_retryable`` are retried; anything else is
+    raised immediately. Backoff sleeps never run past the effective deadline,
+    which is the tighter of the policy's own ``budget`` and any enclosing
+    ``deadline()`` block. ``acall`` also cancels an attempt still running at
+    the deadline; blocking ``call`` relies on the client's socket timeouts
+    (``client_config_options``).
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        max_attempts: int = 3,
+        base_delay: float = 0.05,
+        max_delay: float = 1.0,
+        budget: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.operation = operation
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.breaker = breaker
+
+        metrics = get_metrics_registry()
+        self._retries = metrics.counter("retry_attempts_total", operation=operation)
+        self._exhausted = metrics.counter("retry_exhausted_total", operation=operation)
+        self._deadline_exceeded = metrics.counter(
+            "retry_deadline_exceeded_total", operation=operation
+        )
+
+    @classmethod
+    def for_service(
+        cls, service_name: str, operation: str, budget_ms: Optional[float] = None
+    ) -> "RetryPolicy":
+        """
+        Build a policy from settings, sharing the service's circuit breaker.
+
+        Args:
+            service_name: AWS service name, also the circuit breaker name
+            operation: Operation name used in metric labels
+            budget_ms: Latency budget override (defaults to AWS_CALL_BUDGET_MS)
+
+        Returns:
+            Configured retry policy
+        """
+        settings = get_settings()
+        if budget_ms is None:
+            budget_ms = settings.aws_call_budget_ms
+        return cls(
+            operation=f"{service_name}.{operation}",
+            max_attempts=settings.aws_retry_max_attempts,
+            base_delay=settings.aws_retry_base_delay_ms / 1000,
+            max_delay=settings.aws_retry_max_delay_ms / 1000,
+            budget=budget_ms / 1000,
+            breaker=get_circuit_breaker(service_name),
+        )
+
+    def _expires_at(self) -> Optional[float]:
+        expires_at = _current_deadline.get()
+        if self.budget is not None:
+            own = time.monotonic() + self.budget
+            expires_at = own if expires_at is None else min(expires_at, own)
+        return expires_at
+
+    def _backoff(self, attempt: int, expires_at: Optional[float]) -> Optional[float]:
+        """Return the sleep before the next attempt, or None to give up."""
+        if attempt >= self.max_attempts:
+            self._exhausted.inc()
+            return None
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if expires_at is not None and time.monotonic() + delay >= expires_at:
+            self._deadline_exceeded.inc()
+            return None
+        self._retries.inc()
+        return delay
+
+    def _check_deadline(self, expires_at: Optional[float]) -> None:
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._deadline_exceeded.inc()
+            budget_ms = self.budget * 1000 if self.budget is not None else None
+            raise DeadlineExceededError(self.operation, budget_ms)
+
+    def _on_error(self, error: Exception) -> bool:
+        retryable = is_retryable(error)
+        if self.breaker is not None:
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                # Permanent errors are the caller's fault, not a sign of a sick dependency
+                self.breaker.record_success()
+        return retryable
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call a blocking function under this policy.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The function's result
+        """
+        expires_at = self._expires_at()
+        attempt = 0
+        while True:
+            self._check_deadline(expires_at)
+            if self.breaker is not None:
+                self.breaker.before_call()
+            attempt += 1
+            try:
+                result = fn(*args, **kwargs)
+            except (ClientError, BotoCoreError) as e:
+                if not self._on_error(e):
+                    raise
+                delay = self._backoff(attempt, expires_at)
+                if delay is None:
+                    raise
+                logger.debug(
+                    "Retrying AWS call", operation=self.operation, attempt=attempt, error=str(e)
+                )
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if self.breaker is not None:
+                    self.breaker.release()
+                raise
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return result
+
+    async def acall(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Await a coroutine function under this policy.
+
+        Args:
+            fn: Coroutine function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The coroutine's result
+        """
+        expires_at = self._expires_at()
+        attempt = 0
+        while True:
+            self._check_deadline(expires_at)
+            if self.breaker is not None:
+                self.breaker.before_call()
+            attempt += 1
+            try:
+                if expires_at is None:
+                    result = await fn(*args, **kwargs)
+                else:
+                    remaining = expires_at - time.monotonic()
+                    result = await asyncio.wait_for(fn(*args, **kwargs), remaining)
+            except asyncio.TimeoutError:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                self._deadline_exceeded.inc()
+                budget_ms = self.budget * 1000 if self.budget is not None else None
+                raise DeadlineExceededError(self.operation, budget_ms) from None
+            except (ClientError, BotoCoreError) as e:
+                if not self._on_error(e):
+                    raise
+                delay = self._backoff(attempt, expires_at)
+                if delay is None:
+                    raise
+                logger.debug(
+                    "Retrying AWS call", operation=self.operation, attempt=attempt, error=str(e)
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if self.breaker is not None:
+                    self.breaker.release()
+                raise
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return result
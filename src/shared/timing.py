@@ -0,0 +1,326 @@
+"""Per-chunk latency waterfall carried through the pipeline.
+
+A ``TimingEnvelope`` starts when the client captures a chunk and goes with
+the chunk, and with every result derived from it, across service
+boundaries:
+
+    ingress -> Kinesis -> stt -> translate -> clone -> egress
+
+Each stage stamps its enter and exit wall-clock times. The gap between one
+stage's exit and the next stage's enter is queueing: network, Kinesis
+transit, or a wait for a batch. Stamps are stored as microsecond offsets
+from the origin, so the envelope is a few bytes per stage. It is packed
+in front of the Kinesis record payload and serialized under ``timing`` in
+JSON results.
+
+``LatencyCollector`` breaks envelopes down into per-stage and queueing times.
+It keeps rolling percentiles for this node and for each session, and counts
+chunks over the end-to-end budget against the part that took longest.
+"""
+
+import math
+import struct
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+from .config import get_settings
+from .metrics import Histogram, RollingHistogram, get_metrics_registry
+
+# Wire ids are positions in this tuple: append new stages, never reorder
+STAGES = ("ingress", "stt", "translate", "clone", "egress")
+_STAGE_IDS = {stage: index for index, stage in enumerate(STAGES)}
+
+TIMING_MAGIC = b"UVT1"
+_HEADER = struct.Struct(">4sdB")  # magic, origin (Unix ms), stage count
+_MARK = struct.Struct(">Bii")  # stage id, enter and exit offsets (µs from origin)
+_UNSET = -(2**31)
+
+TOTAL = "total"
+QUANTILES = (50, 95, 99)
+
+
+def now_ms() -> float:
+    """Wall-clock time in Unix ms, comparable across hosts."""
+    return time.time() * 1000
+
+
+class TimingEnvelope:
+    """
+    Enter/exit timestamps of each pipeline stage for one chunk.
+
+    Args:
+        origin_ms: Unix ms the chunk was captured (defaults to now)
+    """
+
+    __slots__ = ("origin_ms", "_marks")
+
+    def __init__(self, origin_ms: Optional[float] = None):
+        self.origin_ms = now_ms() if origin_ms is None else origin_ms
+        # [stage id, enter µs, exit µs] in stage order
+        self._marks: list[list[int]] = []
+
+    def _offset(self, at_ms: Optional[float]) -> int:
+        offset = round(((now_ms() if at_ms is None else at_ms) - self.origin_ms) * 1000)
+        # Keep a badly skewed client clock from overflowing the wire format
+        return min(max(offset, _UNSET + 1), 2**31 - 1)
+
+    def _mark(self, stage: str) -> list[int]:
+        stage_id = _STAGE_IDS.get(stage)
+        if stage_id is None:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+        for mark in self._marks:
+            if mark[0] == stage_id:
+                return mark
+        mark = [stage_id, _UNSET, _UNSET]
+        self._marks.append(mark)
+        return mark
+
+    def enter(self, stage: str, at_ms: Optional[float] = None) -> None:
+        """Stamp the time a stage started work on the chunk."""
+        self._mark(stage)[1] = self._offset(at_ms)
+
+    def exit(self, stage: str, at_ms: Optional[float] = None) -> None:
+        """Stamp the time a stage handed the chunk on."""
+        self._mark(stage)[2] = self._offset(at_ms)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator["TimingEnvelope"]:
+        """Stamp enter and exit around a block."""
+        self.enter(stage)
+        try:
+            yield self
+        finally:
+            self.exit(stage)
+
+    def derive(self) -> "TimingEnvelope":
+        """Copy for a result derived from this chunk, which stamps its own stages."""
+        derived = TimingEnvelope(self.origin_ms)
+        derived._marks = [list(mark) for mark in self._marks]
+        return derived
+
+    def stages(self) -> list[tuple[str, Optional[float], Optional[float]]]:
+        """(stage, enter ms, exit ms) relative to the origin, in stamping order."""
+        return [
+            (
+                STAGES[stage_id],
+                None if enter == _UNSET else enter / 1000,
+                None if exit_ == _UNSET else exit_ / 1000,
+            )
+            for stage_id, enter, exit_ in self._marks
+        ]
+
+    def breakdown(self) -> dict[str, float]:
+        """
+        Split the chunk's latency into stage and queueing time.
+
+        Returns:
+            ms keyed by stage name (time inside it), ``queue:<stage>`` (wait
+            before it since the previous stamp) and ``total`` (origin to last stamp)
+        """
+        parts: dict[str, float] = {}
+        previous = 0.0
+        for stage, enter, exit_ in self.stages():
+            if enter is not None:
+                parts[f"queue:{stage}"] = enter - previous
+                previous = enter
+            if enter is not None and exit_ is not None:
+                parts[stage] = exit_ - enter
+            if exit_ is not None:
+                previous = exit_
+        parts[TOTAL] = previous
+        return parts
+
+    def pack(self) -> bytes:
+        """Binary encoding, ``_HEADER`` followed by one ``_MARK`` per stage."""
+        parts = [_HEADER.pack(TIMING_MAGIC, self.origin_ms, len(self._marks))]
+        parts.extend(_MARK.pack(*mark) for mark in self._marks)
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> tuple["TimingEnvelope", int]:
+        """
+        Decode an envelope from the start of ``data``.
+
+        Returns:
+            The envelope and the number of bytes it occupied
+
+        Raises:
+            ValueError: If ``data`` does not start with an envelope
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated timing envelope")
+        magic, origin_ms, count = _HEADER.unpack_from(data)
+        size = _HEADER.size + count * _MARK.size
+        if magic != TIMING_MAGIC or len(data) < size:
+            raise ValueError("Not a timing envelope")
+        envelope = cls(origin_ms)
+        envelope._marks = [
+            list(_MARK.unpack_from(data, _HEADER.size + index * _MARK.size))
+            for index in range(count)
+        ]
+        return envelope, size
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON results: origin and [stage, enter, exit] in ms."""
+        return {
+            "origin": self.origin_ms,
+            "stages": [[stage, enter, exit_] for stage, enter, exit_ in self.stages()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TimingEnvelope":
+        """Build from the ``to_dict`` format."""
+        envelope = cls(data["origin"])
+        for stage, enter, exit_ in data.get("stages", []):
+            mark = envelope._mark(stage)
+            mark[1] = _UNSET if enter is None else round(enter * 1000)
+            mark[2] = _UNSET if exit_ is None else round(exit_ * 1000)
+        return envelope
+
+
+def frame_record(payload: bytes, timing: Optional[TimingEnvelope]) -> bytes:
+    """
+    Prefix a Kinesis record payload with its timing envelope.
+
+    Args:
+        payload: Record payload
+        timing: Envelope to carry, or None to send the payload as is
+
+    Returns:
+        Framed payload
+    """
+    return payload if timing is None else timing.pack() + payload
+
+
+def split_record(data: bytes) -> tuple[bytes, Optional[TimingEnvelope]]:
+    """
+    Separate a Kinesis record payload from its timing envelope.
+
+    Payloads without an envelope are returned unchanged with None.
+
+    Args:
+        data: Record payload from ``frame_record``
+
+    Returns:
+        The payload and its envelope
+    """
+    if not data.startswith(TIMING_MAGIC):
+        return data, None
+    try:
+        timing, size = TimingEnvelope.unpack(data)
+    except ValueError:
+        return data, None
+    return data[size:], timing
+
+
+def _percentiles(values: deque) -> dict[str, float]:
+    # Nearest rank over the raw samples
+    ordered = sorted(values)
+    return {f"p{q}": ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1] for q in QUANTILES}
+
+
+class LatencyCollector:
+    """
+    Rolling per-stage latency percentiles for this node and each session.
+
+    Args:
+        budget_ms: End-to-end budget; chunks over it are counted by dominant part
+        window_seconds: Span of the node-wide rolling percentiles
+        session_samples: Recent chunks kept per session
+        max_sessions: Sessions tracked before the least recently seen is dropped
+    """
+
+    def __init__(
+        self,
+        budget_ms: Optional[float] = None,
+        window_seconds: Optional[float] = None,
+        session_samples: Optional[int] = None,
+        max_sessions: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.budget_ms = budget_ms or settings.pipeline_latency_budget_ms
+        self.window_seconds = window_seconds or settings.pipeline_latency_window_seconds
+        self.session_samples = session_samples or settings.pipeline_session_samples
+        self.max_sessions = max_sessions or settings.max_concurrent_sessions
+        # part -> (rolling histogram, cumulative registry histogram)
+        self._node: dict[str, tuple[RollingHistogram, Histogram]] = {}
+        self._sessions: dict[str, dict[str, deque]] = {}
+        self._metrics = get_metrics_registry()
+        self._observed = self._metrics.counter("pipeline_chunks_observed_total")
+
+    def observe(self, session_id: str, timing: TimingEnvelope) -> dict[str, float]:
+        """
+        Record one chunk's waterfall, usually at the last stage it reaches.
+
+        Args:
+            session_id: Session the chunk belongs to
+            timing: The chunk's envelope
+
+        Returns:
+            The chunk's breakdown (see ``TimingEnvelope.breakdown``)
+        """
+        parts = timing.breakdown()
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            session = {}
+            if len(self._sessions) >= self.max_sessions:
+                self._sessions.pop(next(iter(self._sessions)))
+        # Re-inserting keeps the dict in least recently seen order
+        self._sessions[session_id] = session
+
+        for part, value in parts.items():
+            node = self._node.get(part)
+            if node is None:
+                node = self._node[part] = (
+                    RollingHistogram(self.window_seconds),
+                    self._histogram(part),
+                )
+            node[0].record(value)
+            node[1].record(value)
+            samples = session.get(part)
+            if samples is None:
+                samples = session[part] = deque(maxlen=self.session_samples)
+            samples.append(value)
+
+        self._observed.inc()
+        if parts[TOTAL] > self.budget_ms:
+            dominant = max((p for p in parts if p != TOTAL), key=parts.get, default=TOTAL)
+            self._metrics.counter("pipeline_over_budget_total", part=dominant).inc()
+        return parts
+
+    def _histogram(self, part: str) -> Histogram:
+        if part == TOTAL:
+            return self._metrics.histogram("pipeline_total_ms")
+        if part.startswith("queue:"):
+            return self._metrics.histogram("pipeline_queue_ms", stage=part[6:])
+        return self._metrics.histogram("pipeline_stage_ms", stage=part)
+
+    def node_percentiles(self) -> dict[str, dict[str, float]]:
+        """p50/p95/p99 and count per part over the last ``window_seconds`` on this node."""
+        summary = {}
+        for part, (rolling, _) in self._node.items():
+            histogram = rolling.merged()
+            if histogram.count:
+                summary[part] = {f"p{q}": histogram.percentile(q) for q in QUANTILES}
+                summary[part]["count"] = histogram.count
+        return summary
+
+    def session_percentiles(self, session_id: str) -> dict[str, dict[str, float]]:
+        """p50/p95/p99 per part over a session's last ``session_samples`` chunks."""
+        return {
+            part: _percentiles(samples)
+            for part, samples in self._sessions.get(session_id, {}).items()
+        }
+
+    def end_session(self, session_id: str) -> None:
+        """Forget a session that has ended."""
+        self._sessions.pop(session_id, None)
+
+
+@lru_cache()
+def get_latency_collector() -> LatencyCollector:
+    """Get cached latency collector for this node."""
+    return LatencyCollector()
@@ -1,16 +1,27 @@
-"""AWS X-Ray distributed tracing configuration."""
+"""AWS X-Ray distributed tracing configuration.
 
+The X-Ray SDK takes about a quarter of a second to import. It is loaded only
+when tracing is enabled, or when a trace annotation is first added.
+"""
+
+import asyncio
+import time
 from typing import Any, Callable
 from functools import wraps
-from aws_xray_sdk.core import xray_recorder, patch_all
-from aws_xray_sdk.core.context import Context
 
 from .config import get_settings
 from .logging import get_logger
+from .metrics import get_metrics_registry
 
 logger = get_logger(__name__)
 
 
+def _recorder() -> Any:
+    from aws_xray_sdk.core import xray_recorder
+
+    return xray_recorder
+
+
 def setup_xray() -> None:
     """Configure AWS X-Ray tracing."""
     settings = get_settings()
@@ -19,8 +30,11 @@ def setup_xray() -> None:
         logger.info("X-Ray tracing disabled")
         return
     
+    from aws_xray_sdk.core import patch_all
+    from aws_xray_sdk.core.context import Context
+
     # Set service name
-    xray_recorder.configure(
+    _recorder().configure(
         service=settings.service_name,
         context=Context(),
         sampling=True,
@@ -32,41 +46,59 @@ def setup_xray() -> None:
     logger.info("X-Ray tracing enabled", service=settings.service_name)
 
 
-def trace_function(name: str | None = None) -> Callable:
+def trace_function(name: str | None = None, xray: bool = True) -> Callable:
     """
-    Decorator to trace function execution with X-Ray.
+    Decorator recording function latency and tracing it with X-Ray.
+
+    Every call's duration in ms is recorded in the ``stage_latency_ms``
+    histogram labelled with the stage name, including calls that raise and
+    whether or not X-Ray is enabled.
     
     Args:
-        name: Custom subsegment name (defaults to function name)
+        name: Stage and subsegment name (defaults to function name)
+        xray: Open an X-Ray subsegment per call; pass False on hot paths to
+            keep only the histogram (also skipped when ``ENABLE_XRAY`` is off)
         
     Returns:
         Decorated function
     """
     def decorator(func: Callable) -> Callable:
+        stage = name or func.__name__
+        histogram = get_metrics_registry().histogram("stage_latency_ms", stage=stage)
+        capture = xray and get_settings().enable_xray
+        recorder = _recorder() if capture else None
+
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            subsegment_name = name or func.__name__
-            
+            start = time.perf_counter()
             try:
-                with xray_recorder.capture(subsegment_name):
+                if not capture:
                     return await func(*args, **kwargs)
-            except Exception as e:
-                xray_recorder.current_subsegment().put_annotation("error", str(e))
-                raise
+                with recorder.capture(stage) as subsegment:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        _annotate_error(subsegment, e)
+                        raise
+            finally:
+                histogram.record((time.perf_counter() - start) * 1000)
         
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            subsegment_name = name or func.__name__
-            
+            start = time.perf_counter()
             try:
-                with xray_recorder.capture(subsegment_name):
+                if not capture:
                     return func(*args, **kwargs)
-            except Exception as e:
-                xray_recorder.current_subsegment().put_annotation("error", str(e))
-                raise
+                with recorder.capture(stage) as subsegment:
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as e:
+                        _annotate_error(subsegment, e)
+                        raise
+            finally:
+                histogram.record((time.perf_counter() - start) * 1000)
         
         # Return appropriate wrapper based on function type
-        import asyncio
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         return sync_wrapper
@@ -74,6 +106,27 @@ def trace_function(name: str | None = None) -> Callable:
     return decorator
 
 
+def _annotate_error(subsegment: Any, error: Exception) -> None:
+    # capture() yields None when there is no active segment to attach to
+    if subsegment is not None:
+        subsegment.put_annotation("error", str(error))
+
+
+def get_stage_latencies() -> dict[str, dict[str, float]]:
+    """
+    Latency summary of every stage decorated with ``trace_function``.
+
+    Returns:
+        Stage name to count, sum, max, p50, p95 and p99 in ms
+    """
+    prefix = "stage_latency_ms{stage="
+    return {
+        key[len(prefix):-1]: metric.export()
+        for key, metric in get_metrics_registry().histograms().items()
+        if key.startswith(prefix)
+    }
+
+
 def add_trace_annotation(key: str, value: Any) -> None:
     """
     Add annotation to current X-Ray segment.
@@ -83,7 +136,7 @@ def add_trace_annotation(key: str, value: Any) -> None:
         value: Annotation value
     """
     try:
-        xray_recorder.current_subsegment().put_annotation(key, value)
+        _recorder().current_subsegment().put_annotation(key, value)
     except Exception as e:
         logger.warning("Failed to add X-Ray annotation", key=key, error=str(e))
 
@@ -98,6 +151,6 @@ def add_trace_metadata(namespace: str, key: str, value: Any) -> None:
         value: Metadata value
     """
     try:
-        xray_recorder.current_subsegment().put_metadata(key, value, namespace)
+        _recorder().current_subsegment().put_metadata(key, value, namespace)
     except Exception as e:
         logger.warning("Failed to add X-Ray metadata", key=key, error=str(e))
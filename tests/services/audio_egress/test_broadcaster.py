@@ -0,0 +1,139 @@
+"""Tests for the encode-once egress broadcaster."""
+
+import asyncio
+import time
+
+import fakeredis
+import pytest
+from src.services.audio_egress.broadcaster import (
+    FRAME_HEADER,
+    EgressHub,
+    FrameEncoder,
+    SessionBroadcaster,
+)
+from src.shared.errors import ValidationError
+
+
+class _Sink:
+    """Connection stand-in recording sends, optionally blocked until released."""
+
+    def __init__(self, blocked: bool = False) -> None:
+        self.frames: list[memoryview] = []
+        self.times: list[float] = []
+        self.closed = 0
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send(self, frame: memoryview) -> None:
+        await self.gate.wait()
+        self.frames.append(frame)
+        self.times.append(time.perf_counter())
+
+    async def close(self) -> None:
+        self.closed += 1
+
+
+def test_encoder_frames_and_carries_partial_tail() -> None:
+    """Test that frames get sequence and media-time headers and tails carry or pad."""
+    encoder = FrameEncoder(frame_bytes=4, frame_ms=20)
+
+    first = encoder.encode(b"abcdefghij", flush=False)
+    second = encoder.encode(b"kl", flush=True)
+    third = encoder.encode(b"m")
+
+    assert [bytes(frame[FRAME_HEADER.size:]) for frame in first] == [b"abcd", b"efgh"]
+    assert [bytes(frame[FRAME_HEADER.size:]) for frame in second] == [b"ijkl"]
+    assert bytes(third[0][FRAME_HEADER.size:]) == b"m\x00\x00\x00"
+    assert [FRAME_HEADER.unpack_from(f)[0] for f in first + second + third] == [0, 1, 2, 3]
+    assert FRAME_HEADER.unpack_from(third[0])[1] == 60
+    assert first[0].readonly and first[0].obj is first[1].obj
+
+
+async def test_listeners_share_one_encoded_buffer() -> None:
+    """Test that every listener receives the same frame objects, in order."""
+    broadcaster = SessionBroadcaster(
+        "s1", sample_rate=8000, frame_ms=10, lead_ms=40, queue_frames=10
+    )
+    sinks = [_Sink() for _ in range(3)]
+    for index, sink in enumerate(sinks):
+        broadcaster.subscribe(f"c{index}", sink.send)
+
+    assert broadcaster.publish(bytes(160 * 4)) == 4
+    await broadcaster.drain()
+    await asyncio.sleep(0.01)
+
+    assert all(len(sink.frames) == 4 for sink in sinks)
+    assert all(a is b for a, b in zip(sinks[0].frames, sinks[2].frames))
+    await broadcaster.close()
+
+
+async def test_release_is_paced_to_real_time() -> None:
+    """Test that frames beyond the lead window go out one frame duration apart."""
+    broadcaster = SessionBroadcaster("s1", sample_rate=8000, frame_ms=20, lead_ms=40)
+    sink = _Sink()
+    broadcaster.subscribe("c1", sink.send)
+
+    start = time.perf_counter()
+    broadcaster.publish(bytes(320 * 8))
+    await broadcaster.drain()
+    await asyncio.sleep(0.01)
+
+    assert len(sink.frames) == 8
+    # 8 frames of 20 ms with 40 ms lead: the last leaves ~100 ms after the first
+    assert sink.times[-1] - start == pytest.approx(0.1, abs=0.04)
+    assert sink.times[2] - start < 0.02
+    await broadcaster.close()
+
+
+async def test_slow_listener_drops_oldest_without_stalling_others() -> None:
+    """Test that a stalled listener keeps only its newest frames while others get all."""
+    broadcaster = SessionBroadcaster(
+        "s1", sample_rate=8000, frame_ms=5, lead_ms=10, queue_frames=3
+    )
+    slow, fast = _Sink(blocked=True), _Sink()
+    listener = broadcaster.subscribe("slow", slow.send)
+    broadcaster.subscribe("fast", fast.send)
+
+    broadcaster.publish(bytes(80 * 10))
+    await broadcaster.drain()
+    await asyncio.sleep(0.01)
+    slow.gate.set()
+    await asyncio.sleep(0.01)
+
+    assert len(fast.frames) == 10
+    # One frame was taken by the blocked send; of the other nine the last three survive
+    assert [FRAME_HEADER.unpack_from(f)[0] for f in slow.frames] == [0, 7, 8, 9]
+    assert listener.frames_dropped == 6
+    await broadcaster.close()
+
+
+async def test_hub_disconnects_slow_listener_and_tracks_connections() -> None:
+    """Test that the disconnect policy closes a stalled listener and updates Redis."""
+    redis = fakeredis.FakeAsyncRedis()
+    hub = EgressHub(
+        redis=redis, sample_rate=8000, frame_ms=5, lead_ms=5, queue_frames=2,
+        policy="disconnect",
+    )
+    slow, fast = _Sink(blocked=True), _Sink()
+    await hub.subscribe("s1", "slow", slow.send, slow.close)
+    await hub.subscribe("s1", "fast", fast.send, fast.close)
+    assert await redis.smembers("ws-session:s1:connections") == {b"slow", b"fast"}
+
+    hub.publish("s1", bytes(80 * 6))
+    await hub.broadcaster("s1").drain()
+    await asyncio.sleep(0.01)
+
+    assert slow.closed == 1
+    assert list(hub.broadcaster("s1").listeners) == ["fast"]
+    assert await redis.smembers("ws-session:s1:connections") == {b"fast"}
+    assert len(fast.frames) == 6
+
+    await hub.close_session("s1")
+    assert fast.closed == 1
+    assert await redis.smembers("ws-session:s1:connections") == set()
+    assert hub.publish("s1", bytes(80)) == 0
+    with pytest.raises(ValidationError):
+        SessionBroadcaster("s2", policy="block")
+    with pytest.raises(ValidationError):
+        SessionBroadcaster("s2", frame_ms=20, lead_ms=200, queue_frames=5)
@@ -0,0 +1,133 @@
+"""Tests for the audio ingress jitter buffer and frame reassembler."""
+
+import pytest
+from src.services.audio_ingress.jitter_buffer import FrameAssembler, JitterBuffer, pcm_bytes
+from src.shared.errors import ValidationError
+
+CHUNK = 8
+FRAME = 16
+
+
+def _chunk(sequence: int) -> bytes:
+    return bytes([sequence + 1]) * CHUNK
+
+
+def _frames(buffer: JitterBuffer) -> bytes:
+    out = bytearray()
+    while (frame := buffer.read_frame()) is not None:
+        out += frame
+    return bytes(out)
+
+
+def test_pcm_bytes() -> None:
+    """Test PCM buffer sizing for 50 ms of 16 kHz mono and 48 kHz stereo."""
+    assert pcm_bytes(50, 16000) == 1600
+    assert pcm_bytes(20, 48000, channels=2) == 3840
+
+
+def test_in_order_chunks_are_reframed() -> None:
+    """Test that chunks are concatenated and re-cut at the frame size."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=4)
+
+    ready = [buffer.push(i, _chunk(i)) for i in range(5)]
+
+    assert ready == [0, 1, 1, 2, 2]
+    assert _frames(buffer) == b"".join(_chunk(i) for i in range(4))
+    assert buffer.frames.available == CHUNK
+
+
+def test_out_of_order_chunks_are_reordered() -> None:
+    """Test that a chunk arriving early is held until the gap is filled."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=4)
+
+    for sequence in (0, 2, 1, 3):
+        buffer.push(sequence, _chunk(sequence))
+
+    assert _frames(buffer) == b"".join(_chunk(i) for i in range(4))
+    assert buffer.chunks_out_of_order == 1
+
+
+def test_missing_chunk_is_concealed_with_silence() -> None:
+    """Test that a chunk that never arrives becomes silence once the window passes."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=3)
+
+    for sequence in (0, 2, 3, 4):
+        buffer.push(sequence, _chunk(sequence))
+
+    assert _frames(buffer) == _chunk(0) + bytes(CHUNK) + _chunk(2) + _chunk(3)
+    assert buffer.chunks_concealed == 1
+
+
+def test_release_overdue_and_flush() -> None:
+    """Test timer-driven gap release and end-of-stream flush."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=6)
+    buffer.push(0, _chunk(0))
+    buffer.push(2, _chunk(2))
+    assert buffer.frames.available == CHUNK
+
+    buffer.release_overdue()
+    buffer.push(4, _chunk(4))
+    buffer.flush()
+
+    expected = _chunk(0) + bytes(CHUNK) + _chunk(2) + bytes(CHUNK) + _chunk(4)
+    assert _frames(buffer) + bytes(buffer.frames.read_partial()) == expected
+    assert buffer.chunks_concealed == 2
+
+
+def test_late_and_duplicate_chunks_are_dropped() -> None:
+    """Test that replays do not corrupt the output stream."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=4)
+    for sequence in (0, 1, 0, 3, 3):
+        buffer.push(sequence, _chunk(sequence))
+
+    assert buffer.chunks_late == 1
+    assert buffer.chunks_duplicate == 1
+    assert _frames(buffer) == _chunk(0) + _chunk(1)
+
+
+def test_long_gap_resyncs_without_silence() -> None:
+    """Test that a reconnect-sized jump does not emit seconds of silence."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=2, max_gap_chunks=4)
+    buffer.push(0, _chunk(0))
+
+    buffer.push(1000, _chunk(1))
+
+    assert buffer.resyncs == 1
+    assert buffer.chunks_concealed == 0
+    assert buffer.next_sequence == 1001
+    assert _frames(buffer) == _chunk(0) + _chunk(1)
+
+
+def test_longest_concealed_gap_keeps_held_audio() -> None:
+    """Test that concealing a gap just short of a resync never drops audio still held."""
+    buffer = JitterBuffer(CHUNK, FRAME, depth=3, max_gap_chunks=20)
+    for sequence in (0, 1):
+        buffer.push(sequence, _chunk(sequence))
+    _frames(buffer)
+    for sequence in (3, 4):
+        buffer.push(sequence, _chunk(sequence))
+
+    buffer.push(25, _chunk(25))
+
+    assert buffer.resyncs == 0 and buffer.frames.frames_dropped == 0
+    assert _frames(buffer) == bytes(CHUNK) + _chunk(3) + _chunk(4) + bytes(17 * CHUNK)
+
+
+def test_oversized_chunk_is_rejected() -> None:
+    """Test that chunks larger than a slot raise ValidationError."""
+    buffer = JitterBuffer(CHUNK, FRAME)
+
+    with pytest.raises(ValidationError):
+        buffer.push(0, bytes(CHUNK + 1))
+
+
+def test_frame_assembler_drops_oldest_frames_on_overflow() -> None:
+    """Test that a stalled consumer loses the oldest whole frames, not alignment."""
+    frames = FrameAssembler(frame_bytes=4, capacity_frames=2)
+
+    for value in range(3):
+        frames.write(bytes([value]) * 4)
+
+    assert frames.frames_dropped == 1
+    assert bytes(frames.read_frame()) == bytes([1]) * 4
+    assert bytes(frames.read_frame()) == bytes([2]) * 4
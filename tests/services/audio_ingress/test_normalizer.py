@@ -0,0 +1,83 @@
+"""Tests for the streaming 16 kHz mono normalizer."""
+
+import numpy as np
+import pytest
+from src.services.audio_ingress.normalizer import PolyphaseResampler, StreamNormalizer
+from src.shared.errors import ValidationError
+
+TONES_HZ = (300, 1234, 3000, 6000)
+
+
+def _tones(rate: int, seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return sum(0.2 * np.sin(2 * np.pi * f * t) for f in TONES_HZ).astype(np.float32)
+
+
+def _fft_resample(samples: np.ndarray, output_size: int) -> np.ndarray:
+    """Reference resampler for periodic signals: truncate the spectrum."""
+    spectrum = np.fft.rfft(samples.astype(np.float64))
+    return np.fft.irfft(spectrum[: output_size // 2 + 1], output_size) * output_size / samples.size
+
+
+def _resample_in_chunks(
+    resampler: PolyphaseResampler, samples: np.ndarray, size: int
+) -> np.ndarray:
+    chunks = [resampler.process(samples[i:i + size]) for i in range(0, samples.size, size)]
+    return np.concatenate(chunks + [resampler.flush()])
+
+
+@pytest.mark.parametrize("rate", [48000, 44100, 22050])
+def test_resampler_matches_reference(rate: int) -> None:
+    """Test accuracy against an FFT resampler on a periodic multi-tone signal."""
+    samples = _tones(rate)
+
+    output = _resample_in_chunks(PolyphaseResampler(rate, 16000), samples, rate // 20)
+    reference = _fft_resample(samples, 16000)
+
+    assert output.size == 16000
+    error = output[100:-100] - reference[100:-100]
+    snr_db = 10 * np.log10(np.mean(reference**2) / np.mean(error**2))
+    assert snr_db > 50
+
+
+def test_chunked_output_is_identical_to_one_shot() -> None:
+    """Test that state carried across chunks leaves no seams at chunk edges."""
+    samples = np.random.default_rng(1).normal(0, 0.1, 44100).astype(np.float32)
+
+    one_shot = PolyphaseResampler(44100, 16000)
+    whole = np.concatenate([one_shot.process(samples), one_shot.flush()])
+    chunked = _resample_in_chunks(PolyphaseResampler(44100, 16000), samples, 441)
+
+    np.testing.assert_allclose(chunked, whole, atol=1e-6)
+
+
+def test_stereo_48k_is_downmixed_and_resampled() -> None:
+    """Test stereo downmix plus 48k -> 16k conversion to int16."""
+    left = _tones(48000, 0.05)
+    stereo = np.stack([left, np.zeros_like(left)], axis=1).astype("<f4").tobytes()
+    normalizer = StreamNormalizer(48000, channels=2, sample_format="float32")
+
+    output = np.frombuffer(normalizer.process(stereo) + normalizer.flush(), dtype="<i2")
+
+    assert output.size == 800
+    expected = _fft_resample(left / 2, 800) * 32768
+    assert np.abs(output[40:-40] - expected[40:-40]).max() < 100
+
+
+def test_canonical_input_passes_through() -> None:
+    """Test that 16 kHz mono int16 is returned untouched."""
+    normalizer = StreamNormalizer(16000)
+    data = np.arange(800, dtype="<i2").tobytes()
+
+    assert normalizer.passthrough
+    assert normalizer.process(data) is data
+
+
+def test_invalid_layouts_are_rejected() -> None:
+    """Test that low rates, unknown formats and partial frames raise."""
+    with pytest.raises(ValidationError):
+        StreamNormalizer(8000)
+    with pytest.raises(ValidationError):
+        StreamNormalizer(48000, sample_format="mp3")
+    with pytest.raises(ValidationError):
+        StreamNormalizer(48000, channels=2).process(b"\x00" * 6)
@@ -0,0 +1,111 @@
+"""Tests for vectorized audio quality validation."""
+
+import numpy as np
+import pytest
+from src.services.audio_ingress.quality import AudioQualityValidator, PcmChunk
+
+RATE = 16000
+TIME = np.arange(800) / RATE  # one 50 ms chunk
+
+
+def _pcm(signal: np.ndarray) -> bytes:
+    return (np.clip(signal, -1, 32767 / 32768) * 32768).astype("<i2").tobytes()
+
+
+def _noise(seed: int, level: float = 0.001) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0, level, TIME.size)
+
+
+def _tone(amplitude: float = 0.3) -> np.ndarray:
+    return amplitude * np.sin(2 * np.pi * 440 * TIME)
+
+
+def test_level_and_clipping() -> None:
+    """Test RMS/peak in dBFS and clipping detection on a full-scale square wave."""
+    validator = AudioQualityValidator()
+
+    tone = validator.validate("s1", _pcm(_tone(0.5)), RATE)
+    square = validator.validate("s2", _pcm(np.sign(_tone())), RATE)
+
+    assert abs(tone.rms_dbfs - 20 * np.log10(0.5 / np.sqrt(2))) < 0.1
+    assert abs(tone.peak_dbfs - 20 * np.log10(0.5)) < 0.1
+    assert tone.is_valid and not tone.clipping_detected
+    assert square.clipping_detected and not square.is_valid
+    assert "CLIPPING" in square.issues
+
+
+def test_running_snr_tracks_noise_floor_across_chunks() -> None:
+    """Test that SNR reflects speech level over the floor learnt from earlier chunks."""
+    validator = AudioQualityValidator(min_snr_db=15.0)
+    for seed in range(5):
+        validator.validate("s1", _pcm(_noise(seed)), RATE)
+
+    clean = validator.validate("s1", _pcm(_noise(10) + _tone()), RATE)
+    noisy = AudioQualityValidator(min_snr_db=15.0)
+    for seed in range(5):
+        noisy.validate("s1", _pcm(_noise(seed, level=0.1)), RATE)
+    poor = noisy.validate("s1", _pcm(_noise(10, level=0.1) + _tone(0.3)), RATE)
+
+    assert clean.signal_to_noise_ratio > 40
+    assert "LOW_SNR" not in clean.issues
+    assert poor.signal_to_noise_ratio < 15
+    assert "LOW_SNR" in poor.issues
+
+
+def test_sample_rate_and_format_checks() -> None:
+    """Test that low sample rates and malformed buffers are rejected."""
+    validator = AudioQualityValidator()
+
+    low_rate = validator.validate("s1", _pcm(_tone()), 8000)
+    odd_bytes = validator.validate("s2", b"\x00\x01\x02", RATE)
+    float_pcm = validator.validate(
+        "s3", _tone().astype("<f4").tobytes(), RATE, sample_format="float32"
+    )
+
+    assert not low_rate.is_valid and "SAMPLE_RATE_TOO_LOW" in low_rate.issues
+    assert odd_bytes.issues == ["INVALID_AUDIO_FORMAT"]
+    assert float_pcm.is_valid
+
+
+def test_batch_matches_sequential_validation() -> None:
+    """Test that a batch gives the same reports as one call per chunk."""
+    chunks = [
+        PcmChunk(f"s{i % 3}", _pcm(_noise(i) + (_tone() if i > 5 else 0)), RATE)
+        for i in range(12)
+    ]
+
+    sequential = AudioQualityValidator()
+    expected = [sequential.validate(*chunk) for chunk in chunks]
+    batched = AudioQualityValidator().validate_batch(chunks)
+
+    assert batched == expected
+
+
+def test_mixed_layout_batch_matches_sequential_validation() -> None:
+    """Test the generic path for batches mixing lengths, rates and formats."""
+    rng = np.random.default_rng(3)
+    chunks = [
+        PcmChunk("a", _pcm(rng.normal(0, 0.05, 805)), RATE),
+        PcmChunk("b", _pcm(rng.normal(0, 0.05, 4800)), 48000, channels=2),
+        PcmChunk("c", rng.normal(0, 0.05, 800).astype("<f4").tobytes(), RATE, 1, "float32"),
+    ]
+
+    sequential = AudioQualityValidator()
+    expected = [sequential.validate(*chunk) for chunk in chunks]
+    batched = AudioQualityValidator().validate_batch(chunks)
+
+    for got, want in zip(batched, expected):
+        assert got.issues == want.issues
+        assert got.rms_dbfs == pytest.approx(want.rms_dbfs, abs=0.01)
+        assert got.peak_dbfs == pytest.approx(want.peak_dbfs, abs=0.01)
+
+
+def test_forget_recycles_stream_state() -> None:
+    """Test that closed streams release their slot."""
+    validator = AudioQualityValidator()
+    validator.validate("s1", _pcm(_noise(1)), RATE)
+
+    validator.forget("s1")
+    validator.validate("s2", _pcm(_noise(2)), RATE)
+
+    assert len(validator) == 1
@@ -0,0 +1,92 @@
+"""Tests for the voice activity gate."""
+
+import numpy as np
+from src.services.audio_ingress.vad import VadGate, VadEventType
+
+RATE = 16000
+
+
+def _pcm(signal: np.ndarray) -> bytes:
+    return (np.clip(signal, -1, 32767 / 32768) * 32768).astype("<i2").tobytes()
+
+
+def _silence(seconds: float, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0, 0.002, int(seconds * RATE))
+
+
+def _speech(seconds: float, seed: int = 1) -> np.ndarray:
+    """Voiced speech stand-in: harmonics of a 150 Hz pitch, syllable-modulated."""
+    t = np.arange(int(seconds * RATE)) / RATE
+    voiced = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 8))
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+    return 0.15 * voiced * envelope + _silence(seconds, seed)
+
+
+def _run(gate: VadGate, signal: np.ndarray, frame_ms: int = 100) -> list:
+    data = _pcm(signal)
+    step = RATE * frame_ms // 1000 * 2
+    events = []
+    for offset in range(0, len(data), step):
+        events.extend(gate.process(data[offset:offset + step]))
+    return events + gate.close()
+
+
+def test_utterance_boundaries_and_silence_dropped() -> None:
+    """Test that each utterance is bracketed by start/end events and silence is not published."""
+    gate = VadGate(RATE, onset_ms=20, hangover_ms=200, pre_roll_ms=100)
+    signal = np.concatenate(
+        [_silence(1.0), _speech(1.0), _silence(1.5, seed=2), _speech(0.5, seed=3), _silence(1.0)]
+    )
+
+    events = _run(gate, signal)
+    starts = [e for e in events if e.type is VadEventType.UTTERANCE_START]
+    ends = [e for e in events if e.type is VadEventType.UTTERANCE_END]
+    audio = b"".join(e.data for e in events if e.type is VadEventType.AUDIO)
+
+    assert [e.utterance_id for e in starts] == [1, 2]
+    assert [e.utterance_id for e in ends] == [1, 2]
+    # Pre-roll starts each utterance before the true onset
+    assert 880 <= starts[0].timestamp_ms <= 1000
+    assert 3380 <= starts[1].timestamp_ms <= 3500
+    # Hangover closes each utterance shortly after speech stops
+    assert 2000 < ends[0].timestamp_ms <= 2250
+    assert 4000 < ends[1].timestamp_ms <= 4250
+    assert len(audio) == gate.bytes_out
+    assert gate.bytes_saved > len(_pcm(signal)) * 0.5
+
+
+def test_pre_roll_keeps_word_onset() -> None:
+    """Test that the published audio contains the samples at and before the speech onset."""
+    gate = VadGate(RATE, onset_ms=30, hangover_ms=100, pre_roll_ms=50)
+    speech = _pcm(_speech(0.3))
+    events = _run(gate, np.concatenate([_silence(0.5), _speech(0.3), _silence(0.5)]))
+
+    audio = b"".join(e.data for e in events if e.type is VadEventType.AUDIO)
+    assert speech[:3200] in audio
+
+
+def test_hangover_bridges_short_pauses() -> None:
+    """Test that pauses shorter than the hangover stay inside one utterance."""
+    gate = VadGate(RATE, hangover_ms=300)
+    signal = np.concatenate(
+        [_silence(0.5), _speech(0.4), _silence(0.2, seed=4), _speech(0.4, seed=5), _silence(1.0)]
+    )
+
+    events = _run(gate, signal)
+
+    assert [e.type for e in events if e.type is not VadEventType.AUDIO] == [
+        VadEventType.UTTERANCE_START,
+        VadEventType.UTTERANCE_END,
+    ]
+
+
+def test_noise_and_odd_frame_sizes() -> None:
+    """Test that steady noise never opens an utterance, whatever the frame size."""
+    loud_noise = np.random.default_rng(7).normal(0, 0.05, RATE * 2)
+    gate = VadGate(RATE)
+
+    events = _run(gate, loud_noise, frame_ms=37)
+
+    assert events == []
+    assert gate.bytes_in == len(_pcm(loud_noise))
+    assert gate.bytes_out == 0
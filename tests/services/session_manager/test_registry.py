@@ -0,0 +1,166 @@
+"""Tests for the consistent-hash session registry."""
+
+import asyncio
+import time
+
+import fakeredis
+import pytest
+from redis.exceptions import RedisError
+from src.services.session_manager.registry import (
+    HANDOFF_KEY,
+    MEMBERS_KEY,
+    HashRing,
+    SessionEvent,
+    SessionEventType,
+    SessionRegistry,
+)
+from src.shared.errors import ResourceNotFoundError, SessionCapacityError
+
+
+def _registry(server: fakeredis.FakeServer, node: str, **kwargs) -> SessionRegistry:
+    return SessionRegistry(node, redis=fakeredis.FakeAsyncRedis(server=server), **kwargs)
+
+
+def test_ring_moves_only_the_joining_nodes_share() -> None:
+    """Test that adding a node moves about 1/N of keys, all of them to the new node."""
+    ring = HashRing(["a", "b", "c"], vnodes=160)
+    keys = [f"session-{i}" for i in range(20_000)]
+    before = {key: ring.node_for(key) for key in keys}
+
+    ring.add_node("d")
+    moved = [key for key in keys if ring.node_for(key) != before[key]]
+
+    assert 0.18 < len(moved) / len(keys) < 0.32
+    assert all(ring.node_for(key) == "d" for key in moved)
+    counts = [sum(1 for key in keys if ring.node_for(key) == n) for n in "abcd"]
+    assert max(counts) / min(counts) < 1.5
+    assert HashRing().node_for("x") is None
+
+
+async def test_admission_control() -> None:
+    """Test that a node rejects sessions beyond its capacity but re-admits hosted ones."""
+    registry = _registry(fakeredis.FakeServer(), "node-a", max_sessions=2)
+
+    await registry.admit("s1", {"status": "ACTIVE"})
+    await registry.admit("s2")
+
+    assert await registry.admit("s1") == {"status": "ACTIVE"}
+    with pytest.raises(SessionCapacityError):
+        await registry.admit("s3")
+    registry.release("s1")
+    await registry.admit("s3")
+
+
+async def test_join_and_leave_hand_off_sessions() -> None:
+    """Test that sessions follow ring changes through Redis hand-off records."""
+    server = fakeredis.FakeServer()
+    node_a = _registry(server, "node-a")
+    await node_a.start()
+    for i in range(200):
+        await node_a.admit(f"s{i}", {"speakers": i})
+
+    node_b = _registry(server, "node-b")
+    await node_b.start()
+    moved = await node_a.refresh()
+
+    assert moved and all(node_a.owner(s) == "node-b" for s in moved)
+    assert len(node_a.sessions) == 200 - len(moved)
+    resumed = await node_b.admit(moved[0])
+    assert resumed == {"speakers": int(moved[0][1:])}
+
+    await node_b.close()
+    assert await node_a.refresh() == []
+    assert node_a.owner(moved[0]) == "node-a"
+    assert await node_a.admit(moved[0]) == resumed
+    await node_a.close()
+
+
+async def test_dead_members_are_pruned_and_loop_survives_errors() -> None:
+    """Test that long-silent members leave the hash and refresh errors don't stop heartbeats."""
+    server = fakeredis.FakeServer()
+    node = _registry(server, "node-a")
+    long_ago = time.time() - node.node_ttl * 10
+    await node.redis.hset(MEMBERS_KEY, mapping={"node-dead": long_ago, "node-b": time.time()})
+
+    await node.heartbeat()
+    await node.refresh()
+    assert set(await node.redis.hkeys(MEMBERS_KEY)) == {b"node-a", b"node-b"}
+    assert node.ring.nodes == {"node-a", "node-b"}
+
+    await node.redis.hset(MEMBERS_KEY, "node-bad", "not-a-timestamp")
+    node.heartbeat_interval = 0.01
+    node._task = asyncio.create_task(node._run())
+    await asyncio.sleep(0.05)
+    assert not node._task.done()
+    await node.close()
+
+
+async def test_concurrent_admits_share_one_claim_and_slot() -> None:
+    """Test that racing admits neither overwrite a claimed hand-off nor exceed capacity."""
+    server = fakeredis.FakeServer()
+    node = _registry(server, "node-a", max_sessions=2)
+    await node.redis.set(HANDOFF_KEY.format(session_id="s1"), '{"speakers": 1}')
+
+    first, second = await asyncio.gather(node.admit("s1"), node.admit("s1", {"speakers": 0}))
+    assert first is second
+    assert node.get("s1") == {"speakers": 1}
+
+    results = await asyncio.gather(
+        node.admit("s2"), node.admit("s3"), return_exceptions=True
+    )
+    assert sum(isinstance(r, SessionCapacityError) for r in results) == 1
+    assert len(node.sessions) == 2 and not node._pending
+
+
+async def test_failed_hand_off_is_retried_on_next_refresh() -> None:
+    """Test that sessions stranded by a failed hand-off move once Redis recovers."""
+    server = fakeredis.FakeServer()
+    node_a = _registry(server, "node-a")
+    await node_a.start()
+    for i in range(50):
+        await node_a.admit(f"s{i}")
+    node_b = _registry(server, "node-b")
+    await node_b.start()
+
+    hand_off = node_a._hand_off
+
+    async def _fail_once(session_ids: list[str]) -> None:
+        node_a._hand_off = hand_off
+        raise RedisError("connection reset")
+
+    node_a._hand_off = _fail_once
+    with pytest.raises(RedisError):
+        await node_a.refresh()
+    moved = await node_a.refresh()
+
+    assert moved and all(node_a.owner(s) == "node-b" for s in moved)
+    assert all(node_a.is_local(s) for s in node_a.sessions)
+    await node_a.close()
+    await node_b.close()
+
+
+async def test_speaker_events_reach_listeners() -> None:
+    """Test that speaker joins, utterances and departures are published to listeners."""
+    registry = _registry(fakeredis.FakeServer(), "node-a")
+    events: list[SessionEvent] = []
+
+    def broken(event: SessionEvent) -> None:
+        raise RuntimeError("listener bug")
+
+    registry.add_listener(broken)
+    registry.add_listener(events.append)
+    await registry.admit("s1", {"speakers": {"u1": {"speakerId": "u1", "voiceProfileId": "p1"}}})
+    registry.add_speaker("s1", {"speakerId": "u2", "voiceProfileId": "p2"})
+    registry.speaker_active("s1", "u2")
+    registry.speaker_active("s1", "unknown")
+    registry.release("s1")
+
+    assert [(e.type, e.profile_id) for e in events] == [
+        (SessionEventType.SPEAKER_JOINED, "p1"),
+        (SessionEventType.SPEAKER_JOINED, "p2"),
+        (SessionEventType.SPEAKER_ACTIVE, "p2"),
+        (SessionEventType.SPEAKER_LEFT, "p1"),
+        (SessionEventType.SPEAKER_LEFT, "p2"),
+    ]
+    with pytest.raises(ResourceNotFoundError):
+        registry.add_speaker("s1", {"speakerId": "u3", "voiceProfileId": "p3"})
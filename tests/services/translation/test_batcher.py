@@ -0,0 +1,146 @@
+"""Tests for the adaptive translation micro-batcher."""
+
+import asyncio
+
+from botocore.exceptions import ClientError
+from src.services.translation.batcher import BatchKey, TranslationBatcher
+from src.shared.async_aws_clients import AsyncTranslateClient
+from src.shared.errors import TranslationError
+from src.shared.fakes import FakeTranslateClient
+
+
+class _Manager:
+    def __init__(self, client: FakeTranslateClient):
+        self.client = client
+
+    async def get_client(self, service_name: str) -> FakeTranslateClient:
+        return self.client
+
+
+def _batcher(fake: FakeTranslateClient, **kwargs) -> TranslationBatcher:
+    return TranslationBatcher(AsyncTranslateClient(manager=_Manager(fake)), **kwargs)
+
+
+async def test_concurrent_requests_share_calls_per_group() -> None:
+    """Test that concurrent segments are grouped by language pair and split back in order."""
+    fake = FakeTranslateClient(latency=0.005)
+    batcher = _batcher(fake, max_segments=50, max_wait_ms=5)
+
+    results = await asyncio.gather(
+        *(batcher.translate(f"line {i}", "en", "es" if i % 2 else "fr") for i in range(10)),
+        batcher.translate("formal", "en", "es", formality="formal"),
+    )
+
+    assert results[:4] == ["[fr] line 0", "[es] line 1", "[fr] line 2", "[es] line 3"]
+    assert results[-1] == "[es] formal"
+    assert fake.call_count == 3
+    assert fake.requests[-1]["Settings"] == {"Formality": "FORMAL"}
+
+
+async def test_sessions_never_share_a_call() -> None:
+    """Test that segments of different sessions are sent in separate calls."""
+    fake = FakeTranslateClient(latency=0.005)
+    batcher = _batcher(fake, max_segments=50, max_wait_ms=5)
+
+    results = await asyncio.gather(
+        *(batcher.translate(f"s{i}", "en", "es", session_id=f"session-{i % 2}") for i in range(6))
+    )
+
+    assert results == [f"[es] s{i}" for i in range(6)]
+    assert sorted(request["Text"] for request in fake.requests) == ["s0\ns2\ns4", "s1\ns3\ns5"]
+
+
+async def test_flush_on_size_and_bytes() -> None:
+    """Test that batches are capped by segment count and payload size."""
+    fake = FakeTranslateClient()
+    batcher = _batcher(fake, max_segments=4, max_bytes=100, max_wait_ms=5)
+
+    await asyncio.gather(*(batcher.translate(f"s{i}", "en", "es") for i in range(8)))
+    await asyncio.gather(*(batcher.translate("x" * 40, "en", "de") for _ in range(3)))
+
+    sizes = [request["Text"].count("\n") + 1 for request in fake.requests]
+    assert sizes == [4, 4, 2, 1]
+
+
+async def test_lone_requests_do_not_wait() -> None:
+    """Test that sparse traffic is sent without waiting for the window."""
+    fake = FakeTranslateClient()
+    batcher = _batcher(fake, max_wait_ms=200)
+
+    loop = asyncio.get_running_loop()
+    for _ in range(3):
+        start = loop.time()
+        await batcher.translate("hello", "en", "es")
+        assert loop.time() - start < 0.05
+        await asyncio.sleep(0.3)
+
+    assert batcher.window_ms(BatchKey("en", "es")) == 0
+
+
+async def test_fallback_and_errors_reach_every_caller() -> None:
+    """Test per-segment fallback when line breaks are lost, and error fan-out."""
+    fake = FakeTranslateClient()
+    batcher = _batcher(fake, max_wait_ms=5)
+    original = fake.translate_text
+
+    async def merge_lines(**kwargs):
+        response = await original(**kwargs)
+        response["TranslatedText"] = response["TranslatedText"].replace("\n", " ")
+        return response
+
+    fake.translate_text = merge_lines
+    results = await asyncio.gather(*(batcher.translate(f"s{i}", "en", "es") for i in range(3)))
+    assert results == ["[es] s0", "[es] s1", "[es] s2"]
+    assert fake.call_count == 4
+
+    async def reject(**kwargs):
+        raise ClientError(
+            {"Error": {"Code": "UnsupportedLanguagePairException", "Message": "no"}},
+            "TranslateText",
+        )
+
+    fake.translate_text = reject
+    outcomes = await asyncio.gather(
+        *(batcher.translate(f"s{i}", "en", "xx") for i in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(outcome, TranslationError) for outcome in outcomes)
+    await batcher.close()
+
+
+async def test_shifted_lines_and_rejected_segments_stay_per_segment() -> None:
+    """Test that misaligned output falls back and a rejected segment fails only its caller."""
+    fake = FakeTranslateClient()
+    batcher = _batcher(fake, max_wait_ms=5)
+    original = fake.translate_text
+
+    async def shift_lines(**kwargs):
+        response = await original(**kwargs)
+        lines = response["TranslatedText"].split("\n")
+        if len(lines) == 3:
+            # Same line count, but the first two segments swapped text
+            response["TranslatedText"] = "\n".join([lines[0] + " " + lines[1], "ok", lines[2]])
+        return response
+
+    fake.translate_text = shift_lines
+    texts = ["short one", "a much longer second segment here", "third"]
+    results = await asyncio.gather(*(batcher.translate(text, "en", "es") for text in texts))
+    assert results == [f"[es] {text}" for text in texts]
+    assert fake.call_count == 4
+
+    async def reject_bad(**kwargs):
+        if "bad" in kwargs["Text"]:
+            raise ClientError(
+                {"Error": {"Code": "DetectedLanguageLowConfidenceException", "Message": "no"}},
+                "TranslateText",
+            )
+        return await original(**kwargs)
+
+    fake.translate_text = reject_bad
+    outcomes = await asyncio.gather(
+        *(batcher.translate(text, "en", "de") for text in ("fine", "bad", "good")),
+        return_exceptions=True,
+    )
+    assert outcomes[0] == "[de] fine"
+    assert isinstance(outcomes[1], TranslationError)
+    assert outcomes[2] == "[de] good"
+    await batcher.close()
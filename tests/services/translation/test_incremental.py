@@ -0,0 +1,101 @@
+"""Tests for incremental translation of partial transcripts."""
+
+from src.services.speech_to_text.models import TranscriptionResult
+from src.services.translation.incremental import IncrementalTranslator
+from src.services.translation.models import TranslationRequest, TranslationResult
+
+
+class _StubService:
+    def __init__(self) -> None:
+        self.requests: list[TranslationRequest] = []
+
+    async def translate(self, request: TranslationRequest) -> TranslationResult:
+        self.requests.append(request)
+        return TranslationResult(
+            request.session_id,
+            request.segment_id,
+            request.source_text.upper(),
+            request.source_language,
+            request.target_language,
+            latency=1.0,
+        )
+
+
+def _result(transcript: str, partial: bool = True, result_id: str = "r1") -> TranscriptionResult:
+    return TranscriptionResult("s1", result_id, partial, transcript)
+
+
+async def _feed(translator: IncrementalTranslator, transcripts: list[str], final: str) -> list:
+    updates = []
+    for transcript in transcripts:
+        updates += await translator.process(_result(transcript))
+    return updates + await translator.process(_result(final, partial=False))
+
+
+async def test_stable_clauses_translated_once() -> None:
+    """Test that each stable clause is translated once and the final adds only the rest."""
+    service = _StubService()
+    translator = IncrementalTranslator("en", "es", service=service, agreement=2, max_words=6)
+
+    updates = await _feed(
+        translator,
+        [
+            "Good",
+            "Good morning,",
+            "Good morning, every",
+            "Good morning, everyone please",
+            "Good morning, everyone please take",
+            "Good morning, everyone please take a seat",
+        ],
+        "Good morning, everyone please take a seat.",
+    )
+
+    assert [u.source_text for u in updates] == [
+        "Good morning,",
+        "everyone please take a seat.",
+    ]
+    assert [u.is_final for u in updates] == [False, True]
+    assert updates[0].translated_text == "GOOD MORNING,"
+    assert not any(u.revision for u in updates)
+    assert service.requests[1].context.previous_segments == ["Good morning,"]
+
+
+async def test_long_unpunctuated_run_committed_after_max_words() -> None:
+    """Test that stable words are committed without punctuation once max_words is reached."""
+    service = _StubService()
+    translator = IncrementalTranslator("en", "es", service=service, agreement=2, max_words=3)
+    words = "so what we need to do next is".split()
+    partials = [" ".join(words[:n]) for n in range(1, len(words) + 1)]
+
+    updates = await _feed(translator, partials, " ".join(words))
+
+    assert len(service.requests) < len(partials)
+    assert " ".join(u.source_text for u in updates) == " ".join(words)
+    assert updates[0].source_text == "so what we"
+
+
+async def test_final_revision_retranslates_whole_result() -> None:
+    """Test that a final result that changes committed words replaces earlier updates."""
+    service = _StubService()
+    translator = IncrementalTranslator("en", "es", service=service, agreement=2)
+
+    updates = await _feed(
+        translator,
+        ["I scream,", "I scream, you", "I scream, you scream"],
+        "Ice cream, you scream.",
+    )
+
+    assert updates[0].source_text == "I scream,"
+    assert updates[-1].revision and updates[-1].is_final
+    assert updates[-1].source_text == "Ice cream, you scream."
+
+
+async def test_final_without_new_words_emits_empty_marker() -> None:
+    """Test that a final result already covered by partials costs no call."""
+    service = _StubService()
+    translator = IncrementalTranslator("en", "es", service=service, agreement=2)
+
+    updates = await _feed(translator, ["Yes.", "Yes."], "yes")
+
+    assert [(u.source_text, u.is_final) for u in updates] == [("Yes.", False), ("", True)]
+    assert len(service.requests) == 1
@@ -0,0 +1,117 @@
+"""Tests for the translation result cache."""
+
+import asyncio
+
+import fakeredis
+import pytest
+from src.services.translation.cache import TranslationCache, normalize_text
+from src.services.translation.models import ConversationContext, TranslationRequest
+from src.services.translation.service import TranslationService
+from src.shared.cache import TwoTierCache
+from src.shared.timing import TimingEnvelope
+
+
+class _StubTranslate:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    async def translate_text(
+        self, text: str, source: str, target: str, terminology=None, formality=None
+    ) -> str:
+        self.calls.append((text, source, target, terminology, formality))
+        return f"[{target}] {text}"
+
+
+@pytest.fixture
+def server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+def _service(server: fakeredis.FakeServer, client: _StubTranslate) -> TranslationService:
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    return TranslationService(client, TranslationCache(TwoTierCache(redis=redis, l1_ttl=60)))
+
+
+def _request(text: str, target: str = "es", **kwargs) -> TranslationRequest:
+    return TranslationRequest("s1", "seg", text, "en", target, **kwargs)
+
+
+async def test_repeated_phrase_served_from_cache(server: fakeredis.FakeServer) -> None:
+    """Test that a repeated phrase calls Translate once and is shared through Redis."""
+    client = _StubTranslate()
+    service = _service(server, client)
+
+    first = await service.translate(_request("Can you repeat that?"))
+    second = await service.translate(_request("Can  you repeat that?"))
+    other_node = await _service(server, client).translate(_request("Can you repeat that?"))
+
+    assert first.translated_text == second.translated_text == other_node.translated_text
+    assert not first.cached and second.cached and other_node.cached
+    assert len(client.calls) == 1
+    assert service.cache.hit_ratio == 0.5
+
+
+async def test_key_covers_language_terminology_and_formality(
+    server: fakeredis.FakeServer,
+) -> None:
+    """Test that anything that changes the output is part of the cache key."""
+    client = _StubTranslate()
+    service = _service(server, client)
+
+    await service.translate(_request("Hello"))
+    await service.translate(_request("Hello", target="fr"))
+    await service.translate(_request("Hello", custom_terminology="medical"))
+    await service.translate(_request("Hello", context=ConversationContext(formality="formal")))
+    await service.translate(_request("Hello", context=ConversationContext(formality="formal")))
+
+    assert len(client.calls) == 4
+    assert client.calls[3][4] == "formal"
+    assert normalize_text("  Hello\tworld \n") == "Hello world"
+
+
+async def test_context_dependent_and_long_segments_bypass(server: fakeredis.FakeServer) -> None:
+    """Test that context-dependent and long segments always reach Translate."""
+    client = _StubTranslate()
+    service = _service(server, client)
+    context = ConversationContext(previous_segments=["My sister called yesterday."])
+    sentence = "She said she would bring them to the meeting tomorrow."
+
+    for _ in range(2):
+        await service.translate(_request(sentence, context=context))
+        await service.translate(_request("Thank you", context=context))
+        await service.translate(_request("word " * 60))
+
+    assert [call[0] for call in client.calls].count(sentence) == 2
+    assert [call[0] for call in client.calls].count("Thank you") == 1
+    assert len(client.calls) == 5
+    assert service.cache.hits == 1 and service.cache.misses == 1
+
+
+async def test_timing_is_carried_and_stamped(server: fakeredis.FakeServer) -> None:
+    """Test that the result carries a copy of the request's envelope with translate stamped."""
+    timing = TimingEnvelope()
+    timing.enter("stt")
+    timing.exit("stt")
+
+    result = await _service(server, _StubTranslate()).translate(_request("Hello", timing=timing))
+
+    assert [stage for stage, _, _ in result.timing.stages()] == ["stt", "translate"]
+    assert len(timing.stages()) == 1
+    assert result.to_dict()["timing"]["stages"][1][0] == "translate"
+
+
+async def test_blank_text_skips_translate_and_waiters_are_not_hits(
+    server: fakeredis.FakeServer,
+) -> None:
+    """Test that blank partials never call Translate and joined calls are not hits."""
+    client = _StubTranslate()
+    service = _service(server, client)
+
+    blank = await service.translate(_request(" \t "))
+    results = await asyncio.gather(*(service.translate(_request("Good morning")) for _ in range(3)))
+
+    assert blank.translated_text == ""
+    assert [call[0] for call in client.calls] == ["Good morning"]
+    assert {r.translated_text for r in results} == {"[es] Good morning"}
+    assert (service.cache.hits, service.cache.misses, service.cache.coalesced) == (0, 1, 2)
+    assert not any(r.cached for r in results)
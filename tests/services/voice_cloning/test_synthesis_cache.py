@@ -0,0 +1,192 @@
+"""Tests for the content-addressed synthesis cache."""
+
+from pathlib import Path
+from typing import AsyncIterator
+
+import fakeredis
+from src.services.voice_cloning.cache import DiskLRU, SynthesisCache
+from src.services.voice_cloning.models import (
+    EmotionalContext,
+    EmotionalProfile,
+    ProsodyHints,
+    SynthesisRequest,
+)
+from src.shared.async_aws_clients import AsyncAWSClientManager, AsyncS3Client
+from src.shared.errors import CircuitOpenError, DeadlineExceededError
+from src.shared.fakes import AsyncFake, FakeS3Client
+
+
+class _Synthesizer:
+    """Synthesizer stand-in producing distinct audio per call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, request: SynthesisRequest) -> AsyncIterator[bytes]:
+        self.calls += 1
+        for part in range(3):
+            yield f"{request.text}|{self.calls}|{part};".encode()
+
+
+def _request(text: str = "Thank you", profile: str = "p1", **kwargs) -> SynthesisRequest:
+    return SynthesisRequest("s1", "seg-1", text, profile, "es", **kwargs)
+
+
+def _node(tmp_path: Path, name: str, s3: FakeS3Client, redis) -> SynthesisCache:
+    manager = AsyncAWSClientManager()
+    manager.register_client("s3", AsyncFake(s3))
+    return SynthesisCache(
+        disk=DiskLRU(tmp_path / name, max_bytes=10_000),
+        s3=AsyncS3Client(manager),
+        redis=redis,
+        bucket="cache",
+        chunk_bytes=8,
+    )
+
+
+async def _collect(cache: SynthesisCache, request: SynthesisRequest, synth) -> bytes:
+    return b"".join([chunk async for chunk in cache.stream(request, synth)])
+
+
+async def test_repeat_synthesis_is_served_from_disk(
+    tmp_path: Path, mock_aws_credentials: None
+) -> None:
+    """Test that a repeated phrase is synthesized once and streamed back in chunks."""
+    cache = _node(tmp_path, "a", FakeS3Client(), fakeredis.FakeAsyncRedis())
+    synth = _Synthesizer()
+
+    first = await _collect(cache, _request(), synth)
+    chunks = [c async for c in cache.stream(_request("  Thank\tyou "), synth)]
+    neutral = await _collect(
+        cache, _request(prosody_hints=ProsodyHints(speaking_rate=1.0, pitch_shift=0)), synth
+    )
+    await _collect(cache, _request(prosody_hints=ProsodyHints(speaking_rate=1.2)), synth)
+
+    assert synth.calls == 2
+    assert b"".join(chunks) == first == neutral
+    assert {len(c) for c in chunks[:-1]} == {8}
+    assert (cache.disk_hits, cache.misses) == (2, 2)
+    assert cache.hit_ratio == 0.5
+
+
+async def test_shared_tier_fills_other_nodes(tmp_path: Path, mock_aws_credentials: None) -> None:
+    """Test that a phrase synthesized on one node is a hit on another via S3."""
+    s3, redis = FakeS3Client(), fakeredis.FakeAsyncRedis()
+    node_a, node_b = _node(tmp_path, "a", s3, redis), _node(tmp_path, "b", s3, redis)
+    synth = _Synthesizer()
+
+    audio = await _collect(node_a, _request(), synth)
+    await node_a.flush()
+
+    assert await _collect(node_b, _request(), synth) == audio
+    assert await _collect(node_b, _request(), synth) == audio
+    assert synth.calls == 1
+    assert (node_b.s3_hits, node_b.disk_hits) == (1, 1)
+    assert s3.call_counts["PutObject"] == 1
+
+
+async def test_reenrollment_invalidates_every_tier(
+    tmp_path: Path, mock_aws_credentials: None
+) -> None:
+    """Test that a re-enrolled profile's phrases are synthesized again on every node."""
+    s3, redis = FakeS3Client(), fakeredis.FakeAsyncRedis()
+    node_a, node_b = _node(tmp_path, "a", s3, redis), _node(tmp_path, "b", s3, redis)
+    synth = _Synthesizer()
+    old = await _collect(node_a, _request(), synth)
+    await _collect(node_a, _request(profile="p2"), synth)
+    await node_a.flush()
+    await _collect(node_b, _request(), synth)
+
+    assert await node_a.invalidate_profile("p1") == 1
+    new_b = await _collect(node_b, _request(), synth)
+    await node_b.flush()
+    new_a = await _collect(node_a, _request(), synth)
+
+    assert new_b != old and new_a == new_b
+    assert synth.calls == 3
+    assert len(node_a.disk) == 2
+    await _collect(node_a, _request(profile="p2"), synth)
+    assert synth.calls == 3
+
+
+async def test_uncacheable_and_interrupted_synthesis_is_not_stored(
+    tmp_path: Path, mock_aws_credentials: None
+) -> None:
+    """Test that emotional, overlong and abandoned syntheses bypass the store."""
+    cache = _node(tmp_path, "a", FakeS3Client(), fakeredis.FakeAsyncRedis())
+    synth = _Synthesizer()
+    emotional = _request(
+        emotional_context=EmotionalContext(EmotionalProfile(0.5, 0.8, 0.5))
+    )
+
+    await _collect(cache, emotional, synth)
+    await _collect(cache, emotional, synth)
+    await _collect(cache, _request("word " * 100), synth)
+    async for _ in cache.stream(_request("Good morning"), synth):
+        break
+    await _collect(cache, _request("Good morning"), synth)
+
+    assert synth.calls == 5
+    assert len(cache.disk) == 1
+    assert cache.misses == 2
+
+
+class _DownS3:
+    """Shared tier whose breaker is open and whose uploads run out of time."""
+
+    async def download_file(self, bucket: str, key: str) -> bytes:
+        raise CircuitOpenError("s3", retry_after=5)
+
+    async def upload_file(self, bucket: str, key: str, data: bytes) -> None:
+        raise DeadlineExceededError("s3.put_object", 100)
+
+
+async def test_shared_tier_outage_falls_back_to_synthesis(tmp_path: Path) -> None:
+    """Test that S3 failures other than a missing object count as misses, not errors."""
+    cache = SynthesisCache(
+        disk=DiskLRU(tmp_path, max_bytes=10_000),
+        s3=_DownS3(),
+        redis=fakeredis.FakeAsyncRedis(),
+        bucket="cache",
+    )
+    synth = _Synthesizer()
+
+    audio = await _collect(cache, _request(), synth)
+    await cache.flush()
+
+    assert audio == b"Thank you|1|0;Thank you|1|1;Thank you|1|2;"
+    assert await _collect(cache, _request(), synth) == audio
+    assert (cache.misses, cache.disk_hits) == (1, 1)
+
+
+def test_disk_lru_evicts_by_size_and_reloads(tmp_path: Path) -> None:
+    """Test that the disk tier stays under budget and recovers its index on restart."""
+    disk = DiskLRU(tmp_path, max_bytes=250)
+    for index in range(3):
+        disk.put("g1" if index < 2 else "g2", f"d{index}", bytes(100))
+    with disk.open("d1") as f:
+        assert f.read() == bytes(100)
+    (tmp_path / "g1" / "d9.123.tmp").write_bytes(b"partial")
+
+    assert "d0" not in disk and disk.size == 200
+    reopened = DiskLRU(tmp_path, max_bytes=250)
+    assert len(reopened) == 2 and reopened.size == 200
+    assert not (tmp_path / "g1" / "d9.123.tmp").exists()
+    assert reopened.drop_group("g1") == 1
+    assert reopened.open("d1") is None and reopened.size == 100
+    disk.put("g1", "big", bytes(300))
+    assert "big" not in disk
+
+
+def test_workers_claim_separate_disk_directories(tmp_path: Path) -> None:
+    """Test that live workers never share a directory and a released one is reused."""
+    first = DiskLRU.for_worker(tmp_path, max_bytes=1000)
+    second = DiskLRU.for_worker(tmp_path, max_bytes=1000)
+    first.put("g1", "d1", bytes(10))
+
+    assert (first.root.name, second.root.name) == ("worker-0", "worker-1")
+    first.close()
+    third = DiskLRU.for_worker(tmp_path, max_bytes=1000)
+    assert third.root.name == "worker-0" and "d1" in third
+    second.close()
+    third.close()
@@ -0,0 +1,142 @@
+"""Tests for the predictive model warm-up scheduler."""
+
+import asyncio
+
+import fakeredis
+from src.services.session_manager.registry import SessionEvent, SessionEventType
+from src.services.voice_cloning.warmup import WarmupScheduler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Endpoint:
+    """Records warm and unload calls."""
+
+    def __init__(self) -> None:
+        self.warmed: list[str] = []
+        self.unloaded: list[str] = []
+
+    async def warm(self, profile_id: str) -> None:
+        await asyncio.sleep(0)
+        self.warmed.append(profile_id)
+
+    async def unload(self, profile_id: str) -> None:
+        self.unloaded.append(profile_id)
+
+
+def _scheduler(endpoint: _Endpoint, clock: _Clock, **kwargs) -> WarmupScheduler:
+    options = dict(
+        unload=endpoint.unload,
+        max_profiles=4,
+        ttl_seconds=600,
+        keepalive_seconds=480,
+        idle_seconds=300,
+        keepalive_per_minute=1,
+        clock=clock,
+    )
+    options.update(kwargs)
+    return WarmupScheduler(endpoint.warm, **options)
+
+
+def _event(kind: SessionEventType, profile: str, clock: _Clock, session: str = "s1"):
+    return SessionEvent(kind, session, profile, clock.now)
+
+
+async def test_join_warms_before_first_use_once_per_cluster() -> None:
+    """Test that a joining speaker is warm by their first synthesis, on every node."""
+    redis, clock = fakeredis.FakeAsyncRedis(), _Clock()
+    endpoint = _Endpoint()
+    node_a = _scheduler(endpoint, clock, redis=redis)
+    node_b = _scheduler(endpoint, clock, redis=redis)
+
+    node_a.on_session_event(_event(SessionEventType.SPEAKER_JOINED, "p1", clock))
+    assert node_a.status("p1") == "warming"
+    await node_a.close()
+    node_b.on_session_event(_event(SessionEventType.SPEAKER_JOINED, "p1", clock, "s2"))
+    await node_b.close()
+
+    assert endpoint.warmed == ["p1"]
+    assert 0 < await redis.ttl("model-warmup:p1") <= 600
+    assert node_a.record_use("p1") == node_b.record_use("p1") == "warm"
+    assert node_a.record_use("p2") == "cold"
+    assert node_a.record_use("p2") == "warm"
+    assert node_a.first_use_cold_start_rate == 0.5
+    assert node_a.cold_start_rate == 1 / 3
+    assert node_a.calls == 1 and node_b.calls == 0
+
+
+async def test_model_is_unloaded_only_by_its_last_live_holder() -> None:
+    """Test that an evicting node keeps the shared model while another node hosts it."""
+    redis, clock = fakeredis.FakeAsyncRedis(), _Clock()
+    endpoint = _Endpoint()
+    node_a = _scheduler(endpoint, clock, redis=redis, node_id="node-a")
+    node_b = _scheduler(endpoint, clock, redis=redis, node_id="node-b")
+    node_a.on_session_event(_event(SessionEventType.SPEAKER_JOINED, "p1", clock))
+    await node_a.close()
+    node_b.on_session_event(_event(SessionEventType.SPEAKER_JOINED, "p1", clock, "s2"))
+    await node_b.close()
+    await redis.zadd("model-warmup:p1:nodes", {"node-dead": 0})
+
+    node_a.on_session_event(_event(SessionEventType.SPEAKER_LEFT, "p1", clock))
+    node_a.tick()
+    await node_a.close()
+    assert endpoint.unloaded == []
+    assert await redis.exists("model-warmup:p1")
+
+    node_b.on_session_event(_event(SessionEventType.SPEAKER_LEFT, "p1", clock, "s2"))
+    node_b.tick()
+    await node_b.close()
+    assert endpoint.unloaded == ["p1"]
+    assert not await redis.exists("model-warmup:p1", "model-warmup:p1:nodes")
+
+
+async def test_warm_set_stays_within_budget() -> None:
+    """Test that a full warm set evicts departed, then least recently active, speakers."""
+    clock, endpoint = _Clock(), _Endpoint()
+    scheduler = _scheduler(endpoint, clock, max_profiles=2)
+
+    for profile in ("p1", "p2"):
+        clock.now += 1
+        scheduler.on_session_event(_event(SessionEventType.SPEAKER_JOINED, profile, clock))
+    await scheduler.close()
+    scheduler.on_session_event(_event(SessionEventType.SPEAKER_LEFT, "p2", clock))
+    scheduler.on_session_event(_event(SessionEventType.SPEAKER_JOINED, "p3", clock))
+    clock.now += 1
+    scheduler.on_session_event(_event(SessionEventType.SPEAKER_ACTIVE, "p1", clock))
+    scheduler.on_session_event(_event(SessionEventType.SPEAKER_JOINED, "p4", clock))
+    await scheduler.close()
+
+    assert sorted(scheduler.warm_profiles) == ["p1", "p4"]
+    assert endpoint.unloaded == ["p2", "p3"]
+    assert scheduler.status("p3") == "cold"
+
+
+async def test_tick_keeps_active_speakers_warm_within_call_budget() -> None:
+    """Test that keep-alives refresh active speakers at a bounded rate and idle ones go."""
+    clock, endpoint = _Clock(), _Endpoint()
+    scheduler = _scheduler(endpoint, clock)
+    for profile in ("p1", "p2", "p3"):
+        scheduler.on_session_event(_event(SessionEventType.SPEAKER_JOINED, profile, clock))
+    await scheduler.close()
+
+    clock.now += 490
+    for profile in ("p1", "p2"):
+        scheduler.on_session_event(_event(SessionEventType.SPEAKER_ACTIVE, profile, clock))
+    clock.now += 10  # p3 has now been quiet for 500 s
+    scheduler.tick()
+    await scheduler.close()
+
+    assert endpoint.unloaded == ["p3"]
+    assert endpoint.warmed == ["p1", "p2", "p3", "p1"]
+    assert scheduler.status("p2") == "warm"
+    clock.now += 60
+    scheduler.tick()
+    await scheduler.close()
+    assert endpoint.warmed[-1] == "p2"
+    assert scheduler.calls == 5
@@ -0,0 +1,139 @@
+"""Tests for the memory-mapped voice-embedding store."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from src.services.voice_profile.embedding_store import DATA_FILE, LOG_FILE, EmbeddingStore
+from src.shared.errors import StorageError, ValidationError
+
+
+def _vectors(count: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((count, dim)).astype(np.float32)
+
+
+def test_search_ranks_by_cosine_similarity(tmp_path: Path) -> None:
+    """Test that batched queries return their own profile first with similarity ~1."""
+    vectors = _vectors(200)
+    with EmbeddingStore(tmp_path, dim=16) as store:
+        store.add_many([f"p{i}" for i in range(200)], vectors)
+
+        results = store.search(vectors[[3, 150]] * 7.5, k=3)
+
+    assert [matches[0][0] for matches in results] == ["p3", "p150"]
+    assert results[0][0][1] == pytest.approx(1.0, abs=1e-3)
+    assert results[0][0][1] >= results[0][1][1] >= results[0][2][1]
+    assert len(results[1]) == 3
+
+
+def test_replace_and_remove_tombstone_rows(tmp_path: Path) -> None:
+    """Test that replaced and removed embeddings drop out of search and compaction."""
+    vectors = _vectors(3)
+    store = EmbeddingStore(tmp_path, dim=16, dtype="float32")
+    store.add_many(["a", "b", "c"], vectors)
+    store.add("a", vectors[2])
+    assert store.remove("b")
+    assert not store.remove("b")
+
+    assert len(store) == 2
+    assert "b" not in store
+    assert {match[0] for match in store.search(vectors[0], k=5)[0]} == {"a", "c"}
+    np.testing.assert_allclose(store.get("a"), store.get("c"), rtol=1e-6)
+
+    size = (tmp_path / DATA_FILE).stat().st_size
+    store.compact()
+    assert (tmp_path / DATA_FILE).stat().st_size == size - 2 * 16 * 4
+    assert {match[0] for match in store.search(vectors[2], k=5)[0]} == {"a", "c"}
+    store.close()
+
+
+def test_reader_refresh_sees_writes_and_compaction(tmp_path: Path) -> None:
+    """Test that a read-only opener picks up appends, tombstones and rewrites."""
+    vectors = _vectors(4)
+    writer = EmbeddingStore(tmp_path, dim=16)
+    writer.add_many(["a", "b"], vectors[:2])
+    reader = EmbeddingStore(tmp_path, readonly=True)
+
+    writer.add_many(["c", "d"], vectors[2:])
+    writer.remove("a")
+    reader.refresh()
+    assert reader.search(vectors[3], k=1)[0][0][0] == "d"
+    assert "a" not in reader
+
+    writer.compact()
+    writer.add("e", vectors[0])
+    reader.refresh()
+    assert len(reader) == 4
+    assert reader.search(vectors[0], k=1)[0][0][0] == "e"
+    with pytest.raises(StorageError):
+        reader.add("f", vectors[1])
+    writer.close()
+
+
+def test_only_one_writer_at_a_time(tmp_path: Path) -> None:
+    """Test that a second writer is refused, even across compaction, until the first closes."""
+    vectors = _vectors(2)
+    writer = EmbeddingStore(tmp_path, dim=16)
+    writer.add("a", vectors[0])
+    with pytest.raises(StorageError):
+        EmbeddingStore(tmp_path)
+    writer.compact()
+    with pytest.raises(StorageError):
+        EmbeddingStore(tmp_path)
+    reader = EmbeddingStore(tmp_path, readonly=True)
+    writer.close()
+
+    with EmbeddingStore(tmp_path) as store:
+        store.add("b", vectors[1])
+    reader.refresh()
+    assert len(reader) == 2
+
+
+def test_reopen_drops_unlogged_rows_and_torn_records(tmp_path: Path) -> None:
+    """Test that a writer recovering from a crash keeps only fully logged rows."""
+    vectors = _vectors(2)
+    with EmbeddingStore(tmp_path, dim=16) as store:
+        store.add_many(["a", "b"], vectors)
+    with open(tmp_path / DATA_FILE, "ab") as f:
+        f.write(b"\x01" * 40)
+    with open(tmp_path / LOG_FILE, "ab") as f:
+        f.write(b"\x01\x00")
+
+    with EmbeddingStore(tmp_path) as store:
+        store.add("c", vectors[0])
+        assert len(store) == 3
+        assert store.search(vectors[1], k=1)[0][0][0] == "b"
+
+
+def test_coarse_index_matches_exact_search(tmp_path: Path) -> None:
+    """Test that IVF search finds the exact nearest profile, including rows added later."""
+    rng = np.random.default_rng(1)
+    centers = rng.standard_normal((20, 32))
+    vectors = centers[rng.integers(0, 20, 2000)] + 0.3 * rng.standard_normal((2000, 32))
+    store = EmbeddingStore(tmp_path, dim=32)
+    store.add_many([f"p{i}" for i in range(2000)], vectors)
+    queries = vectors[:100] + 0.05 * rng.standard_normal((100, 32))
+    exact = [matches[0][0] for matches in store.search(queries, k=1)]
+
+    store.build_index(lists=20, nprobe=3)
+    store.add("late", vectors[5] * 2)
+    indexed = [matches[0][0] for matches in store.search(queries, k=1)]
+
+    assert sum(a == b for a, b in zip(exact, indexed)) >= 95
+    assert store.search(vectors[5], k=2)[0][0][0] in {"p5", "late"}
+    assert {match[0] for match in store.search(vectors[5], k=2)[0]} == {"p5", "late"}
+    store.close()
+
+
+def test_rejects_bad_embeddings(tmp_path: Path) -> None:
+    """Test that width mismatches, zero vectors and repeated ids are rejected."""
+    with EmbeddingStore(tmp_path, dim=16) as store:
+        with pytest.raises(ValidationError):
+            store.add("a", [1.0] * 8)
+        with pytest.raises(ValidationError):
+            store.add("a", [0.0] * 16)
+        with pytest.raises(ValidationError):
+            store.add_many(["a", "a"], _vectors(2))
+        with pytest.raises(ValidationError):
+            EmbeddingStore(tmp_path / "other", dtype="int8")
+        assert store.search(_vectors(1)[0]) == [[]]
@@ -0,0 +1,173 @@
+"""Tests for the asyncio AWS client manager and wrappers."""
+
+import time
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+from src.shared.async_aws_clients import (
+    AsyncAWSClientManager,
+    AsyncDynamoDBClient,
+    AsyncKinesisClient,
+    AsyncTranslateClient,
+)
+from src.shared.errors import StorageError, TranslationError
+from src.shared.fakes import AsyncFake, FakeDynamoDBResource
+
+
+class _StubTable:
+    def __init__(self, items: dict[str, dict]):
+        self.items = items
+
+    async def get_item(self, Key: dict) -> dict:
+        if Key["id"] == "missing-table":
+            raise ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": "no table"}},
+                "GetItem",
+            )
+        item = self.items.get(Key["id"])
+        return {"Item": item} if item else {}
+
+    async def put_item(self, Item: dict) -> None:
+        self.items[Item["id"]] = Item
+
+
+class _StubResource:
+    def __init__(self) -> None:
+        self.table = _StubTable({})
+
+    async def Table(self, name: str) -> _StubTable:
+        return self.table
+
+
+class _StubKinesis:
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+
+    async def put_record(self, **kwargs: Any) -> dict:
+        self.records.append(kwargs)
+        return {"ShardId": "shardId-000000000000", "SequenceNumber": "1"}
+
+
+class _StubTranslate:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def translate_text(self, **kwargs: Any) -> dict:
+        self.calls.append(kwargs)
+        if kwargs["TargetLanguageCode"] == "xx":
+            raise ClientError(
+                {"Error": {"Code": "UnsupportedLanguagePairException", "Message": "no"}},
+                "TranslateText",
+            )
+        return {"TranslatedText": "hola"}
+
+
+class _StubManager:
+    def __init__(self) -> None:
+        self.resource = _StubResource()
+        self.kinesis = _StubKinesis()
+        self.translate = _StubTranslate()
+
+    async def get_resource(self, service_name: str) -> _StubResource:
+        return self.resource
+
+    async def get_client(self, service_name: str) -> Any:
+        return self.translate if service_name == "translate" else self.kinesis
+
+
+async def test_manager_reuses_clients_until_closed(mock_aws_credentials: None) -> None:
+    """Test that clients are shared and released on close."""
+    manager = AsyncAWSClientManager(max_pool_connections=5)
+
+    async with manager:
+        client1 = await manager.get_client("s3")
+        client2 = await manager.get_client("s3")
+        assert client1 is client2
+        assert client1.meta.config.max_pool_connections == 5
+
+    assert manager._clients == {}
+
+
+async def test_dynamodb_put_and_get_item() -> None:
+    """Test async DynamoDB wrapper round trip."""
+    client = AsyncDynamoDBClient(manager=_StubManager())
+
+    await client.put_item("sessions", {"id": "session-1", "status": "ACTIVE"})
+
+    assert await client.get_item("sessions", {"id": "session-1"}) == {
+        "id": "session-1",
+        "status": "ACTIVE",
+    }
+    assert await client.get_item("sessions", {"id": "session-2"}) is None
+
+
+async def test_dynamodb_missing_table_raises_storage_error() -> None:
+    """Test that client errors surface as StorageError."""
+    client = AsyncDynamoDBClient(manager=_StubManager())
+
+    with pytest.raises(StorageError):
+        await client.get_item("sessions", {"id": "missing-table"})
+
+
+async def test_batch_write_dedupes_keys_and_bounds_concurrency(
+    mock_aws_credentials: None,
+) -> None:
+    """Test that repeated keys collapse to their last write and calls run a few at a time."""
+    resource = FakeDynamoDBResource({"speakers": ["sessionId", "speakerId"]}, latency=0.02)
+    manager = AsyncAWSClientManager()
+    manager.register_resource("dynamodb", AsyncFake(resource))
+    client = AsyncDynamoDBClient(manager)
+    client.settings = client.settings.model_copy(update={"dynamodb_batch_concurrency": 2})
+
+    await client.batch_write_items(
+        "speakers",
+        items=[
+            {"sessionId": "s1", "speakerId": "a", "n": 1},
+            {"sessionId": "s1", "speakerId": "b", "n": 1},
+            {"sessionId": "s1", "speakerId": "b", "n": 2},
+        ],
+        delete_keys=[{"sessionId": "s1", "speakerId": "a"}],
+    )
+    assert resource.items["speakers"] == {
+        ("s1", "b"): {"sessionId": "s1", "speakerId": "b", "n": 2}
+    }
+
+    start = time.perf_counter()
+    await client.batch_write_items(
+        "speakers", items=[{"sessionId": "s2", "speakerId": f"x{i}"} for i in range(150)]
+    )
+    # Six calls, two at a time
+    assert time.perf_counter() - start >= 3 * 0.02
+    assert len(resource.items["speakers"]) == 151
+
+
+async def test_kinesis_put_record() -> None:
+    """Test async Kinesis wrapper publishes with the partition key."""
+    manager = _StubManager()
+    client = AsyncKinesisClient(manager=manager)
+
+    await client.put_record("audio", b"chunk", partition_key="session-1")
+
+    assert manager.kinesis.records == [
+        {"StreamName": "audio", "Data": b"chunk", "PartitionKey": "session-1"}
+    ]
+
+
+async def test_translate_text_passes_terminology_and_formality() -> None:
+    """Test Translate request arguments and mapping of permanent errors."""
+    manager = _StubManager()
+    stub = manager.translate
+    client = AsyncTranslateClient(manager=manager)
+
+    translated = await client.translate_text(
+        "hello", "en", "es", terminology="medical", formality="formal"
+    )
+    plain = await client.translate_text("hello", "en", "es")
+
+    assert translated == plain == "hola"
+    assert stub.calls[0]["TerminologyNames"] == ["medical"]
+    assert stub.calls[0]["Settings"] == {"Formality": "FORMAL"}
+    assert "Settings" not in stub.calls[1]
+    with pytest.raises(TranslationError):
+        await client.translate_text("hello", "en", "xx")
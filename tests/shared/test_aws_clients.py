@@ -0,0 +1,213 @@
+"""Tests for AWS client wrappers."""
+
+import io
+
+import pytest
+from botocore.exceptions import ReadTimeoutError
+from src.shared.aws_clients import S3_MIN_PART_BYTES, AWSClientManager, DynamoDBClient, S3Client
+from src.shared.errors import StorageError
+from src.shared.fakes import FakeDynamoDBResource, FakeS3Client
+
+
+def _dynamodb(resource: FakeDynamoDBResource) -> DynamoDBClient:
+    manager = AWSClientManager()
+    manager.register_client("dynamodb", resource.meta.client)
+    manager.register_resource("dynamodb", resource)
+    return DynamoDBClient(manager=manager)
+
+
+def test_get_item_with_projection() -> None:
+    """Test that get_item can fetch only selected attributes."""
+    resource = FakeDynamoDBResource({"profiles": ["profileId"]})
+    client = _dynamodb(resource)
+    client.put_item("profiles", {"profileId": "p1", "status": "ACTIVE", "vector": [0.1]})
+
+    item = client.get_item("profiles", {"profileId": "p1"}, attributes=["status"])
+
+    assert item == {"status": "ACTIVE"}
+
+
+def test_table_handles_are_reused() -> None:
+    """Test that repeated calls reuse the same Table handle."""
+    client = _dynamodb(FakeDynamoDBResource({"sessions": ["sessionId"]}))
+
+    client.get_item("sessions", {"sessionId": "s1"})
+    client.get_item("sessions", {"sessionId": "s2"})
+
+    assert list(client._tables) == ["sessions"]
+
+
+def test_batch_write_and_get_items_chunks_requests() -> None:
+    """Test that batch calls are split at DynamoDB's per-request limits."""
+    resource = FakeDynamoDBResource({"speakers": ["sessionId", "speakerId"]})
+    client = _dynamodb(resource)
+    items = [{"sessionId": "s1", "speakerId": f"sp{i}", "n": i} for i in range(260)]
+
+    client.batch_write_items("speakers", items=items)
+    keys = [{"sessionId": "s1", "speakerId": f"sp{i}"} for i in range(260)]
+    found = client.batch_get_items("speakers", keys + keys[:10], attributes=["speakerId"])
+
+    assert resource.call_counts["BatchWriteItem"] == 11
+    assert resource.call_counts["BatchGetItem"] == 3
+    assert sorted(item["speakerId"] for item in found) == sorted(f"sp{i}" for i in range(260))
+    assert all(set(item) == {"speakerId"} for item in found)
+
+
+def test_batch_calls_retry_unprocessed_entries() -> None:
+    """Test that unprocessed keys and items are re-sent until complete."""
+    resource = FakeDynamoDBResource({"profiles": ["profileId"]}, unprocessed_rate=0.1, seed=3)
+    client = _dynamodb(resource)
+    items = [{"profileId": f"p{i}"} for i in range(50)]
+
+    client.batch_write_items("profiles", items=items)
+    found = client.batch_get_items("profiles", [{"profileId": f"p{i}"} for i in range(50)])
+
+    assert len(resource.items["profiles"]) == 50
+    assert len(found) == 50
+
+
+def test_batch_delete_items() -> None:
+    """Test that batch_write_items can delete by key."""
+    resource = FakeDynamoDBResource({"profiles": ["profileId"]})
+    client = _dynamodb(resource)
+    client.batch_write_items("profiles", items=[{"profileId": "p1"}, {"profileId": "p2"}])
+
+    client.batch_write_items("profiles", delete_keys=[{"profileId": "p1"}])
+
+    assert list(resource.items["profiles"]) == [("p2",)]
+
+
+def test_batch_write_keeps_last_write_per_key() -> None:
+    """Test that repeated keys collapse to their last write and close() stops the pool."""
+    resource = FakeDynamoDBResource({"speakers": ["sessionId", "speakerId"]})
+    with _dynamodb(resource) as client:
+        client.batch_write_items("speakers", items=[{"sessionId": "s1", "speakerId": "a"}])
+        client.batch_write_items(
+            "speakers",
+            items=[
+                {"sessionId": "s1", "speakerId": "a", "n": 1},
+                {"sessionId": "s1", "speakerId": "b", "n": 1},
+                {"sessionId": "s1", "speakerId": "b", "n": 2},
+            ],
+            delete_keys=[{"sessionId": "s1", "speakerId": "a"}],
+        )
+        assert resource.items["speakers"] == {
+            ("s1", "b"): {"sessionId": "s1", "speakerId": "b", "n": 2}
+        }
+        keys = [{"sessionId": "s1", "speakerId": id} for id in ["b", *(f"x{i}" for i in range(30))]]
+        client.batch_write_items("speakers", delete_keys=keys)
+        assert client._executor is not None
+
+    assert resource.items["speakers"] == {}
+    assert client._executor is None
+
+
+def test_batch_get_missing_table_raises_storage_error() -> None:
+    """Test that a missing table surfaces as StorageError."""
+    client = _dynamodb(FakeDynamoDBResource({}))
+
+    with pytest.raises(StorageError):
+        client.batch_get_items("missing", [{"id": "x"}])
+
+
+def _s3(fake: FakeS3Client) -> S3Client:
+    manager = AWSClientManager()
+    manager.register_client("s3", fake)
+    return S3Client(manager=manager)
+
+
+def test_iter_download_uses_ranged_gets() -> None:
+    """Test that objects are streamed back in fixed-size ranges."""
+    fake = FakeS3Client()
+    client = _s3(fake)
+    data = bytes(range(256)) * 40
+    client.upload_file("audio", "a.raw", data)
+
+    chunks = list(client.iter_download("audio", "a.raw", chunk_size=4096))
+
+    assert [len(chunk) for chunk in chunks] == [4096, 4096, 2048]
+    assert b"".join(chunks) == data
+    assert fake.call_counts["GetObject"] == 3
+
+
+def test_ranged_body_read_failures_are_retried() -> None:
+    """Test that a range whose body read times out is fetched again."""
+    fake = FakeS3Client()
+    client = _s3(fake)
+    fake.put_object(Bucket="audio", Key="clip.raw", Body=b"abcdefghij")
+    get_object = fake.get_object
+    failures = [ReadTimeoutError(endpoint_url="https://s3")]
+
+    class _CutOff:
+        def read(self) -> bytes:
+            raise failures.pop()
+
+    def flaky_get_object(**kwargs):
+        response = get_object(**kwargs)
+        return {**response, "Body": _CutOff()} if failures else response
+
+    fake.get_object = flaky_get_object
+
+    assert b"".join(client.iter_download("audio", "clip.raw", chunk_size=4)) == b"abcdefghij"
+    assert fake.call_counts["GetObject"] == 4
+
+
+def test_iter_download_missing_object_raises_storage_error() -> None:
+    """Test that a missing object surfaces as StorageError."""
+    client = _s3(FakeS3Client())
+
+    with pytest.raises(StorageError, match="not found"):
+        list(client.iter_download("audio", "missing.raw"))
+
+
+def test_upload_stream_uses_multipart_for_large_sources() -> None:
+    """Test that large sources are split into parts and reassembled in order."""
+    fake = FakeS3Client()
+    client = _s3(fake)
+    data = bytes(range(256)) * (S3_MIN_PART_BYTES // 256 * 2 + 10)
+
+    client.upload_stream("audio", "big.raw", io.BytesIO(data), part_size=S3_MIN_PART_BYTES)
+
+    assert fake.objects[("audio", "big.raw")] == data
+    assert fake.call_counts["UploadPart"] == 3
+    assert fake.uploads == {}
+
+
+def test_upload_stream_small_source_uses_single_put() -> None:
+    """Test that sources smaller than one part skip the multipart API."""
+    fake = FakeS3Client()
+    client = _s3(fake)
+
+    client.upload_stream("audio", "small.raw", [b"abc", b"def"])
+
+    assert fake.objects[("audio", "small.raw")] == b"abcdef"
+    assert "CreateMultipartUpload" not in fake.call_counts
+
+
+def test_append_writer_reassembles_small_writes() -> None:
+    """Test that small live writes are buffered into full parts in order."""
+    fake = FakeS3Client()
+    client = _s3(fake)
+    chunk = bytes(range(250)) * 4000
+
+    with client.open_append_writer("audio", "live.raw", part_size=S3_MIN_PART_BYTES) as writer:
+        for _ in range(12):
+            writer.write(chunk)
+
+    assert fake.objects[("audio", "live.raw")] == chunk * 12
+    assert writer.bytes_written == len(chunk) * 12
+    assert fake.call_counts["UploadPart"] == 3
+
+
+def test_append_writer_aborts_on_error() -> None:
+    """Test that leaving the writer with an exception aborts the upload."""
+    fake = FakeS3Client()
+    client = _s3(fake)
+
+    with pytest.raises(RuntimeError):
+        with client.open_append_writer("audio", "live.raw", part_size=S3_MIN_PART_BYTES) as writer:
+            writer.write(b"\0" * (S3_MIN_PART_BYTES + 1))
+            raise RuntimeError("recording failed")
+
+    assert fake.call_counts["AbortMultipartUpload"] == 1
+    assert ("audio", "live.raw") not in fake.objects
@@ -0,0 +1,195 @@
+"""Tests for the two-tier read-through cache."""
+
+import asyncio
+from decimal import Decimal
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from src.shared.cache import CachedTable, TTLCache, TwoTierCache, cache_key, key_ttl
+
+
+class _Backend:
+    def __init__(self, items: dict[str, dict]):
+        self.items = items
+        self.reads = 0
+
+    async def get_item(self, table_name: str, key: dict) -> dict | None:
+        self.reads += 1
+        await asyncio.sleep(0.01)
+        return self.items.get(key["sessionId"])
+
+    async def put_item(self, table_name: str, item: dict) -> None:
+        self.items[item["sessionId"]] = item
+
+
+@pytest.fixture
+def server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+def _cache(server: fakeredis.FakeServer) -> TwoTierCache:
+    return TwoTierCache(redis=fakeredis.FakeAsyncRedis(server=server), l1_ttl=60)
+
+
+def test_key_patterns_match_design() -> None:
+    """Test key formats and TTLs from the Redis schema."""
+    assert cache_key("session", session_id="s1") == "session:s1"
+    assert cache_key("voice_profile", profile_id="p1") == "voice-profile:p1"
+    assert key_ttl("session") == 7200
+    assert key_ttl("voice_profile") == 3600
+
+
+def test_ttl_cache_evicts_lru_and_expired() -> None:
+    """Test LRU eviction and TTL expiry in the L1 cache."""
+    cache = TTLCache(max_entries=2, default_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, ttl=0)
+    assert cache.get("d") is None
+
+
+async def test_read_through_fills_both_tiers(server: fakeredis.FakeServer) -> None:
+    """Test that a miss loads from the backend once and later reads hit cache."""
+    backend = _Backend({"s1": {"sessionId": "s1", "speakers": Decimal(2)}})
+    table = CachedTable("sessions", "sessionId", "session", "session_id", _cache(server), backend)
+
+    assert await table.get("s1") == {"sessionId": "s1", "speakers": Decimal(2)}
+    assert await table.get("s1") == {"sessionId": "s1", "speakers": Decimal(2)}
+    assert backend.reads == 1
+
+    other_node = CachedTable(
+        "sessions", "sessionId", "session", "session_id", _cache(server), backend
+    )
+    assert await other_node.get("s1") == {"sessionId": "s1", "speakers": Decimal(2)}
+    assert backend.reads == 1
+    assert await fakeredis.FakeAsyncRedis(server=server).ttl("session:s1") > 7000
+
+
+async def test_concurrent_misses_are_coalesced(server: fakeredis.FakeServer) -> None:
+    """Test that concurrent misses on one key make a single backend read."""
+    backend = _Backend({"s1": {"sessionId": "s1"}})
+    table = CachedTable("sessions", "sessionId", "session", "session_id", _cache(server), backend)
+
+    results = await asyncio.gather(*(table.get("s1") for _ in range(20)))
+
+    assert all(result == {"sessionId": "s1"} for result in results)
+    assert backend.reads == 1
+
+
+async def test_write_invalidates_other_nodes(server: fakeredis.FakeServer) -> None:
+    """Test that a write evicts the L1 copy held by another node."""
+    backend = _Backend({"s1": {"sessionId": "s1", "status": "ACTIVE"}})
+    node_a = _cache(server)
+    node_b = _cache(server)
+    await node_b.start()
+    table_a = CachedTable("sessions", "sessionId", "session", "session_id", node_a, backend)
+    table_b = CachedTable("sessions", "sessionId", "session", "session_id", node_b, backend)
+
+    assert (await table_b.get("s1"))["status"] == "ACTIVE"
+    await table_a.put({"sessionId": "s1", "status": "ENDED"})
+
+    for _ in range(50):
+        if "session:s1" not in node_b.l1:
+            break
+        await asyncio.sleep(0.01)
+
+    assert (await table_b.get("s1"))["status"] == "ENDED"
+    await node_b.close()
+
+
+async def test_cancelled_caller_does_not_fail_coalesced_waiters(
+    server: fakeredis.FakeServer,
+) -> None:
+    """Test that cancelling the caller that started a load leaves the others served."""
+    backend = _Backend({"s1": {"sessionId": "s1"}})
+    table = CachedTable("sessions", "sessionId", "session", "session_id", _cache(server), backend)
+
+    first = asyncio.create_task(table.get("s1"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(table.get("s1"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == {"sessionId": "s1"}
+    assert first.cancelled()
+    assert backend.reads == 1
+
+
+async def test_write_during_load_is_not_overwritten(server: fakeredis.FakeServer) -> None:
+    """Test that a load that started before a write does not cache its stale read."""
+    backend = _Backend({"s1": {"sessionId": "s1", "status": "OLD"}})
+    read, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_read(table_name: str, key: dict) -> dict | None:
+        item = dict(backend.items[key["sessionId"]])
+        read.set()
+        await release.wait()
+        return item
+
+    backend.get_item = slow_read
+    cache = _cache(server)
+    table = CachedTable("sessions", "sessionId", "session", "session_id", cache, backend)
+
+    reader = asyncio.create_task(table.get("s1"))
+    await read.wait()
+    await table.put({"sessionId": "s1", "status": "NEW"})
+    release.set()
+
+    assert (await reader)["status"] == "OLD"
+    assert cache.l1.get("session:s1") == {"sessionId": "s1", "status": "NEW"}
+    assert await fakeredis.FakeAsyncRedis(server=server).get("session:s1") == (
+        b'{"sessionId":"s1","status":"NEW"}'
+    )
+    assert (await table.get("s1"))["status"] == "NEW"
+
+
+async def test_invalidation_listener_resubscribes(
+    server: fakeredis.FakeServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a dropped pub/sub connection is re-established and L1 is flushed."""
+    monkeypatch.setattr("src.shared.cache.RECONNECT_BASE_DELAY", 0.001)
+    node_a, node_b = _cache(server), _cache(server)
+    pubsub = node_b.redis.pubsub
+
+    class _Dropped:
+        async def subscribe(self, channel: str) -> None:
+            pass
+
+        async def listen(self):
+            raise RedisConnectionError("connection reset")
+            yield
+
+        async def aclose(self) -> None:
+            pass
+
+    calls = []
+
+    def flaky_pubsub():
+        calls.append(1)
+        return _Dropped() if len(calls) == 1 else pubsub()
+
+    monkeypatch.setattr(node_b.redis, "pubsub", flaky_pubsub)
+    node_b.l1.set("session:s1", {"status": "ACTIVE"})
+    await node_b.start()
+    for _ in range(50):
+        if len(calls) > 1 and "session:s1" not in node_b.l1:
+            break
+        await asyncio.sleep(0.01)
+    assert "session:s1" not in node_b.l1
+
+    node_b.l1.set("session:s2", {"status": "ACTIVE"})
+    await asyncio.sleep(0.05)
+    await node_a.invalidate("session:s2")
+    for _ in range(50):
+        if "session:s2" not in node_b.l1:
+            break
+        await asyncio.sleep(0.01)
+    assert "session:s2" not in node_b.l1
+    await node_b.close()
@@ -1,7 +1,10 @@
 """Tests for configuration management."""
 
+import time
+
 import pytest
-from src.shared.config import Settings, get_settings
+from src.shared.config import ConfigManager, Settings, get_settings
+from src.shared.fakes import FakeSecretsManagerClient, FakeSSMClient
 
 
 def test_settings_defaults() -> None:
@@ -33,3 +36,82 @@ def test_get_settings_cached() -> None:
     settings2 = get_settings()
     
     assert settings1 is settings2
+
+
+def _manager(parameters: dict[str, str], secrets: dict[str, str] | None = None) -> ConfigManager:
+    return ConfigManager(
+        Settings(),
+        ssm_client=FakeSSMClient(parameters),
+        secrets_client=FakeSecretsManagerClient(secrets),
+    )
+
+
+def test_parameters_load_in_bulk_on_first_read() -> None:
+    """Test that the first read pages through the prefix and later reads hit the cache."""
+    parameters = {f"/univoice/feature/{i}": str(i) for i in range(25)}
+    parameters["/other/ignored"] = "x"
+    manager = _manager(parameters)
+
+    assert manager.get_parameter("feature/3") == "3"
+    assert manager.get_parameter("feature/24") == "24"
+    assert manager.get_parameter("missing") is None
+    assert manager.get_cached_parameter("feature/7") == "7"
+    assert manager.get_cached_parameter("other/ignored", default="d") == "d"
+    assert manager.ssm_client.call_counts == {"GetParametersByPath": 3}
+
+
+def test_refresh_picks_up_rotated_values_and_notifies() -> None:
+    """Test that a refresh replaces changed values and fires matching callbacks."""
+    manager = _manager({"/univoice/a": "1", "/univoice/b": "2"}, {"db": "old"})
+    manager.load()
+    assert manager.get_secret("db") == "old"
+    changes: list[tuple] = []
+    manager.on_change(lambda *change: changes.append(change))
+    only_a: list[tuple] = []
+    manager.on_change(lambda *change: only_a.append(change), parameter_name="a")
+
+    manager.ssm_client.parameters.update({"/univoice/a": "10", "/univoice/c": "3"})
+    del manager.ssm_client.parameters["/univoice/b"]
+    manager.secrets_client.secrets["db"] = "new"
+    manager.refresh()
+
+    assert manager.get_cached_parameter("a") == "10"
+    assert manager.get_cached_parameter("b") is None
+    assert sorted(changes, key=str) == [
+        ("a", "1", "10"),
+        ("b", "2", None),
+        ("c", None, "3"),
+        ("db", "old", "new"),
+    ]
+    assert only_a == [("a", "1", "10")]
+
+
+def test_secrets_are_cached_and_survive_fetch_errors() -> None:
+    """Test that secrets are fetched once per TTL and stale values cover failures."""
+    manager = _manager({}, {"api-key": "k1"})
+
+    assert manager.get_secret("api-key") == "k1"
+    assert manager.get_secret("api-key") == "k1"
+    assert manager.secrets_client.call_count == 1
+
+    del manager.secrets_client.secrets["api-key"]
+    assert manager.get_secret("api-key", use_cache=False) == "k1"
+    assert manager.get_secret("unknown") is None
+
+
+def test_background_refresh_applies_changes() -> None:
+    """Test that the refresher thread reloads parameters on its interval."""
+    manager = ConfigManager(
+        Settings(SSM_REFRESH_SECONDS=0.01),
+        ssm_client=FakeSSMClient({"/univoice/mode": "a"}),
+    )
+    manager.load()
+    manager.start_refresh()
+    try:
+        manager.ssm_client.parameters["/univoice/mode"] = "b"
+        deadline = time.monotonic() + 2
+        while manager.get_cached_parameter("mode") != "b":
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+    finally:
+        manager.stop_refresh()
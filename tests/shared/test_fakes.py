@@ -0,0 +1,144 @@
+"""Tests for the in-process AWS fakes."""
+
+import asyncio
+import random
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+from src.shared.async_aws_clients import (
+    AsyncAWSClientManager,
+    AsyncDynamoDBClient,
+    AsyncKinesisClient,
+)
+from src.shared.aws_clients import AWSClientManager, KinesisClient
+from src.shared.config import get_settings
+from src.shared.errors import ServiceUnavailableError
+from src.shared.fakes import (
+    AsyncFake,
+    FakeAWS,
+    FakeKinesisClient,
+    FakePollyClient,
+    FakeTranscribeStreamingClient,
+    FaultInjector,
+    LatencyModel,
+)
+
+
+def test_latency_model_matches_median_and_p99() -> None:
+    """Test that sampled latencies follow the configured median and p99."""
+    model = LatencyModel(0.1, 0.5)
+    rng = random.Random(1)
+
+    samples = sorted(model.sample(rng) for _ in range(20_000))
+
+    assert samples[10_000] == pytest.approx(0.1, rel=0.05)
+    assert samples[19_800] == pytest.approx(0.5, rel=0.1)
+    assert LatencyModel(0.02).sample(rng) == 0.02
+
+
+def test_fault_injector_throttles_and_fails_at_configured_rates() -> None:
+    """Test that throttling and server errors are injected and counted."""
+    faults = FaultInjector(throttle_rate=0.2, error_rate=0.1, seed=3)
+    codes = []
+    for _ in range(5000):
+        try:
+            faults.check("PutRecord", "ProvisionedThroughputExceededException")
+        except ClientError as e:
+            codes.append(e.response["Error"]["Code"])
+
+    assert codes.count("ProvisionedThroughputExceededException") == pytest.approx(1000, rel=0.1)
+    assert codes.count("InternalServerError") == pytest.approx(500, rel=0.15)
+    assert faults.injected["InternalServerError"] == codes.count("InternalServerError")
+
+
+def test_throttled_kinesis_calls_surface_as_service_unavailable() -> None:
+    """Test that a fake installed on the client manager drives the real wrapper's retries."""
+    manager = AWSClientManager()
+    aws = FakeAWS({"kinesis": FaultInjector(throttle_rate=1.0)})
+    aws.install(manager=manager)
+
+    with pytest.raises(ServiceUnavailableError):
+        KinesisClient(manager).put_record("stream", b"data", "key")
+    assert aws.kinesis.call_count > 1
+    assert aws.kinesis.faults.injected["ProvisionedThroughputExceededException"] > 1
+
+
+async def test_async_fake_awaits_latency_without_blocking() -> None:
+    """Test that AsyncFake calls overlap instead of sleeping in turn."""
+    fake = FakeKinesisClient(faults=FaultInjector(0.05))
+    client = AsyncFake(fake)
+
+    start = time.perf_counter()
+    for _ in range(2):
+        fake.put_record(StreamName="s", Data=b"x", PartitionKey="k")
+    blocking = time.perf_counter() - start
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client.put_record(StreamName="s", Data=b"x", PartitionKey="k") for _ in range(10))
+    )
+
+    assert blocking >= 0.1
+    assert time.perf_counter() - start < 0.1
+    assert len(fake.records()) == 12
+
+
+async def test_fake_aws_serves_async_dynamodb(mock_aws_credentials: None) -> None:
+    """Test that the async client wrappers run unchanged against installed fakes."""
+    manager = AsyncAWSClientManager()
+    aws = FakeAWS()
+    aws.install(async_manager=manager)
+    table = get_settings().dynamodb_sessions_table
+
+    await AsyncDynamoDBClient(manager).put_item(table, {"sessionId": "s1", "status": "ACTIVE"})
+    await AsyncKinesisClient(manager).put_record("stream", b"audio", "s1")
+
+    assert await AsyncDynamoDBClient(manager).get_item(table, {"sessionId": "s1"}) == {
+        "sessionId": "s1",
+        "status": "ACTIVE",
+    }
+    assert aws.kinesis.records()[0]["Data"] == b"audio"
+
+
+async def test_transcribe_stream_emits_partials_then_finals() -> None:
+    """Test that each audio event yields a result and the end of audio closes a segment."""
+    client = FakeTranscribeStreamingClient(segment_seconds=0.3, seed=5)
+    stream = await client.start_stream_transcription("en-US", 16_000)
+    for _ in range(4):
+        await stream.input_stream.send_audio_event(audio_chunk=bytes(3200))  # 100 ms
+    await stream.input_stream.end_stream()
+
+    results = [
+        result
+        async for event in stream.output_stream
+        for result in event["Transcript"]["Results"]
+    ]
+
+    assert [r["IsPartial"] for r in results] == [True, True, False, True, False]
+    assert results[2]["EndTime"] == pytest.approx(0.3)
+    assert results[4]["StartTime"] == pytest.approx(0.3)
+    assert results[4]["EndTime"] == pytest.approx(0.4)
+    assert all(r["Alternatives"][0]["Transcript"] for r in results)
+    assert client.active_streams == 0
+
+
+async def test_transcribe_limits_concurrent_streams() -> None:
+    """Test that starts beyond max_streams are throttled."""
+    client = FakeTranscribeStreamingClient(max_streams=1)
+    await client.start_stream_transcription("en-US", 16_000)
+
+    with pytest.raises(ClientError) as error:
+        await client.start_stream_transcription("en-US", 16_000)
+    assert error.value.response["Error"]["Code"] == "LimitExceededException"
+
+
+def test_polly_returns_audio_sized_by_text() -> None:
+    """Test that synthesized PCM length follows the text length."""
+    polly = FakePollyClient(chars_per_second=10)
+
+    response = polly.synthesize_speech(
+        Text="x" * 20, OutputFormat="pcm", VoiceId="Joanna", SampleRate="8000"
+    )
+
+    assert len(response["AudioStream"].read()) == 2 * 2 * 8000
+    assert polly.characters == 20
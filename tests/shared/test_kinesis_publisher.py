@@ -0,0 +1,92 @@
+"""Tests for the batched Kinesis publisher."""
+
+import pytest
+from src.shared.errors import ServiceUnavailableError, ValidationError
+from src.shared.fakes import FakeKinesisClient
+from src.shared.kinesis_publisher import (
+    KinesisBatchPublisher,
+    aggregate_records,
+    deaggregate_record,
+)
+
+
+def _published(client: FakeKinesisClient) -> dict[str, list[bytes]]:
+    by_key: dict[str, list[bytes]] = {}
+    for record in client.records():
+        by_key.setdefault(record["PartitionKey"], []).extend(deaggregate_record(record["Data"]))
+    return by_key
+
+
+def test_aggregation_round_trip() -> None:
+    """Test that aggregated payloads unpack to the original records."""
+    records = [b"a", b"", b"chunk-3" * 100]
+
+    assert deaggregate_record(aggregate_records(records)) == records
+    assert deaggregate_record(b"raw-payload") == [b"raw-payload"]
+
+
+def test_publisher_coalesces_records_into_batches() -> None:
+    """Test that many small records are sent in few PutRecords calls."""
+    client = FakeKinesisClient()
+
+    with KinesisBatchPublisher("audio", client=client, linger_ms=1000) as publisher:
+        for i in range(200):
+            publisher.publish(f"{i}".encode(), partition_key=f"session-{i % 10}")
+        assert publisher.flush(timeout=5)
+
+    assert client.call_count == 1
+    assert len(client.records()) == 10
+    assert sum(len(records) for records in _published(client).values()) == 200
+
+
+def test_publisher_preserves_order_with_partial_failures() -> None:
+    """Test that per-partition-key order survives retried entries."""
+    client = FakeKinesisClient(failure_rate=0.3, seed=7)
+
+    with KinesisBatchPublisher(
+        "audio", client=client, linger_ms=1, max_retries=50, retry_base_delay=0
+    ) as publisher:
+        for i in range(300):
+            publisher.publish(f"{i}".encode(), partition_key=f"session-{i % 3}")
+        assert publisher.flush(timeout=5)
+
+    published = _published(client)
+    for n in range(3):
+        expected = [f"{i}".encode() for i in range(300) if i % 3 == n]
+        assert published[f"session-{n}"] == expected
+
+
+def test_publisher_splits_batches_at_record_limit() -> None:
+    """Test that a batch never exceeds the configured record count."""
+    client = FakeKinesisClient()
+
+    with KinesisBatchPublisher("audio", client=client, max_batch_records=5) as publisher:
+        for i in range(20):
+            publisher.publish(b"x", partition_key=f"session-{i}")
+        assert publisher.flush(timeout=5)
+
+    assert client.call_count >= 4
+    assert len(client.records()) == 20
+
+
+def test_publisher_rejects_when_queue_full() -> None:
+    """Test that a full queue raises instead of blocking the caller."""
+    client = FakeKinesisClient()
+    publisher = KinesisBatchPublisher(
+        "audio", client=client, linger_ms=10_000, max_queued_records=2
+    )
+    publisher.publish(b"1", partition_key="a")
+    publisher.publish(b"2", partition_key="a")
+
+    with pytest.raises(ServiceUnavailableError):
+        publisher.publish(b"3", partition_key="a")
+
+    publisher.close()
+    assert len(_published(client)["a"]) == 2
+
+
+def test_publisher_rejects_oversized_record() -> None:
+    """Test that records above the Kinesis limit are rejected up front."""
+    with KinesisBatchPublisher("audio", client=FakeKinesisClient()) as publisher:
+        with pytest.raises(ValidationError):
+            publisher.publish(b"x" * (1024 * 1024), partition_key="a")
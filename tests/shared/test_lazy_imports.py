@@ -0,0 +1,30 @@
+"""Tests that heavy SDKs stay out of the shared package's import path."""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("boto3", "aioboto3", "aws_xray_sdk", "pythonjsonlogger")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "src.shared.config",
+        "src.shared.logging",
+        "src.shared.tracing",
+        "src.shared.aws_clients",
+        "src.shared.async_aws_clients",
+        "src.shared.cache",
+        "src.shared.rate_limiter",
+    ],
+)
+def test_import_defers_heavy_sdks(module: str) -> None:
+    """Test that importing a shared module loads none of the heavy SDKs."""
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,113 @@
+"""Tests for the queue-backed, sampled logging pipeline."""
+
+import io
+import json
+import threading
+import time
+
+import pytest
+import structlog
+from src.shared.logging import (
+    EventSampler,
+    LogWriter,
+    QueueLogger,
+    defer_rendering,
+    stamp_time,
+)
+from src.shared.metrics import get_metrics_registry
+
+
+class _BlockingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.release.wait()
+        self.writes += 1
+        return super().write(text)
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end
+        time.sleep(0.005)
+
+
+def test_events_are_rendered_off_thread_in_batches() -> None:
+    """Test that queued events are written as JSON lines, several per write."""
+    stream = _BlockingStream()
+    writer = LogWriter(stream, max_queue=100, batch_size=50)
+    logger = structlog.wrap_logger(
+        QueueLogger(writer),
+        processors=[structlog.processors.add_log_level, stamp_time, defer_rendering],
+    )
+
+    for index in range(20):
+        logger.info("chunk_received", seq=index, session={"id": "s1"})
+    stream.release.set()
+    writer.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["seq"] for line in lines] == list(range(20))
+    assert lines[0].pop("timestamp").endswith("Z")
+    assert lines[0] == {
+        "event": "chunk_received", "seq": 0, "session": {"id": "s1"}, "level": "info"
+    }
+    assert stream.writes < 20
+
+
+def test_deferred_events_are_copied_at_enqueue() -> None:
+    """Test that changing an event dict after it is queued leaves the queued event alone."""
+    event_dict = {"event": "chunk_received", "seq": 1}
+    (queued,), _ = defer_rendering(None, "info", event_dict)
+    event_dict["seq"] = 2
+
+    assert queued == {"event": "chunk_received", "seq": 1}
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    """Test that a stalled writer makes puts drop and count rather than block."""
+    stream = _BlockingStream()
+    writer = LogWriter(stream, max_queue=5, batch_size=1)
+    dropped = get_metrics_registry().counter("log_events_dropped_total", reason="queue_full")
+    before = dropped.value
+
+    writer.put({"event": "first"})
+    writer.flush()
+    _wait_for(lambda: not writer._events)  # the thread holds it, stuck in write()
+    start = time.perf_counter()
+    for index in range(50):
+        writer.put({"event": "e", "n": index})
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.05
+    assert dropped.value - before == 45
+    stream.release.set()
+    writer.close()
+    assert len(stream.getvalue().splitlines()) == 6
+
+
+def test_sampler_caps_each_event_name_per_second(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that each event name is capped per second, warnings pass and drops are reported."""
+    now = [100.0]
+    monkeypatch.setattr("src.shared.logging.time.monotonic", lambda: now[0])
+    sampler = EventSampler(max_per_second=3)
+
+    def kept(event: str, level: str = "debug") -> bool:
+        try:
+            sampler(None, level, {"event": event})
+            return True
+        except structlog.DropEvent:
+            return False
+
+    assert [kept("frame") for _ in range(5)] == [True, True, True, False, False]
+    assert kept("other")
+    assert kept("frame", level="warning")
+
+    now[0] += 1.0
+    event = sampler(None, "debug", {"event": "frame"})
+    assert event["sampled_out"] == 2
+    assert EventSampler(max_per_second=0)(None, "debug", {"event": "x"}) == {"event": "x"}
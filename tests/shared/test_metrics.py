@@ -0,0 +1,55 @@
+"""Tests for the in-process metrics registry and latency histograms."""
+
+import random
+
+import numpy as np
+import pytest
+from src.shared.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_percentiles_within_bucket_error() -> None:
+    """Test that p50/p95/p99 are within 4% of exact percentiles over a wide range."""
+    rng = random.Random(3)
+    values = [rng.lognormvariate(3, 1.5) for _ in range(50_000)]
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    for percent in (50, 95, 99):
+        exact = np.percentile(values, percent)
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.04)
+    assert histogram.percentile(100) == max(values)
+    assert histogram.count == len(values)
+    assert Histogram().percentile(99) == 0.0
+
+
+def test_histogram_merge_matches_single_histogram() -> None:
+    """Test that merging per-node histograms equals recording everything in one."""
+    rng = random.Random(5)
+    values = [rng.uniform(0, 500) for _ in range(10_000)]
+    combined, node_a, node_b = Histogram(), Histogram(), Histogram()
+    for index, value in enumerate(values):
+        combined.record(value)
+        (node_a if index % 2 else node_b).record(value)
+
+    node_a.merge(node_b)
+
+    assert node_a.export() == pytest.approx(combined.export())
+
+
+def test_snapshot_flattens_histograms() -> None:
+    """Test that snapshots export histogram count, sum and percentiles per label set."""
+    registry = MetricsRegistry()
+    registry.counter("chunks_total").inc(2)
+    for value in (1.0, 2.0, 3.0, 400.0):
+        registry.histogram("stage_latency_ms", stage="translate").record(value)
+
+    snapshot = registry.snapshot()
+
+    assert snapshot["chunks_total"] == 2
+    assert snapshot["stage_latency_ms_count{stage=translate}"] == 4
+    assert snapshot["stage_latency_ms_sum{stage=translate}"] == 406
+    assert snapshot["stage_latency_ms_p50{stage=translate}"] == pytest.approx(2.0, rel=0.04)
+    assert snapshot["stage_latency_ms_p99{stage=translate}"] == 400
+    with pytest.raises(TypeError):
+        registry.counter("stage_latency_ms", stage="translate")
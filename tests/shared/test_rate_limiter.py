@@ -0,0 +1,136 @@
+"""Tests for the Redis token-bucket rate limiter."""
+
+import asyncio
+import time
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from src.shared.errors import RateLimitError, ValidationError
+from src.shared.rate_limiter import TOKEN_BUCKET_LUA, TokenBucketLimiter
+
+
+def _limiter(server: fakeredis.FakeServer, **kwargs) -> TokenBucketLimiter:
+    kwargs.setdefault("lease_tokens", 10)
+    kwargs.setdefault("lease_ttl_ms", 60_000)
+    return TokenBucketLimiter("test", redis=fakeredis.FakeAsyncRedis(server=server), **kwargs)
+
+
+async def test_burst_is_shared_across_nodes_and_leased_in_batches() -> None:
+    """Test that two nodes together get exactly the burst, one Redis call per lease."""
+    server = fakeredis.FakeServer()
+    node_a = _limiter(server, rate=0.01, capacity=30)
+    node_b = _limiter(server, rate=0.01, capacity=30)
+    calls = 0
+    for limiter in (node_a, node_b):
+        script = limiter._script
+
+        async def counting(*args, script=script, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await script(*args, **kwargs)
+
+        limiter._script = counting
+
+    allowed = 0
+    for _ in range(20):
+        for limiter in (node_a, node_b):
+            try:
+                await limiter.acquire("rate-limit:ip:10.0.0.1")
+                allowed += 1
+            except RateLimitError:
+                pass
+
+    assert allowed == 30
+    # Three leases of 10, then one denial that node B caches locally
+    assert calls == 4
+
+
+async def test_retry_after_covers_the_deficit() -> None:
+    """Test that retry_after is the whole seconds until the bucket covers the cost."""
+    limiter = _limiter(fakeredis.FakeServer(), rate=0.5, capacity=4, lease_tokens=4)
+    for _ in range(4):
+        await limiter.acquire("k")
+
+    with pytest.raises(RateLimitError) as one:
+        await limiter.acquire("k")
+    with pytest.raises(RateLimitError) as three:
+        await limiter.acquire("other", cost=3)
+        await limiter.acquire("other", cost=3)
+
+    assert one.value.details["retry_after"] == 2
+    # 1 token left, 2 short at 0.5 tokens/s
+    assert three.value.details["retry_after"] == 4
+
+
+async def test_denial_is_cached_until_tokens_refill() -> None:
+    """Test that a denied key skips Redis until the bucket has refilled."""
+    limiter = _limiter(fakeredis.FakeServer(), rate=20, capacity=2, lease_tokens=2)
+    await limiter.acquire("k")
+    await limiter.acquire("k")
+    with pytest.raises(RateLimitError):
+        await limiter.acquire("k")
+    limiter._script = None  # any Redis call would now fail
+    with pytest.raises(RateLimitError):
+        await limiter.acquire("k")
+
+    await asyncio.sleep(0.06)
+    limiter._script = limiter.redis.register_script(TOKEN_BUCKET_LUA)
+    await limiter.acquire("k")
+
+
+async def test_concurrent_refills_are_coalesced() -> None:
+    """Test that simultaneous misses on one key share a single Redis round trip."""
+    limiter = _limiter(fakeredis.FakeServer(), rate=1, capacity=100, lease_tokens=50)
+    script, calls = limiter._script, 0
+
+    async def slow(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return await script(*args, **kwargs)
+
+    limiter._script = slow
+    await asyncio.gather(*(limiter.acquire("k") for _ in range(40)))
+
+    assert calls == 1
+
+
+async def test_idle_leases_are_swept_and_oversized_costs_rejected() -> None:
+    """Test that lapsed leases are dropped and a cost above capacity is a validation error."""
+    limiter = _limiter(fakeredis.FakeServer(), rate=100, capacity=5, lease_ttl_ms=200)
+    for i in range(20):
+        await limiter.acquire(f"client-{i}")
+    assert len(limiter._leases) == 20
+
+    await asyncio.sleep(0.25)
+    await limiter.acquire("client-new")
+    assert list(limiter._leases) == ["client-new"]
+
+    with pytest.raises(ValidationError):
+        await limiter.acquire("client-new", cost=6)
+
+
+async def test_fails_open_when_redis_is_down() -> None:
+    """Test that Redis errors let traffic through rather than rejecting it."""
+    limiter = _limiter(fakeredis.FakeServer(), rate=1, capacity=1)
+
+    async def broken(*args, **kwargs):
+        raise RedisConnectionError("down")
+
+    limiter._script = broken
+    for _ in range(5):
+        await limiter.acquire("k")
+
+
+async def test_local_fast_path_under_50_microseconds() -> None:
+    """Test that checks served from a lease stay well under 50 µs each."""
+    limiter = _limiter(fakeredis.FakeServer(), rate=1, capacity=20_000, lease_tokens=20_000)
+    await limiter.acquire("k")
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        await limiter.acquire("k")
+    per_check = (time.perf_counter() - start) / 10_000
+
+    assert per_check < 50e-6
@@ -0,0 +1,169 @@
+"""Tests for retry policy, deadlines and circuit breaker."""
+
+import asyncio
+import time
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError, ParamValidationError
+from src.shared.errors import CircuitOpenError, DeadlineExceededError
+from src.shared.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    client_config_options,
+    deadline,
+    is_retryable,
+)
+
+
+def _client_error(code: str, status: int = 400) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code, "Message": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "Operation",
+    )
+
+
+class _Flaky:
+    def __init__(self, errors: list[Exception]):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def test_error_classification() -> None:
+    """Test that throttling and 5xx are retryable but validation errors are not."""
+    assert is_retryable(_client_error("ProvisionedThroughputExceededException"))
+    assert is_retryable(_client_error("SomethingNew", status=503))
+    assert is_retryable(EndpointConnectionError(endpoint_url="https://example.com"))
+    assert not is_retryable(_client_error("ValidationException"))
+    assert not is_retryable(_client_error("ResourceNotFoundException"))
+    assert not is_retryable(ParamValidationError(report="bad"))
+
+
+def test_retry_policy_retries_transient_errors() -> None:
+    """Test that transient errors are retried until success."""
+    fn = _Flaky([_client_error("ThrottlingException")] * 2)
+    policy = RetryPolicy("test.transient", max_attempts=3, base_delay=0.001)
+
+    assert policy.call(fn) == "ok"
+    assert fn.calls == 3
+
+
+def test_retry_policy_does_not_retry_permanent_errors() -> None:
+    """Test that non-retryable errors are raised after one attempt."""
+    fn = _Flaky([_client_error("ValidationException")])
+    policy = RetryPolicy("test.permanent", max_attempts=5, base_delay=0.001)
+
+    with pytest.raises(ClientError):
+        policy.call(fn)
+    assert fn.calls == 1
+
+
+def test_retry_policy_respects_budget() -> None:
+    """Test that backoff never sleeps past the latency budget."""
+    fn = _Flaky([_client_error("ThrottlingException")] * 10)
+    policy = RetryPolicy("test.budget", max_attempts=10, base_delay=1.0, max_delay=1.0, budget=0.05)
+
+    start = time.monotonic()
+    with pytest.raises(ClientError):
+        policy.call(fn)
+    assert time.monotonic() - start < 0.1
+
+
+def test_expired_deadline_fails_fast() -> None:
+    """Test that an exhausted ambient deadline raises before calling."""
+    fn = _Flaky([])
+    policy = RetryPolicy("test.deadline")
+
+    with deadline(0):
+        with pytest.raises(DeadlineExceededError):
+            policy.call(fn)
+    assert fn.calls == 0
+
+
+async def test_async_retry_policy() -> None:
+    """Test that the async path retries like the sync one."""
+    errors = [_client_error("ServiceUnavailable", status=503)]
+
+    async def fn() -> str:
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    policy = RetryPolicy("test.async", max_attempts=2, base_delay=0.001)
+    assert await policy.acall(fn) == "ok"
+
+
+def test_circuit_breaker_opens_and_recovers() -> None:
+    """Test the CLOSED -> OPEN -> HALF_OPEN -> CLOSED cycle."""
+    breaker = CircuitBreaker("test", failure_threshold=2, success_threshold=2, reset_timeout=0.05)
+    policy = RetryPolicy("test.breaker", max_attempts=1, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(ClientError):
+            policy.call(_Flaky([_client_error("InternalServerError", status=500)]))
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        policy.call(_Flaky([]))
+
+    time.sleep(0.06)
+    assert policy.call(_Flaky([])) == "ok"
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert policy.call(_Flaky([])) == "ok"
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_permanent_errors_do_not_trip_breaker() -> None:
+    """Test that caller errors are not counted as dependency failures."""
+    breaker = CircuitBreaker("test-permanent", failure_threshold=1)
+    policy = RetryPolicy("test.breaker-permanent", max_attempts=1, breaker=breaker)
+
+    with pytest.raises(ClientError):
+        policy.call(_Flaky([_client_error("ValidationException")]))
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_admits_one_probe_at_a_time() -> None:
+    """Test that a half-open circuit rejects concurrent probes until the first reports."""
+    breaker = CircuitBreaker("test.probe", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+async def test_async_attempt_is_cut_off_at_deadline() -> None:
+    """Test that a hung attempt is cancelled when the budget runs out."""
+    breaker = CircuitBreaker("test.hung", failure_threshold=5)
+    policy = RetryPolicy("test.hung", max_attempts=3, budget=0.05, breaker=breaker)
+
+    async def hang() -> str:
+        await asyncio.sleep(10)
+        return "late"
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        await policy.acall(hang)
+    assert time.monotonic() - start < 1
+
+
+def test_client_config_disables_botocore_retries() -> None:
+    """Test that botocore retries are off and socket timeouts follow the call budget."""
+    options = client_config_options(7)
+
+    assert options["retries"] == {"total_max_attempts": 1}
+    assert options["max_pool_connections"] == 7
+    assert options["connect_timeout"] == options["read_timeout"] == 1.0
@@ -0,0 +1,81 @@
+"""Tests for the per-chunk latency waterfall."""
+
+import pytest
+from src.services.audio_ingress.models import AudioChunk, parse_audio_record
+from src.shared.timing import LatencyCollector, TimingEnvelope, split_record
+
+
+def _envelope(**stamps: tuple[float, float]) -> TimingEnvelope:
+    timing = TimingEnvelope(origin_ms=1_000_000.0)
+    for stage, (enter, exit_) in stamps.items():
+        timing.enter(stage, at_ms=1_000_000.0 + enter)
+        timing.exit(stage, at_ms=1_000_000.0 + exit_)
+    return timing
+
+
+def test_breakdown_separates_stage_and_queue_time() -> None:
+    """Test that each stage's own time and the wait before it are reported."""
+    timing = _envelope(ingress=(40, 42), stt=(90, 600), translate=(610, 700))
+
+    assert timing.breakdown() == pytest.approx(
+        {
+            "queue:ingress": 40,
+            "ingress": 2,
+            "queue:stt": 48,
+            "stt": 510,
+            "queue:translate": 10,
+            "translate": 90,
+            "total": 700,
+        }
+    )
+
+
+def test_envelope_survives_kinesis_record_and_json() -> None:
+    """Test that the envelope round-trips through the record framing and to_dict."""
+    chunk = AudioChunk(b"\x01\x02" * 800, "wav", 16000, 1, timestamp=1_000_000.0, sequence_number=7)
+    chunk.start_timing()
+    record = chunk.to_record()
+
+    audio, timing = parse_audio_record(record)
+
+    assert audio == chunk.data
+    assert len(record) - len(audio) < 40
+    assert [stage for stage, _, _ in timing.stages()] == ["ingress", "stt"]
+    assert timing.stages()[1][2] is None  # STT has not finished yet
+    assert TimingEnvelope.from_dict(timing.to_dict()).stages() == timing.stages()
+    assert split_record(b"raw pcm") == (b"raw pcm", None)
+
+
+def test_derived_results_do_not_share_stamps() -> None:
+    """Test that stamping a derived envelope leaves the source chunk's untouched."""
+    chunk = _envelope(ingress=(1, 2))
+    derived = chunk.derive()
+    derived.enter("stt", at_ms=1_000_010.0)
+
+    assert len(chunk.stages()) == 1
+    assert len(derived.stages()) == 2
+    with pytest.raises(ValueError):
+        derived.enter("unknown")
+
+
+def test_collector_percentiles_and_over_budget_attribution() -> None:
+    """Test node and session percentiles and which part gets blamed over budget."""
+    collector = LatencyCollector(budget_ms=1000, window_seconds=60, session_samples=10)
+    for index in range(20):
+        stt_end = 300 + index * 10
+        collector.observe(
+            "s1", _envelope(ingress=(10, 12), stt=(50, stt_end), translate=(stt_end, 400 + stt_end))
+        )
+    collector.observe("s2", _envelope(ingress=(10, 12), stt=(1500, 1600)))
+
+    node = collector.node_percentiles()
+    assert node["stt"]["count"] == 21
+    assert node["total"]["p50"] == pytest.approx(795, rel=0.04)
+    session = collector.session_percentiles("s1")
+    assert session["stt"]["p99"] == 440  # last 10 chunks only
+    assert session["total"]["p50"] == 840
+
+    over = collector._metrics.snapshot()
+    assert over["pipeline_over_budget_total{part=queue:stt}"] == 1
+    collector.end_session("s1")
+    assert collector.session_percentiles("s1") == {}
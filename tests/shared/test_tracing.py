@@ -0,0 +1,42 @@
+"""Tests for the tracing decorator's latency recording."""
+
+import asyncio
+import time
+
+import pytest
+from src.shared.tracing import get_stage_latencies, trace_function
+
+
+def test_sync_calls_are_recorded_without_xray() -> None:
+    """Test that sync call durations land in the stage histogram, errors included."""
+
+    @trace_function("test_sync_stage", xray=False)
+    def work(fail: bool = False) -> str:
+        time.sleep(0.01)
+        if fail:
+            raise ValueError("boom")
+        return "done"
+
+    assert work() == "done"
+    with pytest.raises(ValueError):
+        work(fail=True)
+
+    stage = get_stage_latencies()["test_sync_stage"]
+    assert stage["count"] == 2
+    assert 10 <= stage["p50"] < 50
+
+
+async def test_async_calls_are_recorded_by_function_name() -> None:
+    """Test that coroutines keep their signature and are timed across awaits."""
+
+    @trace_function(xray=False)
+    async def test_async_stage(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    assert asyncio.iscoroutinefunction(test_async_stage)
+    assert await test_async_stage(0.02) == 0.02
+
+    stage = get_stage_latencies()["test_async_stage"]
+    assert stage["count"] == 1
+    assert stage["max"] >= 20